@@ -0,0 +1,313 @@
+"""Process-wide pool of warm agent instances.
+
+The CopilotKit graph nodes and the streaming router used to build the Zoho
+integration, ``ZohoDataScout``, ``MemoryAnalyst``, ``RecommendationAuthor``
+and their SDK/HTTP clients for every request. None of these agents keep
+per-conversation state (the scout's sync times and the integration circuit
+breakers are per account/tier and are better shared), so the pool builds one
+of each on first use and hands them to every session.
+
+Per-session state stays small: an ``AgentSession`` (session ID + event
+emitter) or an ``OrchestratorAgent`` wired to the pooled agents and the
+shared intent engine, analysis cache and approval manager.
+"""
+
+import os
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+import structlog
+
+from src.agents.analysis_cache import AccountAnalysisCache, get_analysis_cache
+from src.agents.config import DataScoutConfig
+from src.agents.intent_detection import IntentDetectionEngine
+from src.agents.memory_analyst import MemoryAnalyst
+from src.agents.orchestrator import OrchestratorAgent
+from src.agents.recommendation_author import RecommendationAuthor
+from src.agents.zoho_data_scout import ZohoDataScout
+from src.events.ag_ui_emitter import AGUIEventEmitter
+from src.events.approval_manager import ApprovalManager, approval_manager as shared_approval_manager
+from src.integrations.cognee.cognee_client import CogneeClient
+from src.integrations.zoho.integration_manager import ZohoIntegrationManager
+from src.services.memory_service import MemoryService
+
+logger = structlog.get_logger(__name__)
+
+
+DEFAULT_MEMORY_MODEL = "claude-3-5-sonnet-20241022"
+
+
+@dataclass
+class AgentSession:
+    """Per-session state handed out by the pool.
+
+    Attributes:
+        session_id: Session identifier
+        emitter: AG UI event emitter bound to the session
+        created_at: When the session was handed out
+    """
+
+    session_id: str
+    emitter: AGUIEventEmitter
+    created_at: datetime = field(default_factory=datetime.utcnow)
+
+
+class AgentPool:
+    """Lazily built, process-wide agent instances shared across sessions.
+
+    Example:
+        >>> pool = get_agent_pool()
+        >>> orchestrator = pool.create_orchestrator("session_123")
+        >>> async for event in orchestrator.execute_with_events(context):
+        ...     print(event)
+    """
+
+    def __init__(
+        self,
+        zoho_manager: Optional[ZohoIntegrationManager] = None,
+        cognee_client: Optional[CogneeClient] = None,
+        scout_config: Optional[DataScoutConfig] = None,
+        api_key: Optional[str] = None,
+        memory_model: str = DEFAULT_MEMORY_MODEL,
+        analysis_cache: Optional[AccountAnalysisCache] = None,
+        approval_manager: Optional[ApprovalManager] = None
+    ):
+        """Initialize the pool (agents are built on first use).
+
+        Args:
+            zoho_manager: Zoho integration (defaults to ZohoIntegrationManager.from_env())
+            cognee_client: Cognee client (defaults to CogneeClient())
+            scout_config: ZohoDataScout configuration (defaults to DataScoutConfig.from_env())
+            api_key: Anthropic API key for MemoryAnalyst (defaults to ANTHROPIC_API_KEY)
+            memory_model: Model used by MemoryAnalyst
+            analysis_cache: Analysis cache for orchestrators (defaults to the shared cache)
+            approval_manager: Approval manager (defaults to the process-wide instance
+                the approval router resolves requests against)
+        """
+        self.api_key = api_key
+        self.memory_model = memory_model
+        self.analysis_cache = analysis_cache or get_analysis_cache()
+        self.approval_manager = approval_manager or shared_approval_manager
+        self.logger = logger.bind(component="agent_pool")
+
+        self._instances: Dict[str, Any] = {}
+        if zoho_manager is not None:
+            self._instances["zoho_manager"] = zoho_manager
+        if cognee_client is not None:
+            self._instances["cognee_client"] = cognee_client
+        if scout_config is not None:
+            self._instances["scout_config"] = scout_config
+
+        self._build_ms: Dict[str, float] = {}
+        self._sessions_created = 0
+
+    # ------------------------------------------------------------------
+    # Shared instances
+    # ------------------------------------------------------------------
+
+    @property
+    def zoho_manager(self) -> ZohoIntegrationManager:
+        """Shared Zoho integration (keeps circuit breaker state across requests)."""
+        return self._get("zoho_manager", lambda: ZohoIntegrationManager.from_env())
+
+    @property
+    def cognee_client(self) -> CogneeClient:
+        """Shared Cognee client."""
+        return self._get("cognee_client", CogneeClient)
+
+    @property
+    def scout_config(self) -> DataScoutConfig:
+        """ZohoDataScout configuration, read from the environment once."""
+        return self._get("scout_config", DataScoutConfig.from_env)
+
+    @property
+    def memory_service(self) -> MemoryService:
+        """Shared memory service (using the Cognee client's local stores)."""
+        return self._get(
+            "memory_service",
+            lambda: MemoryService(
+                cognee_client=self.cognee_client,
+                zoho_manager=self.zoho_manager,
+                similarity_index=self.cognee_client.similarity_index,
+                snapshot_store=self.cognee_client.snapshot_store
+            )
+        )
+
+    @property
+    def zoho_scout(self) -> ZohoDataScout:
+        """Shared ZohoDataScout."""
+        return self._get(
+            "zoho_scout",
+            lambda: ZohoDataScout(zoho_manager=self.zoho_manager, config=self.scout_config)
+        )
+
+    @property
+    def memory_analyst(self) -> MemoryAnalyst:
+        """Shared MemoryAnalyst (one Anthropic client for all sessions)."""
+        return self._get(
+            "memory_analyst",
+            lambda: MemoryAnalyst(
+                memory_service=self.memory_service,
+                cognee_client=self.cognee_client,
+                api_key=self.api_key or os.getenv("ANTHROPIC_API_KEY"),
+                model=self.memory_model
+            )
+        )
+
+    @property
+    def recommendation_author(self) -> RecommendationAuthor:
+        """Shared RecommendationAuthor (its SDK client is kept once created)."""
+        return self._get("recommendation_author", RecommendationAuthor)
+
+    @property
+    def intent_engine(self) -> IntentDetectionEngine:
+        """Shared intent engine (compiled matcher and result cache)."""
+        return self._get(
+            "intent_engine",
+            lambda: IntentDetectionEngine(confidence_threshold=0.5, verbose_signals=False)
+        )
+
+    # ------------------------------------------------------------------
+    # Per-session state
+    # ------------------------------------------------------------------
+
+    def create_session(self, session_id: Optional[str] = None) -> AgentSession:
+        """Hand out lightweight per-session state.
+
+        Args:
+            session_id: Session identifier (generated if None)
+
+        Returns:
+            AgentSession with its own event emitter
+        """
+        session_id = session_id or f"session_{uuid.uuid4().hex[:8]}"
+        self._sessions_created += 1
+        return AgentSession(
+            session_id=session_id,
+            emitter=AGUIEventEmitter(session_id=session_id)
+        )
+
+    def create_orchestrator(
+        self,
+        session_id: str,
+        with_specialists: bool = True
+    ) -> OrchestratorAgent:
+        """Build a session's orchestrator on top of the pooled agents.
+
+        The orchestrator gets no recommendation author, as before pooling,
+        so it keeps producing its placeholder recommendations; the pooled
+        author serves the recommendation author node.
+
+        Args:
+            session_id: Session identifier
+            with_specialists: Wire the pooled Zoho scout and memory analyst
+                (False for general conversation only)
+
+        Returns:
+            OrchestratorAgent holding only per-session state
+        """
+        self._sessions_created += 1
+        return OrchestratorAgent(
+            session_id=session_id,
+            zoho_scout=self.zoho_scout if with_specialists else None,
+            memory_analyst=self.memory_analyst if with_specialists else None,
+            approval_manager=self.approval_manager,
+            recommendation_author=None,
+            analysis_cache=self.analysis_cache,
+            intent_engine=self.intent_engine
+        )
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def warm(self) -> Dict[str, bool]:
+        """Build the pooled agents ahead of the first request.
+
+        Components whose configuration is missing are skipped (and built,
+        or fail, on first use as before).
+
+        Returns:
+            Component name -> whether it is ready
+        """
+        components = {
+            "intent_engine": lambda: self.intent_engine,
+            "recommendation_author": self._warm_recommendation_author,
+            "zoho_scout": lambda: self.zoho_scout,
+            "memory_analyst": lambda: self.memory_analyst,
+        }
+
+        ready = {}
+        for name, build in components.items():
+            try:
+                build()
+                ready[name] = True
+            except Exception as e:
+                ready[name] = False
+                self.logger.warning("agent_pool_warm_skipped", component=name, error=str(e))
+
+        self.logger.info("agent_pool_warmed", **ready)
+        return ready
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics.
+
+        Returns:
+            Built components with their one-off build time, and sessions served
+        """
+        return {
+            "components": sorted(self._instances),
+            "build_ms": dict(self._build_ms),
+            "sessions_created": self._sessions_created
+        }
+
+    async def aclose(self) -> None:
+        """Close pooled clients."""
+        cognee_client = self._instances.get("cognee_client")
+        if cognee_client is not None:
+            await cognee_client.close()
+        self._instances.clear()
+        self.logger.info("agent_pool_closed")
+
+    def _warm_recommendation_author(self) -> None:
+        """Build the author and its SDK client when an API key is configured."""
+        author = self.recommendation_author
+        if author.client is None and os.getenv("ANTHROPIC_API_KEY"):
+            author._initialize_client()
+
+    def _get(self, name: str, build: Callable[[], Any]) -> Any:
+        """Return a pooled instance, building it on first use."""
+        instance = self._instances.get(name)
+        if instance is None:
+            start_time = time.perf_counter()
+            instance = build()
+            self._instances[name] = instance
+            self._build_ms[name] = (time.perf_counter() - start_time) * 1000
+            self.logger.info(
+                "agent_pool_component_built",
+                component=name,
+                build_ms=round(self._build_ms[name], 2)
+            )
+        return instance
+
+
+_agent_pool: Optional[AgentPool] = None
+
+
+def get_agent_pool() -> AgentPool:
+    """Get the process-wide agent pool."""
+    global _agent_pool
+    if _agent_pool is None:
+        _agent_pool = AgentPool()
+    return _agent_pool
+
+
+async def close_agent_pool() -> None:
+    """Close the process-wide agent pool at shutdown."""
+    global _agent_pool
+    if _agent_pool is not None:
+        await _agent_pool.aclose()
+        _agent_pool = None
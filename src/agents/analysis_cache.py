@@ -0,0 +1,218 @@
+"""Account analysis result cache for repeated orchestrator queries.
+
+Follow-up chat turns about the same account reuse the previous scout
+snapshot, historical context and recommendations instead of re-running the
+whole agent chain, as long as the account has not changed in Zoho.
+
+Two tiers:
+- Session tier: small per-session map, so a conversation keeps its own
+  analyses even when the global tier evicts them
+- Global tier: process-wide LRU shared across sessions
+
+Entries are versioned by the account's Zoho ``Modified_Time`` (or record
+checksum) and expire after ``ttl_seconds``, which bounds how stale the
+Cognee-derived parts of an analysis can get.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+# Cache key: (account_id, workflow)
+AnalysisKey = Tuple[str, str]
+
+
+@dataclass
+class CachedAnalysis:
+    """Result of one account analysis run."""
+
+    account_id: str
+    workflow: str
+    version: str
+    account_snapshot: Any
+    historical_context: Any
+    recommendations: List[Dict[str, Any]] = field(default_factory=list)
+    cached_at: float = field(default_factory=time.monotonic)
+
+
+class AccountAnalysisCache:
+    """Two-tier (session, global) cache of account analysis results.
+
+    Example:
+        >>> cache = AccountAnalysisCache(ttl_seconds=900)
+        >>> cache.put(CachedAnalysis("ACC-1", "account_analysis", version, snapshot, history), session_id)
+        >>> cache.get("ACC-1", "account_analysis", version, session_id)
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 900,
+        max_entries: int = 1000,
+        max_session_entries: int = 20,
+        max_sessions: int = 500
+    ):
+        """Initialize cache.
+
+        Args:
+            ttl_seconds: Maximum age of a cached analysis
+            max_entries: Global tier capacity (least recently used evicted)
+            max_session_entries: Per-session tier capacity
+            max_sessions: Sessions tracked (least recently active dropped)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_session_entries = max_session_entries
+        self.max_sessions = max_sessions
+        self.logger = logger.bind(component="analysis_cache")
+
+        self._global: "OrderedDict[AnalysisKey, CachedAnalysis]" = OrderedDict()
+        self._sessions: "OrderedDict[str, OrderedDict[AnalysisKey, CachedAnalysis]]" = OrderedDict()
+
+        self._stats = {
+            "session_hits": 0,
+            "global_hits": 0,
+            "misses": 0,
+            "stale": 0,
+        }
+
+    def get(
+        self,
+        account_id: str,
+        workflow: str,
+        version: str,
+        session_id: Optional[str] = None
+    ) -> Optional[CachedAnalysis]:
+        """Get a cached analysis if it matches the account's current version.
+
+        Args:
+            account_id: Account identifier
+            workflow: Workflow the analysis ran
+            version: Current account version
+            session_id: Session to check first
+
+        Returns:
+            Cached analysis, or None on miss or if stale
+        """
+        key = (account_id, workflow)
+        session = self._sessions.get(session_id) if session_id else None
+
+        if session is not None:
+            entry = self._fresh(session, key, version)
+            if entry is not None:
+                session.move_to_end(key)
+                self._stats["session_hits"] += 1
+                return entry
+
+        entry = self._fresh(self._global, key, version)
+        if entry is None:
+            self._stats["misses"] += 1
+            return None
+
+        self._global.move_to_end(key)
+        self._stats["global_hits"] += 1
+        if session_id:
+            self._put_session(session_id, key, entry)
+        return entry
+
+    def put(self, entry: CachedAnalysis, session_id: Optional[str] = None) -> None:
+        """Store an analysis in the global tier (and the session's tier).
+
+        Args:
+            entry: Completed analysis
+            session_id: Session that produced it
+        """
+        key = (entry.account_id, entry.workflow)
+
+        self._global[key] = entry
+        self._global.move_to_end(key)
+        while len(self._global) > self.max_entries:
+            self._global.popitem(last=False)
+
+        if session_id:
+            self._put_session(session_id, key, entry)
+
+    def invalidate(self, account_id: str) -> None:
+        """Drop every cached analysis of an account.
+
+        Args:
+            account_id: Account identifier
+        """
+        for tier in (self._global, *self._sessions.values()):
+            for key in [k for k in tier if k[0] == account_id]:
+                del tier[key]
+
+        self.logger.debug("analysis_invalidated", account_id=account_id)
+
+    def clear_session(self, session_id: str) -> None:
+        """Drop a session's tier (global entries are kept).
+
+        Args:
+            session_id: Session identifier
+        """
+        self._sessions.pop(session_id, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters.
+
+        Returns:
+            Stats dict with hit rate
+        """
+        hits = self._stats["session_hits"] + self._stats["global_hits"]
+        lookups = hits + self._stats["misses"]
+        return {
+            **self._stats,
+            "entries": len(self._global),
+            "sessions": len(self._sessions),
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+        }
+
+    def _fresh(
+        self,
+        tier: "OrderedDict[AnalysisKey, CachedAnalysis]",
+        key: AnalysisKey,
+        version: str
+    ) -> Optional[CachedAnalysis]:
+        """Return the tier's entry if current, evicting it if stale."""
+        entry = tier.get(key)
+        if entry is None:
+            return None
+
+        if entry.version != version or time.monotonic() - entry.cached_at > self.ttl_seconds:
+            del tier[key]
+            self._stats["stale"] += 1
+            return None
+
+        return entry
+
+    def _put_session(
+        self,
+        session_id: str,
+        key: AnalysisKey,
+        entry: CachedAnalysis
+    ) -> None:
+        session = self._sessions.setdefault(session_id, OrderedDict())
+        self._sessions.move_to_end(session_id)
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+
+        session[key] = entry
+        session.move_to_end(key)
+        while len(session) > self.max_session_entries:
+            session.popitem(last=False)
+
+
+_shared_cache: Optional[AccountAnalysisCache] = None
+
+
+def get_analysis_cache() -> AccountAnalysisCache:
+    """Get the process-wide analysis cache shared by orchestrators."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = AccountAnalysisCache()
+    return _shared_cache
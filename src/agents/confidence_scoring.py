@@ -4,8 +4,10 @@ This module implements confidence scoring logic based on data recency,
 pattern strength, evidence quality, and historical accuracy.
 """
 
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
+import numpy as np
 import structlog
 
 from .recommendation_models import (
@@ -18,6 +20,153 @@ from .recommendation_models import (
 logger = structlog.get_logger()
 
 
+COMPONENT_WEIGHTS = {
+    "data_recency": 0.25,
+    "pattern_strength": 0.25,
+    "evidence_quality": 0.30,
+    "historical_accuracy": 0.20
+}
+
+# Level codes used by ConfidenceBatch.level_codes
+_LEVELS = (ConfidenceLevel.LOW, ConfidenceLevel.MEDIUM, ConfidenceLevel.HIGH)
+
+
+@dataclass
+class ConfidenceFeatures:
+    """Scoring inputs for N recommendations as arrays.
+
+    References are stored flat: ``reference_age_days`` holds the ages of
+    every item's references back to back and ``reference_counts[i]`` says
+    how many belong to item ``i``. Items without a pattern have
+    ``has_pattern`` False; items without matching history have
+    ``history_total`` 0.
+    """
+
+    reference_age_days: np.ndarray
+    reference_counts: np.ndarray
+    unique_sources: np.ndarray
+    unique_source_types: np.ndarray
+    has_pattern: np.ndarray
+    pattern_occurrences: np.ndarray
+    pattern_consistency: np.ndarray
+    pattern_confidence: np.ndarray
+    history_total: np.ndarray
+    history_successful: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.reference_counts)
+
+    @classmethod
+    def from_inputs(
+        cls,
+        data_references: Sequence[List[DataReference]],
+        patterns: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+        past_recommendations: Optional[List[Dict[str, Any]]] = None,
+        recommendation_types: Optional[Sequence[Optional[str]]] = None,
+        current_time: Optional[datetime] = None
+    ) -> "ConfidenceFeatures":
+        """Extract features from the inputs ``calculate_confidence_score`` takes.
+
+        Args:
+            data_references: Data references per recommendation
+            patterns: Pattern per recommendation (None for no pattern)
+            past_recommendations: Historical recommendations shared by the
+                batch (outcome counts are tallied once per type)
+            recommendation_types: Type per recommendation for history matching
+            current_time: Reference time for reference ages (defaults to now)
+
+        Returns:
+            Feature arrays
+        """
+        if current_time is None:
+            current_time = datetime.utcnow()
+        n = len(data_references)
+        patterns = patterns if patterns is not None else [None] * n
+        recommendation_types = (
+            recommendation_types if recommendation_types is not None else [None] * n
+        )
+
+        ages = [
+            (current_time - ref.timestamp).total_seconds() / 86400
+            for refs in data_references for ref in refs
+        ]
+
+        history: Dict[str, List[int]] = {}
+        for rec in past_recommendations or []:
+            counts = history.setdefault(rec.get("type"), [0, 0])
+            counts[0] += 1
+            if rec.get("outcome") == "successful" or rec.get("status") == "approved":
+                counts[1] += 1
+        item_history = [
+            history.get(rec_type, [0, 0]) if past_recommendations and rec_type else [0, 0]
+            for rec_type in recommendation_types
+        ]
+
+        return cls(
+            reference_age_days=np.asarray(ages, dtype=np.float64),
+            reference_counts=np.fromiter((len(refs) for refs in data_references), np.int64, n),
+            unique_sources=np.fromiter(
+                (len({ref.source_id for ref in refs}) for refs in data_references), np.int64, n
+            ),
+            unique_source_types=np.fromiter(
+                (len({ref.source_type for ref in refs}) for refs in data_references), np.int64, n
+            ),
+            has_pattern=np.fromiter((bool(p) for p in patterns), bool, n),
+            pattern_occurrences=np.fromiter(
+                ((p or {}).get("occurrences", 0) for p in patterns), np.float64, n
+            ),
+            pattern_consistency=np.fromiter(
+                ((p or {}).get("consistency", 0.0) for p in patterns), np.float64, n
+            ),
+            pattern_confidence=np.fromiter(
+                ((p or {}).get("confidence", 0.5) for p in patterns), np.float64, n
+            ),
+            history_total=np.fromiter((h[0] for h in item_history), np.int64, n),
+            history_successful=np.fromiter((h[1] for h in item_history), np.int64, n),
+        )
+
+
+@dataclass
+class ConfidenceBatch:
+    """Confidence scores for N recommendations.
+
+    ``passed`` marks items meeting the minimum confidence; only those have
+    a rationale.
+    """
+
+    data_recency: np.ndarray
+    pattern_strength: np.ndarray
+    evidence_quality: np.ndarray
+    historical_accuracy: np.ndarray
+    overall: np.ndarray
+    level_codes: np.ndarray
+    passed: np.ndarray
+    rationales: List[Optional[str]]
+
+    def __len__(self) -> int:
+        return len(self.overall)
+
+    @property
+    def levels(self) -> List[ConfidenceLevel]:
+        """Confidence level per item."""
+        return [_LEVELS[code] for code in self.level_codes.tolist()]
+
+    def to_confidence_scores(self) -> List[Optional[ConfidenceScore]]:
+        """Build ConfidenceScore objects for passing items (None otherwise)."""
+        return [
+            ConfidenceScore(
+                overall=float(self.overall[i]),
+                level=_LEVELS[int(self.level_codes[i])],
+                data_recency=float(self.data_recency[i]),
+                pattern_strength=float(self.pattern_strength[i]),
+                evidence_quality=float(self.evidence_quality[i]),
+                historical_accuracy=float(self.historical_accuracy[i]),
+                rationale=self.rationales[i]
+            ) if self.passed[i] else None
+            for i in range(len(self))
+        ]
+
+
 class ConfidenceScorer:
     """Calculates confidence scores for recommendations."""
 
@@ -223,17 +372,10 @@ class ConfidenceScorer:
             ConfidenceLevel enum value
         """
         # Calculate weighted average
-        weights = {
-            "data_recency": 0.25,
-            "pattern_strength": 0.25,
-            "evidence_quality": 0.30,
-            "historical_accuracy": 0.20
-        }
-
         total_weight = 0.0
         weighted_sum = 0.0
 
-        for key, weight in weights.items():
+        for key, weight in COMPONENT_WEIGHTS.items():
             if key in scores and scores[key] is not None:
                 weighted_sum += scores[key] * weight
                 total_weight += weight
@@ -305,16 +447,9 @@ class ConfidenceScorer:
         level = self.assign_overall_confidence(scores)
 
         # Determine overall score
-        weights = {
-            "data_recency": 0.25,
-            "pattern_strength": 0.25,
-            "evidence_quality": 0.30,
-            "historical_accuracy": 0.20
-        }
-
         overall = sum(
-            scores[key] * weights[key]
-            for key in weights.keys()
+            scores[key] * weight
+            for key, weight in COMPONENT_WEIGHTS.items()
         )
 
         # Generate rationale
@@ -393,6 +528,123 @@ class ConfidenceScorer:
 
         return " ".join(parts)
 
+    def calculate_confidence_scores_batch(
+        self,
+        features: ConfidenceFeatures,
+        min_threshold: float = 0.5
+    ) -> ConfidenceBatch:
+        """Score many recommendations at once.
+
+        Computes the same sub-scores, overall score and level as
+        ``calculate_confidence_score`` with array arithmetic, and builds
+        rationale text only for items that pass
+        ``validate_minimum_confidence`` at ``min_threshold``.
+
+        Args:
+            features: Feature arrays (see ``ConfidenceFeatures.from_inputs``)
+            min_threshold: Minimum acceptable overall confidence
+
+        Returns:
+            Batch of scores
+        """
+        n = len(features)
+        counts = features.reference_counts
+        has_refs = counts > 0
+        # Segment start of each item's references (empty items are masked)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.int64)
+
+        # Data recency: mean exponential decay per item, future data is fresh
+        ages = features.reference_age_days
+        decay = np.where(ages < 0, 1.0, np.exp2(-np.maximum(ages, 0) / self.recency_half_life_days))
+        recency_sums = np.zeros(n)
+        if decay.size:
+            recency_sums[has_refs] = np.add.reduceat(decay, starts[has_refs])
+        data_recency = np.divide(recency_sums, counts, out=np.zeros(n), where=has_refs)
+
+        # Pattern strength: log-scaled occurrences, consistency, confidence
+        saturation = self.min_pattern_occurrences * 3
+        occurrences = features.pattern_occurrences
+        occurrence_score = np.where(
+            occurrences >= saturation,
+            1.0,
+            np.minimum(1.0, np.log(np.maximum(occurrences, 0) + 1) / np.log(saturation + 1))
+        )
+        occurrence_score = np.where(occurrences == 0, 0.0, occurrence_score)
+        pattern_strength = np.where(
+            features.has_pattern,
+            np.clip(
+                occurrence_score * 0.4 +
+                features.pattern_consistency * 0.3 +
+                features.pattern_confidence * 0.3,
+                0.0, 1.0
+            ),
+            0.5
+        )
+
+        # Evidence quality: source count, diversity, reference recency
+        evidence_quality = np.where(
+            has_refs,
+            np.clip(
+                np.minimum(1.0, features.unique_sources / self.min_evidence_sources) * 0.4 +
+                np.minimum(1.0, features.unique_source_types / 3.0) * 0.2 +
+                data_recency * 0.4,
+                0.0, 1.0
+            ),
+            0.0
+        )
+
+        # Historical accuracy: success rate, Wilson lower bound under 5 samples
+        total = features.history_total.astype(np.float64)
+        has_history = total > 0
+        safe_total = np.where(has_history, total, 1.0)
+        rate = features.history_successful / safe_total
+        z = 1.645
+        denominator = 1 + z**2 / safe_total
+        center = (rate + z**2 / (2 * safe_total)) / denominator
+        adjustment = z * np.sqrt((rate * (1 - rate) + z**2 / (4 * safe_total)) / safe_total) / denominator
+        wilson = np.maximum(0.0, center - adjustment)
+        historical_accuracy = np.where(
+            has_history, np.where(total < 5, wilson, rate), 0.5
+        )
+
+        overall = (
+            data_recency * COMPONENT_WEIGHTS["data_recency"] +
+            pattern_strength * COMPONENT_WEIGHTS["pattern_strength"] +
+            evidence_quality * COMPONENT_WEIGHTS["evidence_quality"] +
+            historical_accuracy * COMPONENT_WEIGHTS["historical_accuracy"]
+        )
+        level_codes = (overall >= 0.6).astype(np.int8) + (overall >= 0.8)
+        passed = overall >= min_threshold
+
+        rationales: List[Optional[str]] = [None] * n
+        for i in np.flatnonzero(passed).tolist():
+            rationales[i] = self._generate_rationale(
+                {
+                    "data_recency": data_recency[i],
+                    "pattern_strength": pattern_strength[i],
+                    "evidence_quality": evidence_quality[i],
+                    "historical_accuracy": historical_accuracy[i],
+                },
+                _LEVELS[level_codes[i]]
+            )
+
+        self.logger.debug(
+            "confidence_batch_scored",
+            count=n,
+            passed=int(passed.sum())
+        )
+
+        return ConfidenceBatch(
+            data_recency=data_recency,
+            pattern_strength=pattern_strength,
+            evidence_quality=evidence_quality,
+            historical_accuracy=historical_accuracy,
+            overall=overall,
+            level_codes=level_codes,
+            passed=passed,
+            rationales=rationales
+        )
+
 
 def create_threshold_config() -> Dict[str, Any]:
     """Create default threshold configuration for confidence scoring.
@@ -409,12 +661,7 @@ def create_threshold_config() -> Dict[str, Any]:
             "medium": 0.6,
             "low": 0.5
         },
-        "weights": {
-            "data_recency": 0.25,
-            "pattern_strength": 0.25,
-            "evidence_quality": 0.30,
-            "historical_accuracy": 0.20
-        }
+        "weights": dict(COMPONENT_WEIGHTS)
     }
 
 
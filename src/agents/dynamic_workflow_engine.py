@@ -14,14 +14,15 @@ Features:
 """
 
 import asyncio
+import heapq
 import uuid
 import time
 import traceback
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Set, Tuple, Callable, Union
+from typing import Dict, Any, AsyncGenerator, List, Optional, Set, Tuple, Callable, Union
 from enum import Enum
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import defaultdict, deque
 import structlog
 
 from src.agents.intent_detection import IntentDetectionEngine, IntentResult
@@ -30,6 +31,10 @@ from src.events.ag_ui_emitter import AGUIEventEmitter
 logger = structlog.get_logger(__name__)
 
 
+# Weight of the latest observed duration in learned step estimates
+DURATION_SMOOTHING = 0.3
+
+
 class WorkflowState(str, Enum):
     """Workflow execution states."""
     PENDING = "pending"
@@ -239,6 +244,11 @@ class Workflow:
     context: Dict[str, Any] = field(default_factory=dict)
     shared_data: Dict[str, Any] = field(default_factory=dict)
 
+    # Step lookup index (rebuilt when steps change)
+    _step_index: Dict[str, WorkflowStep] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
         """Validate workflow configuration."""
         if not self.workflow_id:
@@ -264,10 +274,24 @@ class Workflow:
         Returns:
             WorkflowStep if found, None otherwise
         """
+        step = self._step_index.get(step_id)
+        if step is None or step.step_id != step_id or len(self._step_index) != len(self.steps):
+            self._step_index = {step.step_id: step for step in self.steps}
+            step = self._step_index.get(step_id)
+        return step
+
+    def get_dependency_graph(self) -> Tuple[Dict[str, int], Dict[str, List[WorkflowStep]]]:
+        """Build dependency counters for topological scheduling.
+
+        Returns:
+            Tuple of (step ID -> number of dependencies, step ID -> dependent steps)
+        """
+        indegree = {step.step_id: len(step.dependencies) for step in self.steps}
+        dependents: Dict[str, List[WorkflowStep]] = defaultdict(list)
         for step in self.steps:
-            if step.step_id == step_id:
-                return step
-        return None
+            for dep_id in step.dependencies:
+                dependents[dep_id].append(step)
+        return indegree, dependents
 
     def get_ready_steps(self) -> List[WorkflowStep]:
         """Get steps ready for execution.
@@ -298,40 +322,45 @@ class Workflow:
         if self.execution_mode == ExecutionMode.SEQUENTIAL:
             return [[step] for step in self.steps]
 
+        # Kahn's algorithm, one layer per group
+        order = {step.step_id: index for index, step in enumerate(self.steps)}
+        indegree, dependents = self.get_dependency_graph()
+
         groups = []
-        remaining_steps = self.steps.copy()
+        grouped: Set[str] = set()
+        layer = [
+            step for step in self.steps
+            if step.state == WorkflowState.PENDING and indegree[step.step_id] == 0
+        ]
 
-        while remaining_steps:
+        while layer:
             current_group = []
-            completed_steps = set()
-
-            # Add steps from previous groups to completed set
-            for group in groups:
-                for step in group:
-                    completed_steps.add(step.step_id)
-
-            # Find steps that can run in parallel
-            for step in remaining_steps[:]:
-                if step.state == WorkflowState.PENDING and step.is_ready(completed_steps):
-                    can_add = True
-
-                    # Check compatibility with current group
-                    for group_step in current_group:
-                        if not step.can_run_in_parallel(group_step):
-                            can_add = False
-                            break
-
-                    if can_add:
-                        current_group.append(step)
-                        remaining_steps.remove(step)
-
-            if current_group:
-                groups.append(current_group)
-            else:
-                # No progress - add remaining steps sequentially
-                for step in remaining_steps:
-                    groups.append([step])
-                break
+            next_layer = []
+            has_exclusive = False
+
+            # At most one exclusive step per group, the rest wait a layer
+            for step in layer:
+                if step.resource_requirements.get("exclusive", False):
+                    if has_exclusive:
+                        next_layer.append(step)
+                        continue
+                    has_exclusive = True
+                current_group.append(step)
+
+            groups.append(current_group)
+
+            for step in current_group:
+                grouped.add(step.step_id)
+                for dependent in dependents[step.step_id]:
+                    indegree[dependent.step_id] -= 1
+                    if indegree[dependent.step_id] == 0 and dependent.state == WorkflowState.PENDING:
+                        next_layer.append(dependent)
+
+            next_layer.sort(key=lambda s: order[s.step_id])
+            layer = next_layer
+
+        # No progress - add remaining steps sequentially
+        groups.extend([step] for step in self.steps if step.step_id not in grouped)
 
         return groups
 
@@ -352,49 +381,86 @@ class Workflow:
 
         return completed_steps / total_steps
 
+    def get_topological_order(self) -> List[WorkflowStep]:
+        """Order steps so every step comes after its dependencies.
+
+        Returns:
+            Steps in dependency order (steps caught in a cycle are left out)
+        """
+        indegree, dependents = self.get_dependency_graph()
+        queue = deque(step for step in self.steps if indegree[step.step_id] == 0)
+
+        order = []
+        while queue:
+            step = queue.popleft()
+            order.append(step)
+            for dependent in dependents[step.step_id]:
+                indegree[dependent.step_id] -= 1
+                if indegree[dependent.step_id] == 0:
+                    queue.append(dependent)
+
+        return order
+
     def get_critical_path(self) -> List[WorkflowStep]:
         """Calculate critical path of workflow.
 
         Returns:
             List of steps on the critical path
         """
-        # Build dependency graph
-        graph = {step.step_id: step.dependencies for step in self.steps}
-
-        # Calculate longest path using dynamic programming
-        def longest_path(step_id: str, memo: Dict[str, Tuple[float, List[str]]]) -> Tuple[float, List[str]]:
-            if step_id in memo:
-                return memo[step_id]
-
-            step = self.get_step_by_id(step_id)
-            if not step:
-                return 0.0, []
+        # Longest path ending at each step, in dependency order
+        path_duration: Dict[str, float] = {}
+        previous_step: Dict[str, Optional[str]] = {}
 
+        for step in self.get_topological_order():
             max_duration = 0.0
-            best_path = []
+            best_dep = None
 
             for dep_id in step.dependencies:
-                duration, path = longest_path(dep_id, memo)
+                duration = path_duration.get(dep_id, 0.0)
                 if duration > max_duration:
                     max_duration = duration
-                    best_path = path
+                    best_dep = dep_id
 
-            total_duration = max_duration + step.estimated_duration
-            memo[step_id] = (total_duration, best_path + [step_id])
-            return memo[step_id]
+            path_duration[step.step_id] = max_duration + step.estimated_duration
+            previous_step[step.step_id] = best_dep
 
         # Find longest path from any step
-        memo = {}
         max_total_duration = 0.0
-        critical_path_ids = []
+        last_step_id = None
 
         for step in self.steps:
-            duration, path = longest_path(step.step_id, memo)
+            duration = path_duration.get(step.step_id, 0.0)
             if duration > max_total_duration:
                 max_total_duration = duration
-                critical_path_ids = path
+                last_step_id = step.step_id
+
+        critical_path_ids = []
+        while last_step_id is not None:
+            critical_path_ids.append(last_step_id)
+            last_step_id = previous_step[last_step_id]
+
+        return [self.get_step_by_id(step_id) for step_id in reversed(critical_path_ids)]
+
+    def get_critical_path_lengths(self) -> Dict[str, float]:
+        """Calculate each step's remaining critical-path length.
+
+        The remaining length of a step is its estimated duration plus the
+        longest chain of estimated durations through its dependents, i.e. the
+        least time the workflow still needs once the step starts.
+
+        Returns:
+            Step ID -> remaining critical-path length
+        """
+        _, dependents = self.get_dependency_graph()
+        lengths: Dict[str, float] = {}
+
+        for step in reversed(self.get_topological_order()):
+            lengths[step.step_id] = step.estimated_duration + max(
+                (lengths.get(dependent.step_id, 0.0) for dependent in dependents[step.step_id]),
+                default=0.0
+            )
 
-        return [self.get_step_by_id(step_id) for step_id in critical_path_ids]
+        return lengths
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert workflow to dictionary representation.
@@ -420,6 +486,163 @@ class Workflow:
         }
 
 
+class StepScheduler:
+    """Topological scheduler for a workflow's pending steps.
+
+    Each step keeps a counter of unfinished dependencies. Finishing a step
+    decrements its dependents' counters and hands back the ones that reach
+    zero, so steps can be launched as soon as their dependencies are done
+    instead of waiting for a whole layer. Queued steps are popped by priority
+    boost, then remaining critical-path length (longest first), then
+    definition order. Steps never exceed their capability's concurrency pool,
+    and steps with an exclusive resource requirement never run alongside
+    each other.
+
+    Example:
+        >>> scheduler = StepScheduler(workflow, {AgentCapability.ANALYSIS: 2})
+        >>> scheduler.push(scheduler.start())
+        >>> step = scheduler.pop()
+        >>> scheduler.push(scheduler.complete(step))
+    """
+
+    def __init__(
+        self,
+        workflow: Workflow,
+        capability_limits: Optional[Dict[AgentCapability, int]] = None
+    ):
+        """Build dependency counters and priorities for the workflow.
+
+        Args:
+            workflow: Workflow to schedule (completed steps count as satisfied)
+            capability_limits: Maximum concurrently running steps per capability
+                (capabilities not listed are unlimited)
+        """
+        self._order = {step.step_id: index for index, step in enumerate(workflow.steps)}
+        self._indegree, self._dependents = workflow.get_dependency_graph()
+        self._path_lengths = workflow.get_critical_path_lengths()
+        self._capability_limits = {
+            AgentCapability(capability): max(1, limit)
+            for capability, limit in (capability_limits or {}).items()
+        }
+        self._ready: Dict[Tuple[AgentCapability, bool], List[Tuple[float, float, int, WorkflowStep]]] = defaultdict(list)
+        self._running: Dict[AgentCapability, int] = defaultdict(int)
+        self._exclusive_running = False
+
+        for step in workflow.steps:
+            if step.state == WorkflowState.COMPLETED:
+                for dependent in self._dependents[step.step_id]:
+                    self._indegree[dependent.step_id] -= 1
+
+        self._initial = [
+            step for step in workflow.steps
+            if step.state == WorkflowState.PENDING and self._indegree[step.step_id] == 0
+        ]
+
+    def start(self) -> List[WorkflowStep]:
+        """Get the steps that are ready before anything runs.
+
+        Returns:
+            Ready steps (not yet queued)
+        """
+        initial, self._initial = self._initial, []
+        return initial
+
+    def push(self, steps: List[WorkflowStep]) -> None:
+        """Queue ready steps.
+
+        Args:
+            steps: Steps whose dependencies are satisfied
+        """
+        for step in steps:
+            path_length = self._path_lengths.get(step.step_id, step.estimated_duration)
+            entry = (-step.priority_boost, -path_length, self._order[step.step_id], step)
+            heapq.heappush(self._ready[self._pool_key(step)], entry)
+
+    def pop(self) -> Optional[WorkflowStep]:
+        """Take the highest-priority queued step that can start now.
+
+        Returns:
+            Next step to launch, or None if nothing can start
+        """
+        best_queue = None
+        for (capability, exclusive), queue in self._ready.items():
+            if not queue:
+                continue
+            if exclusive and self._exclusive_running:
+                continue
+            limit = self._capability_limits.get(capability)
+            if limit is not None and self._running[capability] >= limit:
+                continue
+            if best_queue is None or queue[0] < best_queue[0]:
+                best_queue = queue
+
+        if best_queue is None:
+            return None
+
+        step = heapq.heappop(best_queue)[-1]
+        self._running[step.agent_capability] += 1
+        if step.resource_requirements.get("exclusive", False):
+            self._exclusive_running = True
+        return step
+
+    def complete(self, step: WorkflowStep) -> List[WorkflowStep]:
+        """Record a finished step.
+
+        Args:
+            step: Step that completed
+
+        Returns:
+            Dependents that became ready (not yet queued)
+        """
+        self._release(step)
+
+        ready = []
+        for dependent in self._dependents[step.step_id]:
+            self._indegree[dependent.step_id] -= 1
+            if self._indegree[dependent.step_id] == 0 and dependent.state == WorkflowState.PENDING:
+                ready.append(dependent)
+        return ready
+
+    def fail(self, step: WorkflowStep) -> List[WorkflowStep]:
+        """Record a failed step.
+
+        Args:
+            step: Step that failed
+
+        Returns:
+            Pending steps that depend on it, directly or transitively, and can
+            no longer run
+        """
+        self._release(step)
+
+        blocked = []
+        seen = {step.step_id}
+        stack = list(self._dependents[step.step_id])
+        while stack:
+            dependent = stack.pop()
+            if dependent.step_id in seen:
+                continue
+            seen.add(dependent.step_id)
+            if dependent.state == WorkflowState.PENDING:
+                blocked.append(dependent)
+            stack.extend(self._dependents[dependent.step_id])
+        return blocked
+
+    def has_ready(self) -> bool:
+        """Check whether any steps are queued."""
+        return any(self._ready.values())
+
+    def _pool_key(self, step: WorkflowStep) -> Tuple[AgentCapability, bool]:
+        """Ready queue for a step: its capability and whether it is exclusive."""
+        return step.agent_capability, bool(step.resource_requirements.get("exclusive", False))
+
+    def _release(self, step: WorkflowStep) -> None:
+        """Free the pool slots held by a finished step."""
+        self._running[step.agent_capability] -= 1
+        if step.resource_requirements.get("exclusive", False):
+            self._exclusive_running = False
+
+
 class DynamicWorkflowEngine:
     """Advanced workflow engine with adaptive agent coordination.
 
@@ -439,7 +662,8 @@ class DynamicWorkflowEngine:
         max_concurrent_workflows: int = 10,
         default_timeout: int = 3600,
         enable_adaptation: bool = True,
-        enable_monitoring: bool = True
+        enable_monitoring: bool = True,
+        capability_limits: Optional[Dict[AgentCapability, int]] = None
     ):
         """Initialize dynamic workflow engine.
 
@@ -450,9 +674,11 @@ class DynamicWorkflowEngine:
             default_timeout: Default workflow timeout in seconds
             enable_adaptation: Enable adaptive routing and optimization
             enable_monitoring: Enable performance monitoring
+            capability_limits: Concurrency pool per capability (defaults to the
+                combined max_concurrent_tasks of the agents providing it)
         """
         self.engine_id = f"workflow_engine_{uuid.uuid4().hex[:8]}"
-        self.intent_engine = intent_engine or IntentDetectionEngine()
+        self.intent_engine = intent_engine or IntentDetectionEngine(verbose_signals=False)
         self.agent_registry = agent_registry or {}
 
         # Configuration
@@ -460,6 +686,10 @@ class DynamicWorkflowEngine:
         self.default_timeout = default_timeout
         self.enable_adaptation = enable_adaptation
         self.enable_monitoring = enable_monitoring
+        self.capability_limits = {
+            AgentCapability(capability): limit
+            for capability, limit in (capability_limits or {}).items()
+        }
 
         # Workflow tracking
         self.active_workflows: Dict[str, Workflow] = {}
@@ -475,6 +705,8 @@ class DynamicWorkflowEngine:
         self.agent_load: Dict[str, int] = defaultdict(int)
         self.agent_capabilities: Dict[str, Set[AgentCapability]] = defaultdict(set)
         self.execution_history: List[Dict[str, Any]] = []
+        self.duration_estimates: Dict[str, float] = {}
+        self._agent_released = asyncio.Condition()
 
         # Event handling
         self.event_emitters: Dict[str, AGUIEventEmitter] = {}
@@ -498,7 +730,9 @@ class DynamicWorkflowEngine:
         description: str,
         steps: List[Dict[str, Any]],
         priority: WorkflowPriority = WorkflowPriority.MEDIUM,
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        execution_mode: ExecutionMode = ExecutionMode.ADAPTIVE,
+        max_parallel_steps: int = 5
     ) -> Workflow:
         """Create a new workflow from step definitions.
 
@@ -508,6 +742,8 @@ class DynamicWorkflowEngine:
             steps: List of step definitions
             priority: Workflow priority
             context: Initial workflow context
+            execution_mode: How steps are executed
+            max_parallel_steps: Maximum steps running at once (parallel/adaptive modes)
 
         Returns:
             Created workflow instance
@@ -543,6 +779,8 @@ class DynamicWorkflowEngine:
             description=description,
             steps=workflow_steps,
             priority=priority,
+            execution_mode=execution_mode,
+            max_parallel_steps=max_parallel_steps,
             context=context or {}
         )
 
@@ -627,6 +865,12 @@ class DynamicWorkflowEngine:
                 1 for step in workflow.steps
                 if step.state == WorkflowState.COMPLETED
             ) / len(workflow.steps)
+            estimate_errors = [
+                abs(step.metrics["estimate_error"]) for step in workflow.steps
+                if "estimate_error" in step.metrics
+            ]
+            if estimate_errors:
+                workflow.metrics["mean_estimate_error"] = sum(estimate_errors) / len(estimate_errors)
 
             # Move to completed workflows
             self.completed_workflows[workflow.workflow_id] = workflow
@@ -698,13 +942,13 @@ class DynamicWorkflowEngine:
         """
         workflow.state = WorkflowState.RUNNING
 
-        for step in workflow.steps:
+        for step_number, step in enumerate(workflow.steps, start=1):
             workflow.current_step = step.step_id
 
             # Emit step started
             yield emitter.emit_agent_started(
                 agent=step.agent_type,
-                step=workflow.steps.index(step) + 1,
+                step=step_number,
                 task=step.name
             )
 
@@ -727,7 +971,7 @@ class DynamicWorkflowEngine:
                 # Emit step completed
                 yield emitter.emit_agent_completed(
                     agent=step.agent_type,
-                    step=workflow.steps.index(step) + 1,
+                    step=step_number,
                     output=result
                 )
 
@@ -755,7 +999,7 @@ class DynamicWorkflowEngine:
                     # Emit step error
                     yield emitter.emit_agent_error(
                         agent=step.agent_type,
-                        step=workflow.steps.index(step) + 1,
+                        step=step_number,
                         error_type="step_execution_error",
                         error_message=str(e)
                     )
@@ -785,34 +1029,8 @@ class DynamicWorkflowEngine:
         Yields:
             Execution events
         """
-        workflow.state = WorkflowState.RUNNING
-
-        # Get execution groups
-        execution_groups = workflow.get_execution_groups()
-
-        for group_idx, group in enumerate(execution_groups):
-            # Limit parallel execution
-            concurrent_steps = group[:workflow.max_parallel_steps]
-
-            # Create tasks for concurrent execution
-            tasks = []
-            for step in concurrent_steps:
-                task = asyncio.create_task(
-                    self._execute_step_async(step, workflow, emitter, group_idx)
-                )
-                tasks.append(task)
-
-            # Wait for all steps in group to complete
-            await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Check if any step failed
-            failed_steps = [
-                step for step in concurrent_steps
-                if step.state == WorkflowState.FAILED
-            ]
-
-            if failed_steps and not workflow.auto_retry:
-                raise RuntimeError(f"Parallel execution group {group_idx} failed")
+        async for event in self._execute_scheduled(workflow, emitter, adaptive=False):
+            yield event
 
     async def _execute_adaptive(
         self,
@@ -825,46 +1043,125 @@ class DynamicWorkflowEngine:
             workflow: Workflow to execute
             emitter: Event emitter for streaming
 
+        Yields:
+            Execution events
+        """
+        async for event in self._execute_scheduled(workflow, emitter, adaptive=True):
+            yield event
+
+    async def _execute_scheduled(
+        self,
+        workflow: Workflow,
+        emitter: AGUIEventEmitter,
+        adaptive: bool
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Execute workflow steps as soon as their dependencies complete.
+
+        Up to ``workflow.max_parallel_steps`` steps run at once; whenever one
+        finishes, its newly ready dependents are queued and the highest
+        priority queued steps are launched. Dependents of a failed step are
+        cancelled.
+
+        Args:
+            workflow: Workflow to execute
+            emitter: Event emitter for streaming
+            adaptive: Adapt newly ready steps and record performance metrics
+
         Yields:
             Execution events
         """
         workflow.state = WorkflowState.RUNNING
 
-        # Adaptive execution with real-time optimization
-        while True:
-            # Get ready steps
-            ready_steps = workflow.get_ready_steps()
+        scheduler = StepScheduler(workflow, self._get_capability_limits())
+        step_numbers = {step.step_id: index + 1 for index, step in enumerate(workflow.steps)}
+        max_workers = max(1, workflow.max_parallel_steps)
+        running: Dict[asyncio.Task, WorkflowStep] = {}
+        ready = scheduler.start()
 
-            if not ready_steps:
-                # Check if workflow is complete
-                if all(step.state in [WorkflowState.COMPLETED, WorkflowState.FAILED] for step in workflow.steps):
-                    break
-                else:
-                    # Wait for running steps to complete
-                    await asyncio.sleep(0.1)
-                    continue
+        try:
+            while True:
+                # Queue newly ready steps
+                if ready:
+                    if adaptive and self.enable_adaptation:
+                        await self._adapt_execution_strategy(workflow, ready)
+                    scheduler.push(ready)
+                    ready = []
+
+                # Fill free workers
+                while len(running) < max_workers:
+                    step = scheduler.pop()
+                    if step is None:
+                        break
+
+                    step.state = WorkflowState.RUNNING
+                    step.start_time = datetime.utcnow()
+                    workflow.current_step = step.step_id
+
+                    yield emitter.emit_agent_started(
+                        agent=step.agent_type,
+                        step=step_numbers[step.step_id],
+                        task=step.name
+                    )
 
-            # Select optimal execution strategy
-            if self.enable_adaptation:
-                await self._adapt_execution_strategy(workflow, ready_steps)
+                    running[asyncio.create_task(self._execute_step(step, workflow))] = step
 
-            # Execute ready steps in parallel (with limits)
-            concurrent_steps = ready_steps[:workflow.max_parallel_steps]
+                if not running:
+                    break
 
-            # Execute steps concurrently
-            tasks = []
-            for step in concurrent_steps:
-                task = asyncio.create_task(
-                    self._execute_step_async(step, workflow, emitter, 0)
-                )
-                tasks.append(task)
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    step = running.pop(task)
+                    step.end_time = datetime.utcnow()
+                    step.execution_time = (step.end_time - step.start_time).total_seconds()
+
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        step.state = WorkflowState.FAILED
+                        step.error = str(e)
+                        workflow.errors.append(f"Step {step.step_id} failed: {str(e)}")
+
+                        self.logger.error(
+                            "workflow_step_failed",
+                            workflow_id=workflow.workflow_id,
+                            step_id=step.step_id,
+                            error=str(e)
+                        )
+
+                        yield emitter.emit_agent_error(
+                            agent=step.agent_type,
+                            step=step_numbers[step.step_id],
+                            error_type="step_execution_error",
+                            error_message=str(e)
+                        )
+
+                        if not workflow.auto_retry:
+                            raise RuntimeError(f"Step {step.step_id} failed: {str(e)}") from e
+
+                        for blocked in scheduler.fail(step):
+                            blocked.state = WorkflowState.CANCELLED
+                            blocked.error = f"Dependency {step.step_id} failed"
+                        continue
+
+                    step.state = WorkflowState.COMPLETED
+                    step.result = result
+                    workflow.results[step.step_id] = result
+
+                    yield emitter.emit_agent_completed(
+                        agent=step.agent_type,
+                        step=step_numbers[step.step_id],
+                        output=result
+                    )
 
-            # Wait for completion
-            await asyncio.gather(*tasks, return_exceptions=True)
+                    ready.extend(scheduler.complete(step))
 
-            # Update performance metrics
-            if self.enable_monitoring:
-                await self._update_performance_metrics(workflow)
+                if adaptive and self.enable_monitoring:
+                    await self._update_performance_metrics(workflow)
+
+        finally:
+            for task in running:
+                task.cancel()
 
     async def _execute_pipeline(
         self,
@@ -885,7 +1182,7 @@ class DynamicWorkflowEngine:
         # Pipeline execution with data flow optimization
         pipeline_data = {}
 
-        for step in workflow.steps:
+        for step_number, step in enumerate(workflow.steps, start=1):
             workflow.current_step = step.step_id
 
             # Prepare input data
@@ -914,7 +1211,7 @@ class DynamicWorkflowEngine:
                 # Emit step completed
                 yield emitter.emit_agent_completed(
                     agent=step.agent_type,
-                    step=workflow.steps.index(step) + 1,
+                    step=step_number,
                     output=result
                 )
 
@@ -924,63 +1221,6 @@ class DynamicWorkflowEngine:
                 workflow.errors.append(f"Pipeline step {step.step_id} failed: {str(e)}")
                 raise
 
-    async def _execute_step_async(
-        self,
-        step: WorkflowStep,
-        workflow: Workflow,
-        emitter: AGUIEventEmitter,
-        group_idx: int
-    ) -> None:
-        """Execute a single step asynchronously.
-
-        Args:
-            step: Step to execute
-            workflow: Parent workflow
-            emitter: Event emitter
-            group_idx: Group index for parallel execution
-        """
-        try:
-            step.state = WorkflowState.RUNNING
-            step.start_time = datetime.utcnow()
-
-            # Emit step started
-            emitter.emit_agent_started(
-                agent=step.agent_type,
-                step=workflow.steps.index(step) + 1,
-                task=step.name
-            )
-
-            # Execute step
-            result = await self._execute_step(step, workflow)
-
-            step.state = WorkflowState.COMPLETED
-            step.end_time = datetime.utcnow()
-            step.execution_time = (step.end_time - step.start_time).total_seconds()
-            step.result = result
-
-            # Store result
-            workflow.results[step.step_id] = result
-
-            # Emit step completed
-            emitter.emit_agent_completed(
-                agent=step.agent_type,
-                step=workflow.steps.index(step) + 1,
-                output=result
-            )
-
-        except Exception as e:
-            step.state = WorkflowState.FAILED
-            step.error = str(e)
-            workflow.errors.append(f"Step {step.step_id} failed: {str(e)}")
-
-            # Emit step error
-            emitter.emit_agent_error(
-                agent=step.agent_type,
-                step=workflow.steps.index(step) + 1,
-                error_type="step_execution_error",
-                error_message=str(e)
-            )
-
     async def _execute_step(
         self,
         step: WorkflowStep,
@@ -1013,19 +1253,25 @@ class DynamicWorkflowEngine:
         if input_data:
             step_context.update(input_data)
 
-        # Select appropriate agent
-        agent = await self._select_agent(step, workflow)
+        # Select appropriate agent, waiting for a slot if all capable agents are busy
+        async with self._agent_released:
+            agent = await self._select_agent(step, workflow)
+            while not agent and self._has_capable_agent(step.agent_capability):
+                await self._agent_released.wait()
+                agent = await self._select_agent(step, workflow)
 
-        if not agent:
-            raise RuntimeError(f"No suitable agent found for step {step.step_id}")
+            if not agent:
+                raise RuntimeError(f"No suitable agent found for step {step.step_id}")
 
-        # Execute with agent
-        try:
             # Update agent load
-            self.agent_load[step.agent_type] += 1
+            self.agent_load[agent["agent_id"]] += 1
 
+        # Execute with agent
+        try:
             # Execute step logic (this would integrate with actual agents)
+            start_time = time.perf_counter()
             result = await self._execute_with_agent(agent, step_context)
+            self._record_step_duration(step, time.perf_counter() - start_time)
 
             # Apply data transformations
             if step.data_transformations:
@@ -1041,7 +1287,56 @@ class DynamicWorkflowEngine:
 
         finally:
             # Update agent load
-            self.agent_load[step.agent_type] -= 1
+            self.agent_load[agent["agent_id"]] -= 1
+            async with self._agent_released:
+                self._agent_released.notify_all()
+
+    def _has_capable_agent(self, capability: AgentCapability) -> bool:
+        """Check whether any registered agent can ever run a capability."""
+        return any(
+            capability in agent_info.get("capabilities", [])
+            and agent_info.get("max_concurrent_tasks", 5) > 0
+            for agent_info in self.agent_registry.values()
+        )
+
+    def _get_capability_limits(self) -> Dict[AgentCapability, int]:
+        """Get the concurrency pool of each capability.
+
+        Returns:
+            Capability -> maximum concurrently running steps
+        """
+        limits: Dict[AgentCapability, int] = defaultdict(int)
+        for agent_info in self.agent_registry.values():
+            for capability in agent_info.get("capabilities", []):
+                try:
+                    limits[AgentCapability(capability)] += agent_info.get("max_concurrent_tasks", 5)
+                except ValueError:
+                    continue
+
+        limits.update(self.capability_limits)
+        return dict(limits)
+
+    def _duration_key(self, step: WorkflowStep) -> str:
+        """Key under which a step's observed durations are learned."""
+        return f"{step.agent_capability.value}:{step.name}"
+
+    def _record_step_duration(self, step: WorkflowStep, duration: float) -> None:
+        """Compare a step's estimate with its actual duration and learn from it.
+
+        Args:
+            step: Executed step
+            duration: Time the agent took, in seconds
+        """
+        step.metrics["estimated_duration"] = step.estimated_duration
+        step.metrics["actual_duration"] = duration
+        step.metrics["estimate_error"] = duration - step.estimated_duration
+
+        key = self._duration_key(step)
+        learned = self.duration_estimates.get(key)
+        if learned is None:
+            self.duration_estimates[key] = duration
+        else:
+            self.duration_estimates[key] = learned + DURATION_SMOOTHING * (duration - learned)
 
     async def _select_agent(
         self,
@@ -1232,35 +1527,33 @@ class DynamicWorkflowEngine:
     async def _optimize_workflow(self, workflow: Workflow) -> None:
         """Optimize workflow execution based on historical data.
 
+        Pending steps take the duration learned from earlier runs of steps
+        with the same capability and name, so the scheduler's critical-path
+        priorities follow how long steps actually take.
+
         Args:
             workflow: Workflow to optimize
         """
-        # Get historical performance data
-        similar_workflows = [
-            w for w in self.execution_history[-100:]  # Last 100 executions
-            if len(w.get("steps", [])) == len(workflow.steps)
-        ]
+        refined_steps = 0
+        for step in workflow.steps:
+            if step.state != WorkflowState.PENDING:
+                continue
+
+            learned = self.duration_estimates.get(self._duration_key(step))
+            if learned is not None:
+                step.metrics.setdefault("declared_duration", step.estimated_duration)
+                step.estimated_duration = learned
+                refined_steps += 1
 
-        if similar_workflows:
-            # Calculate average execution times
-            avg_times = {}
-            for step in workflow.steps:
-                step_times = [
-                    w.get("step_times", {}).get(step.step_id, step.estimated_duration)
-                    for w in similar_workflows
-                ]
-                if step_times:
-                    avg_times[step.step_id] = sum(step_times) / len(step_times)
-
-            # Update step estimates
-            for step in workflow.steps:
-                if step.step_id in avg_times:
-                    step.estimated_duration = avg_times[step.step_id]
-
-            # Optimize execution order based on critical path
+        if refined_steps:
             critical_path = workflow.get_critical_path()
-            for step in critical_path:
-                step.priority_boost += 10
+            self.logger.info(
+                "workflow_estimates_refined",
+                workflow_id=workflow.workflow_id,
+                refined_steps=refined_steps,
+                critical_path=[step.step_id for step in critical_path],
+                critical_path_duration=sum(step.estimated_duration for step in critical_path)
+            )
 
     async def _adapt_execution_strategy(
         self,
@@ -1357,6 +1650,10 @@ class DynamicWorkflowEngine:
             "resource_usage": dict(self.resource_usage),
             "performance_metrics": dict(self.performance_metrics),
             "registered_agents": len(self.agent_registry),
+            "capability_limits": {
+                capability.value: limit for capability, limit in self._get_capability_limits().items()
+            },
+            "learned_durations": len(self.duration_estimates),
             "max_concurrent_workflows": self.max_concurrent_workflows,
             "enable_adaptation": self.enable_adaptation,
             "enable_monitoring": self.enable_monitoring
@@ -23,6 +23,14 @@ import httpx
 import tenacity
 from collections import defaultdict, deque
 
+from src.agents.glm_admission import (
+    GLMAdmissionScheduler,
+    RequestPriority,
+    estimate_request_tokens,
+    parse_retry_after,
+)
+from src.agents.llm_response_cache import LLMResponseCache
+
 logger = structlog.get_logger(__name__)
 
 
@@ -585,6 +593,8 @@ class EnhancedGLMIntegration:
         default_timeout: int = 30000,
         max_retries: int = 3,
         enable_performance_tracking: bool = True,
+        response_cache: Optional[LLMResponseCache] = None,
+        scheduler: Optional[GLMAdmissionScheduler] = None,
     ):
         """Initialize enhanced GLM integration.
 
@@ -594,12 +604,18 @@ class EnhancedGLMIntegration:
             default_timeout: Default timeout in milliseconds
             max_retries: Maximum number of retries
             enable_performance_tracking: Enable performance tracking
+            response_cache: Optional cache for deterministic (temperature 0)
+                requests of the task types it is configured for
+            scheduler: Admission scheduler enforcing per-model concurrency
+                and tokens-per-minute limits (default limits if omitted)
         """
         self.api_key = api_key
         self.base_url = base_url
         self.default_timeout = default_timeout
         self.max_retries = max_retries
         self.enable_performance_tracking = enable_performance_tracking
+        self.response_cache = response_cache
+        self.scheduler = scheduler or GLMAdmissionScheduler()
 
         self.logger = logger.bind(component="EnhancedGLMIntegration")
 
@@ -629,6 +645,8 @@ class EnhancedGLMIntegration:
         task_type: TaskType = TaskType.TEXT_GENERATION,
         priority: str = "balanced",
         model: Optional[GLMModel] = None,
+        cache_accounts: Optional[Dict[str, str]] = None,
+        request_priority: RequestPriority = RequestPriority.INTERACTIVE,
         **kwargs
     ) -> GLMResponse:
         """Generate text with intelligent model selection.
@@ -638,6 +656,10 @@ class EnhancedGLMIntegration:
             task_type: Type of task being performed
             priority: Selection priority (speed, quality, cost, balanced)
             model: Specific model to use (overrides selection)
+            cache_accounts: Data checksums of the accounts the prompt is
+                built from; a cached response is reused only while they match
+            request_priority: Admission priority when the model is at its
+                limits (interactive requests are admitted before batch)
             **kwargs: Additional generation parameters
 
         Returns:
@@ -676,27 +698,55 @@ class EnhancedGLMIntegration:
                 **kwargs
             )
 
-            # Execute request with retry logic
-            response = await self._execute_request_with_retry(config, request_id)
+            cache_params = None
+            if self.response_cache is not None:
+                params = config.model_dump(exclude={"model", "messages"})
+                if self.response_cache.is_cacheable(task_type, params):
+                    cache_params = params
+                    cached = self.response_cache.get(
+                        config.model, messages, cache_params, cache_accounts
+                    )
+                    if cached is not None:
+                        latency_ms = int((time.time() - start_time) * 1000)
+                        self.logger.info(
+                            "generation_cache_hit",
+                            request_id=request_id,
+                            model=model,
+                            task_type=task_type
+                        )
+                        return cached.model_copy(
+                            update={"latency_ms": latency_ms, "request_id": request_id}
+                        )
+
+            # Execute request within the model's admission budget
+            response, service_ms, queued_ms = await self._execute_admitted(
+                config, request_id, request_priority
+            )
 
             # Calculate latency
             latency_ms = int((time.time() - start_time) * 1000)
             response.latency_ms = latency_ms
 
-            # Update performance tracking
+            # Update performance tracking (provider latency, not queue wait)
             if self.enable_performance_tracking:
                 self.model_selector.update_model_performance(
                     model=model,
                     success=True,
-                    latency_ms=latency_ms,
+                    latency_ms=service_ms,
                     tokens_used=response.usage.get("total_tokens", 0)
                 )
 
+            if cache_params is not None:
+                self.response_cache.put(
+                    config.model, messages, cache_params, response, cache_accounts
+                )
+
             self.logger.info(
                 "generation_completed",
                 request_id=request_id,
                 model=model,
                 latency_ms=latency_ms,
+                queued_ms=queued_ms,
                 tokens_used=response.usage.get("total_tokens", 0),
                 finish_reason=response.finish_reason
             )
@@ -730,6 +780,46 @@ class EnhancedGLMIntegration:
             # Clean up active request tracking
             self.active_requests.pop(request_id, None)
 
+    async def _execute_admitted(
+        self,
+        config: GLMRequestConfig,
+        request_id: str,
+        request_priority: RequestPriority
+    ) -> Tuple[GLMResponse, int, int]:
+        """Execute a request once the admission scheduler has capacity for it.
+
+        A 429 pauses admissions for the model for the provider's Retry-After
+        and the request is queued again, so concurrent callers back off
+        together instead of each retrying on its own schedule.
+
+        Returns:
+            Response, provider latency in ms and total queue wait in ms
+        """
+        estimated_tokens = estimate_request_tokens(config.messages, config.max_tokens)
+        queued_ms = 0
+        attempt = 0
+
+        while True:
+            attempt += 1
+            async with self.scheduler.admit(
+                config.model, estimated_tokens, request_priority
+            ) as ticket:
+                queued_ms += ticket.queued_ms
+                sent_at = time.time()
+                try:
+                    response = await self._execute_request_with_retry(config, request_id)
+                except httpx.HTTPStatusError as e:
+                    if e.response.status_code != 429 or attempt >= self.max_retries:
+                        raise
+                    self.scheduler.throttle(
+                        config.model, parse_retry_after(e.response.headers.get("retry-after"))
+                    )
+                    continue
+
+                ticket.tokens_used = response.usage.get("total_tokens")
+                service_ms = int((time.time() - sent_at) * 1000)
+                return response, service_ms, queued_ms
+
     async def _execute_request_with_retry(self, config: GLMRequestConfig, request_id: str) -> GLMResponse:
         """Execute GLM request with retry logic."""
 
@@ -831,12 +921,18 @@ class EnhancedGLMIntegration:
                 **kwargs
             )
 
-            # Execute streaming request
+            # Execute streaming request (holds an admission slot until done)
             total_tokens = 0
-            async for chunk in self._execute_stream_request(config, request_id):
-                if "usage" in chunk and chunk["usage"].get("total_tokens"):
-                    total_tokens = chunk["usage"]["total_tokens"]
-                yield chunk
+            async with self.scheduler.admit(
+                config.model,
+                estimate_request_tokens(messages, config.max_tokens),
+                RequestPriority.INTERACTIVE
+            ) as ticket:
+                async for chunk in self._execute_stream_request(config, request_id):
+                    if "usage" in chunk and chunk["usage"].get("total_tokens"):
+                        total_tokens = chunk["usage"]["total_tokens"]
+                    yield chunk
+                ticket.tokens_used = total_tokens or None
 
             # Calculate latency and update performance
             latency_ms = int((time.time() - start_time) * 1000)
@@ -969,6 +1065,8 @@ class EnhancedGLMIntegration:
             "generated_at": datetime.utcnow().isoformat(),
             "total_models": len(self.model_selector.performance),
             "active_requests": len(self.active_requests),
+            "response_cache": self.response_cache.get_stats() if self.response_cache else None,
+            "admission": self.scheduler.get_stats(),
             "models": {}
         }
 
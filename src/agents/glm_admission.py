@@ -0,0 +1,331 @@
+"""Admission scheduler for GLM requests.
+
+Keeps each GLM model within its provider limits instead of sending
+everything at once and retrying 429s:
+
+- Concurrency: at most ``max_concurrent`` in-flight requests per model
+- Token budget: estimated (then actual) tokens admitted in the last
+  60 seconds stay under ``tokens_per_minute``
+- Priority: waiting requests are admitted interactive first, then batch,
+  FIFO within a priority, so a fan-out of batch work never delays a user
+  request by more than the requests already in flight
+- Throttling: a 429 pauses admissions for that model for the provider's
+  ``Retry-After`` instead of every caller retrying on its own schedule
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+TOKEN_WINDOW_SECONDS = 60.0
+DEFAULT_COMPLETION_TOKENS = 1024
+DEFAULT_RETRY_AFTER_SECONDS = 1.0
+
+
+def estimate_request_tokens(
+    messages: List[Dict[str, Any]],
+    max_tokens: Optional[int] = None
+) -> int:
+    """Rough token estimate for admission (about four characters per token).
+
+    Args:
+        messages: Request messages
+        max_tokens: Completion limit (defaults to ``DEFAULT_COMPLETION_TOKENS``)
+
+    Returns:
+        Estimated prompt plus completion tokens
+    """
+    chars = sum(len(str(message.get("content", ""))) for message in messages)
+    return chars // 4 + (max_tokens or DEFAULT_COMPLETION_TOKENS)
+
+
+def parse_retry_after(value: Optional[str]) -> float:
+    """Seconds to wait from a ``Retry-After`` header value.
+
+    Args:
+        value: Header value (delay in seconds; HTTP dates are not used by
+            the GLM API and fall back to the default)
+
+    Returns:
+        Delay in seconds
+    """
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER_SECONDS
+
+
+class RequestPriority(IntEnum):
+    """Admission priority (lower is admitted first)."""
+
+    INTERACTIVE = 0
+    BATCH = 1
+
+
+@dataclass
+class ModelLimits:
+    """Provider limits for one model."""
+
+    max_concurrent: int = 16
+    tokens_per_minute: int = 200_000
+
+
+@dataclass
+class AdmissionTicket:
+    """An admitted request; set ``tokens_used`` before release when known."""
+
+    model: str
+    estimated_tokens: int
+    priority: RequestPriority
+    queued_ms: int = 0
+    tokens_used: Optional[int] = None
+    _window_entry: List[float] = field(default_factory=list, repr=False)
+
+
+@dataclass
+class _ModelState:
+    limits: ModelLimits
+    in_flight: int = 0
+    # Window entries: [admitted_at, tokens] (mutable so release can correct)
+    window: Deque[List[float]] = field(default_factory=deque)
+    window_tokens: float = 0.0
+    # Waiters: (priority, seq, tokens, future)
+    waiters: List[Tuple[int, int, int, asyncio.Future]] = field(default_factory=list)
+    throttled_until: float = 0.0
+    timer: Optional[asyncio.TimerHandle] = None
+    admitted: int = 0
+    throttles: int = 0
+    total_queued_ms: int = 0
+
+
+class GLMAdmissionScheduler:
+    """Per-model concurrency and tokens-per-minute admission control.
+
+    Example:
+        >>> scheduler = GLMAdmissionScheduler({GLMModel.GLM_4_6: ModelLimits(8, 120_000)})
+        >>> async with scheduler.admit("glm-4.6", estimated_tokens=1500) as ticket:
+        ...     response = await send(...)
+        ...     ticket.tokens_used = response.usage["total_tokens"]
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[Any, ModelLimits]] = None,
+        default_limits: Optional[ModelLimits] = None
+    ):
+        """Initialize scheduler.
+
+        Args:
+            limits: Limits per model (GLMModel or model name)
+            default_limits: Limits for models not listed
+        """
+        self.limits = {str(getattr(m, "value", m)): l for m, l in (limits or {}).items()}
+        self.default_limits = default_limits or ModelLimits()
+        self.logger = logger.bind(component="glm_admission_scheduler")
+
+        self._models: Dict[str, _ModelState] = {}
+        self._seq = itertools.count()
+
+    @asynccontextmanager
+    async def admit(
+        self,
+        model: Any,
+        estimated_tokens: int,
+        priority: RequestPriority = RequestPriority.INTERACTIVE
+    ) -> AsyncIterator[AdmissionTicket]:
+        """Wait for admission, hold the slot for the block, then release.
+
+        Args:
+            model: GLMModel or model name
+            estimated_tokens: Expected prompt plus completion tokens
+            priority: Admission priority
+
+        Yields:
+            Admission ticket
+        """
+        ticket = await self.acquire(model, estimated_tokens, priority)
+        try:
+            yield ticket
+        finally:
+            self.release(ticket)
+
+    async def acquire(
+        self,
+        model: Any,
+        estimated_tokens: int,
+        priority: RequestPriority = RequestPriority.INTERACTIVE
+    ) -> AdmissionTicket:
+        """Wait until the model has capacity for a request.
+
+        Args:
+            model: GLMModel or model name
+            estimated_tokens: Expected prompt plus completion tokens
+            priority: Admission priority
+
+        Returns:
+            Admission ticket (pass to ``release``)
+        """
+        name = str(getattr(model, "value", model))
+        state = self._state(name)
+        # A request larger than the whole budget is admitted alone
+        tokens = min(max(estimated_tokens, 1), state.limits.tokens_per_minute)
+        started = time.monotonic()
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(state.waiters, (int(priority), next(self._seq), tokens, future))
+        self._dispatch(name)
+
+        try:
+            window_entry = await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Admitted just as the caller gave up: hand the slot back
+                self._release_slot(name, future.result(), None)
+            else:
+                state.waiters = [w for w in state.waiters if w[3] is not future]
+                heapq.heapify(state.waiters)
+            self._dispatch(name)
+            raise
+
+        queued_ms = int((time.monotonic() - started) * 1000)
+        state.total_queued_ms += queued_ms
+        return AdmissionTicket(
+            model=name,
+            estimated_tokens=tokens,
+            priority=priority,
+            queued_ms=queued_ms,
+            _window_entry=window_entry
+        )
+
+    def release(self, ticket: AdmissionTicket) -> None:
+        """Free a request's concurrency slot and settle its token usage.
+
+        Args:
+            ticket: Ticket from ``acquire``
+        """
+        self._release_slot(ticket.model, ticket._window_entry, ticket.tokens_used)
+        self._dispatch(ticket.model)
+
+    def throttle(self, model: Any, retry_after: float) -> None:
+        """Pause admissions for a model after a rate-limit response.
+
+        Args:
+            model: GLMModel or model name
+            retry_after: Seconds to pause (provider ``Retry-After``)
+        """
+        name = str(getattr(model, "value", model))
+        state = self._state(name)
+        until = time.monotonic() + max(retry_after, 0.0)
+        if until > state.throttled_until:
+            state.throttled_until = until
+            state.throttles += 1
+            self.logger.warning("glm_model_throttled", model=name, retry_after=retry_after)
+        self._dispatch(name)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-model admission stats.
+
+        Returns:
+            Stats dict keyed by model name
+        """
+        now = time.monotonic()
+        stats = {}
+        for name, state in self._models.items():
+            self._expire_window(state, now)
+            stats[name] = {
+                "in_flight": state.in_flight,
+                "queued": len(state.waiters),
+                "tokens_last_minute": int(state.window_tokens),
+                "max_concurrent": state.limits.max_concurrent,
+                "tokens_per_minute": state.limits.tokens_per_minute,
+                "admitted": state.admitted,
+                "throttles": state.throttles,
+                "average_queue_ms": (
+                    round(state.total_queued_ms / state.admitted, 1) if state.admitted else 0.0
+                ),
+            }
+        return stats
+
+    def _state(self, name: str) -> _ModelState:
+        state = self._models.get(name)
+        if state is None:
+            state = _ModelState(limits=self.limits.get(name, self.default_limits))
+            self._models[name] = state
+        return state
+
+    def _expire_window(self, state: _ModelState, now: float) -> None:
+        while state.window and now - state.window[0][0] >= TOKEN_WINDOW_SECONDS:
+            state.window_tokens -= state.window.popleft()[1]
+
+    def _release_slot(
+        self,
+        name: str,
+        window_entry: List[float],
+        tokens_used: Optional[int]
+    ) -> None:
+        state = self._models[name]
+        state.in_flight -= 1
+        if tokens_used is not None and window_entry:
+            # Charge actual usage while the entry is still in the window
+            if any(entry is window_entry for entry in state.window):
+                state.window_tokens += tokens_used - window_entry[1]
+            window_entry[1] = tokens_used
+
+    def _dispatch(self, name: str) -> None:
+        """Admit waiters in priority order while the model has capacity."""
+        state = self._models[name]
+        now = time.monotonic()
+        self._expire_window(state, now)
+
+        if state.timer is not None:
+            state.timer.cancel()
+            state.timer = None
+
+        while state.waiters:
+            priority, seq, tokens, future = state.waiters[0]
+            if future.done():
+                heapq.heappop(state.waiters)
+                continue
+
+            if now < state.throttled_until:
+                self._wake_at(name, state.throttled_until - now)
+                return
+            if state.in_flight >= state.limits.max_concurrent:
+                # Woken by release
+                return
+            if state.window_tokens + tokens > state.limits.tokens_per_minute:
+                self._wake_at(name, self._budget_wait(state, tokens, now))
+                return
+
+            heapq.heappop(state.waiters)
+            entry = [now, float(tokens)]
+            state.window.append(entry)
+            state.window_tokens += tokens
+            state.in_flight += 1
+            state.admitted += 1
+            future.set_result(entry)
+
+    def _budget_wait(self, state: _ModelState, tokens: int, now: float) -> float:
+        """Seconds until enough window tokens expire to admit ``tokens``."""
+        excess = state.window_tokens + tokens - state.limits.tokens_per_minute
+        for admitted_at, used in state.window:
+            excess -= used
+            if excess <= 0:
+                return max(admitted_at + TOKEN_WINDOW_SECONDS - now, 0.0)
+        return TOKEN_WINDOW_SECONDS
+
+    def _wake_at(self, name: str, delay: float) -> None:
+        state = self._models[name]
+        loop = asyncio.get_running_loop()
+        state.timer = loop.call_later(delay, self._dispatch, name)
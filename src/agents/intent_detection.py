@@ -8,7 +8,9 @@ semantic analysis to determine intent and make routing decisions in the orchestr
 """
 
 import re
+import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime
 from typing import Dict, Any, List, Optional, Set, Tuple
 from enum import Enum
@@ -144,6 +146,87 @@ class KeywordPatterns:
         'question_pattern': re.compile(r'\^(what|when|where|why|how|who|which)\b', re.IGNORECASE)
     }
 
+    # Pattern signals: (pattern name, confidence, category, description)
+    PATTERN_SIGNALS = (
+        ('account_id_pattern', 0.9, IntentCategory.ACCOUNT_ANALYSIS, 'Account ID format detected'),
+        ('account_review_pattern', 0.85, IntentCategory.ACCOUNT_ANALYSIS, 'Account review request detected'),
+        ('zoho_query_pattern', 0.8, IntentCategory.ZOHO_SPECIFIC, 'Zoho/CRM query detected'),
+        ('historical_pattern', 0.75, IntentCategory.MEMORY_HISTORY, 'Historical data request detected'),
+        ('help_pattern', 0.6, IntentCategory.HELP_ASSISTANCE, 'Help request detected'),
+        ('question_pattern', 0.4, IntentCategory.GENERAL_CONVERSATION, 'Question format detected'),
+    )
+
+
+def _trie_pattern(words: List[str]) -> str:
+    """Regex alternation over ``words`` shaped as a prefix trie.
+
+    Each position is tested one character at a time instead of once per
+    word, and the longest word starting at a position is preferred.
+    """
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{body})?' if '' in node else body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """All keyword groups compiled into one matcher.
+
+    Keywords match as substrings of the normalized message (so ``acc-``
+    matches ``acc-123`` and ``risk`` matches ``risks``). One regex scan
+    finds the longest keyword starting at every position; shorter keywords
+    that are prefixes of it are implied, so the hits equal testing every
+    keyword with ``in``.
+    """
+
+    def __init__(self, entries: List[Tuple[IntentCategory, str, str, float]]):
+        """Compile keyword entries.
+
+        Args:
+            entries: (category, group, keyword, weight) in reporting order
+        """
+        self.entries = entries
+
+        self._entry_indexes: Dict[str, List[int]] = {}
+        for index, (_, _, keyword, _) in enumerate(entries):
+            self._entry_indexes.setdefault(keyword, []).append(index)
+
+        keywords = list(self._entry_indexes)
+        self._implied = {
+            longest: sorted({
+                index
+                for keyword in keywords if longest.startswith(keyword)
+                for index in self._entry_indexes[keyword]
+            })
+            for longest in keywords
+        }
+        self._regex = re.compile(f'(?=({_trie_pattern(keywords)}))')
+
+    def match(self, message: str) -> List[int]:
+        """Find keyword entries present in a message.
+
+        Args:
+            message: Normalized message
+
+        Returns:
+            Indexes into ``entries`` of matched keywords, in entry order
+        """
+        found = set()
+        for longest in set(self._regex.findall(message)):
+            found.update(self._implied[longest])
+        return sorted(found)
+
 
 class IntentDetectionEngine:
     """Advanced intent detection engine for Sergas Orchestrator.
@@ -158,13 +241,24 @@ class IntentDetectionEngine:
     account_id for all conversations.
     """
 
-    def __init__(self, confidence_threshold: float = 0.5):
+    def __init__(
+        self,
+        confidence_threshold: float = 0.5,
+        verbose_signals: bool = True,
+        cache_size: int = 1024
+    ):
         """Initialize intent detection engine.
 
         Args:
             confidence_threshold: Minimum confidence threshold for routing decisions (default: 0.5)
+            verbose_signals: Include per-signal details in ``signals_detected``
+                by default (can be overridden per call; routing callers that
+                never read the signals pass False to skip building them)
+            cache_size: Normalized messages whose analysis is cached (0 disables)
         """
         self.confidence_threshold = confidence_threshold
+        self.verbose_signals = verbose_signals
+        self.cache_size = cache_size
         self.patterns = KeywordPatterns()
         self.logger = logger.bind(component="intent_detection_engine")
 
@@ -177,15 +271,34 @@ class IntentDetectionEngine:
             IntentCategory.GENERAL_CONVERSATION: 0.4
         }
 
+        keyword_categories = {
+            IntentCategory.ACCOUNT_ANALYSIS: self.patterns.ACCOUNT_KEYWORDS,
+            IntentCategory.ZOHO_SPECIFIC: self.patterns.ZOHO_KEYWORDS,
+            IntentCategory.MEMORY_HISTORY: self.patterns.MEMORY_KEYWORDS,
+            IntentCategory.GENERAL_CONVERSATION: self.patterns.GENERAL_KEYWORDS
+        }
+        self.keyword_matcher = KeywordMatcher([
+            (category, group, keyword, self._get_keyword_weight(keyword, group))
+            for category, keyword_groups in keyword_categories.items()
+            for group, keywords in keyword_groups.items()
+            for keyword in keywords
+        ])
+
+        # Normalized message (and verbosity) -> analysis fields
+        self._cache: "OrderedDict[Tuple[str, bool], Dict[str, Any]]" = OrderedDict()
+        self._cache_stats = {"hits": 0, "misses": 0}
+
         self.logger.info("intent_detection_engine_initialized", confidence_threshold=confidence_threshold)
 
-    def analyze_intent(self, message: str) -> IntentResult:
+    def analyze_intent(self, message: str, include_signals: Optional[bool] = None) -> IntentResult:
         """Analyze user message to determine intent and routing decisions.
 
         This is the primary method that orchestrates all intent detection logic.
 
         Args:
             message: User message to analyze
+            include_signals: Populate ``signals_detected`` with per-signal
+                details (defaults to the engine's ``verbose_signals``)
 
         Returns:
             IntentResult with classification and routing decisions
@@ -196,61 +309,146 @@ class IntentDetectionEngine:
             >>> print(result.primary_intent)  # IntentCategory.ACCOUNT_ANALYSIS
             >>> print(result.should_call_zoho_agent)  # True
         """
-        start_time = datetime.utcnow()
+        start_time = time.perf_counter()
 
         # Normalize message
         normalized_message = self._normalize_message(message)
-        message_length = len(normalized_message)
-
-        # Detect signals from different strategies
-        keyword_signals = self._detect_keyword_signals(normalized_message)
-        pattern_signals = self._detect_pattern_signals(normalized_message)
-        semantic_signals = self._detect_semantic_signals(normalized_message)
+        verbose = self.verbose_signals if include_signals is None else include_signals
 
-        # Combine and analyze signals
-        all_signals = keyword_signals + pattern_signals + semantic_signals
-
-        # Calculate primary intent and confidence
-        primary_intent, confidence_score = self._calculate_primary_intent(all_signals)
-
-        # Extract matched keywords and patterns
-        keywords_matched = [sig.get('keyword', '') for sig in keyword_signals if sig.get('keyword')]
-        patterns_matched = [sig.get('pattern', '') for sig in pattern_signals if sig.get('pattern')]
-
-        # Make routing decisions
-        routing_decisions = self._make_routing_decisions(primary_intent, confidence_score, all_signals)
-
-        # Calculate processing time
-        processing_time = (datetime.utcnow() - start_time).total_seconds() * 1000
-
-        # Create result
+        cache_key = (normalized_message, verbose)
+        analysis = self._cache.get(cache_key)
+        if analysis is not None:
+            self._cache.move_to_end(cache_key)
+            self._cache_stats["hits"] += 1
+        else:
+            self._cache_stats["misses"] += 1
+            analysis = self._classify(normalized_message, verbose)
+            if self.cache_size > 0:
+                self._cache[cache_key] = analysis
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        # Validation copies the lists, so callers can't alter the cached analysis
         result = IntentResult(
-            primary_intent=primary_intent,
-            confidence_score=confidence_score,
-            confidence_level=self._get_confidence_level(confidence_score),
-            signals_detected=[{
-                'type': sig['type'],
-                'confidence': sig['confidence'],
-                'category': sig['category'],
-                'details': sig.get('details', {})
-            } for sig in all_signals],
-            keywords_matched=keywords_matched,
-            patterns_matched=patterns_matched,
-            message_length=message_length,
-            processing_time_ms=int(processing_time),
-            **routing_decisions
+            **analysis,
+            processing_time_ms=int((time.perf_counter() - start_time) * 1000)
         )
 
         self.logger.info(
             "intent_analysis_completed",
             analysis_id=result.analysis_id,
-            primary_intent=primary_intent,
-            confidence=confidence_score,
+            primary_intent=result.primary_intent,
+            confidence=result.confidence_score,
             processing_time_ms=result.processing_time_ms
         )
 
         return result
 
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get analysis cache hit/miss counters.
+
+        Returns:
+            Cache statistics
+        """
+        lookups = self._cache_stats["hits"] + self._cache_stats["misses"]
+        return {
+            **self._cache_stats,
+            "entries": len(self._cache),
+            "hit_rate": round(self._cache_stats["hits"] / lookups, 3) if lookups else 0.0,
+        }
+
+    def _classify(self, message: str, verbose: bool) -> Dict[str, Any]:
+        """Score a normalized message in one pass over the compiled matchers.
+
+        Produces the same intent, confidence and routing as combining the
+        signals from ``_detect_keyword_signals``, ``_detect_pattern_signals``
+        and ``_detect_semantic_signals``, without materializing them unless
+        ``verbose`` is set.
+
+        Args:
+            message: Normalized message
+            verbose: Build per-signal details
+
+        Returns:
+            IntentResult fields other than per-call metadata
+        """
+        category_scores: Dict[IntentCategory, float] = {}
+        category_counts: Dict[IntentCategory, int] = {}
+
+        def add(category: IntentCategory, confidence: float) -> None:
+            category_scores[category] = (
+                category_scores.get(category, 0) + confidence * self.category_weights.get(category, 1.0)
+            )
+            category_counts[category] = category_counts.get(category, 0) + 1
+
+        entries = self.keyword_matcher.entries
+        keyword_hits = self.keyword_matcher.match(message)
+        for index in keyword_hits:
+            category, _, _, weight = entries[index]
+            add(category, weight)
+
+        pattern_hits = [
+            signal for signal in self.patterns.PATTERN_SIGNALS
+            if self.patterns.PATTERNS[signal[0]].search(message)
+        ]
+        for _, confidence, category, _ in pattern_hits:
+            add(category, confidence)
+
+        semantic_signals = self._detect_semantic_signals(message)
+        for signal in semantic_signals:
+            add(signal['category'], signal['confidence'])
+
+        primary_intent, confidence_score = self._score_categories(
+            category_scores, category_counts, sum(category_counts.values())
+        )
+
+        signals_detected = []
+        if verbose:
+            signals_detected = [
+                {
+                    'type': 'keyword',
+                    'confidence': entries[index][3],
+                    'category': entries[index][0],
+                    'details': {'weight': entries[index][3], 'group': entries[index][1]}
+                }
+                for index in keyword_hits
+            ] + [
+                {
+                    'type': 'pattern',
+                    'confidence': confidence,
+                    'category': category,
+                    'details': {'description': description}
+                }
+                for _, confidence, category, description in pattern_hits
+            ] + [
+                {
+                    'type': signal['type'],
+                    'confidence': signal['confidence'],
+                    'category': signal['category'],
+                    'details': signal.get('details', {})
+                }
+                for signal in semantic_signals
+            ]
+
+        patterns_matched = [signal[0] for signal in pattern_hits]
+        routing_decisions = self._route(
+            primary_intent,
+            confidence_score,
+            set(category_counts),
+            'account_id_pattern' in patterns_matched
+        )
+
+        return {
+            "primary_intent": primary_intent,
+            "confidence_score": confidence_score,
+            "confidence_level": self._get_confidence_level(confidence_score),
+            "signals_detected": signals_detected,
+            "keywords_matched": [entries[index][2] for index in keyword_hits],
+            "patterns_matched": patterns_matched,
+            "message_length": len(message),
+            **routing_decisions
+        }
+
     def requires_account_data(self, intent: IntentResult) -> bool:
         """Determine if intent requires account-specific data.
 
@@ -296,13 +494,8 @@ class IntentDetectionEngine:
         if not message:
             return ""
 
-        # Convert to lowercase and strip
-        normalized = message.lower().strip()
-
-        # Remove extra whitespace
-        normalized = re.sub(r'\s+', ' ', normalized)
-
-        return normalized
+        # Lowercase, strip and collapse whitespace runs
+        return ' '.join(message.lower().split())
 
     def _detect_keyword_signals(self, message: str) -> List[Dict[str, Any]]:
         """Detect keyword-based signals.
@@ -315,33 +508,16 @@ class IntentDetectionEngine:
         """
         signals = []
 
-        # Check each keyword category
-        all_keywords = {
-            IntentCategory.ACCOUNT_ANALYSIS: self.patterns.ACCOUNT_KEYWORDS,
-            IntentCategory.ZOHO_SPECIFIC: self.patterns.ZOHO_KEYWORDS,
-            IntentCategory.MEMORY_HISTORY: self.patterns.MEMORY_KEYWORDS,
-            IntentCategory.GENERAL_CONVERSATION: self.patterns.GENERAL_KEYWORDS
-        }
-
-        for category, keyword_groups in all_keywords.items():
-            category_score = 0
-            matched_keywords = []
-
-            for group, keywords in keyword_groups.items():
-                for keyword in keywords:
-                    if keyword in message:
-                        weight = self._get_keyword_weight(keyword, group)
-                        category_score += weight
-                        matched_keywords.append(keyword)
-
-                        signals.append({
-                            'type': 'keyword',
-                            'confidence': weight,
-                            'category': category,
-                            'keyword': keyword,
-                            'group': group,
-                            'details': {'weight': weight, 'group': group}
-                        })
+        for index in self.keyword_matcher.match(message):
+            category, group, keyword, weight = self.keyword_matcher.entries[index]
+            signals.append({
+                'type': 'keyword',
+                'confidence': weight,
+                'category': category,
+                'keyword': keyword,
+                'group': group,
+                'details': {'weight': weight, 'group': group}
+            })
 
         return signals
 
@@ -356,65 +532,15 @@ class IntentDetectionEngine:
         """
         signals = []
 
-        # Account ID pattern
-        if self.patterns.PATTERNS['account_id_pattern'].search(message):
-            signals.append({
-                'type': 'pattern',
-                'confidence': 0.9,
-                'category': IntentCategory.ACCOUNT_ANALYSIS,
-                'pattern': 'account_id_pattern',
-                'details': {'description': 'Account ID format detected'}
-            })
-
-        # Account review pattern
-        if self.patterns.PATTERNS['account_review_pattern'].search(message):
-            signals.append({
-                'type': 'pattern',
-                'confidence': 0.85,
-                'category': IntentCategory.ACCOUNT_ANALYSIS,
-                'pattern': 'account_review_pattern',
-                'details': {'description': 'Account review request detected'}
-            })
-
-        # Zoho query pattern
-        if self.patterns.PATTERNS['zoho_query_pattern'].search(message):
-            signals.append({
-                'type': 'pattern',
-                'confidence': 0.8,
-                'category': IntentCategory.ZOHO_SPECIFIC,
-                'pattern': 'zoho_query_pattern',
-                'details': {'description': 'Zoho/CRM query detected'}
-            })
-
-        # Historical pattern
-        if self.patterns.PATTERNS['historical_pattern'].search(message):
-            signals.append({
-                'type': 'pattern',
-                'confidence': 0.75,
-                'category': IntentCategory.MEMORY_HISTORY,
-                'pattern': 'historical_pattern',
-                'details': {'description': 'Historical data request detected'}
-            })
-
-        # Help pattern
-        if self.patterns.PATTERNS['help_pattern'].search(message):
-            signals.append({
-                'type': 'pattern',
-                'confidence': 0.6,
-                'category': IntentCategory.HELP_ASSISTANCE,
-                'pattern': 'help_pattern',
-                'details': {'description': 'Help request detected'}
-            })
-
-        # Question pattern
-        if self.patterns.PATTERNS['question_pattern'].search(message):
-            signals.append({
-                'type': 'pattern',
-                'confidence': 0.4,
-                'category': IntentCategory.GENERAL_CONVERSATION,
-                'pattern': 'question_pattern',
-                'details': {'description': 'Question format detected'}
-            })
+        for name, confidence, category, description in self.patterns.PATTERN_SIGNALS:
+            if self.patterns.PATTERNS[name].search(message):
+                signals.append({
+                    'type': 'pattern',
+                    'confidence': confidence,
+                    'category': category,
+                    'pattern': name,
+                    'details': {'description': description}
+                })
 
         return signals
 
@@ -489,6 +615,25 @@ class IntentDetectionEngine:
             category_scores[category] += weighted_confidence
             category_signal_counts[category] += 1
 
+        return self._score_categories(category_scores, category_signal_counts, len(signals))
+
+    def _score_categories(
+        self,
+        category_scores: Dict[IntentCategory, float],
+        category_signal_counts: Dict[IntentCategory, int],
+        total_signals: int
+    ) -> Tuple[IntentCategory, float]:
+        """Pick the primary intent from weighted per-category scores.
+
+        Args:
+            category_scores: Weighted confidence sum per category (ties go
+                to the category seen first)
+            category_signal_counts: Signal count per category
+            total_signals: Signals across all categories
+
+        Returns:
+            Tuple of (primary_intent, confidence_score)
+        """
         # Find category with highest score
         if not category_scores:
             return IntentCategory.UNKNOWN, 0.0
@@ -501,7 +646,6 @@ class IntentDetectionEngine:
         normalized_score = min(raw_score / max(signal_count, 1), 1.0)
 
         # Apply additional normalization based on total signals
-        total_signals = len(signals)
         if total_signals > 0:
             category_ratio = signal_count / total_signals
             final_score = normalized_score * category_ratio
@@ -518,6 +662,31 @@ class IntentDetectionEngine:
             confidence: Confidence score
             signals: All detected signals
 
+        Returns:
+            Dictionary of routing decisions
+        """
+        return self._route(
+            primary_intent,
+            confidence,
+            {sig['category'] for sig in signals},
+            any(sig.get('pattern') == 'account_id_pattern' for sig in signals)
+        )
+
+    def _route(
+        self,
+        primary_intent: IntentCategory,
+        confidence: float,
+        signal_categories: Set[IntentCategory],
+        has_account_id: bool
+    ) -> Dict[str, bool]:
+        """Make routing decisions from the categories that produced signals.
+
+        Args:
+            primary_intent: Primary intent category
+            confidence: Confidence score
+            signal_categories: Categories with at least one signal
+            has_account_id: Whether the account ID pattern matched
+
         Returns:
             Dictionary of routing decisions
         """
@@ -537,21 +706,21 @@ class IntentDetectionEngine:
             routing['should_call_zoho_agent'] = True
 
             # Also call memory agent for historical context
-            if any(sig['category'] == IntentCategory.MEMORY_HISTORY for sig in signals):
+            if IntentCategory.MEMORY_HISTORY in signal_categories:
                 routing['should_call_memory_agent'] = True
 
         # Zoho-specific routing
         elif primary_intent == IntentCategory.ZOHO_SPECIFIC:
             routing['should_call_zoho_agent'] = True
             # May need account data if specific account mentioned
-            if any(sig.get('pattern') == 'account_id_pattern' for sig in signals):
+            if has_account_id:
                 routing['requires_account_data'] = True
 
         # Memory/History routing
         elif primary_intent == IntentCategory.MEMORY_HISTORY:
             routing['should_call_memory_agent'] = True
             # May need account data for historical analysis
-            if any(sig['category'] == IntentCategory.ACCOUNT_ANALYSIS for sig in signals):
+            if IntentCategory.ACCOUNT_ANALYSIS in signal_categories:
                 routing['requires_account_data'] = True
 
         # Help/General routing - no specialized agents needed
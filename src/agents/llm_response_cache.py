@@ -0,0 +1,366 @@
+"""Response cache for deterministic GLM requests.
+
+Identical requests (same model, normalised messages and generation
+parameters) are answered from memory instead of ``/chat/completions``.
+Only temperature-0 requests of explicitly enabled task types are cached,
+since only those are expected to return the same answer twice.
+
+- Exact mode: SHA-256 key over the normalised request
+- Semantic mode (optional): on an exact miss, requests whose earlier
+  messages and parameters match and whose final message is a near
+  paraphrase (cosine similarity of local embeddings above a threshold)
+  reuse the cached answer
+- Entries expire after ``ttl_seconds`` and can be bound to account data
+  checksums: a lookup with a different checksum for any bound account is
+  a miss, and ``invalidate_account`` drops an account's entries outright
+"""
+
+import hashlib
+import json
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+# Embedding function for semantic mode: text -> vector
+Embedder = Callable[[str], Sequence[float]]
+
+_WHITESPACE = re.compile(r"\s+")
+_TOKEN = re.compile(r"[a-z0-9]+(?:[-_][a-z0-9]+)*")
+
+
+def normalise_messages(messages: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Normalise messages so formatting-only differences share a key.
+
+    Roles are lowercased and string content is stripped with internal
+    whitespace collapsed; other fields are kept as-is.
+
+    Args:
+        messages: Chat messages
+
+    Returns:
+        Normalised copies of the messages
+    """
+    normalised = []
+    for message in messages:
+        item = dict(message)
+        if isinstance(item.get("role"), str):
+            item["role"] = item["role"].lower()
+        if isinstance(item.get("content"), str):
+            item["content"] = _WHITESPACE.sub(" ", item["content"]).strip()
+        normalised.append(item)
+    return normalised
+
+
+def _digest(payload: Any) -> str:
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def hashed_embedding(text: str, dim: int = 256) -> np.ndarray:
+    """Local bag-of-words embedding using feature hashing.
+
+    Words and word bigrams are hashed into ``dim`` signed buckets and the
+    result is L2-normalised, so cosine similarity reflects shared
+    vocabulary. Cheap and dependency-free; pass a real ``embedder`` to the
+    cache for paraphrase-level matching.
+
+    Args:
+        text: Text to embed
+        dim: Vector width
+
+    Returns:
+        Unit-length float32 vector (all zeros for empty text)
+    """
+    vector = np.zeros(dim, dtype=np.float32)
+    tokens = _TOKEN.findall(text.lower())
+    features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+    for feature in features:
+        digest = hashlib.md5(feature.encode()).digest()
+        bucket = int.from_bytes(digest[:4], "little") % dim
+        vector[bucket] += 1.0 if digest[4] & 1 else -1.0
+
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+@dataclass
+class CachedResponse:
+    """One cached GLM response."""
+
+    key: str
+    prefix_key: str
+    response: Any
+    accounts: Dict[str, str] = field(default_factory=dict)
+    embedding: Optional[np.ndarray] = None
+    cached_at: float = field(default_factory=time.monotonic)
+
+
+class LLMResponseCache:
+    """LRU cache of deterministic GLM responses.
+
+    Example:
+        >>> cache = LLMResponseCache(task_types={TaskType.CLASSIFICATION})
+        >>> glm = EnhancedGLMIntegration(api_key, response_cache=cache)
+        >>> await glm.generate(messages, task_type=TaskType.CLASSIFICATION,
+        ...                    temperature=0, cache_accounts={"ACC-1": checksum})
+    """
+
+    def __init__(
+        self,
+        task_types: Iterable[Any],
+        ttl_seconds: float = 3600,
+        max_entries: int = 2000,
+        semantic_threshold: Optional[float] = None,
+        embedder: Optional[Embedder] = None
+    ):
+        """Initialize cache.
+
+        Args:
+            task_types: Task types whose temperature-0 requests are cached
+            ttl_seconds: Maximum age of a cached response
+            max_entries: Capacity (least recently used evicted)
+            semantic_threshold: Cosine similarity for semantic hits
+                (None disables semantic mode)
+            embedder: Embedding function for semantic mode (defaults to
+                ``hashed_embedding``)
+        """
+        self.task_types = frozenset(task_types)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.semantic_threshold = semantic_threshold
+        self.embedder = embedder or hashed_embedding
+        self.logger = logger.bind(component="llm_response_cache")
+
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        # Semantic candidates: prefix key -> entry keys
+        self._by_prefix: Dict[str, List[str]] = {}
+
+        self._stats = {
+            "hits": 0,
+            "semantic_hits": 0,
+            "misses": 0,
+            "stale": 0,
+            "invalidated": 0,
+        }
+
+    def is_cacheable(self, task_type: Any, params: Dict[str, Any]) -> bool:
+        """Check whether a request may be served from the cache.
+
+        Args:
+            task_type: Request task type
+            params: Generation parameters (temperature, top_p, ...)
+
+        Returns:
+            True for deterministic requests of enabled task types
+        """
+        return (
+            task_type in self.task_types
+            and params.get("temperature") == 0
+            and not params.get("stream")
+        )
+
+    def get(
+        self,
+        model: str,
+        messages: List[Dict[str, Any]],
+        params: Dict[str, Any],
+        accounts: Optional[Dict[str, str]] = None
+    ) -> Optional[Any]:
+        """Look up a cached response.
+
+        Args:
+            model: Model the request would be sent to
+            messages: Request messages
+            params: Generation parameters
+            accounts: Current checksums of accounts the prompt is built from
+
+        Returns:
+            Cached response, or None on miss
+        """
+        normalised = normalise_messages(messages)
+        key, prefix_key = self._keys(model, normalised, params)
+
+        entry = self._fresh(key, accounts)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return entry.response
+
+        if self.semantic_threshold is not None and normalised:
+            entry = self._nearest(prefix_key, normalised[-1], accounts)
+            if entry is not None:
+                self._entries.move_to_end(entry.key)
+                self._stats["semantic_hits"] += 1
+                return entry.response
+
+        self._stats["misses"] += 1
+        return None
+
+    def put(
+        self,
+        model: str,
+        messages: List[Dict[str, Any]],
+        params: Dict[str, Any],
+        response: Any,
+        accounts: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Store a response.
+
+        Args:
+            model: Model that produced the response
+            messages: Request messages
+            params: Generation parameters
+            response: Response to cache
+            accounts: Checksums of accounts the prompt was built from
+        """
+        normalised = normalise_messages(messages)
+        key, prefix_key = self._keys(model, normalised, params)
+
+        embedding = None
+        if self.semantic_threshold is not None and normalised:
+            embedding = self._embed(normalised[-1])
+
+        self._drop(key)
+        self._entries[key] = CachedResponse(
+            key=key,
+            prefix_key=prefix_key,
+            response=response,
+            accounts=dict(accounts or {}),
+            embedding=embedding
+        )
+        self._by_prefix.setdefault(prefix_key, []).append(key)
+
+        while len(self._entries) > self.max_entries:
+            self._drop(next(iter(self._entries)))
+
+    def invalidate_account(self, account_id: str) -> int:
+        """Drop every response whose prompt was built from an account.
+
+        Hook for the sync pipeline when an account's data changes.
+
+        Args:
+            account_id: Account identifier
+
+        Returns:
+            Number of entries dropped
+        """
+        keys = [key for key, entry in self._entries.items() if account_id in entry.accounts]
+        for key in keys:
+            self._drop(key)
+
+        self._stats["invalidated"] += len(keys)
+        if keys:
+            self.logger.debug("llm_cache_account_invalidated", account_id=account_id, entries=len(keys))
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+        self._by_prefix.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters.
+
+        Returns:
+            Stats dict with hit rate
+        """
+        hits = self._stats["hits"] + self._stats["semantic_hits"]
+        lookups = hits + self._stats["misses"]
+        return {
+            **self._stats,
+            "entries": len(self._entries),
+            "semantic_mode": self.semantic_threshold is not None,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+        }
+
+    def _keys(
+        self,
+        model: str,
+        normalised: List[Dict[str, Any]],
+        params: Dict[str, Any]
+    ) -> Tuple[str, str]:
+        """Exact key and semantic candidate key (everything but the last message)."""
+        params = {k: v for k, v in params.items() if v is not None}
+        return (
+            _digest([model, normalised, params]),
+            _digest([model, normalised[:-1], params]),
+        )
+
+    def _embed(self, message: Dict[str, Any]) -> np.ndarray:
+        content = message.get("content")
+        text = content if isinstance(content, str) else json.dumps(content, sort_keys=True, default=str)
+        vector = np.asarray(self.embedder(text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _fresh(
+        self,
+        key: str,
+        accounts: Optional[Dict[str, str]]
+    ) -> Optional[CachedResponse]:
+        """Return the entry if current for these accounts, evicting it if stale.
+
+        An entry only serves lookups bound to exactly the accounts it was
+        cached for; a lookup for other accounts is a miss, not a stale entry.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        accounts = accounts or {}
+        if set(entry.accounts) != set(accounts):
+            return None
+
+        expired = time.monotonic() - entry.cached_at > self.ttl_seconds
+        changed = any(
+            accounts[account_id] != checksum
+            for account_id, checksum in entry.accounts.items()
+        )
+        if expired or changed:
+            self._drop(key)
+            self._stats["stale"] += 1
+            return None
+
+        return entry
+
+    def _nearest(
+        self,
+        prefix_key: str,
+        last_message: Dict[str, Any],
+        accounts: Optional[Dict[str, str]]
+    ) -> Optional[CachedResponse]:
+        """Best semantic match among entries sharing the request prefix."""
+        candidates = [
+            entry for entry in (
+                self._fresh(key, accounts) for key in list(self._by_prefix.get(prefix_key, []))
+            )
+            if entry is not None and entry.embedding is not None
+        ]
+        if not candidates:
+            return None
+
+        query = self._embed(last_message)
+        scores = np.stack([entry.embedding for entry in candidates]) @ query
+        best = int(np.argmax(scores))
+        if scores[best] < self.semantic_threshold:
+            return None
+        return candidates[best]
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        siblings = self._by_prefix.get(entry.prefix_key)
+        if siblings is not None:
+            siblings.remove(key)
+            if not siblings:
+                del self._by_prefix[entry.prefix_key]
@@ -15,9 +15,11 @@ Integration:
 - Pattern Recognition for advanced analysis
 """
 
-from typing import Dict, Any, List, Optional, AsyncGenerator
+from typing import Dict, Any, List, Optional, AsyncGenerator, Tuple
 from datetime import datetime, timedelta
 import asyncio
+import functools
+import os
 import structlog
 
 from anthropic import Anthropic
@@ -39,7 +41,7 @@ from src.agents.memory_utils import (
     identify_key_milestones, calculate_relationship_score,
     assess_executive_alignment
 )
-from src.agents.pattern_recognition import PatternRecognizer
+from src.agents.pattern_recognition import AccountTimeline, PatternRecognizer
 from src.events.ag_ui_emitter import AGUIEventEmitter
 
 logger = structlog.get_logger(__name__)
@@ -293,86 +295,23 @@ If memory is stale, flag for re-ingestion.
             if context is None:
                 context = await self.cognee.get_account_context(account_id)
 
-            patterns: List[Pattern] = []
-
-            # Detect churn patterns
-            churn_patterns = detect_churn_patterns(timeline_events)
-            patterns.extend(churn_patterns)
-
-            # Detect engagement cycles
-            interactions_data = [
-                {
-                    'account_id': event.account_id,
-                    'timestamp': event.timestamp.isoformat(),
-                    'type': event.event_type.value
-                }
-                for event in timeline_events
-            ]
-            engagement_cycles = identify_engagement_cycles(interactions_data)
-
-            # Convert cycles to patterns
-            for cycle in engagement_cycles:
-                patterns.append(Pattern(
-                    pattern_id=cycle.cycle_id,
-                    pattern_type=PatternType.ENGAGEMENT_CYCLE,
-                    confidence=cycle.confidence,
-                    description=f"{cycle.cycle_type} engagement cycle detected",
-                    evidence=[
-                        f"Cycle length: {cycle.cycle_length_days} days",
-                        f"Average frequency: {cycle.average_frequency:.2f}"
-                    ],
-                    first_detected=cycle.start_date,
-                    last_detected=cycle.end_date,
-                    frequency=1,
-                    risk_score=0
-                ))
-
-            # Detect commitment patterns
-            commitment_history = {
-                'account_id': account_id,
-                'commitments': context.get('commitments', [])
-            }
-            commitment_patterns = find_commitment_patterns(commitment_history)
-
-            for cp in commitment_patterns:
-                patterns.append(Pattern(
-                    pattern_id=cp.pattern_id,
-                    pattern_type=PatternType.COMMITMENT_PATTERN,
-                    confidence=0.7,
-                    description=cp.pattern_description,
-                    evidence=[
-                        f"Completion rate: {cp.completion_rate:.1%}",
-                        f"Average delay: {cp.average_delay_days:.1f} days"
-                    ],
-                    first_detected=datetime.utcnow() - timedelta(days=90),
-                    last_detected=datetime.utcnow(),
-                    frequency=cp.commitment_count,
-                    risk_score=50 if cp.completion_rate < 0.7 else 20,
-                    recommendations=["Review commitment tracking", "Improve delivery process"]
-                ))
+            patterns = self._detect_history_patterns(account_id, timeline_events, context)
 
             # Use pattern recognizer for advanced patterns
-            engagement_data = {
-                'total_interactions': len(timeline_events),
-                'days_since_last_interaction': (
-                    datetime.utcnow() - timeline_events[-1].timestamp
-                ).days if timeline_events else 90
-            }
+            inputs = self._build_pattern_inputs(account_id, timeline_events, context)
 
             advanced_churn = self.pattern_recognizer.detect_churn_risk_patterns(
-                account_id, timeline_events, engagement_data
+                account_id, timeline_events, inputs.engagement_data
             )
             patterns.extend(advanced_churn)
 
-            usage_data = context.get('usage_data', {})
             upsell_patterns = self.pattern_recognizer.detect_upsell_opportunities(
-                account_id, timeline_events, usage_data
+                account_id, timeline_events, inputs.usage_data
             )
             patterns.extend(upsell_patterns)
 
-            contract_data = context.get('contract_data', {})
             renewal_patterns = self.pattern_recognizer.detect_renewal_risk_patterns(
-                account_id, timeline_events, contract_data
+                account_id, timeline_events, inputs.contract_data
             )
             patterns.extend(renewal_patterns)
 
@@ -392,6 +331,176 @@ If memory is stale, flag for re-ingestion.
             )
             return []
 
+    async def identify_patterns_batch(
+        self,
+        account_ids: List[str],
+        max_workers: Optional[int] = None,
+        fetch_concurrency: int = 20
+    ) -> Dict[str, List[Pattern]]:
+        """Identify patterns for a whole book of business.
+
+        Timelines and contexts are fetched concurrently (bounded by
+        ``fetch_concurrency``), then the churn/upsell/renewal detectors run
+        once across all accounts via ``PatternRecognizer.detect_patterns_batch``
+        off the event loop.
+
+        Args:
+            account_ids: Accounts to analyze
+            max_workers: Worker processes for pattern detection
+            fetch_concurrency: Maximum concurrent Cognee fetches
+
+        Returns:
+            Mapping of account ID to detected patterns (empty on fetch failure)
+        """
+        self.logger.info("identifying_patterns_batch", account_count=len(account_ids))
+
+        semaphore = asyncio.Semaphore(fetch_concurrency)
+
+        async def fetch(account_id: str) -> Tuple[List[TimelineEvent], Dict[str, Any]]:
+            async with semaphore:
+                timeline_raw, context = await asyncio.gather(
+                    self.cognee.get_account_timeline(account_id, limit=50),
+                    self.cognee.get_account_context(account_id)
+                )
+            return self._build_timeline_events(account_id, timeline_raw), context
+
+        fetched = await asyncio.gather(
+            *(fetch(account_id) for account_id in account_ids),
+            return_exceptions=True
+        )
+
+        results: Dict[str, List[Pattern]] = {}
+        batch_inputs: List[AccountTimeline] = []
+        for account_id, outcome in zip(account_ids, fetched):
+            if isinstance(outcome, Exception):
+                self.logger.error(
+                    "pattern_identification_failed",
+                    account_id=account_id,
+                    error=str(outcome)
+                )
+                results[account_id] = []
+                continue
+
+            timeline_events, context = outcome
+            results[account_id] = self._detect_history_patterns(
+                account_id, timeline_events, context
+            )
+            batch_inputs.append(
+                self._build_pattern_inputs(account_id, timeline_events, context)
+            )
+
+        loop = asyncio.get_running_loop()
+        advanced = await loop.run_in_executor(
+            None,
+            functools.partial(
+                self.pattern_recognizer.detect_patterns_batch,
+                batch_inputs,
+                max_workers=max_workers
+            )
+        )
+        for account_id, patterns in advanced.items():
+            results[account_id].extend(patterns)
+
+        pattern_count = sum(len(p) for p in results.values())
+        self._metrics["pattern_detections"] += pattern_count
+
+        self.logger.info(
+            "patterns_identified_batch",
+            account_count=len(account_ids),
+            pattern_count=pattern_count
+        )
+
+        return results
+
+    def _detect_history_patterns(
+        self,
+        account_id: str,
+        timeline_events: List[TimelineEvent],
+        context: Dict[str, Any]
+    ) -> List[Pattern]:
+        """Detect churn, engagement-cycle and commitment patterns from history."""
+        patterns: List[Pattern] = []
+
+        # Detect churn patterns
+        churn_patterns = detect_churn_patterns(timeline_events)
+        patterns.extend(churn_patterns)
+
+        # Detect engagement cycles
+        interactions_data = [
+            {
+                'account_id': event.account_id,
+                'timestamp': event.timestamp.isoformat(),
+                'type': event.event_type.value
+            }
+            for event in timeline_events
+        ]
+        engagement_cycles = identify_engagement_cycles(interactions_data)
+
+        # Convert cycles to patterns
+        for cycle in engagement_cycles:
+            patterns.append(Pattern(
+                pattern_id=cycle.cycle_id,
+                pattern_type=PatternType.ENGAGEMENT_CYCLE,
+                confidence=cycle.confidence,
+                description=f"{cycle.cycle_type} engagement cycle detected",
+                evidence=[
+                    f"Cycle length: {cycle.cycle_length_days} days",
+                    f"Average frequency: {cycle.average_frequency:.2f}"
+                ],
+                first_detected=cycle.start_date,
+                last_detected=cycle.end_date,
+                frequency=1,
+                risk_score=0
+            ))
+
+        # Detect commitment patterns
+        commitment_history = {
+            'account_id': account_id,
+            'commitments': context.get('commitments', [])
+        }
+        commitment_patterns = find_commitment_patterns(commitment_history)
+
+        for cp in commitment_patterns:
+            patterns.append(Pattern(
+                pattern_id=cp.pattern_id,
+                pattern_type=PatternType.COMMITMENT_PATTERN,
+                confidence=0.7,
+                description=cp.pattern_description,
+                evidence=[
+                    f"Completion rate: {cp.completion_rate:.1%}",
+                    f"Average delay: {cp.average_delay_days:.1f} days"
+                ],
+                first_detected=datetime.utcnow() - timedelta(days=90),
+                last_detected=datetime.utcnow(),
+                frequency=cp.commitment_count,
+                risk_score=50 if cp.completion_rate < 0.7 else 20,
+                recommendations=["Review commitment tracking", "Improve delivery process"]
+            ))
+
+        return patterns
+
+    def _build_pattern_inputs(
+        self,
+        account_id: str,
+        timeline_events: List[TimelineEvent],
+        context: Dict[str, Any]
+    ) -> AccountTimeline:
+        """Assemble pattern recognizer inputs for an account."""
+        engagement_data = {
+            'total_interactions': len(timeline_events),
+            'days_since_last_interaction': (
+                datetime.utcnow() - timeline_events[-1].timestamp
+            ).days if timeline_events else 90
+        }
+
+        return AccountTimeline(
+            account_id=account_id,
+            events=timeline_events,
+            engagement_data=engagement_data,
+            usage_data=context.get('usage_data', {}),
+            contract_data=context.get('contract_data', {})
+        )
+
     async def analyze_sentiment_trend(
         self,
         account_id: str,
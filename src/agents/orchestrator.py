@@ -38,7 +38,7 @@ import asyncio
 import uuid
 import traceback
 import re
-from typing import Dict, Any, AsyncGenerator, Optional, List
+from typing import Dict, Any, AsyncGenerator, Optional, List, Tuple
 from datetime import datetime
 import structlog
 
@@ -48,9 +48,13 @@ from src.agents.zoho_data_scout import ZohoDataScout
 from src.agents.memory_analyst import MemoryAnalyst
 from src.agents.base_agent import BaseAgent
 from src.agents.intent_detection import IntentDetectionEngine
+from src.agents.analysis_cache import AccountAnalysisCache, CachedAnalysis
 
 logger = structlog.get_logger(__name__)
 
+# Account IDs quoted in a chat message ("analyze ACC-123")
+ACCOUNT_ID_PATTERN = re.compile(r'\bACC-[A-Za-z0-9-]+\b', re.IGNORECASE)
+
 
 class OrchestratorAgent:
     """Multi-agent orchestrator with AG UI Protocol streaming and dual-mode operation.
@@ -59,7 +63,8 @@ class OrchestratorAgent:
 
     Dual Operation Modes:
     1. Account Analysis Mode (when account_id provided):
-       - Coordinates execution of specialist agents in sequence
+       - Coordinates specialist agents; the Zoho and memory fetches run
+         concurrently while events are emitted in step order
        - ZohoDataScout - Fetch and analyze Zoho CRM data
        - MemoryAnalyst - Retrieve historical context and patterns
        - RecommendationAuthor - Generate actionable recommendations (Week 7)
@@ -97,7 +102,9 @@ class OrchestratorAgent:
         memory_analyst: MemoryAnalyst,
         approval_manager: ApprovalManager,
         recommendation_author: Optional[Any] = None,
-        system_prompt: Optional[str] = None
+        system_prompt: Optional[str] = None,
+        analysis_cache: Optional[AccountAnalysisCache] = None,
+        intent_engine: Optional[IntentDetectionEngine] = None
     ):
         """Initialize orchestrator with specialist agents and general conversation capability.
 
@@ -108,6 +115,10 @@ class OrchestratorAgent:
             approval_manager: Approval workflow manager (for account analysis mode)
             recommendation_author: RecommendationAuthor (optional, Week 7)
             system_prompt: Custom system prompt for general conversation mode
+            analysis_cache: Cache of account analysis results reused while
+                the account is unchanged in Zoho (disabled if None)
+            intent_engine: Intent engine shared across sessions (a new one
+                is built if None)
         """
         self.session_id = session_id
         self.agent_id = "orchestrator"
@@ -120,11 +131,20 @@ class OrchestratorAgent:
         # Approval manager (account analysis mode)
         self.approval_manager = approval_manager
 
+        # Analysis results reused across chat turns (account analysis mode)
+        self.analysis_cache = analysis_cache
+
         # General conversation mode setup
         self.system_prompt = system_prompt or self._get_default_system_prompt()
 
         # Intent detection engine for intelligent routing
-        self.intent_engine = IntentDetectionEngine(confidence_threshold=0.5)
+        self.intent_engine = intent_engine or IntentDetectionEngine(
+            confidence_threshold=0.5,
+            verbose_signals=False
+        )
+
+        # Outcomes of fetches started before routing was decided
+        self.prefetch_stats = {"started": 0, "used": 0, "discarded": 0}
 
         # Logging
         self.logger = logger.bind(
@@ -336,7 +356,9 @@ Be helpful, professional, and concise. Focus on providing actionable insights an
         Phase 1 Transformation: Supports both account analysis and general conversation modes.
 
         Workflow Steps (Intent Detection First):
-        1. Extract message and detect user intent
+        1. Extract message and detect user intent; when the message quotes an
+           account ID and context has account_id, the Zoho snapshot and
+           Cognee context fetches start first and are cancelled if unused
         2. Route to appropriate execution mode:
            - Account Analysis Mode: When account_id provided or account intent detected
            - General Conversation Mode: When no account_id and general intent detected
@@ -389,6 +411,46 @@ Be helpful, professional, and concise. Focus on providing actionable insights an
         # Check for forced mode override
         force_mode = context.get("force_mode")
 
+        # The account the message names wins over the one in the context, so
+        # the prefetch and the analysis below agree on it
+        account_id = self._resolve_account_id(message, context)
+        if account_id != context.get("account_id"):
+            context = {**context, "account_id": account_id}
+
+        # An account ID in the message ("analyze ACC-123") nearly always ends
+        # in account analysis, so the Zoho and Cognee fetches start before
+        # routing is decided and are cancelled if the route doesn't need them
+        prefetch = None
+        if not force_mode and self._should_prefetch(message, account_id):
+            prefetch = self._start_account_prefetch(account_id)
+            # Let the fetches send their requests before intent scoring runs
+            await asyncio.sleep(0)
+
+        try:
+            async for event in self._route_and_execute(context, message, force_mode, prefetch):
+                yield event
+        finally:
+            if prefetch is not None:
+                self._release_tasks(prefetch)
+
+    async def _route_and_execute(
+        self,
+        context: Dict[str, Any],
+        message: str,
+        force_mode: Optional[str],
+        prefetch: Optional[Tuple[asyncio.Task, asyncio.Task]]
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Detect intent and run the chosen execution mode.
+
+        Args:
+            context: Execution context
+            message: User message
+            force_mode: Mode override, skips intent detection when set
+            prefetch: Speculative (snapshot, history) fetches, if started
+
+        Yields:
+            AG UI Protocol events from the chosen mode
+        """
         # Detect intent unless mode is explicitly forced
         if force_mode:
             intent_result = {
@@ -432,9 +494,12 @@ Be helpful, professional, and concise. Focus on providing actionable insights an
 
         if should_use_account_analysis:
             # Account Analysis Mode - use existing logic but make account_id optional
-            async for event in self._execute_account_analysis(context, intent_result):
+            async for event in self._execute_account_analysis(context, intent_result, prefetch):
                 yield event
         else:
+            if prefetch is not None:
+                self._discard_prefetch(prefetch, account_id, reason="general_conversation")
+
             # General Conversation Mode
             async for event in self._execute_general_conversation(message, context, AGUIEventEmitter(session_id=self.session_id)):
                 yield event
@@ -442,13 +507,22 @@ Be helpful, professional, and concise. Focus on providing actionable insights an
     async def _execute_account_analysis(
         self,
         context: Dict[str, Any],
-        intent_result: Dict[str, Any]
+        intent_result: Dict[str, Any],
+        prefetch: Optional[Tuple[asyncio.Task, asyncio.Task]] = None
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """Execute account analysis workflow with specialist agents.
 
+        The Zoho snapshot and the MemoryAnalyst lookups run concurrently;
+        events are still emitted in step order. The analyst's lookups only
+        need the account ID, so there is no account data to merge into them
+        mid-flight, and the recommendation step starts as soon as both
+        results it is built from are in.
+
         Args:
             context: Execution context
             intent_result: Intent detection results
+            prefetch: (snapshot, history) fetches already started for
+                the account before routing, adopted instead of refetching
 
         Yields:
             AG UI Protocol events for account analysis workflow
@@ -520,12 +594,56 @@ Be helpful, professional, and concise. Focus on providing actionable insights an
             "intent_detection": intent_result
         }
 
+        if prefetch is not None:
+            # Already running since before intent detection
+            scout_task, memory_task = prefetch
+        else:
+            # The Zoho fetch and the Cognee lookups only need the account ID,
+            # so both start now, alongside the cache version lookup; events
+            # below are still emitted in step order
+            scout_task = asyncio.create_task(
+                self.zoho_scout.get_account_snapshot(account_id)
+            )
+            memory_task = asyncio.create_task(
+                self.memory_analyst.get_historical_context(
+                    account_id=account_id,
+                    lookback_days=365,
+                    include_patterns=True
+                )
+            )
+
+        # Reuse the previous analysis while the account is unchanged
+        try:
+            account_version, cached = await self._lookup_cached_analysis(account_id, workflow)
+        except BaseException:
+            self._release_tasks((scout_task, memory_task))
+            raise
+
+        if cached is not None:
+            if prefetch is not None:
+                self._discard_prefetch(prefetch, account_id, reason="analysis_cache_hit")
+            else:
+                self._release_tasks((scout_task, memory_task))
+            scout_task = self._completed_future(cached.account_snapshot)
+            memory_task = self._completed_future(cached.historical_context)
+        elif prefetch is not None:
+            self.prefetch_stats["used"] += 1
+            self.logger.info("account_prefetch_used", account_id=account_id)
+
         try:
             # ================================================================
             # Step 1: Workflow Started
             # ================================================================
             yield emitter.emit_workflow_started(workflow, account_id)
 
+            if cached is not None:
+                execution_context["analysis_cache_hit"] = True
+                yield emitter.emit_agent_stream(
+                    agent="orchestrator",
+                    content="Account unchanged since the last analysis; reusing cached results",
+                    content_type="text"
+                )
+
             # ================================================================
             # Step 2: ZohoDataScout - Fetch Account Data
             # ================================================================
@@ -536,20 +654,11 @@ Be helpful, professional, and concise. Focus on providing actionable insights an
             )
 
             try:
-                # Fetch account snapshot
-                account_snapshot = await self.zoho_scout.get_account_snapshot(account_id)
+                # Wait for the account snapshot
+                account_snapshot = await scout_task
 
                 # Store in execution context
-                execution_context["account_data"] = {
-                    "snapshot_id": account_snapshot.snapshot_id,
-                    "account": account_snapshot.account.model_dump(),
-                    "aggregated_data": account_snapshot.aggregated_data.model_dump(),
-                    "changes": account_snapshot.changes.model_dump(),
-                    "risk_signals": [signal.model_dump() for signal in account_snapshot.risk_signals],
-                    "risk_level": account_snapshot.risk_level.value,
-                    "priority_score": account_snapshot.priority_score,
-                    "needs_review": account_snapshot.needs_review
-                }
+                execution_context["account_data"] = self._build_account_data(account_snapshot)
 
                 # Emit progress stream
                 yield emitter.emit_agent_stream(
@@ -600,12 +709,8 @@ Be helpful, professional, and concise. Focus on providing actionable insights an
             )
 
             try:
-                # Get historical context
-                historical_context = await self.memory_analyst.get_historical_context(
-                    account_id=account_id,
-                    lookback_days=365,
-                    include_patterns=True
-                )
+                # Get historical context (fetched alongside the snapshot)
+                historical_context = await memory_task
 
                 # Store in execution context
                 execution_context["historical_context"] = historical_context.model_dump()
@@ -660,7 +765,9 @@ Be helpful, professional, and concise. Focus on providing actionable insights an
             # Step 4: RecommendationAuthor - Generate Recommendations
             # ================================================================
             # TODO: Week 7 implementation
-            if self.recommendation_author:
+            if cached is not None:
+                execution_context["recommendations"] = cached.recommendations
+            elif self.recommendation_author:
                 yield emitter.emit_agent_started(
                     agent="recommendation_author",
                     step=3,
@@ -693,6 +800,19 @@ Be helpful, professional, and concise. Focus on providing actionable insights an
                     "expected_impact": "Mitigate identified risks"
                 }]
 
+            if cached is None and account_version is not None:
+                self.analysis_cache.put(
+                    CachedAnalysis(
+                        account_id=account_id,
+                        workflow=workflow,
+                        version=account_version,
+                        account_snapshot=account_snapshot,
+                        historical_context=historical_context,
+                        recommendations=execution_context["recommendations"]
+                    ),
+                    session_id=self.session_id
+                )
+
             # ================================================================
             # Step 5: Request Approval
             # ================================================================
@@ -855,6 +975,158 @@ Be helpful, professional, and concise. Focus on providing actionable insights an
 
             raise
 
+        finally:
+            # Don't leave a fetch running (or its error unobserved) when the
+            # workflow fails or the client disconnects
+            self._release_tasks((scout_task, memory_task))
+
+    @staticmethod
+    def _resolve_account_id(message: str, context: Dict[str, Any]) -> Optional[str]:
+        """Take the account ID quoted in the message, else the context's.
+
+        Args:
+            message: User message
+            context: Execution context
+
+        Returns:
+            Account ID, or None if neither names one
+        """
+        match = ACCOUNT_ID_PATTERN.search(message or "")
+        if match:
+            return "ACC-" + match.group(0)[4:]
+        return context.get("account_id")
+
+    def _should_prefetch(self, message: str, account_id: Optional[str]) -> bool:
+        """Decide whether to fetch account data before routing is decided.
+
+        Args:
+            message: User message
+            account_id: Account ID resolved from the message or context
+
+        Returns:
+            True when account analysis is possible and the message quotes an
+            account ID
+        """
+        return bool(
+            account_id
+            and self.zoho_scout is not None
+            and self.memory_analyst is not None
+            and ACCOUNT_ID_PATTERN.search(message)
+        )
+
+    def _start_account_prefetch(self, account_id: str) -> Tuple[asyncio.Task, asyncio.Task]:
+        """Start the Zoho snapshot and Cognee context fetches for an account.
+
+        Args:
+            account_id: Account identifier
+
+        Returns:
+            (snapshot task, historical context task)
+        """
+        self.prefetch_stats["started"] += 1
+        self.logger.info("account_prefetch_started", account_id=account_id)
+        return (
+            asyncio.create_task(self.zoho_scout.get_account_snapshot(account_id)),
+            asyncio.create_task(
+                self.memory_analyst.get_historical_context(
+                    account_id=account_id,
+                    lookback_days=365,
+                    include_patterns=True
+                )
+            )
+        )
+
+    def _discard_prefetch(
+        self,
+        prefetch: Tuple[asyncio.Task, asyncio.Task],
+        account_id: Optional[str],
+        reason: str
+    ) -> None:
+        """Cancel speculative fetches the chosen route doesn't need.
+
+        Args:
+            prefetch: (snapshot, history) tasks
+            account_id: Account the fetches were started for
+            reason: Why the fetches were not used
+        """
+        self._release_tasks(prefetch)
+        self.prefetch_stats["discarded"] += 1
+        self.logger.info("account_prefetch_discarded", account_id=account_id, reason=reason)
+
+    @staticmethod
+    def _release_tasks(tasks: Tuple["asyncio.Future[Any]", ...]) -> None:
+        """Cancel unfinished tasks and mark finished ones' errors as observed."""
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                task.exception()
+
+    async def _lookup_cached_analysis(
+        self,
+        account_id: str,
+        workflow: str
+    ) -> Tuple[Optional[str], Optional[CachedAnalysis]]:
+        """Check the analysis cache against the account's current version.
+
+        Args:
+            account_id: Account identifier
+            workflow: Workflow being run
+
+        Returns:
+            (current account version, cached analysis if still valid); the
+            version is None when caching is disabled or it can't be resolved
+        """
+        if self.analysis_cache is None:
+            return None, None
+
+        try:
+            version = await self.zoho_scout.get_account_version(account_id)
+        except Exception as e:
+            # Without a version the cache can't be trusted; run the full chain
+            self.logger.warning(
+                "account_version_lookup_failed",
+                account_id=account_id,
+                error=str(e)
+            )
+            return None, None
+
+        cached = self.analysis_cache.get(account_id, workflow, version, self.session_id)
+        self.logger.info(
+            "analysis_cache_lookup",
+            account_id=account_id,
+            hit=cached is not None
+        )
+        return version, cached
+
+    @staticmethod
+    def _completed_future(result: Any) -> "asyncio.Future[Any]":
+        """Wrap an already available result as a finished future."""
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(result)
+        return future
+
+    @staticmethod
+    def _build_account_data(account_snapshot: Any) -> Dict[str, Any]:
+        """Flatten a ZohoDataScout snapshot into execution context data.
+
+        Args:
+            account_snapshot: AccountSnapshot from ZohoDataScout
+
+        Returns:
+            Account data dict shared with later steps
+        """
+        return {
+            "snapshot_id": account_snapshot.snapshot_id,
+            "account": account_snapshot.account.model_dump(),
+            "aggregated_data": account_snapshot.aggregated_data.model_dump(),
+            "changes": account_snapshot.changes.model_dump(),
+            "risk_signals": [signal.model_dump() for signal in account_snapshot.risk_signals],
+            "risk_level": account_snapshot.risk_level.value,
+            "priority_score": account_snapshot.priority_score,
+            "needs_review": account_snapshot.needs_review
+        }
+
     async def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Execute orchestration without event streaming (legacy interface).
 
@@ -5,11 +5,19 @@ Detects sophisticated patterns including:
 - Upsell opportunities
 - Renewal risks
 - Engagement anomalies
+
+Single-account detectors are used on the interactive path; portfolio runs
+use ``PatternRecognizer.detect_patterns_batch`` which computes time-window
+statistics for every account in one vectorized pass and fans the remaining
+per-account detectors out to a process pool.
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from datetime import datetime, timedelta
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import numpy as np
 import structlog
 
 from src.agents.memory_models import (
@@ -20,6 +28,52 @@ from src.agents.memory_models import (
 logger = structlog.get_logger(__name__)
 
 
+# Column layout of the per-account window count matrix used by batch detection
+_RECENT_30 = 0
+_HISTORICAL_30_90 = 1
+_LAST_60 = 2
+
+
+@dataclass
+class AccountTimeline:
+    """Inputs for one account in a batch pattern detection run.
+
+    Attributes:
+        account_id: Account identifier
+        events: Timeline events for the account
+        engagement_data: Engagement metrics (churn detection)
+        usage_data: Product usage data (upsell detection)
+        contract_data: Contract and renewal data (renewal risk detection)
+    """
+    account_id: str
+    events: List[TimelineEvent]
+    engagement_data: Dict[str, Any] = field(default_factory=dict)
+    usage_data: Dict[str, Any] = field(default_factory=dict)
+    contract_data: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class _BatchItem:
+    """Per-account work unit with batch-precomputed statistics."""
+    timeline: AccountTimeline
+    window_counts: Tuple[int, int, int]
+    renewal_dt: Optional[datetime]
+    days_to_renewal: Optional[int]
+
+
+def _detect_batch_chunk(
+    thresholds: Tuple[float, float, float],
+    now: datetime,
+    items: List[_BatchItem]
+) -> List[Tuple[str, List[Pattern]]]:
+    """Run all detector families over a chunk of accounts.
+
+    Module-level so it can be pickled into ``ProcessPoolExecutor`` workers.
+    """
+    recognizer = PatternRecognizer(*thresholds)
+    return [(item.timeline.account_id, recognizer._detect_item(item, now)) for item in items]
+
+
 class PatternRecognizer:
     """Advanced pattern recognition engine.
 
@@ -68,13 +122,31 @@ class PatternRecognizer:
         Returns:
             List of churn risk patterns
         """
-        patterns: List[Pattern] = []
         now = datetime.utcnow()
-
-        # Pattern 1: Engagement drop
         engagement_pattern = self._detect_engagement_drop(
             account_id, events, engagement_data, now
         )
+        patterns = self._collect_churn_patterns(account_id, events, now, engagement_pattern)
+
+        self.logger.info(
+            "churn_patterns_detected",
+            account_id=account_id,
+            pattern_count=len(patterns)
+        )
+
+        return patterns
+
+    def _collect_churn_patterns(
+        self,
+        account_id: str,
+        events: List[TimelineEvent],
+        now: datetime,
+        engagement_pattern: Optional[Pattern]
+    ) -> List[Pattern]:
+        """Run churn detectors given an already-evaluated engagement drop."""
+        patterns: List[Pattern] = []
+
+        # Pattern 1: Engagement drop
         if engagement_pattern:
             patterns.append(engagement_pattern)
 
@@ -97,12 +169,6 @@ class PatternRecognizer:
         if meeting_pattern:
             patterns.append(meeting_pattern)
 
-        self.logger.info(
-            "churn_patterns_detected",
-            account_id=account_id,
-            pattern_count=len(patterns)
-        )
-
         return patterns
 
     def detect_upsell_opportunities(
@@ -128,8 +194,27 @@ class PatternRecognizer:
         Returns:
             List of upsell opportunity patterns
         """
+        patterns = self._collect_upsell_patterns(
+            account_id, events, usage_data, datetime.utcnow()
+        )
+
+        self.logger.info(
+            "upsell_patterns_detected",
+            account_id=account_id,
+            pattern_count=len(patterns)
+        )
+
+        return patterns
+
+    def _collect_upsell_patterns(
+        self,
+        account_id: str,
+        events: List[TimelineEvent],
+        usage_data: Dict[str, Any],
+        now: datetime
+    ) -> List[Pattern]:
+        """Run upsell detectors against a fixed reference time."""
         patterns: List[Pattern] = []
-        now = datetime.utcnow()
 
         # Pattern 1: Usage growth
         usage_pattern = self._detect_usage_growth(account_id, usage_data, now)
@@ -150,12 +235,6 @@ class PatternRecognizer:
         if engagement_pattern:
             patterns.append(engagement_pattern)
 
-        self.logger.info(
-            "upsell_patterns_detected",
-            account_id=account_id,
-            pattern_count=len(patterns)
-        )
-
         return patterns
 
     def detect_renewal_risk_patterns(
@@ -181,22 +260,43 @@ class PatternRecognizer:
         Returns:
             List of renewal risk patterns
         """
-        patterns: List[Pattern] = []
         now = datetime.utcnow()
 
-        renewal_date = contract_data.get('renewal_date')
-        if not renewal_date:
-            return patterns
-
-        renewal_dt = datetime.fromisoformat(renewal_date) if isinstance(
-            renewal_date, str
-        ) else renewal_date
+        renewal_dt = self._parse_renewal_date(contract_data)
+        if renewal_dt is None:
+            return []
 
         days_to_renewal = (renewal_dt - now).days
 
         # Only analyze if within renewal window (90 days)
         if days_to_renewal > 90:
-            return patterns
+            return []
+
+        recent_count = sum(1 for e in events if (now - e.timestamp).days <= 60)
+        patterns = self._collect_renewal_patterns(
+            account_id, events, now, renewal_dt, days_to_renewal, recent_count
+        )
+
+        self.logger.info(
+            "renewal_risk_patterns_detected",
+            account_id=account_id,
+            pattern_count=len(patterns),
+            days_to_renewal=days_to_renewal
+        )
+
+        return patterns
+
+    def _collect_renewal_patterns(
+        self,
+        account_id: str,
+        events: List[TimelineEvent],
+        now: datetime,
+        renewal_dt: datetime,
+        days_to_renewal: int,
+        recent_count: int
+    ) -> List[Pattern]:
+        """Run renewal risk detectors for an account inside the renewal window."""
+        patterns: List[Pattern] = []
 
         # Pattern 1: Commitment gaps
         commitment_pattern = self._detect_commitment_gaps(
@@ -223,19 +323,158 @@ class PatternRecognizer:
             patterns.append(competitive_pattern)
 
         # Pattern 5: Low engagement
-        engagement_pattern = self._detect_renewal_low_engagement(
-            account_id, events, now, days_to_renewal
+        engagement_pattern = self._renewal_low_engagement_pattern(
+            account_id, recent_count, now, days_to_renewal
         )
         if engagement_pattern:
             patterns.append(engagement_pattern)
 
+        return patterns
+
+    @staticmethod
+    def _parse_renewal_date(contract_data: Dict[str, Any]) -> Optional[datetime]:
+        """Extract the renewal date from contract data, if present."""
+        renewal_date = contract_data.get('renewal_date')
+        if not renewal_date:
+            return None
+
+        return datetime.fromisoformat(renewal_date) if isinstance(
+            renewal_date, str
+        ) else renewal_date
+
+    # Batch detection
+
+    def detect_patterns_batch(
+        self,
+        timelines: Sequence[AccountTimeline],
+        max_workers: Optional[int] = None,
+        chunk_size: int = 250
+    ) -> Dict[str, List[Pattern]]:
+        """Detect churn, upsell and renewal patterns for many accounts.
+
+        The reference time, renewal windows and event-age window counts are
+        computed once for the whole batch (event ages in a single NumPy
+        pass). The remaining detectors are CPU-bound string/list work and are
+        spread over a process pool when ``max_workers`` > 1 and the batch
+        spans more than one chunk.
+
+        Results match calling ``detect_churn_risk_patterns``,
+        ``detect_upsell_opportunities`` and ``detect_renewal_risk_patterns``
+        per account, in that order, with a shared reference time.
+
+        Args:
+            timelines: Account inputs to analyze
+            max_workers: Worker processes (None or 1 runs inline)
+            chunk_size: Accounts per worker task
+
+        Returns:
+            Mapping of account ID to detected patterns
+        """
+        now = datetime.utcnow()
+        items = self._prepare_batch(timelines, now)
+
+        chunks = [items[i:i + chunk_size] for i in range(0, len(items), max(1, chunk_size))]
+        thresholds = (self.churn_threshold, self.upsell_threshold, self.renewal_risk_threshold)
+
+        if max_workers and max_workers > 1 and len(chunks) > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                chunk_results = list(executor.map(
+                    _detect_batch_chunk,
+                    [thresholds] * len(chunks),
+                    [now] * len(chunks),
+                    chunks
+                ))
+        else:
+            chunk_results = [_detect_batch_chunk(thresholds, now, chunk) for chunk in chunks]
+
+        results: Dict[str, List[Pattern]] = {}
+        for chunk_result in chunk_results:
+            for account_id, patterns in chunk_result:
+                results.setdefault(account_id, []).extend(patterns)
+
         self.logger.info(
-            "renewal_risk_patterns_detected",
-            account_id=account_id,
-            pattern_count=len(patterns),
-            days_to_renewal=days_to_renewal
+            "batch_patterns_detected",
+            account_count=len(results),
+            pattern_count=sum(len(p) for p in results.values()),
+            chunk_count=len(chunks),
+            max_workers=max_workers or 1
         )
 
+        return results
+
+    def _prepare_batch(
+        self,
+        timelines: Sequence[AccountTimeline],
+        now: datetime
+    ) -> List[_BatchItem]:
+        """Precompute window counts and renewal windows for every account."""
+        window_counts = self._compute_window_counts(timelines, now)
+
+        items: List[_BatchItem] = []
+        for timeline, counts in zip(timelines, window_counts.tolist()):
+            renewal_dt = self._parse_renewal_date(timeline.contract_data)
+            days_to_renewal = (renewal_dt - now).days if renewal_dt is not None else None
+            items.append(_BatchItem(
+                timeline=timeline,
+                window_counts=tuple(counts),
+                renewal_dt=renewal_dt,
+                days_to_renewal=days_to_renewal
+            ))
+
+        return items
+
+    @staticmethod
+    def _compute_window_counts(
+        timelines: Sequence[AccountTimeline],
+        now: datetime
+    ) -> np.ndarray:
+        """Count events per account in each look-back window.
+
+        Returns:
+            Integer array of shape (n_accounts, 3) with columns for the
+            last 30 days, 30-90 days ago and the last 60 days.
+        """
+        sizes = np.fromiter((len(t.events) for t in timelines), dtype=np.int64, count=len(timelines))
+        counts = np.zeros((len(timelines), 3), dtype=np.int64)
+        if sizes.sum() == 0:
+            return counts
+
+        timestamps = np.array(
+            [e.timestamp for t in timelines for e in t.events], dtype="datetime64[us]"
+        )
+        # Floor division matches timedelta.days used by the per-account detectors
+        ages = (np.datetime64(now, "us") - timestamps) // np.timedelta64(1, "D")
+        owner = np.repeat(np.arange(len(timelines)), sizes)
+
+        n = len(timelines)
+        counts[:, _RECENT_30] = np.bincount(owner, weights=ages <= 30, minlength=n)
+        counts[:, _HISTORICAL_30_90] = np.bincount(
+            owner, weights=(ages > 30) & (ages <= 90), minlength=n
+        )
+        counts[:, _LAST_60] = np.bincount(owner, weights=ages <= 60, minlength=n)
+        return counts
+
+    def _detect_item(self, item: _BatchItem, now: datetime) -> List[Pattern]:
+        """Run all detector families for one precomputed batch item."""
+        timeline = item.timeline
+        account_id = timeline.account_id
+        events = timeline.events
+        counts = item.window_counts
+
+        engagement_pattern = self._engagement_drop_pattern(
+            account_id, counts[_RECENT_30], counts[_HISTORICAL_30_90], now
+        )
+        patterns = self._collect_churn_patterns(account_id, events, now, engagement_pattern)
+        patterns.extend(self._collect_upsell_patterns(
+            account_id, events, timeline.usage_data, now
+        ))
+
+        if item.renewal_dt is not None and item.days_to_renewal <= 90:
+            patterns.extend(self._collect_renewal_patterns(
+                account_id, events, now, item.renewal_dt,
+                item.days_to_renewal, counts[_LAST_60]
+            ))
+
         return patterns
 
     # Private helper methods for churn detection
@@ -248,14 +487,24 @@ class PatternRecognizer:
         now: datetime
     ) -> Optional[Pattern]:
         """Detect significant engagement drop."""
-        recent_events = [e for e in events if (now - e.timestamp).days <= 30]
-        historical_events = [e for e in events if 30 < (now - e.timestamp).days <= 90]
+        recent_count = sum(1 for e in events if (now - e.timestamp).days <= 30)
+        historical_count = sum(1 for e in events if 30 < (now - e.timestamp).days <= 90)
 
-        if not historical_events:
+        return self._engagement_drop_pattern(account_id, recent_count, historical_count, now)
+
+    def _engagement_drop_pattern(
+        self,
+        account_id: str,
+        recent_count: int,
+        historical_count: int,
+        now: datetime
+    ) -> Optional[Pattern]:
+        """Build the engagement drop pattern from window event counts."""
+        if not historical_count:
             return None
 
-        recent_rate = len(recent_events) / 30
-        historical_rate = len(historical_events) / 60
+        recent_rate = recent_count / 30
+        historical_rate = historical_count / 60
 
         if historical_rate == 0:
             return None
@@ -788,22 +1037,16 @@ class PatternRecognizer:
 
         return None
 
-    def _detect_renewal_low_engagement(
+    def _renewal_low_engagement_pattern(
         self,
         account_id: str,
-        events: List[TimelineEvent],
+        actual_interactions: int,
         now: datetime,
         days_to_renewal: int
     ) -> Optional[Pattern]:
-        """Detect low engagement during renewal period."""
-        renewal_period_events = [
-            e for e in events
-            if (now - e.timestamp).days <= 60
-        ]
-
+        """Build the renewal low-engagement pattern from a 60-day event count."""
         # Expected: at least 1 interaction per week
         expected_interactions = 60 / 7  # ~8-9
-        actual_interactions = len(renewal_period_events)
 
         if actual_interactions < expected_interactions * 0.5:
             return Pattern(
@@ -4,7 +4,9 @@ Part of Week 6: Recommendation Author Implementation.
 Follows SPARC Refinement Phase specification (MASTER_SPARC_PLAN_V3.md lines 605-625).
 """
 
-from typing import Dict, Any, List, AsyncGenerator
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, AsyncGenerator, Optional, Sequence, Tuple
 from datetime import datetime, timedelta
 import structlog
 
@@ -14,6 +16,17 @@ from src.events.ag_ui_emitter import AGUIEventEmitter
 logger = structlog.get_logger(__name__)
 
 
+def _author_batch_chunk(
+    now: datetime,
+    items: List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]
+) -> List[Tuple[str, List[Dict[str, Any]], Optional[str]]]:
+    """Generate recommendations for a chunk of accounts.
+
+    Module-level so it can be pickled into ``ProcessPoolExecutor`` workers.
+    """
+    return RecommendationAuthor()._build_batch_chunk(now, items)
+
+
 class RecommendationAuthor(BaseAgent):
     """Generates actionable account recommendations with confidence scoring.
 
@@ -74,6 +87,10 @@ class RecommendationAuthor(BaseAgent):
             permission_mode="default"
         )
 
+        # Worker pool for generate_batch, built on first use and reused
+        self._batch_executor: Optional[ProcessPoolExecutor] = None
+        self._batch_executor_workers = 0
+
         self.logger.info("recommendation_author_initialized")
 
     async def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
@@ -185,6 +202,140 @@ class RecommendationAuthor(BaseAgent):
 
             raise
 
+    async def generate_batch(
+        self,
+        contexts: Sequence[Dict[str, Any]],
+        max_workers: Optional[int] = None,
+        chunk_size: int = 50
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Generate recommendations for many accounts as an async stream.
+
+        The reference time is taken once for the whole batch and repeated
+        account IDs are generated once (contexts without an account ID are
+        never merged). Accounts are processed in chunks, spread over a
+        process pool when ``max_workers`` > 1, and each chunk's results are
+        yielded as soon as it finishes, so a caller compiling a brief can
+        start before the last account is done. The pool is kept on the
+        agent and reused by later batches until ``cleanup`` is called.
+
+        Results match ``execute`` per account, except that every
+        recommendation in the batch shares one ``created_at``. An account
+        that fails is reported with an ``error`` instead of aborting the
+        batch.
+
+        Args:
+            contexts: Execution contexts (account_data, historical_insights)
+            max_workers: Worker processes (None or 1 runs inline)
+            chunk_size: Accounts per chunk
+
+        Yields:
+            Per-account results: account_id, recommendations and error
+            (None on success), in chunk completion order
+        """
+        now = datetime.utcnow()
+
+        items = []
+        seen = set()
+        for context in contexts:
+            account_data = context.get("account_data") or {}
+            account_id = account_data.get("account_id")
+            if account_id is not None:
+                if account_id in seen:
+                    continue
+                seen.add(account_id)
+            items.append((account_data, context.get("historical_insights", [])))
+
+        chunks = [items[i:i + chunk_size] for i in range(0, len(items), max(1, chunk_size))]
+
+        self.logger.info(
+            "generating_recommendations_batch",
+            account_count=len(items),
+            duplicates_skipped=len(contexts) - len(items),
+            chunk_count=len(chunks),
+            max_workers=max_workers or 1
+        )
+
+        generated = 0
+        if max_workers and max_workers > 1 and len(chunks) > 1:
+            loop = asyncio.get_running_loop()
+            executor = self._get_batch_executor(max_workers)
+            pending = [
+                loop.run_in_executor(executor, _author_batch_chunk, now, chunk)
+                for chunk in chunks
+            ]
+            try:
+                for next_chunk in asyncio.as_completed(pending):
+                    for result in await next_chunk:
+                        generated += len(result[1])
+                        yield self._batch_result(*result)
+            finally:
+                # Drop chunks not yet started if the consumer stops early
+                for future in pending:
+                    future.cancel()
+        else:
+            for chunk in chunks:
+                for result in self._build_batch_chunk(now, chunk):
+                    generated += len(result[1])
+                    yield self._batch_result(*result)
+                # Let consumers run between chunks
+                await asyncio.sleep(0)
+
+        self.logger.info(
+            "recommendations_batch_generated",
+            account_count=len(items),
+            count=generated
+        )
+
+    async def cleanup(self) -> None:
+        """Shut down the batch worker pool, then end the session."""
+        self.close_batch_executor()
+        await super().cleanup()
+
+    def close_batch_executor(self) -> None:
+        """Shut down the worker pool kept for ``generate_batch``."""
+        if self._batch_executor is not None:
+            self._batch_executor.shutdown(wait=False, cancel_futures=True)
+            self._batch_executor = None
+            self._batch_executor_workers = 0
+
+    def _get_batch_executor(self, max_workers: int) -> ProcessPoolExecutor:
+        """Return the shared worker pool, rebuilding it if the size changed."""
+        if self._batch_executor is None or self._batch_executor_workers != max_workers:
+            self.close_batch_executor()
+            self._batch_executor = ProcessPoolExecutor(max_workers=max_workers)
+            self._batch_executor_workers = max_workers
+        return self._batch_executor
+
+    def _build_batch_chunk(
+        self,
+        now: datetime,
+        items: List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]
+    ) -> List[Tuple[str, List[Dict[str, Any]], Optional[str]]]:
+        """Apply the rules to a chunk, capturing per-account failures."""
+        results = []
+        for account_data, historical_insights in items:
+            account_id = account_data.get("account_id", "unknown")
+            try:
+                if not account_data:
+                    raise ValueError("account_data is required in context")
+                results.append((
+                    account_id,
+                    self._build_recommendations(account_data, historical_insights, now),
+                    None
+                ))
+            except Exception as e:
+                self.logger.warning("batch_account_failed", account_id=account_id, error=str(e))
+                results.append((account_id, [], str(e)))
+        return results
+
+    @staticmethod
+    def _batch_result(
+        account_id: str,
+        recommendations: List[Dict[str, Any]],
+        error: Optional[str]
+    ) -> Dict[str, Any]:
+        return {"account_id": account_id, "recommendations": recommendations, "error": error}
+
     async def _generate_recommendations(
         self,
         account_data: Dict[str, Any],
@@ -198,6 +349,24 @@ class RecommendationAuthor(BaseAgent):
             historical_insights: Historical patterns from MemoryAnalyst
             emitter: Event emitter for progress streaming
 
+        Returns:
+            List of recommendation dictionaries with confidence scores
+        """
+        return self._build_recommendations(account_data, historical_insights)
+
+    def _build_recommendations(
+        self,
+        account_data: Dict[str, Any],
+        historical_insights: List[Dict[str, Any]],
+        now: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """Apply the recommendation rules to one account (synchronous).
+
+        Args:
+            account_data: Account metrics and information
+            historical_insights: Historical patterns from MemoryAnalyst
+            now: Reference time shared by a batch (defaults to now)
+
         Returns:
             List of recommendation dictionaries with confidence scores
         """
@@ -205,10 +374,11 @@ class RecommendationAuthor(BaseAgent):
 
         # Extract key metrics
         account_id = account_data.get("account_id", "unknown")
-        last_engagement_days = self._get_days_since_last_engagement(account_data)
+        now = now or datetime.utcnow()
+        last_engagement_days = self._get_days_since_last_engagement(account_data, now)
         account_health = account_data.get("health_score", 50)
         revenue = account_data.get("annual_revenue", 0)
-        contract_expiry_days = self._get_days_until_contract_expiry(account_data)
+        contract_expiry_days = self._get_days_until_contract_expiry(account_data, now)
 
         # Generate engagement recommendations
         engagement_rec = self._generate_engagement_recommendation(
@@ -257,6 +427,10 @@ class RecommendationAuthor(BaseAgent):
             if insight_rec:
                 recommendations.append(insight_rec)
 
+        created_at = now.isoformat()
+        for rec in recommendations:
+            rec["created_at"] = created_at
+
         return recommendations
 
     def _generate_engagement_recommendation(
@@ -492,11 +666,16 @@ class RecommendationAuthor(BaseAgent):
         )
         return int(min(max(confidence, 0), 100))
 
-    def _get_days_since_last_engagement(self, account_data: Dict[str, Any]) -> int:
+    def _get_days_since_last_engagement(
+        self,
+        account_data: Dict[str, Any],
+        now: Optional[datetime] = None
+    ) -> int:
         """Calculate days since last engagement.
 
         Args:
             account_data: Account information
+            now: Reference time (defaults to now)
 
         Returns:
             Number of days since last engagement
@@ -517,7 +696,7 @@ class RecommendationAuthor(BaseAgent):
                 return 999
 
             # Calculate difference
-            delta = datetime.utcnow() - last_date.replace(tzinfo=None)
+            delta = (now or datetime.utcnow()) - last_date.replace(tzinfo=None)
             return delta.days
 
         except Exception as e:
@@ -528,11 +707,16 @@ class RecommendationAuthor(BaseAgent):
             )
             return 999
 
-    def _get_days_until_contract_expiry(self, account_data: Dict[str, Any]) -> int:
+    def _get_days_until_contract_expiry(
+        self,
+        account_data: Dict[str, Any],
+        now: Optional[datetime] = None
+    ) -> int:
         """Calculate days until contract expiry.
 
         Args:
             account_data: Account information
+            now: Reference time (defaults to now)
 
         Returns:
             Number of days until contract expires (-1 if unknown)
@@ -552,7 +736,7 @@ class RecommendationAuthor(BaseAgent):
                 return -1
 
             # Calculate difference
-            delta = end_date.replace(tzinfo=None) - datetime.utcnow()
+            delta = end_date.replace(tzinfo=None) - (now or datetime.utcnow())
             return delta.days
 
         except Exception as e:
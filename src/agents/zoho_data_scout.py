@@ -17,6 +17,7 @@ Tool Allowlist: Zoho read-only tools + Read/Write (approval required)
 """
 
 import asyncio
+import hashlib
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, AsyncGenerator
 from decimal import Decimal
@@ -480,6 +481,38 @@ class ZohoDataScout:
             )
             raise
 
+    async def get_account_version(
+        self,
+        account_id: str,
+    ) -> str:
+        """Get a cheap version marker for an account.
+
+        Fetches only the account record (no related records), so callers
+        can tell whether a previous snapshot is still current.
+
+        Args:
+            account_id: Account identifier
+
+        Returns:
+            Zoho ``Modified_Time``, or a checksum of the record when the
+            field is missing
+
+        Raises:
+            ZohoAPIError: If fetch fails
+        """
+        zoho_account = await self.zoho_manager.get_account(
+            account_id,
+            context={"agent_context": True},
+        )
+
+        modified_time = zoho_account.get("Modified_Time")
+        if modified_time:
+            return str(modified_time)
+
+        return hashlib.md5(
+            json.dumps(zoho_account, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
     async def execute_with_events(
         self,
         context: Dict[str, Any]
@@ -0,0 +1,143 @@
+"""Process-wide async LLM client for the API routers.
+
+Request handlers share one ``AsyncAnthropic`` client (GLM-4.6 via the Z.ai
+Anthropic-compatible endpoint) backed by a pooled ``httpx.AsyncClient``:
+
+- Calls are awaited, so an LLM round-trip no longer blocks the event loop
+- Connections (and their TLS sessions) are reused across requests
+- The client is created at application startup and closed at shutdown;
+  routers receive it through ``Depends(get_llm_client)``
+"""
+
+import os
+from typing import Any, Dict, List, Optional
+
+import httpx
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+DEFAULT_MODEL = "glm-4.6"
+
+
+class LLMClient:
+    """Shared async LLM client with a pooled HTTP transport.
+
+    Example:
+        >>> llm = get_llm_client()
+        >>> response = await llm.create_message(
+        ...     system="You are an AI Account Manager assistant.",
+        ...     messages=[{"role": "user", "content": "Summarize ACC-001"}],
+        ...     max_tokens=800
+        ... )
+        >>> response.content[0].text
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        model: Optional[str] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        timeout: float = 60.0
+    ):
+        """Initialize client settings (connections open on first use).
+
+        Args:
+            api_key: API key (defaults to ANTHROPIC_API_KEY)
+            base_url: API base URL (defaults to ANTHROPIC_BASE_URL)
+            model: Default model (defaults to CLAUDE_MODEL, then glm-4.6)
+            max_connections: Maximum concurrent connections in the pool
+            max_keepalive_connections: Idle connections kept open
+            timeout: Request timeout in seconds
+        """
+        self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
+        self.base_url = base_url or os.getenv("ANTHROPIC_BASE_URL")
+        self.model = model or os.getenv("CLAUDE_MODEL", DEFAULT_MODEL)
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.timeout = timeout
+        self.logger = logger.bind(component="llm_client")
+
+        self._http: Optional[httpx.AsyncClient] = None
+        self._client: Any = None
+
+    @property
+    def client(self) -> Any:
+        """The underlying ``AsyncAnthropic`` client, created on first use."""
+        if self._client is None:
+            from anthropic import AsyncAnthropic
+
+            self._http = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections
+                ),
+                timeout=self.timeout
+            )
+            self._client = AsyncAnthropic(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                http_client=self._http
+            )
+            self.logger.info(
+                "llm_client_initialized",
+                model=self.model,
+                max_connections=self.max_connections
+            )
+        return self._client
+
+    async def create_message(
+        self,
+        system: str,
+        messages: List[Dict[str, Any]],
+        max_tokens: int = 1024,
+        model: Optional[str] = None
+    ) -> Any:
+        """Create a message without blocking the event loop.
+
+        Args:
+            system: System prompt
+            messages: Conversation messages
+            max_tokens: Maximum tokens to generate
+            model: Model override (defaults to the client's model)
+
+        Returns:
+            Anthropic ``Message`` response
+        """
+        return await self.client.messages.create(
+            model=model or self.model,
+            max_tokens=max_tokens,
+            system=system,
+            messages=messages
+        )
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        if self._client is not None:
+            await self._client.close()
+        elif self._http is not None:
+            await self._http.aclose()
+        self._client = None
+        self._http = None
+
+
+_llm_client: Optional[LLMClient] = None
+
+
+def get_llm_client() -> LLMClient:
+    """Get the process-wide LLM client (FastAPI dependency)."""
+    global _llm_client
+    if _llm_client is None:
+        _llm_client = LLMClient()
+    return _llm_client
+
+
+async def close_llm_client() -> None:
+    """Close the process-wide LLM client at shutdown."""
+    global _llm_client
+    if _llm_client is not None:
+        await _llm_client.aclose()
+        _llm_client = None
@@ -10,13 +10,14 @@ import asyncio
 import uuid
 import json
 import structlog
-from typing import Dict, Any, AsyncGenerator
+from typing import Dict, Any, AsyncGenerator, Optional
 from datetime import datetime
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from fastapi.responses import StreamingResponse, JSONResponse
 from pydantic import BaseModel, Field
 
+from src.api.llm_client import LLMClient, get_llm_client
 from src.events.ag_ui_emitter import AGUIEventEmitter
 from src.copilotkit.agents.orchestrator_wrapper import create_orchestrator_graph, initialize_orchestrator_dependencies
 from src.agents.orchestrator import OrchestratorAgent
@@ -43,7 +44,10 @@ class CopilotKitRequest(BaseModel):
 
 
 @router.post("/copilotkit")
-async def copilotkit_endpoint(body: CopilotKitRequest):
+async def copilotkit_endpoint(
+    body: CopilotKitRequest,
+    llm_client: LLMClient = Depends(get_llm_client)
+):
     """Handle CopilotKit requests from the frontend with REAL agents."""
     logger.info(
         "copilotkit_request_received",
@@ -61,17 +65,20 @@ async def copilotkit_endpoint(body: CopilotKitRequest):
     elif body.operationName == "generateCopilotResponse":
         if body.stream:
             logger.info("routing_to_generate_response_with_streaming")
-            return await handle_generate_response_streaming(body)
+            return await handle_generate_response_streaming(body, llm_client)
         else:
             logger.info("routing_to_generate_response_with_real_agents")
-            return await handle_generate_response_with_orchestrator(body)
+            return await handle_generate_response_with_orchestrator(body, llm_client)
     else:
         logger.info("routing_to_generate_response_default")
-        return await handle_generate_response_with_orchestrator(body)
+        return await handle_generate_response_with_orchestrator(body, llm_client)
 
 
 @router.post("/copilotkit/stream")
-async def copilotkit_stream_endpoint(body: CopilotKitRequest):
+async def copilotkit_stream_endpoint(
+    body: CopilotKitRequest,
+    llm_client: LLMClient = Depends(get_llm_client)
+):
     """Server-Sent Events endpoint for real-time agent execution streaming."""
     logger.info(
         "copilotkit_stream_request_received",
@@ -81,7 +88,7 @@ async def copilotkit_stream_endpoint(body: CopilotKitRequest):
         workflow=body.workflow
     )
 
-    return await handle_generate_response_streaming(body)
+    return await handle_generate_response_streaming(body, llm_client)
 
 
 async def handle_load_agent_state(body: CopilotKitRequest):
@@ -111,8 +118,12 @@ async def handle_load_agent_state(body: CopilotKitRequest):
     return JSONResponse(content=response_data)
 
 
-async def handle_generate_response(body: CopilotKitRequest):
+async def handle_generate_response(
+    body: CopilotKitRequest,
+    llm_client: Optional[LLMClient] = None
+):
     """Handle generateCopilotResponse requests with REAL AGENTS."""
+    llm_client = llm_client or get_llm_client()
     # Use default account_id if none provided
     account_id = body.account_id or "DEFAULT_ACCOUNT"
 
@@ -165,23 +176,13 @@ async def handle_generate_response(body: CopilotKitRequest):
         # TODO: Replace with full OrchestratorAgent once Zoho integration is complete
         logger.info("generating_glm_response", model="glm-4.6", account_id=account_id)
 
-        # Import GLM-4.6 client
-        import os
-        from anthropic import Anthropic
-
-        # Initialize GLM-4.6 via Z.ai
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        base_url = os.getenv("ANTHROPIC_BASE_URL")
-        model = os.getenv("CLAUDE_MODEL", "glm-4.6")
-
-        client = Anthropic(api_key=api_key, base_url=base_url)
+        model = llm_client.model
 
         # Generate response using GLM-4.6
         system_prompt = f"""You are an AI Account Manager assistant analyzing account {account_id}.
         Provide insights about account health, risks, and recommendations based on the user's request."""
 
-        response = client.messages.create(
-            model=model,
+        response = await llm_client.create_message(
             max_tokens=1024,
             system=system_prompt,
             messages=[
@@ -272,8 +273,12 @@ async def handle_generate_response(body: CopilotKitRequest):
     return JSONResponse(content=response_data)
 
 
-async def handle_generate_response_with_orchestrator(body: CopilotKitRequest):
+async def handle_generate_response_with_orchestrator(
+    body: CopilotKitRequest,
+    llm_client: Optional[LLMClient] = None
+):
     """Handle generateCopilotResponse requests using proper GraphQL protocol with GLM-4.6 agents."""
+    llm_client = llm_client or get_llm_client()
 
     # Extract user message using CopilotKit's GraphQL protocol
     user_message = ""
@@ -325,20 +330,11 @@ async def handle_generate_response_with_orchestrator(body: CopilotKitRequest):
     )
 
     try:
-        # Import GLM-4.6 client for direct integration
-        import os
-        from anthropic import Anthropic
+        model = llm_client.model
 
-        # Initialize GLM-4.6 via Z.ai
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        base_url = os.getenv("ANTHROPIC_BASE_URL")
-        model = os.getenv("CLAUDE_MODEL", "glm-4.6")
-
-        if not api_key:
+        if not llm_client.api_key:
             raise ValueError("ANTHROPIC_API_KEY environment variable is not set")
 
-        client = Anthropic(api_key=api_key, base_url=base_url)
-
         # Generate response using GLM-4.6
         system_prompt = f"""You are an AI Account Manager assistant powered by GLM-4.6, analyzing account {account_id}.
 
@@ -357,8 +353,7 @@ Be thorough, professional, and provide specific, actionable insights based on th
 
         logger.info("calling_glm46_model", model=model, account_id=account_id)
 
-        response = client.messages.create(
-            model=model,
+        response = await llm_client.create_message(
             max_tokens=1024,
             system=system_prompt,
             messages=glm_messages
@@ -487,12 +482,15 @@ I'm here to help once the technical issue is resolved!"""
         return JSONResponse(content=error_data)
 
 
-async def handle_generate_response_streaming(body: CopilotKitRequest):
+async def handle_generate_response_streaming(
+    body: CopilotKitRequest,
+    llm_client: Optional[LLMClient] = None
+):
     """Handle Server-Sent Events streaming for real-time agent execution."""
     # For now, delegate to the non-streaming handler
     # TODO: Implement proper SSE streaming in a future iteration
     logger.info("streaming_request_delegated_to_standard_handler")
-    return await handle_generate_response_with_orchestrator(body)
+    return await handle_generate_response_with_orchestrator(body, llm_client)
 
 
 @router.get("/copilotkit/health")
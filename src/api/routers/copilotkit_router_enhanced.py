@@ -10,16 +10,18 @@ import asyncio
 import uuid
 import json
 import structlog
-from typing import Dict, Any, AsyncGenerator
+from typing import Dict, Any, AsyncGenerator, Optional, Union
 from datetime import datetime
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from fastapi.responses import StreamingResponse, JSONResponse
 from pydantic import BaseModel, Field
 
+from src.api.llm_client import LLMClient, get_llm_client
 from src.events.ag_ui_emitter import AGUIEventEmitter
+from src.events.event_bus import SessionEventBus, SubscriberDisconnected, get_event_bus
 from src.copilotkit.agents.orchestrator_wrapper import create_orchestrator_graph
-from src.agents.orchestrator import OrchestratorAgent
+from src.agents.agent_pool import get_agent_pool
 
 logger = structlog.get_logger(__name__)
 
@@ -43,7 +45,10 @@ class CopilotKitRequest(BaseModel):
 
 
 @router.post("/copilotkit")
-async def copilotkit_endpoint(body: CopilotKitRequest):
+async def copilotkit_endpoint(
+    body: CopilotKitRequest,
+    llm_client: LLMClient = Depends(get_llm_client)
+):
     """Handle CopilotKit requests from frontend with REAL agents."""
     logger.info(
         "copilotkit_request_received",
@@ -62,17 +67,20 @@ async def copilotkit_endpoint(body: CopilotKitRequest):
     elif body.operationName == "generateCopilotResponse":
         if body.stream:
             logger.info("routing_to_generate_response_with_streaming")
-            return await handle_generate_response_streaming(body)
+            return await handle_generate_response_streaming(body, llm_client)
         else:
             logger.info("routing_to_generate_response_with_orchestrator")
-            return await handle_generate_response_with_orchestrator(body)
+            return await handle_generate_response_with_orchestrator(body, llm_client)
     else:
         logger.info("routing_to_generate_response_default")
-        return await handle_generate_response_with_orchestrator(body)
+        return await handle_generate_response_with_orchestrator(body, llm_client)
 
 
 @router.post("/copilotkit/stream")
-async def copilotkit_stream_endpoint(body: CopilotKitRequest):
+async def copilotkit_stream_endpoint(
+    body: CopilotKitRequest,
+    llm_client: LLMClient = Depends(get_llm_client)
+):
     """Server-Sent Events endpoint for real-time agent execution streaming."""
     logger.info(
         "copilotkit_stream_request_received",
@@ -82,7 +90,7 @@ async def copilotkit_stream_endpoint(body: CopilotKitRequest):
         workflow=body.workflow
     )
 
-    return await handle_generate_response_streaming(body)
+    return await handle_generate_response_streaming(body, llm_client)
 
 
 async def handle_load_agent_state(body: CopilotKitRequest):
@@ -117,8 +125,12 @@ async def handle_load_agent_state(body: CopilotKitRequest):
     return JSONResponse(content=response_data)
 
 
-async def handle_generate_response_with_orchestrator(body: CopilotKitRequest):
+async def handle_generate_response_with_orchestrator(
+    body: CopilotKitRequest,
+    llm_client: Optional[LLMClient] = None
+):
     """Handle generateCopilotResponse requests using REAL OrchestratorAgent system."""
+    llm_client = llm_client or get_llm_client()
     account_id = body.account_id or "DEFAULT_ACCOUNT"
 
     logger.info(
@@ -139,17 +151,7 @@ async def handle_generate_response_with_orchestrator(body: CopilotKitRequest):
 
         # Use GLM-4.6 for a more natural greeting response
         try:
-            import os
-            from anthropic import Anthropic
-
-            api_key = os.getenv("ANTHROPIC_API_KEY")
-            base_url = os.getenv("ANTHROPIC_BASE_URL")
-            model = os.getenv("CLAUDE_MODEL", "glm-4.6")
-
-            client = Anthropic(api_key=api_key, base_url=base_url)
-
-            response = client.messages.create(
-                model=model,
+            response = await llm_client.create_message(
                 max_tokens=200,
                 system="You are a friendly AI Account Manager assistant. Respond warmly and professionally to greetings.",
                 messages=[{"role": "user", "content": user_message}]
@@ -180,17 +182,6 @@ async def handle_generate_response_with_orchestrator(body: CopilotKitRequest):
         # Use direct GLM-4.6 response for general queries since orchestrator has issues
         logger.info("using_direct_glm_response", message=user_message[:100])
 
-        # Import GLM-4.6 client
-        import os
-        from anthropic import Anthropic
-
-        # Initialize GLM-4.6 via Z.ai
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        base_url = os.getenv("ANTHROPIC_BASE_URL")
-        model = os.getenv("CLAUDE_MODEL", "glm-4.6")
-
-        client = Anthropic(api_key=api_key, base_url=base_url)
-
         # Generate response using GLM-4.6
         system_prompt = "You are an AI Account Manager assistant. Provide helpful insights about account management, customer relationships, and business analysis."
 
@@ -199,8 +190,7 @@ async def handle_generate_response_with_orchestrator(body: CopilotKitRequest):
             response_text = f"I notice you're asking about account analysis. Currently, the advanced account analysis features are being updated. For general account management questions, I'm happy to help! Could you tell me more about what you'd like to know about account management best practices?"
         else:
             try:
-                response = client.messages.create(
-                    model=model,
+                response = await llm_client.create_message(
                     max_tokens=800,
                     system=system_prompt,
                     messages=[
@@ -268,8 +258,12 @@ async def handle_generate_response_with_orchestrator(body: CopilotKitRequest):
         })
 
 
-async def handle_generate_response_streaming(body: CopilotKitRequest):
+async def handle_generate_response_streaming(
+    body: CopilotKitRequest,
+    llm_client: Optional[LLMClient] = None
+):
     """Handle generateCopilotResponse requests with Server-Sent Events streaming."""
+    llm_client = llm_client or get_llm_client()
     account_id = body.account_id or "DEFAULT_ACCOUNT"
 
     logger.info(
@@ -302,17 +296,7 @@ async def handle_generate_response_streaming(body: CopilotKitRequest):
 
                 # Generate greeting response
                 try:
-                    import os
-                    from anthropic import Anthropic
-
-                    api_key = os.getenv("ANTHROPIC_API_KEY")
-                    base_url = os.getenv("ANTHROPIC_BASE_URL")
-                    model = os.getenv("CLAUDE_MODEL", "glm-4.6")
-
-                    client = Anthropic(api_key=api_key, base_url=base_url)
-
-                    response = client.messages.create(
-                        model=model,
+                    response = await llm_client.create_message(
                         max_tokens=200,
                         system="You are a friendly AI Account Manager assistant. Respond warmly and professionally to greetings.",
                         messages=[{"role": "user", "content": user_message}]
@@ -367,7 +351,21 @@ async def handle_generate_response_streaming(body: CopilotKitRequest):
             }
         )
 
-    async def event_stream_generator() -> AsyncGenerator[str, None]:
+    # A run already streaming for this session (another tab, a dashboard)
+    # is only shared with requests asking for the same thing
+    bus = get_event_bus()
+    run_key = (account_id, body.workflow, user_message)
+    if bus.is_running(body.session_id) and not bus.is_running(body.session_id, run_key):
+        logger.info("session_busy_with_other_run", session_id=body.session_id)
+        return JSONResponse(
+            status_code=409,
+            content={
+                "error": f"Session {body.session_id} is already running a different request",
+                "errorType": "session_busy"
+            }
+        )
+
+    async def event_stream_generator() -> AsyncGenerator[Union[str, bytes], None]:
         """Generate SSE events from real agent orchestration."""
         try:
             # Send initial connection event
@@ -382,17 +380,20 @@ async def handle_generate_response_streaming(body: CopilotKitRequest):
                 }
             })}\n\n"
 
-            # Initialize OrchestratorAgent with simplified setup
+            # The same request already streaming for this session is shared
+            # instead of started again
+            if bus.is_running(body.session_id, run_key):
+                logger.info("attaching_to_running_session", session_id=body.session_id)
+                async for sse_event in _relay_session_events(bus, body.session_id):
+                    yield sse_event
+                return
+
+            # Per-session orchestrator over the pooled agents (simplified
+            # setup: no specialist agents for the demo)
             try:
-                from src.events.approval_manager import ApprovalManager
-                approval_manager = ApprovalManager()
-
-                orchestrator = OrchestratorAgent(
-                    session_id=body.session_id,
-                    zoho_scout=None,  # Simplified for demo
-                    memory_analyst=None,  # Simplified for demo
-                    approval_manager=approval_manager,
-                    recommendation_author=None
+                orchestrator = get_agent_pool().create_orchestrator(
+                    body.session_id,
+                    with_specialists=False
                 )
             except Exception as init_error:
                 logger.error("streaming_orchestrator_initialization_failed", error=str(init_error))
@@ -413,14 +414,26 @@ async def handle_generate_response_streaming(body: CopilotKitRequest):
                 "user_message": user_message
             }
 
-            # Stream events from orchestration
-            async for event in orchestrator.execute_with_events(execution_context):
-                # Forward AG UI Protocol events as SSE
+            # Stream events from orchestration through the session bus
+            started = bus.start(
+                body.session_id,
+                orchestrator.execute_with_events(execution_context),
+                run_key=run_key
+            )
+            if not started and not bus.is_running(body.session_id, run_key):
+                # A different request claimed the session since the check above
                 yield f"data: {json.dumps({
-                    'event': event.get('event', 'agent_update'),
-                    'data': event.get('data', {}),
-                    'timestamp': datetime.utcnow().isoformat()
+                    'event': 'orchestration_error',
+                    'data': {
+                        'error': f'Session {body.session_id} is already running a different request',
+                        'errorType': 'session_busy',
+                        'accountId': account_id
+                    }
                 })}\n\n"
+                return
+
+            async for sse_event in _relay_session_events(bus, body.session_id):
+                yield sse_event
 
         except Exception as e:
             logger.error(
@@ -453,6 +466,79 @@ async def handle_generate_response_streaming(body: CopilotKitRequest):
     )
 
 
+@router.get("/copilotkit/stream/{session_id}")
+async def copilotkit_attach_endpoint(session_id: str):
+    """Attach to a session's running workflow as an extra SSE subscriber.
+
+    Args:
+        session_id: Session whose workflow events to receive
+
+    Returns:
+        SSE stream of recent and live events, or 404 if nothing is running
+    """
+    bus = get_event_bus()
+    if not bus.is_running(session_id):
+        return JSONResponse(
+            status_code=404,
+            content={"error": f"No running workflow for session {session_id}"}
+        )
+
+    return StreamingResponse(
+        _relay_session_events(bus, session_id),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+        }
+    )
+
+
+async def _relay_session_events(
+    bus: SessionEventBus,
+    session_id: str
+) -> AsyncGenerator[Union[str, bytes], None]:
+    """Forward a session's AG UI Protocol events as SSE.
+
+    Events are framed by ``AGUIEventEmitter.stream_sse_frames``, which
+    merges consecutive agent_stream chunks before serialising them.
+    """
+    try:
+        events = bus.subscribe(session_id)
+    except KeyError:
+        # Run finished between the running check and subscribing
+        return
+
+    emitter = AGUIEventEmitter(session_id=session_id)
+    try:
+        async for frame in emitter.stream_sse_frames(events, transform=_relay_envelope):
+            yield frame
+    except SubscriberDisconnected:
+        yield f"data: {json.dumps({
+            'event': 'stream_lagging',
+            'data': {'sessionId': session_id, 'errorType': 'subscriber_too_slow'}
+        })}\n\n"
+    except Exception as e:
+        # The workflow run itself failed
+        logger.error("session_run_stream_failed", session_id=session_id, error=str(e))
+        yield f"data: {json.dumps({
+            'event': 'orchestration_error',
+            'data': {
+                'error': str(e),
+                'errorType': 'orchestration_stream_error',
+                'sessionId': session_id
+            }
+        })}\n\n"
+
+
+def _relay_envelope(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Wrap an AG UI event in the envelope the SSE relay sends."""
+    return {
+        'event': event.get('event', 'agent_update'),
+        'data': event.get('data', {}),
+        'timestamp': datetime.utcnow().isoformat()
+    }
+
+
 def _extract_user_message(body: CopilotKitRequest) -> str:
     """Extract user message from various CopilotKit request formats."""
     # Try different message locations
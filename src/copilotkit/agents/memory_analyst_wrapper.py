@@ -25,13 +25,10 @@ from langgraph.graph import StateGraph, END
 from langgraph.graph.message import add_messages
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
 import structlog
-import os
 from datetime import datetime
 
 # Import existing Sergas agents and services
-from src.agents.memory_analyst import MemoryAnalyst
-from src.services.memory_service import MemoryService
-from src.integrations.cognee.cognee_client import CogneeClient
+from src.agents.agent_pool import get_agent_pool
 from src.agents.memory_models import (
     HistoricalContext,
     SentimentTrend,
@@ -116,7 +113,7 @@ async def memory_analyst_node(state: MemoryAnalystState) -> MemoryAnalystState:
 
     Flow:
         1. Extract account_id and parameters from state
-        2. Initialize MemoryAnalyst with Cognee integration
+        2. Get the pooled MemoryAnalyst (Cognee integration)
         3. Execute comprehensive historical context retrieval
         4. Parse and structure results for downstream agents
         5. Calculate risk level and identify patterns
@@ -154,17 +151,8 @@ async def memory_analyst_node(state: MemoryAnalystState) -> MemoryAnalystState:
         include_patterns = state.get("include_patterns", True)
         session_id = state.get("session_id", "default_session")
 
-        # Initialize dependencies
-        memory_service = MemoryService()
-        cognee_client = CogneeClient()
-
-        # Create MemoryAnalyst instance
-        memory_analyst = MemoryAnalyst(
-            memory_service=memory_service,
-            cognee_client=cognee_client,
-            api_key=os.getenv("ANTHROPIC_API_KEY"),
-            model="claude-3-5-sonnet-20241022"
-        )
+        # Pooled MemoryAnalyst shared across sessions
+        memory_analyst = get_agent_pool().memory_analyst
 
         # Execute historical context retrieval
         logger.info(
@@ -546,22 +534,12 @@ def initialize_memory_analyst_dependencies() -> Dict[str, Any]:
     logger.info("initializing_memory_analyst_dependencies")
 
     try:
-        # Memory services
-        memory_service = MemoryService()
-        cognee_client = CogneeClient()
-
-        # MemoryAnalyst
-        memory_analyst = MemoryAnalyst(
-            memory_service=memory_service,
-            cognee_client=cognee_client,
-            api_key=os.getenv("ANTHROPIC_API_KEY"),
-            model="claude-3-5-sonnet-20241022"
-        )
-
+        # Pooled instances shared with the graph nodes
+        pool = get_agent_pool()
         dependencies = {
-            "memory_service": memory_service,
-            "cognee_client": cognee_client,
-            "memory_analyst": memory_analyst
+            "memory_service": pool.memory_service,
+            "cognee_client": pool.cognee_client,
+            "memory_analyst": pool.memory_analyst
         }
 
         logger.info("memory_analyst_dependencies_initialized")
@@ -22,7 +22,6 @@ Architecture Alignment:
 - Maintains session and context management
 """
 
-import os
 import uuid
 from typing import TypedDict, Annotated, Dict, Any, List
 from typing_extensions import NotRequired
@@ -32,12 +31,7 @@ from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, System
 import structlog
 
 # Import existing Sergas agents
-from src.agents.orchestrator import OrchestratorAgent
-from src.agents.zoho_data_scout import ZohoDataScout
-from src.agents.memory_analyst import MemoryAnalyst
-from src.integrations.zoho.integration_manager import ZohoIntegrationManager
-from src.services.memory_service import MemoryService
-from src.integrations.cognee.cognee_client import CogneeClient
+from src.agents.agent_pool import get_agent_pool
 from src.events.approval_manager import ApprovalManager
 
 logger = structlog.get_logger(__name__)
@@ -109,7 +103,7 @@ async def orchestrator_node(state: OrchestratorState) -> OrchestratorState:
 
     Flow:
         1. Extract account_id from user message or state
-        2. Initialize orchestrator with all specialist agents
+        2. Get a per-session orchestrator over the pooled specialist agents
         3. Execute orchestration workflow via execute_with_events()
         4. Collect AG UI Protocol events for streaming
         5. Update state with final results
@@ -145,34 +139,10 @@ async def orchestrator_node(state: OrchestratorState) -> OrchestratorState:
                 "Could not extract account_id. Please provide account ID in format ACC-XXX"
             )
 
-        # Initialize dependencies
         session_id = state.get("session_id", f"session_{uuid.uuid4().hex[:8]}")
 
-        # Initialize Zoho integration
-        zoho_manager = ZohoIntegrationManager.from_env()
-
-        # Initialize ZohoDataScout
-        zoho_scout = ZohoDataScout(zoho_manager=zoho_manager)
-
-        # Initialize MemoryAnalyst
-        memory_service = MemoryService()
-        cognee_client = CogneeClient()
-        memory_analyst = MemoryAnalyst(
-            memory_service=memory_service,
-            cognee_client=cognee_client,
-            api_key=os.getenv("ANTHROPIC_API_KEY")
-        )
-
-        # Initialize ApprovalManager
-        approval_manager = ApprovalManager()
-
-        # Create OrchestratorAgent (existing implementation)
-        orchestrator = OrchestratorAgent(
-            session_id=session_id,
-            zoho_scout=zoho_scout,
-            memory_analyst=memory_analyst,
-            approval_manager=approval_manager
-        )
+        # Per-session orchestrator over the pooled specialist agents
+        orchestrator = get_agent_pool().create_orchestrator(session_id)
 
         # Execute orchestration workflow
         execution_context = {
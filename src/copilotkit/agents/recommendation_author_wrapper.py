@@ -30,7 +30,7 @@ import structlog
 from datetime import datetime
 
 # Import existing Sergas agents and services
-from src.agents.recommendation_author import RecommendationAuthor
+from src.agents.agent_pool import get_agent_pool
 
 logger = structlog.get_logger(__name__)
 
@@ -132,8 +132,8 @@ async def recommendation_author_node(state: RecommendationAuthorState) -> Recomm
         if not account_data:
             raise ValueError("account_data is required for recommendation generation")
 
-        # Create RecommendationAuthor instance
-        recommendation_author = RecommendationAuthor()
+        # Pooled RecommendationAuthor shared across sessions
+        recommendation_author = get_agent_pool().recommendation_author
 
         # Build execution context
         execution_context = {
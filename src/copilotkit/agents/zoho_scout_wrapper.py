@@ -30,9 +30,7 @@ from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
 import structlog
 from datetime import datetime
 
-from src.agents.zoho_data_scout import ZohoDataScout
-from src.integrations.zoho.integration_manager import ZohoIntegrationManager
-from src.agents.config import DataScoutConfig
+from src.agents.agent_pool import get_agent_pool
 
 logger = structlog.get_logger(__name__)
 
@@ -167,7 +165,7 @@ async def fetch_account_data_node(state: ZohoScoutState) -> ZohoScoutState:
     Fetch complete account data from Zoho CRM.
 
     This node wraps ZohoDataScout.get_account_snapshot() to:
-    1. Initialize ZohoDataScout with proper configuration
+    1. Get the pooled ZohoDataScout
     2. Fetch complete account snapshot
     3. Detect changes since last sync
     4. Aggregate related records (deals, activities, notes)
@@ -188,15 +186,8 @@ async def fetch_account_data_node(state: ZohoScoutState) -> ZohoScoutState:
     )
 
     try:
-        # Initialize Zoho integration
-        zoho_manager = ZohoIntegrationManager.from_env()
-
-        # Initialize ZohoDataScout with configuration
-        config = DataScoutConfig.from_env()
-        scout = ZohoDataScout(
-            zoho_manager=zoho_manager,
-            config=config
-        )
+        # Pooled ZohoDataScout (integration and config built once per process)
+        scout = get_agent_pool().zoho_scout
 
         # Fetch complete account snapshot (wraps existing logic)
         snapshot = await scout.get_account_snapshot(account_id)
@@ -646,10 +637,7 @@ async def fetch_account_data_direct(account_id: str) -> Dict[str, Any]:
     logger.info("fetching_account_data_direct", account_id=account_id)
 
     try:
-        # Initialize Zoho integration
-        zoho_manager = ZohoIntegrationManager.from_env()
-        config = DataScoutConfig.from_env()
-        scout = ZohoDataScout(zoho_manager=zoho_manager, config=config)
+        scout = get_agent_pool().zoho_scout
 
         # Fetch snapshot (wraps existing ZohoDataScout logic)
         snapshot = await scout.get_account_snapshot(account_id)
@@ -4,9 +4,11 @@ This module provides:
 - AG UI event formatting and emission
 - Event schemas (Pydantic models)
 - Approval workflow management
+- Session event bus for fanning a workflow run out to SSE subscribers
 """
 
-from src.events.ag_ui_emitter import AGUIEventEmitter
+from src.events.ag_ui_emitter import AGUIEventEmitter, coalesce_stream_events
+from src.events.event_bus import SessionEventBus, SubscriberDisconnected, get_event_bus
 from src.events.event_schemas import (
     WorkflowStartedEvent,
     AgentStartedEvent,
@@ -18,6 +20,10 @@ from src.events.event_schemas import (
 
 __all__ = [
     "AGUIEventEmitter",
+    "coalesce_stream_events",
+    "SessionEventBus",
+    "SubscriberDisconnected",
+    "get_event_bus",
     "WorkflowStartedEvent",
     "AgentStartedEvent",
     "AgentStreamEvent",
@@ -3,14 +3,21 @@
 This module provides event emission functionality for streaming
 agent execution via AG UI Protocol (Server-Sent Events).
 
+Stream chunks are the hot path: token-sized ``agent_stream`` events can be
+framed straight from their models (``to_sse_frame``) and coalesced on a short
+flush interval (``coalesce_stream_events``) before they reach the client.
+
 Reference: MASTER_SPARC_PLAN_V3.md lines 1770-1814
 """
 
+import asyncio
+import json
 import time
 import uuid
 from datetime import datetime
-from typing import Any, Dict, Optional, AsyncGenerator
+from typing import Any, AsyncGenerator, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
 import structlog
+from pydantic import BaseModel
 
 from src.events.event_schemas import (
     WorkflowStartedEvent,
@@ -36,8 +43,36 @@ from src.events.event_schemas import (
     StateSnapshotEventData,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = structlog.get_logger(__name__)
 
+# Default window for merging consecutive agent_stream chunks
+STREAM_FLUSH_INTERVAL = 0.025
+
+# Merged chunk size that forces a flush before the window ends
+STREAM_MAX_CHUNK_CHARS = 4096
+
+SSE_PREFIX = b"data: "
+SSE_SUFFIX = b"\n\n"
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize datetimes for ``json.dumps``."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Type {type(obj)} not serializable")
+
+
+def _dumps_bytes(event: Dict[str, Any]) -> bytes:
+    """Serialize an event dict to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(event)
+    return json.dumps(event, default=_json_default, separators=(",", ":")).encode()
+
 
 class AGUIEventEmitter:
     """Emit AG UI Protocol events for streaming agent execution.
@@ -220,6 +255,35 @@ class AGUIEventEmitter:
 
         return event.model_dump()
 
+    def emit_agent_stream_frame(
+        self,
+        agent: str,
+        content: str,
+        content_type: str = "text"
+    ) -> bytes:
+        """Emit agent_stream event as a ready-to-send SSE frame.
+
+        Skips the intermediate dict of ``emit_agent_stream``; use it where
+        chunks go straight to the wire.
+
+        Args:
+            agent: Agent identifier
+            content: Streamed content
+            content_type: Type of content ("text", "tool_call", "tool_result")
+
+        Returns:
+            SSE frame bytes
+        """
+        event = AgentStreamEvent(
+            data=AgentStreamEventData(
+                agent=agent,
+                content=content,
+                content_type=content_type  # type: ignore
+            )
+        )
+
+        return self.to_sse_frame(event)
+
     def emit_agent_completed(
         self,
         agent: str,
@@ -462,27 +526,42 @@ class AGUIEventEmitter:
     # ========================================================================
 
     @staticmethod
-    def format_sse_event(event: Dict[str, Any]) -> str:
+    def format_sse_event(event: Union[Dict[str, Any], BaseModel]) -> str:
         """Format event as Server-Sent Event (SSE).
 
         Args:
-            event: AG UI event dictionary
+            event: AG UI event dictionary or event model
 
         Returns:
             SSE formatted string
         """
-        import json
-
-        # Convert datetime objects to ISO format strings
-        def serialize_datetime(obj):
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            raise TypeError(f"Type {type(obj)} not serializable")
+        if isinstance(event, BaseModel):
+            return f"data: {event.model_dump_json()}\n\n"
 
         # SSE format: data: {json}\n\n
-        event_json = json.dumps(event, default=serialize_datetime)
+        event_json = json.dumps(event, default=_json_default)
         return f"data: {event_json}\n\n"
 
+    @staticmethod
+    def to_sse_frame(event: Union[Dict[str, Any], BaseModel]) -> bytes:
+        """Serialize event to SSE frame bytes.
+
+        Event models are serialized by pydantic-core and dicts by orjson
+        (when installed), so neither path goes through a Python-level
+        datetime callback.
+
+        Args:
+            event: AG UI event model or dictionary
+
+        Returns:
+            SSE frame bytes (``data: {json}\\n\\n``)
+        """
+        if isinstance(event, BaseModel):
+            body = event.model_dump_json().encode()
+        else:
+            body = _dumps_bytes(event)
+        return SSE_PREFIX + body + SSE_SUFFIX
+
     async def stream_events(
         self,
         events: AsyncGenerator[Dict[str, Any], None]
@@ -497,3 +576,130 @@ class AGUIEventEmitter:
         """
         async for event in events:
             yield self.format_sse_event(event)
+
+    async def stream_sse_frames(
+        self,
+        events: AsyncIterator[Dict[str, Any]],
+        flush_interval: float = STREAM_FLUSH_INTERVAL,
+        transform: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+    ) -> AsyncGenerator[bytes, None]:
+        """Stream events as SSE frame bytes, coalescing stream chunks.
+
+        Args:
+            events: Async iterator of AG UI events
+            flush_interval: Seconds consecutive agent_stream chunks are
+                merged for (0 frames every chunk as-is)
+            transform: Optional mapping applied to each (coalesced) event
+                before framing, e.g. a transport envelope
+
+        Yields:
+            SSE frame bytes
+        """
+        if flush_interval > 0:
+            events = coalesce_stream_events(events, flush_interval)
+
+        async for event in events:
+            yield self.to_sse_frame(transform(event) if transform else event)
+
+
+def _stream_key(event: Any) -> Optional[Tuple[Any, Any]]:
+    """Merge key of a coalescable agent_stream event dict, else None."""
+    if not isinstance(event, dict) or event.get("type") != "agent_stream":
+        return None
+    data = event.get("data") or {}
+    return data.get("agent"), data.get("content_type", "text")
+
+
+async def coalesce_stream_events(
+    events: AsyncIterator[Dict[str, Any]],
+    flush_interval: float = STREAM_FLUSH_INTERVAL,
+    max_chunk_chars: int = STREAM_MAX_CHUNK_CHARS
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """Merge consecutive agent_stream chunks of the same agent.
+
+    A merged chunk is released when the flush interval since its first
+    piece elapses (even if the producer is idle), when it reaches
+    ``max_chunk_chars``, or when a different event arrives. Event order is
+    preserved and non-stream events pass through unchanged. If the source
+    raises, the buffered chunk is released before the error is re-raised.
+
+    Args:
+        events: Async iterator of AG UI event dicts
+        flush_interval: Seconds a merged chunk may wait for more content
+        max_chunk_chars: Content size that forces a flush
+
+    Yields:
+        AG UI event dicts
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=256)
+    done = object()
+
+    async def pump() -> None:
+        try:
+            async for event in events:
+                await queue.put(event)
+        except Exception as e:
+            await queue.put(e)
+        finally:
+            await queue.put(done)
+
+    pump_task = asyncio.create_task(pump())
+    pending: Optional[Dict[str, Any]] = None
+    pending_key: Optional[Tuple[Any, Any]] = None
+    pieces: List[str] = []
+    size = 0
+    deadline = 0.0
+
+    def merged() -> Dict[str, Any]:
+        return {**pending, "data": {**pending["data"], "content": "".join(pieces)}}
+
+    try:
+        while True:
+            if pending is None:
+                item = await queue.get()
+            else:
+                try:
+                    item = await asyncio.wait_for(
+                        queue.get(), max(0.0, deadline - loop.time())
+                    )
+                except asyncio.TimeoutError:
+                    yield merged()
+                    pending = None
+                    continue
+
+            if item is done:
+                break
+            if isinstance(item, Exception):
+                if pending is not None:
+                    yield merged()
+                    pending = None
+                raise item
+
+            key = _stream_key(item)
+            if pending is not None and key == pending_key:
+                content = item["data"].get("content", "")
+                pieces.append(content)
+                size += len(content)
+                if size >= max_chunk_chars:
+                    yield merged()
+                    pending = None
+                continue
+
+            if pending is not None:
+                yield merged()
+                pending = None
+
+            if key is None:
+                yield item
+                continue
+
+            pending, pending_key = item, key
+            pieces = [item["data"].get("content", "")]
+            size = len(pieces[0])
+            deadline = loop.time() + flush_interval
+
+        if pending is not None:
+            yield merged()
+    finally:
+        pump_task.cancel()
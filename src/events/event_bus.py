@@ -0,0 +1,348 @@
+"""In-process fan-out of workflow events to SSE subscribers.
+
+One workflow run per session publishes its AG UI events to a channel;
+every SSE connection for that session (a second browser tab, a dashboard)
+subscribes to the channel instead of starting a duplicate run.
+
+- Late subscribers get a bounded replay of recent events, then live ones
+- The producer never waits on subscribers: each subscriber has a bounded
+  queue, and a subscriber that falls behind is either disconnected or
+  sampled (intermediate stream chunks skipped) depending on its policy
+- A run survives its subscribers briefly (so a reconnecting tab can
+  re-attach); once the last one has been gone for the idle grace period
+  the run is cancelled. The channel closes when the run ends and attached
+  subscribers finish with it
+- A run can carry a key describing what it computes, so callers only
+  share it with requests that asked for the same thing
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, AsyncGenerator, AsyncIterator, Deque, Dict, Hashable, Optional, Set
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+# Slow-subscriber policies
+OVERFLOW_DISCONNECT = "disconnect"
+OVERFLOW_SAMPLE = "sample"
+
+_CLOSED = object()
+
+
+class SubscriberDisconnected(Exception):
+    """Raised to a subscriber that fell too far behind the producer."""
+
+
+class _Subscriber:
+    """One consumer of a session channel."""
+
+    def __init__(self, backlog: Deque[Dict[str, Any]], max_queue: int, overflow: str):
+        self.backlog = backlog
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.overflow = overflow
+        self.disconnected = False
+        self.skipped = 0
+
+    def offer(self, event: Any) -> None:
+        """Queue an event without blocking the producer."""
+        if self.disconnected:
+            return
+
+        try:
+            self.queue.put_nowait(event)
+            return
+        except asyncio.QueueFull:
+            pass
+
+        if self.overflow == OVERFLOW_DISCONNECT:
+            self.disconnected = True
+            # Wake a consumer waiting on get()
+            self._evict_oldest()
+            self.queue.put_nowait(_CLOSED)
+            return
+
+        # Sample: skip incoming stream chunks, make room for everything else
+        if event is not _CLOSED and isinstance(event, dict) and event.get("type") == "agent_stream":
+            self.skipped += 1
+            return
+        self._evict_oldest()
+        self.queue.put_nowait(event)
+
+    def _evict_oldest(self) -> None:
+        try:
+            self.queue.get_nowait()
+            self.skipped += 1
+        except asyncio.QueueEmpty:
+            pass
+
+
+class _SessionChannel:
+    """Replay buffer and subscribers of one session's workflow run."""
+
+    def __init__(self, session_id: str, replay_size: int, run_key: Optional[Hashable] = None):
+        self.session_id = session_id
+        self.run_key = run_key
+        self.replay: Deque[Dict[str, Any]] = deque(maxlen=replay_size)
+        self.subscribers: Set[_Subscriber] = set()
+        self.producer: Optional[asyncio.Task] = None
+        self.idle_timer: Optional[asyncio.TimerHandle] = None
+        self.error: Optional[BaseException] = None
+        self.closed = False
+        self.published = 0
+
+    def publish(self, event: Dict[str, Any]) -> None:
+        self.published += 1
+        self.replay.append(event)
+        for subscriber in self.subscribers:
+            subscriber.offer(event)
+
+    def close(self, error: Optional[BaseException] = None) -> None:
+        self.closed = True
+        self.error = error
+        for subscriber in self.subscribers:
+            subscriber.offer(_CLOSED)
+
+
+class SessionEventBus:
+    """Session-keyed pub/sub for workflow events.
+
+    Example:
+        >>> bus = get_event_bus()
+        >>> if not bus.is_running(session_id):
+        ...     bus.start(session_id, orchestrator.execute_with_events(context))
+        >>> async for event in bus.subscribe(session_id):
+        ...     yield format_event(event)
+    """
+
+    def __init__(
+        self,
+        replay_size: int = 200,
+        subscriber_queue_size: int = 500,
+        overflow: str = OVERFLOW_SAMPLE,
+        idle_grace_seconds: float = 10.0
+    ):
+        """Initialize event bus.
+
+        Args:
+            replay_size: Recent events replayed to a late subscriber
+            subscriber_queue_size: Live events buffered per subscriber
+            overflow: Default slow-subscriber policy (``"sample"`` or
+                ``"disconnect"``)
+            idle_grace_seconds: How long a run keeps going after its last
+                subscriber detached before it is cancelled
+
+        Raises:
+            ValueError: If overflow is not a known policy
+        """
+        if overflow not in (OVERFLOW_SAMPLE, OVERFLOW_DISCONNECT):
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+
+        self.replay_size = replay_size
+        self.subscriber_queue_size = subscriber_queue_size
+        self.overflow = overflow
+        self.idle_grace_seconds = idle_grace_seconds
+        self.logger = logger.bind(component="session_event_bus")
+
+        self._channels: Dict[str, _SessionChannel] = {}
+
+    def is_running(self, session_id: str, run_key: Optional[Hashable] = None) -> bool:
+        """Check whether a session has a workflow run publishing events.
+
+        Args:
+            session_id: Session identifier
+            run_key: Only count a run started with this key
+
+        Returns:
+            True if subscribers can attach to a running workflow
+        """
+        channel = self._channels.get(session_id)
+        if channel is None or channel.closed:
+            return False
+        return run_key is None or channel.run_key == run_key
+
+    def start(
+        self,
+        session_id: str,
+        events: AsyncIterator[Dict[str, Any]],
+        run_key: Optional[Hashable] = None
+    ) -> bool:
+        """Publish a workflow run's events to the session channel.
+
+        Args:
+            session_id: Session identifier
+            events: The run's event stream (consumed by a background task)
+            run_key: What the run computes (e.g. account, workflow and
+                message), checked by ``is_running`` before sharing it
+
+        Returns:
+            True if the run was started, False if the session already has
+            a running workflow (the given stream is closed unconsumed)
+        """
+        if self.is_running(session_id):
+            aclose = getattr(events, "aclose", None)
+            if aclose is not None:
+                asyncio.create_task(aclose())
+            return False
+
+        channel = _SessionChannel(session_id, self.replay_size, run_key)
+        self._channels[session_id] = channel
+        channel.producer = asyncio.create_task(self._produce(channel, events))
+
+        self.logger.info("session_run_started", session_id=session_id)
+        return True
+
+    def subscribe(
+        self,
+        session_id: str,
+        replay: bool = True,
+        overflow: Optional[str] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Attach to a session's events until its workflow run ends.
+
+        The subscriber is attached immediately, not on first iteration, so
+        nothing published after this call is missed.
+
+        Args:
+            session_id: Session identifier
+            replay: Start with the buffered recent events
+            overflow: Slow-subscriber policy (defaults to the bus policy)
+
+        Returns:
+            Async iterator of AG UI events; it raises SubscriberDisconnected
+            if the subscriber fell behind under the ``"disconnect"`` policy,
+            or whatever ended the workflow run with an error
+
+        Raises:
+            KeyError: If the session has no workflow run
+        """
+        channel = self._channels.get(session_id)
+        if channel is None:
+            raise KeyError(f"No workflow run for session {session_id}")
+
+        # Snapshot the replay and register in one step, so no event is
+        # missed or delivered twice
+        backlog = deque(channel.replay) if replay else deque()
+        subscriber = _Subscriber(
+            backlog, self.subscriber_queue_size, overflow or self.overflow
+        )
+        if channel.closed:
+            subscriber.offer(_CLOSED)
+        else:
+            channel.subscribers.add(subscriber)
+            if channel.idle_timer is not None:
+                channel.idle_timer.cancel()
+                channel.idle_timer = None
+
+        self.logger.debug(
+            "session_subscriber_attached",
+            session_id=session_id,
+            replayed=len(backlog),
+            subscribers=len(channel.subscribers)
+        )
+
+        return self._deliver(channel, subscriber)
+
+    async def _deliver(
+        self,
+        channel: _SessionChannel,
+        subscriber: _Subscriber
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Yield a subscriber's replay, then its live events."""
+        session_id = channel.session_id
+        try:
+            while subscriber.backlog:
+                yield subscriber.backlog.popleft()
+
+            while True:
+                event = await subscriber.queue.get()
+                if event is _CLOSED:
+                    break
+                yield event
+
+            if subscriber.disconnected:
+                self.logger.warning(
+                    "session_subscriber_disconnected",
+                    session_id=session_id,
+                    skipped=subscriber.skipped
+                )
+                raise SubscriberDisconnected(
+                    f"Subscriber fell behind session {session_id}"
+                )
+            if channel.error is not None:
+                raise channel.error
+        finally:
+            channel.subscribers.discard(subscriber)
+            if not channel.subscribers and not channel.closed and channel.idle_timer is None:
+                channel.idle_timer = asyncio.get_running_loop().call_later(
+                    self.idle_grace_seconds, self._cancel_idle, channel
+                )
+
+    def _cancel_idle(self, channel: _SessionChannel) -> None:
+        """Cancel a run nobody re-attached to within the grace period."""
+        channel.idle_timer = None
+        if channel.subscribers or channel.closed or channel.producer is None:
+            return
+
+        self.logger.info("session_run_abandoned", session_id=channel.session_id)
+        channel.producer.cancel()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-session channel stats.
+
+        Returns:
+            Stats dict keyed by session ID
+        """
+        return {
+            session_id: {
+                "running": not channel.closed,
+                "subscribers": len(channel.subscribers),
+                "events_published": channel.published,
+                "events_skipped": sum(s.skipped for s in channel.subscribers),
+            }
+            for session_id, channel in self._channels.items()
+        }
+
+    async def _produce(
+        self,
+        channel: _SessionChannel,
+        events: AsyncIterator[Dict[str, Any]]
+    ) -> None:
+        """Pump a run's events into its channel, then retire the channel."""
+        error: Optional[BaseException] = None
+        try:
+            async for event in events:
+                channel.publish(event)
+        except Exception as e:
+            error = e
+            self.logger.error(
+                "session_run_failed",
+                session_id=channel.session_id,
+                error=str(e)
+            )
+        finally:
+            if channel.idle_timer is not None:
+                channel.idle_timer.cancel()
+                channel.idle_timer = None
+            channel.close(error)
+            if self._channels.get(channel.session_id) is channel:
+                del self._channels[channel.session_id]
+
+            self.logger.info(
+                "session_run_finished",
+                session_id=channel.session_id,
+                events_published=channel.published
+            )
+
+
+_shared_bus: Optional[SessionEventBus] = None
+
+
+def get_event_bus() -> SessionEventBus:
+    """Get the process-wide session event bus."""
+    global _shared_bus
+    if _shared_bus is None:
+        _shared_bus = SessionEventBus()
+    return _shared_bus
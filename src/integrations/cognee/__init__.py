@@ -9,6 +9,9 @@ Main Components:
 - CogneeConfig: Configuration and settings management
 - AccountIngestionPipeline: Bulk account ingestion from Zoho CRM
 - CogneeMCPTools: MCP tools for agent access
+- AccountSimilarityIndex: Local ANN index for lookalike account queries
+- AccountSnapshotStore: Write-through store of last synced account records
+- AccountEventIndex: Append-only per-account event log for incremental timelines
 
 Quick Start:
     from src.integrations.cognee import CogneeClient, CogneeConfig
@@ -37,12 +40,26 @@ from src.integrations.cognee.cognee_config import (
 )
 from src.integrations.cognee.account_ingestion import (
     AccountIngestionPipeline,
-    AccountSyncScheduler
+    AccountSyncScheduler,
+    IngestionCheckpoint
 )
 from src.integrations.cognee.cognee_mcp_tools import (
     CogneeMCPTools,
     create_mcp_tool_definitions
 )
+from src.integrations.cognee.similarity_index import (
+    AccountFeatureEncoder,
+    AccountSimilarityIndex
+)
+from src.integrations.cognee.snapshot_store import (
+    AccountSnapshot,
+    AccountSnapshotStore
+)
+from src.integrations.cognee.timeline_index import (
+    AccountEventIndex,
+    IndexedTimelineEvent,
+    TimelinePage
+)
 
 __all__ = [
     # Core client
@@ -57,10 +74,24 @@ __all__ = [
     # Ingestion pipeline
     "AccountIngestionPipeline",
     "AccountSyncScheduler",
+    "IngestionCheckpoint",
 
     # MCP tools
     "CogneeMCPTools",
     "create_mcp_tool_definitions",
+
+    # Local similarity index
+    "AccountFeatureEncoder",
+    "AccountSimilarityIndex",
+
+    # Local snapshot store
+    "AccountSnapshot",
+    "AccountSnapshotStore",
+
+    # Incremental timeline index
+    "AccountEventIndex",
+    "IndexedTimelineEvent",
+    "TimelinePage",
 ]
 
 __version__ = "1.0.0"
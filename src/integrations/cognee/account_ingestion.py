@@ -3,11 +3,24 @@ Account Ingestion Pipeline.
 
 Pipeline for ingesting Zoho CRM accounts into Cognee knowledge graph.
 Handles bulk ingestion, incremental sync, and data transformation.
+
+Large ingestions are resumable: a cursor (last contiguous batch and last
+account ID) is persisted after every batch, accounts that failed before an
+interruption are retried on resume, total in-flight Cognee writes are
+bounded across batches, and batch size adapts to observed Cognee write
+latency.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple
 import asyncio
+import hashlib
+import json
+import os
+import statistics
+import time
+from dataclasses import dataclass, field, asdict
 from datetime import datetime
+from pathlib import Path
 import structlog
 
 from src.integrations.cognee.cognee_client import CogneeClient
@@ -16,6 +29,107 @@ from src.integrations.cognee.cognee_config import CogneeIngestionConfig
 logger = structlog.get_logger(__name__)
 
 
+@dataclass
+class IngestionCheckpoint:
+    """
+    Persisted cursor for resumable ingestion runs.
+
+    Attributes:
+        run_key: Fingerprint of the requested account ID list
+        last_batch: Highest batch number completed with all earlier batches
+        last_account_id: Last account ID covered by ``last_batch``
+        processed_count: Accounts processed up to the cursor
+        failed_ids: Accounts that failed within completed batches (retried
+            when the run resumes)
+        updated_at: When the cursor was last written
+    """
+    run_key: str
+    last_batch: int = 0
+    last_account_id: Optional[str] = None
+    processed_count: int = 0
+    failed_ids: List[str] = field(default_factory=list)
+    updated_at: Optional[str] = None
+
+    @staticmethod
+    def run_key_for(account_ids: List[str]) -> str:
+        """Fingerprint an ordered account ID list."""
+        digest = hashlib.sha256()
+        for account_id in account_ids:
+            digest.update(str(account_id).encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    @classmethod
+    def load(cls, path: str, run_key: str) -> Optional["IngestionCheckpoint"]:
+        """Load the cursor at ``path`` if it belongs to ``run_key``."""
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        if data.get("run_key") != run_key:
+            return None
+        return cls(**data)
+
+    def save(self, path: str) -> None:
+        """Atomically persist the cursor."""
+        self.updated_at = datetime.utcnow().isoformat()
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_suffix(target.suffix + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(asdict(self), f)
+        os.replace(tmp, target)
+
+    @staticmethod
+    def clear(path: str) -> None:
+        """Remove a persisted cursor."""
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+class AdaptiveBatchSizer:
+    """
+    AIMD batch size controller driven by Cognee write latency.
+
+    Grows the batch additively while median write latency stays under
+    target and halves it when latency exceeds target. When disabled the
+    initial size is used as given, without clamping to the bounds.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        target_latency_ms: float,
+        enabled: bool = True
+    ):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        if enabled:
+            self.size = min(max(initial, self.minimum), self.maximum)
+        else:
+            self.size = max(1, initial)
+        self.target_latency_ms = target_latency_ms
+        self.enabled = enabled
+
+    def observe(self, write_latencies_ms: List[float]) -> int:
+        """Update batch size from a completed batch's write latencies."""
+        if not self.enabled or not write_latencies_ms:
+            return self.size
+
+        median = statistics.median(write_latencies_ms)
+        if median > self.target_latency_ms:
+            self.size = max(self.minimum, self.size // 2)
+        elif median < self.target_latency_ms * 0.8:
+            self.size = min(self.maximum, self.size + self.minimum)
+        return self.size
+
+
 class AccountIngestionPipeline:
     """
     Pipeline for ingesting Zoho CRM accounts into Cognee.
@@ -27,6 +141,8 @@ class AccountIngestionPipeline:
     - Deduplication
     - Progress tracking
     - Error handling and recovery
+    - Resumable runs via a persisted cursor
+    - Bounded Cognee write concurrency and adaptive batch sizing
     """
 
     def __init__(
@@ -63,7 +179,8 @@ class AccountIngestionPipeline:
     async def ingest_pilot_accounts(
         self,
         account_ids: List[str],
-        batch_size: Optional[int] = None
+        batch_size: Optional[int] = None,
+        resume: bool = True
     ) -> Dict[str, Any]:
         """
         Ingest pilot accounts (50) into Cognee.
@@ -75,9 +192,15 @@ class AccountIngestionPipeline:
         4. Store in Cognee knowledge graph
         5. Create relationships
 
+        When ``config.checkpoint_path`` is set and ``resume`` is True, a
+        previous interrupted run over the same account list continues after
+        its persisted cursor without re-fetching completed accounts; the
+        accounts that failed before the cursor are retried first.
+
         Args:
             account_ids: List of Zoho account IDs to ingest
-            batch_size: Batch size for processing
+            batch_size: Initial batch size for processing
+            resume: Resume from a persisted cursor if one matches
 
         Returns:
             Detailed ingestion report with stats
@@ -89,35 +212,49 @@ class AccountIngestionPipeline:
         )
 
         self.stats["start_time"] = datetime.utcnow()
-        batch_size = batch_size or self.config.batch_delay_ms
+        batch_size = batch_size or self.config.batch_size
+
+        checkpoint = self._load_checkpoint(account_ids, resume)
+        position = {account_id: i for i, account_id in enumerate(account_ids)}
+        if checkpoint.last_account_id in position:
+            account_ids = account_ids[position[checkpoint.last_account_id] + 1:]
+            self.stats["total_processed"] = checkpoint.processed_count
+            self.logger.info(
+                "pilot_ingestion_resumed",
+                last_batch=checkpoint.last_batch,
+                last_account_id=checkpoint.last_account_id,
+                remaining=len(account_ids)
+            )
+
+        retry_results = None
+        if checkpoint.failed_ids:
+            retry_results = await self._retry_failed_accounts(checkpoint, batch_size)
 
         # Fetch accounts from Zoho
         accounts_data = await self._fetch_accounts_from_zoho(account_ids)
+        # Keep request order so the cursor maps onto the account ID list
+        accounts_data.sort(key=lambda a: position.get(a.get("id"), len(position)))
 
         if not accounts_data:
-            self.logger.warning("no_accounts_fetched_from_zoho")
-            return self._generate_report()
-
-        # Validate accounts
-        validated_accounts = self._validate_accounts(accounts_data)
-
-        # Transform accounts to Cognee format
-        transformed_accounts = [
-            self._transform_zoho_to_cognee(account)
-            for account in validated_accounts
-        ]
+            if not account_ids and not checkpoint.failed_ids and self.config.checkpoint_path:
+                # Only retries were left, and they all went through
+                IngestionCheckpoint.clear(self.config.checkpoint_path)
+            else:
+                self.logger.warning("no_accounts_fetched_from_zoho")
+            self.stats["end_time"] = datetime.utcnow()
+            return self._generate_report(retry_results)
 
-        # Check for duplicates if enabled
-        if self.config.enable_deduplication:
-            transformed_accounts = await self._deduplicate_accounts(
-                transformed_accounts
-            )
+        transformed_accounts = await self._prepare_accounts(accounts_data)
 
         # Ingest in batches
         results = await self._ingest_in_batches(
             transformed_accounts,
-            batch_size
+            batch_size,
+            checkpoint=checkpoint
         )
+        if retry_results:
+            for key in ("success", "failed", "errors"):
+                results[key] = retry_results[key] + results[key]
 
         # Create account relationships
         if self.config.enable_progress_tracking:
@@ -174,6 +311,60 @@ class AccountIngestionPipeline:
 
     # Private methods
 
+    async def _prepare_accounts(
+        self,
+        accounts_data: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Validate, transform and (if enabled) deduplicate Zoho accounts."""
+        validated_accounts = self._validate_accounts(accounts_data)
+
+        transformed_accounts = [
+            self._transform_zoho_to_cognee(account)
+            for account in validated_accounts
+        ]
+
+        if self.config.enable_deduplication:
+            transformed_accounts = await self._deduplicate_accounts(
+                transformed_accounts
+            )
+        return transformed_accounts
+
+    async def _retry_failed_accounts(
+        self,
+        checkpoint: IngestionCheckpoint,
+        batch_size: int
+    ) -> Dict[str, Any]:
+        """
+        Re-ingest accounts that failed before the persisted cursor.
+
+        The cursor keeps listing the accounts until the retry finishes, so
+        an interrupted retry is attempted again on the next resume.
+        """
+        retry_ids = list(checkpoint.failed_ids)
+        self.logger.info("failed_accounts_retry_started", count=len(retry_ids))
+
+        accounts_data = await self._fetch_accounts_from_zoho(retry_ids)
+        accounts = await self._prepare_accounts(accounts_data)
+
+        results = await self._ingest_in_batches(accounts, batch_size)
+        # Already counted in the cursor's processed_count
+        self.stats["total_processed"] -= len(accounts)
+
+        # Anything not ingested this time is kept for the next resume
+        succeeded = set(results["success"])
+        checkpoint.failed_ids = [
+            account_id for account_id in retry_ids if account_id not in succeeded
+        ]
+        if self.config.checkpoint_path:
+            await asyncio.to_thread(checkpoint.save, self.config.checkpoint_path)
+
+        self.logger.info(
+            "failed_accounts_retry_completed",
+            retried=len(accounts),
+            still_failed=len(checkpoint.failed_ids)
+        )
+        return results
+
     async def _fetch_accounts_from_zoho(
         self,
         account_ids: List[str]
@@ -363,16 +554,44 @@ class AccountIngestionPipeline:
 
         return deduplicated
 
+    def _load_checkpoint(
+        self,
+        account_ids: List[str],
+        resume: bool
+    ) -> IngestionCheckpoint:
+        """Load a matching persisted cursor or start a fresh one."""
+        run_key = IngestionCheckpoint.run_key_for(account_ids)
+        if resume and self.config.checkpoint_path:
+            checkpoint = IngestionCheckpoint.load(self.config.checkpoint_path, run_key)
+            if checkpoint:
+                return checkpoint
+        return IngestionCheckpoint(run_key=run_key)
+
     async def _ingest_in_batches(
         self,
         accounts: List[Dict[str, Any]],
-        batch_size: Optional[int] = None
+        batch_size: Optional[int] = None,
+        checkpoint: Optional[IngestionCheckpoint] = None
     ) -> Dict[str, Any]:
         """
         Ingest accounts in batches with progress tracking.
+
+        Batches are carved off sequentially with an adaptively sized window
+        and, when ``parallel_batches`` is enabled, up to
+        ``max_inflight_batches`` run at once. Cognee writes are bounded by a
+        semaphore shared across batches. After each batch the cursor is
+        advanced to the highest contiguous completed batch and persisted.
         """
-        batch_size = batch_size or 10
         total = len(accounts)
+        sizer = AdaptiveBatchSizer(
+            initial=batch_size or self.config.batch_size,
+            minimum=self.config.min_batch_size,
+            maximum=self.config.max_batch_size,
+            target_latency_ms=self.config.target_write_latency_ms,
+            enabled=self.config.adaptive_batch_sizing
+        )
+        write_limit = asyncio.Semaphore(self.config.max_concurrent_writes)
+        max_inflight = self.config.max_inflight_batches if self.config.parallel_batches else 1
 
         results = {
             "success": [],
@@ -380,64 +599,137 @@ class AccountIngestionPipeline:
             "errors": []
         }
 
-        for i in range(0, total, batch_size):
-            batch = accounts[i:i + batch_size]
-            batch_num = (i // batch_size) + 1
+        # Batches completed out of order, waiting for the cursor to reach them
+        completed: Dict[int, Dict[str, Any]] = {}
+        pending: Set[asyncio.Task] = set()
+        batch_num = checkpoint.last_batch if checkpoint else 0
+        offset = 0
+        aborted = False
+
+        async def advance_cursor() -> None:
+            if not checkpoint:
+                completed.clear()
+                return
+            while checkpoint.last_batch + 1 in completed:
+                done = completed.pop(checkpoint.last_batch + 1)
+                checkpoint.last_batch += 1
+                checkpoint.last_account_id = done["last_account_id"]
+                checkpoint.processed_count += done["size"]
+                checkpoint.failed_ids.extend(done["failed"])
+            if self.config.checkpoint_path:
+                # Keep the file write off the event loop; batches still in
+                # flight don't touch the cursor
+                await asyncio.to_thread(checkpoint.save, self.config.checkpoint_path)
+
+        async def drain(return_when: str) -> None:
+            nonlocal aborted
+            done, _ = await asyncio.wait(pending, return_when=return_when)
+            for task in done:
+                pending.discard(task)
+                number, batch_result = task.result()
+
+                results["success"].extend(batch_result["success"])
+                results["failed"].extend(batch_result["failed"])
+                results["errors"].extend(batch_result["errors"])
+                self.stats["success_count"] += len(batch_result["success"])
+                self.stats["failure_count"] += len(batch_result["failed"])
+                self.stats["total_processed"] += batch_result["size"]
+
+                sizer.observe(batch_result["latencies_ms"])
+                completed[number] = batch_result
+
+                if (
+                    self.config.max_errors and
+                    self.stats["failure_count"] >= self.config.max_errors
+                ):
+                    aborted = True
+            await advance_cursor()
+
+        while offset < total and not aborted:
+            batch = accounts[offset:offset + sizer.size]
+            offset += len(batch)
+            batch_num += 1
 
             # Log progress
             if self.config.enable_progress_tracking:
                 self.logger.info(
                     "ingestion_progress",
                     batch=batch_num,
-                    processed=min(i + batch_size, total),
+                    batch_size=len(batch),
+                    processed=offset,
                     total=total,
-                    progress_pct=round((min(i + batch_size, total) / total) * 100, 1)
+                    progress_pct=round((offset / total) * 100, 1),
+                    inflight_batches=len(pending) + 1
                 )
 
-            # Ingest batch
-            if self.config.parallel_batches:
-                batch_result = await self.cognee.add_accounts_bulk(batch)
-            else:
-                # Sequential processing
-                batch_result = {"success": 0, "failed": 0, "errors": []}
-                for account in batch:
-                    try:
-                        await self.cognee.add_account(account)
-                        batch_result["success"] += 1
-                        results["success"].append(account["id"])
-                    except Exception as e:
-                        batch_result["failed"] += 1
-                        batch_result["errors"].append({
-                            "account_id": account["id"],
-                            "error": str(e)
-                        })
-                        results["failed"].append(account["id"])
-
-            # Aggregate results
-            self.stats["success_count"] += batch_result.get("success", 0)
-            self.stats["failure_count"] += batch_result.get("failed", 0)
-            self.stats["total_processed"] += len(batch)
-
-            results["errors"].extend(batch_result.get("errors", []))
-
-            # Check max errors threshold
-            if (
-                self.config.max_errors and
-                self.stats["failure_count"] >= self.config.max_errors
-            ):
-                self.logger.error(
-                    "max_errors_reached",
-                    failures=self.stats["failure_count"],
-                    max_allowed=self.config.max_errors
-                )
-                break
+            pending.add(asyncio.create_task(
+                self._ingest_batch(batch_num, batch, write_limit)
+            ))
+
+            if len(pending) >= max_inflight:
+                await drain(asyncio.FIRST_COMPLETED)
 
             # Add delay between batches if configured
-            if self.config.batch_delay_ms > 0 and i + batch_size < total:
+            if self.config.batch_delay_ms > 0 and offset < total:
                 await asyncio.sleep(self.config.batch_delay_ms / 1000)
 
+        if pending:
+            await drain(asyncio.ALL_COMPLETED)
+
+        if aborted:
+            self.logger.error(
+                "max_errors_reached",
+                failures=self.stats["failure_count"],
+                max_allowed=self.config.max_errors
+            )
+        elif checkpoint and self.config.checkpoint_path:
+            # Run finished; the next run over this list starts fresh
+            IngestionCheckpoint.clear(self.config.checkpoint_path)
+
         return results
 
+    async def _ingest_batch(
+        self,
+        batch_num: int,
+        batch: List[Dict[str, Any]],
+        write_limit: asyncio.Semaphore
+    ) -> Tuple[int, Dict[str, Any]]:
+        """Ingest one batch, recording per-write Cognee latency."""
+        batch_result = {
+            "success": [],
+            "failed": [],
+            "errors": [],
+            "latencies_ms": [],
+            "size": len(batch),
+            "last_account_id": batch[-1]["id"] if batch else None
+        }
+
+        async def write(account: Dict[str, Any]) -> None:
+            async with write_limit:
+                started = time.perf_counter()
+                try:
+                    await self.cognee.add_account(account)
+                    batch_result["success"].append(account["id"])
+                except Exception as e:
+                    batch_result["failed"].append(account["id"])
+                    batch_result["errors"].append({
+                        "account_id": account["id"],
+                        "error": str(e)
+                    })
+                finally:
+                    batch_result["latencies_ms"].append(
+                        (time.perf_counter() - started) * 1000
+                    )
+
+        if self.config.parallel_batches:
+            await asyncio.gather(*(write(account) for account in batch))
+        else:
+            # Sequential processing
+            for account in batch:
+                await write(account)
+
+        return batch_num, batch_result
+
     async def _create_account_relationships(
         self,
         accounts: List[Dict[str, Any]]
@@ -5,7 +5,7 @@ Production-ready client for Cognee persistent memory and knowledge graph.
 Provides interface to store, retrieve, and analyze account data.
 """
 
-from typing import Dict, List, Optional, Any, Union
+from typing import AsyncIterator, Dict, List, Optional, Any, Union
 import asyncio
 from datetime import datetime
 import structlog
@@ -18,6 +18,9 @@ except ImportError:
     cognee = None
 
 from src.integrations.cognee.cognee_config import CogneeConfig
+from src.integrations.cognee.similarity_index import AccountSimilarityIndex
+from src.integrations.cognee.snapshot_store import AccountSnapshotStore
+from src.integrations.cognee.timeline_index import AccountEventIndex
 
 logger = structlog.get_logger(__name__)
 
@@ -35,7 +38,7 @@ class CogneeClient:
     - Historical context retrieval
     - Account health analysis
     - Relationship discovery
-    - Interaction timeline tracking
+    - Interaction timeline tracking (incremental reads via event index)
     """
 
     def __init__(
@@ -43,16 +46,31 @@ class CogneeClient:
         config: Optional[CogneeConfig] = None,
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
-        workspace: Optional[str] = None
+        workspace: Optional[str] = None,
+        similarity_index: Optional[AccountSimilarityIndex] = None,
+        event_index: Optional[AccountEventIndex] = None,
+        snapshot_store: Optional[AccountSnapshotStore] = None
     ):
         """
         Initialize Cognee client.
 
+        Local stores not passed in are built from the config paths
+        (``similarity_index_path``, ``event_index_path``,
+        ``snapshot_store_path``) when those are set. The memory service and
+        sync pipeline default to the client's stores, so one process shares
+        a single instance of each.
+
         Args:
             config: CogneeConfig object (takes precedence)
             api_key: Cognee API key (fallback)
             base_url: Cognee API base URL (fallback)
             workspace: Workspace name (fallback)
+            similarity_index: Optional local ANN index used for similarity
+                relations instead of free-text search
+            event_index: Optional local append-only event index backing
+                timeline reads and ``since`` cursors
+            snapshot_store: Optional write-through store of last synced
+                account records
 
         Raises:
             ImportError: If cognee library not available
@@ -75,6 +93,19 @@ class CogneeClient:
             workspace=self.config.workspace
         )
 
+        if similarity_index is None and self.config.similarity_index_path:
+            similarity_index = AccountSimilarityIndex.load_or_create(
+                self.config.similarity_index_path
+            )
+        if event_index is None and self.config.event_index_path:
+            event_index = AccountEventIndex(self.config.event_index_path)
+        if snapshot_store is None and self.config.snapshot_store_path:
+            snapshot_store = AccountSnapshotStore(self.config.snapshot_store_path)
+
+        self.similarity_index = similarity_index
+        self.event_index = event_index
+        self.snapshot_store = snapshot_store
+
         # Connection state
         self._initialized = False
         self._session = None
@@ -146,6 +177,8 @@ class CogneeClient:
 
         account_id = account_data["id"]
 
+        ingestion_time = datetime.utcnow().isoformat()
+
         try:
             # Prepare account document
             account_text = self._format_account_for_storage(account_data)
@@ -160,7 +193,7 @@ class CogneeClient:
                         "account_name": account_data.get("Account_Name", ""),
                         "industry": account_data.get("Industry", ""),
                         "region": account_data.get("Billing_Country", ""),
-                        "ingestion_time": datetime.utcnow().isoformat(),
+                        "ingestion_time": ingestion_time,
                         "source": "zoho_crm"
                     }
                 )
@@ -174,6 +207,14 @@ class CogneeClient:
                     dataset_name=f"account_{account_id}"
                 )
 
+            self._index_event(
+                account_id,
+                interaction_id=f"{account_id}_account_sync_{ingestion_time}",
+                event_type="account_sync",
+                timestamp=ingestion_time,
+                summary=account_text[:200]
+            )
+
             self.logger.info(
                 "account_added_to_cognee",
                 account_id=account_id,
@@ -481,6 +522,16 @@ class CogneeClient:
         Returns:
             List of related accounts with relationship details
         """
+        # Similarity relations are answered by the local index when available
+        if (
+            self.similarity_index is not None
+            and relationship_type in (None, "similar_industry", "same_region")
+            and account_id in self.similarity_index
+        ):
+            return self.similarity_index.query(
+                account_id, k=limit, criteria=relationship_type or "all"
+            )
+
         await self._ensure_initialized()
 
         # Get account context
@@ -531,7 +582,8 @@ class CogneeClient:
         await self._ensure_initialized()
 
         # Create interaction document
-        interaction_id = f"{account_id}_{interaction_type}_{datetime.utcnow().timestamp()}"
+        now = datetime.utcnow()
+        interaction_id = f"{account_id}_{interaction_type}_{now.timestamp()}"
 
         interaction_text = f"""
         Interaction for account {account_id}
@@ -549,13 +601,21 @@ class CogneeClient:
                     "account_id": account_id,
                     "interaction_id": interaction_id,
                     "interaction_type": interaction_type,
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": now.isoformat(),
                     **data.get("metadata", {})
                 }
             )
 
             await cognee.cognify()
 
+            self._index_event(
+                account_id,
+                interaction_id=interaction_id,
+                event_type=interaction_type,
+                timestamp=now.isoformat(),
+                summary=interaction_text[:200]
+            )
+
             self.logger.info(
                 "interaction_stored",
                 account_id=account_id,
@@ -576,18 +636,138 @@ class CogneeClient:
     async def get_account_timeline(
         self,
         account_id: str,
-        limit: int = 50
+        limit: int = 50,
+        since: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Get chronological account interaction timeline.
 
+        With an event index configured, reads are served locally and each
+        entry carries a ``cursor``; pass the newest cursor seen as ``since``
+        to fetch only events recorded afterwards. A ``since`` read returns
+        the oldest ``limit`` events after the cursor, so repeating it with
+        the newest cursor returned walks forward without gaps (use
+        ``get_timeline_page`` to also learn whether more remain).
+
         Args:
             account_id: Account ID
             limit: Maximum interactions to return
+            since: Only return events after this cursor (requires event index)
 
         Returns:
             Sorted list of interactions (newest first)
+
+        Raises:
+            ValueError: If ``since`` is given without an event index
         """
+        if self.event_index is None:
+            if since is not None:
+                raise ValueError("Timeline cursors require an event index")
+            return await self._search_timeline(account_id, limit)
+
+        try:
+            await self._ensure_timeline_indexed(account_id)
+            if since is None:
+                events = self.event_index.read_latest(account_id, limit=limit)
+            else:
+                page = self.event_index.read_since(
+                    account_id,
+                    since=since,
+                    limit=limit
+                )
+                events = page.events[::-1]
+            return [event.to_dict() for event in events]
+
+        except Exception as e:
+            self.logger.error(
+                "get_timeline_failed",
+                account_id=account_id,
+                error=str(e)
+            )
+            raise
+
+    async def get_timeline_page(
+        self,
+        account_id: str,
+        since: int = 0,
+        limit: int = 50
+    ) -> Dict[str, Any]:
+        """
+        Read one page of timeline events forward from a cursor.
+
+        Args:
+            account_id: Account ID
+            since: Cursor of the last event already seen (0 reads from the start)
+            limit: Maximum events in the page
+
+        Returns:
+            Page with ``events`` (oldest first), ``next_cursor`` and ``has_more``
+
+        Raises:
+            ValueError: If no event index is configured
+        """
+        if self.event_index is None:
+            raise ValueError("Timeline cursors require an event index")
+
+        await self._ensure_timeline_indexed(account_id)
+        return self.event_index.read_since(
+            account_id,
+            since=since,
+            limit=limit
+        ).to_dict()
+
+    async def iter_account_timeline(
+        self,
+        account_id: str,
+        since: int = 0,
+        page_size: int = 50
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over timeline pages appended after a cursor.
+
+        Example:
+            >>> async for page in client.iter_account_timeline("acc_1", since=cursor):
+            ...     process(page["events"])
+            ...     cursor = page["next_cursor"]
+
+        Args:
+            account_id: Account ID
+            since: Cursor to start after
+            page_size: Events per page
+
+        Yields:
+            Pages as returned by ``get_timeline_page``
+        """
+        while True:
+            page = await self.get_timeline_page(account_id, since=since, limit=page_size)
+            if page["events"]:
+                yield page
+            if not page["has_more"]:
+                return
+            since = page["next_cursor"]
+
+    async def close(self) -> None:
+        """Close Cognee client and cleanup resources."""
+        if self._session:
+            await self._session.close()
+            self._session = None
+
+        self._initialized = False
+        self.logger.info("cognee_client_closed")
+
+    # Helper methods
+
+    async def _ensure_initialized(self) -> None:
+        """Ensure client is initialized before operations."""
+        if not self._initialized:
+            await self.initialize()
+
+    async def _search_timeline(
+        self,
+        account_id: str,
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """Build a timeline from a Cognee search (newest first)."""
         await self._ensure_initialized()
 
         try:
@@ -611,7 +791,7 @@ class CogneeClient:
 
             # Sort by timestamp (newest first)
             timeline.sort(
-                key=lambda x: x.get("timestamp", ""),
+                key=lambda x: x.get("timestamp") or "",
                 reverse=True
             )
 
@@ -625,21 +805,57 @@ class CogneeClient:
             )
             raise
 
-    async def close(self) -> None:
-        """Close Cognee client and cleanup resources."""
-        if self._session:
-            await self._session.close()
-            self._session = None
+    async def _ensure_timeline_indexed(self, account_id: str) -> None:
+        """Seed the event index from Cognee the first time an account is read."""
+        if account_id in self.event_index:
+            return
 
-        self._initialized = False
-        self.logger.info("cognee_client_closed")
+        history = await self._search_timeline(
+            account_id,
+            self.event_index.backfill_limit
+        )
+        self.event_index.extend(
+            account_id,
+            [
+                (
+                    entry["interaction_id"],
+                    entry["type"],
+                    entry["timestamp"],
+                    entry["summary"]
+                )
+                for entry in reversed(history)
+            ]
+        )
 
-    # Helper methods
+        self.logger.debug(
+            "timeline_backfilled",
+            account_id=account_id,
+            events=len(history)
+        )
 
-    async def _ensure_initialized(self) -> None:
-        """Ensure client is initialized before operations."""
-        if not self._initialized:
-            await self.initialize()
+    def _index_event(
+        self,
+        account_id: str,
+        interaction_id: str,
+        event_type: str,
+        timestamp: str,
+        summary: str
+    ) -> None:
+        """Append a written event to the local index.
+
+        Accounts not yet indexed are skipped; their first timeline read
+        backfills the full history from Cognee, including this event.
+        """
+        if self.event_index is None or account_id not in self.event_index:
+            return
+
+        self.event_index.append(
+            account_id,
+            event_type,
+            timestamp,
+            summary,
+            interaction_id=interaction_id
+        )
 
     def _format_account_for_storage(self, account_data: Dict[str, Any]) -> str:
         """Format account data as text for Cognee storage."""
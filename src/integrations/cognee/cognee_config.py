@@ -44,6 +44,22 @@ class CogneeConfig(BaseModel):
         description="Local path for vector store data"
     )
 
+    # Local account stores (each is built only when its path is set)
+    similarity_index_path: Optional[str] = Field(
+        default_factory=lambda: os.getenv("COGNEE_SIMILARITY_INDEX_PATH"),
+        description="Directory of the local ANN index for lookalike account queries"
+    )
+
+    snapshot_store_path: Optional[str] = Field(
+        default_factory=lambda: os.getenv("COGNEE_SNAPSHOT_STORE_PATH"),
+        description="SQLite file of the write-through store of last synced accounts"
+    )
+
+    event_index_path: Optional[str] = Field(
+        default_factory=lambda: os.getenv("COGNEE_EVENT_INDEX_PATH"),
+        description="SQLite file of the per-account event log backing timelines"
+    )
+
     embedding_model: str = Field(
         default="text-embedding-ada-002",
         description="Embedding model for vector generation"
@@ -285,6 +301,54 @@ class CogneeIngestionConfig(BaseModel):
         description="Process batches in parallel"
     )
 
+    batch_size: int = Field(
+        default=10,
+        ge=1,
+        description="Initial accounts per ingestion batch"
+    )
+
+    max_concurrent_writes: int = Field(
+        default=10,
+        ge=1,
+        description="Maximum in-flight Cognee writes across all batches"
+    )
+
+    max_inflight_batches: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum batches being ingested concurrently"
+    )
+
+    # Adaptive batch sizing
+    adaptive_batch_sizing: bool = Field(
+        default=True,
+        description="Resize batches based on observed Cognee write latency"
+    )
+
+    min_batch_size: int = Field(
+        default=5,
+        ge=1,
+        description="Lower bound for adaptive batch size"
+    )
+
+    max_batch_size: int = Field(
+        default=100,
+        ge=1,
+        description="Upper bound for adaptive batch size"
+    )
+
+    target_write_latency_ms: int = Field(
+        default=500,
+        ge=1,
+        description="Target median Cognee write latency for adaptive sizing"
+    )
+
+    # Resumable ingestion
+    checkpoint_path: Optional[str] = Field(
+        default=None,
+        description="File for the resumable ingestion cursor (None disables)"
+    )
+
     batch_delay_ms: int = Field(
         default=100,
         ge=0,
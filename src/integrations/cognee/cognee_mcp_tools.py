@@ -441,19 +441,24 @@ class CogneeMCPTools:
     async def cognee_get_timeline(
         self,
         account_id: str,
-        limit: int = 50
+        limit: int = 50,
+        since: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Bonus Tool: Get chronological interaction timeline.
 
-        Returns sorted timeline of all account interactions.
+        Returns sorted timeline of all account interactions, or only those
+        recorded after ``since`` when a cursor from a previous call is given.
 
         Args:
             account_id: Account ID
             limit: Maximum interactions
+            since: Cursor from a previous call's ``next_cursor``
 
         Returns:
-            Chronological timeline (newest first)
+            Chronological timeline (newest first). With ``since`` the timeline
+            is the next page after the cursor (oldest first) and ``has_more``
+            tells whether to call again with the returned ``next_cursor``.
         """
         self.logger.info(
             "mcp_tool_invoked",
@@ -462,6 +467,21 @@ class CogneeMCPTools:
         )
 
         try:
+            if since is not None:
+                page = await self.cognee.get_timeline_page(
+                    account_id=account_id,
+                    since=since,
+                    limit=limit
+                )
+                return {
+                    "success": True,
+                    "account_id": account_id,
+                    "timeline_count": len(page["events"]),
+                    "timeline": page["events"],
+                    "next_cursor": page["next_cursor"],
+                    "has_more": page["has_more"]
+                }
+
             timeline = await self.cognee.get_account_timeline(
                 account_id=account_id,
                 limit=limit
@@ -471,7 +491,11 @@ class CogneeMCPTools:
                 "success": True,
                 "account_id": account_id,
                 "timeline_count": len(timeline),
-                "timeline": timeline
+                "timeline": timeline,
+                "next_cursor": max(
+                    (entry.get("cursor") or 0 for entry in timeline),
+                    default=0
+                )
             }
 
         except Exception as e:
@@ -0,0 +1,687 @@
+"""
+Local approximate-nearest-neighbour index for account similarity.
+
+Replaces free-text Cognee queries ("accounts similar to X") for lookalike
+analysis with an in-process vector index over account features:
+
+- Industry and region (feature-hashed one-hot blocks)
+- Company size (employee and revenue tiers)
+- Health signals (health score band and risk level)
+- Optional external embeddings
+
+Each feature block is normalised independently so criteria-specific
+queries (industry only, size only, ...) are cosine similarity over the
+selected blocks. Large indexes are partitioned with an IVF coarse
+quantizer so whole-portfolio batch queries stay in the seconds range.
+
+The index is updated incrementally by the sync pipeline and persisted as
+``.npy`` files which are memory-mapped on load for fast startup.
+"""
+
+import hashlib
+import json
+import math
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+# Criteria accepted by queries, mapped to the feature blocks they compare
+CRITERIA_BLOCKS: Dict[str, Tuple[str, ...]] = {
+    "all": ("industry", "region", "size", "health", "embedding"),
+    "industry": ("industry",),
+    "region": ("region",),
+    "size": ("size",),
+    "health": ("health",),
+    "embedding": ("embedding",),
+}
+
+# Aliases used by CogneeClient.get_related_accounts relationship types
+CRITERIA_ALIASES: Dict[str, str] = {
+    "similar_industry": "industry",
+    "same_region": "region",
+    "semantic": "embedding",
+}
+
+_RISK_LEVELS = ("low", "medium", "high", "critical")
+_SIZE_TIERS = 8
+_HEALTH_BANDS = 5
+
+
+def _stable_bucket(value: str, buckets: int, salt: str = "") -> int:
+    """Hash a categorical value to a bucket, stable across processes."""
+    digest = hashlib.md5(f"{salt}{value.strip().lower()}".encode()).digest()
+    return int.from_bytes(digest[:8], "little") % buckets
+
+
+def _add_hashed(block: np.ndarray, value: str, weight: float, salt: str = "") -> None:
+    """Add a categorical value to a hashed block using two independent probes.
+
+    Two probes mean a single bucket collision only yields partial similarity
+    between unrelated values instead of an exact match.
+    """
+    buckets = len(block)
+    block[_stable_bucket(value, buckets, f"{salt}0:")] += weight
+    block[_stable_bucket(value, buckets, f"{salt}1:")] += weight
+
+
+def _soft_one_hot(position: float, size: int) -> np.ndarray:
+    """One-hot over ``size`` ordinal tiers, spilling half weight to neighbours."""
+    vector = np.zeros(size, dtype=np.float32)
+    tier = int(min(max(round(position), 0), size - 1))
+    vector[tier] = 1.0
+    if tier > 0:
+        vector[tier - 1] = 0.5
+    if tier < size - 1:
+        vector[tier + 1] = 0.5
+    return vector
+
+
+def _to_float(value: Any) -> Optional[float]:
+    """Best-effort numeric conversion for CRM fields."""
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class AccountFeatureEncoder:
+    """Encode Zoho account records into fixed-width feature vectors.
+
+    Layout (in order): industry, region, size, health and, when
+    ``embedding_dim`` > 0, embedding blocks.
+    """
+
+    def __init__(self, hash_buckets: int = 64, embedding_dim: int = 0):
+        """
+        Initialize encoder.
+
+        Args:
+            hash_buckets: Buckets for hashed categorical blocks
+            embedding_dim: Width of optional external embeddings (0 disables)
+        """
+        self.hash_buckets = hash_buckets
+        self.embedding_dim = embedding_dim
+
+        widths = [
+            ("industry", hash_buckets),
+            ("region", hash_buckets),
+            ("size", 2 * _SIZE_TIERS),
+            ("health", _HEALTH_BANDS + len(_RISK_LEVELS)),
+        ]
+        if embedding_dim:
+            widths.append(("embedding", embedding_dim))
+
+        self.blocks: Dict[str, slice] = {}
+        offset = 0
+        for name, width in widths:
+            self.blocks[name] = slice(offset, offset + width)
+            offset += width
+        self.dim = offset
+
+    def encode(
+        self,
+        account: Dict[str, Any],
+        health: Optional[Dict[str, Any]] = None,
+        embedding: Optional[Sequence[float]] = None
+    ) -> np.ndarray:
+        """
+        Encode one account record.
+
+        Args:
+            account: Zoho account record (flat field dict)
+            health: Optional health analysis (health_score, risk_level)
+            embedding: Optional external embedding vector
+
+        Returns:
+            Feature vector with each populated block normalised to unit length
+        """
+        vector = np.zeros(self.dim, dtype=np.float32)
+        health = health or {}
+
+        industry = account.get("Industry") or account.get("industry")
+        if industry:
+            _add_hashed(vector[self.blocks["industry"]], str(industry), 1.0)
+
+        country = account.get("Billing_Country") or account.get("country")
+        state = account.get("Billing_State") or account.get("region")
+        block = vector[self.blocks["region"]]
+        if country:
+            _add_hashed(block, str(country), 1.0, "country:")
+        if state:
+            _add_hashed(block, str(state), 0.5, "state:")
+
+        block = vector[self.blocks["size"]]
+        employees = _to_float(account.get("Employees"))
+        if employees is not None and employees >= 0:
+            block[:_SIZE_TIERS] = _soft_one_hot(math.log10(1 + employees), _SIZE_TIERS)
+        revenue = _to_float(account.get("Annual_Revenue"))
+        if revenue is not None and revenue >= 0:
+            block[_SIZE_TIERS:] = _soft_one_hot(math.log10(1 + revenue) - 3, _SIZE_TIERS)
+
+        block = vector[self.blocks["health"]]
+        health_score = _to_float(health.get("health_score", account.get("health_score")))
+        if health_score is not None:
+            band_position = min(max(health_score, 0.0), 100.0) / 100 * (_HEALTH_BANDS - 1)
+            block[:_HEALTH_BANDS] = _soft_one_hot(band_position, _HEALTH_BANDS)
+        risk_level = str(health.get("risk_level", account.get("risk_level", ""))).lower()
+        if risk_level in _RISK_LEVELS:
+            block[_HEALTH_BANDS + _RISK_LEVELS.index(risk_level)] = 1.0
+
+        if self.embedding_dim and embedding is not None:
+            values = np.asarray(embedding, dtype=np.float32)
+            if values.shape != (self.embedding_dim,):
+                raise ValueError(
+                    f"Embedding must have dimension {self.embedding_dim}, got {values.shape}"
+                )
+            vector[self.blocks["embedding"]] = values
+
+        for block_slice in self.blocks.values():
+            norm = np.linalg.norm(vector[block_slice])
+            if norm > 0:
+                vector[block_slice] /= norm
+
+        return vector
+
+    def block_mask(self, criteria: str) -> np.ndarray:
+        """Boolean mask over block order for the given criteria."""
+        criteria = CRITERIA_ALIASES.get(criteria, criteria)
+        if criteria not in CRITERIA_BLOCKS:
+            criteria = "all"
+        selected = CRITERIA_BLOCKS[criteria]
+        return np.array([name in selected for name in self.blocks], dtype=bool)
+
+
+class AccountSimilarityIndex:
+    """
+    In-process approximate-nearest-neighbour index over account features.
+
+    Features:
+    - Incremental upserts/removals from the sync pipeline
+    - Criteria-aware cosine similarity (industry, region, size, health, all)
+    - Batch top-k queries for whole-portfolio lookalike analysis
+    - IVF partitioning for large indexes (exact search below ``ivf_min_size``)
+    - Disk persistence with memory-mapped loading
+
+    Example:
+        >>> index = AccountSimilarityIndex(path="data/similarity_index")
+        >>> index.upsert("acc_1", {"Industry": "Software", "Employees": 250})
+        >>> index.query("acc_1", k=5, criteria="industry")
+        >>> index.save()
+    """
+
+    _VECTORS_FILE = "vectors.npy"
+    _CENTROIDS_FILE = "centroids.npy"
+    _ASSIGNMENTS_FILE = "assignments.npy"
+    _META_FILE = "meta.json"
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        hash_buckets: int = 64,
+        embedding_dim: int = 0,
+        ivf_min_size: int = 20000,
+        n_probe: int = 8
+    ):
+        """
+        Initialize similarity index.
+
+        Args:
+            path: Directory for persistence (None keeps the index in memory only)
+            hash_buckets: Buckets for hashed categorical features
+            embedding_dim: Width of optional external embeddings
+            ivf_min_size: Active accounts before IVF partitioning is used
+            n_probe: IVF partitions scanned per query
+        """
+        self.path = Path(path) if path else None
+        self.encoder = AccountFeatureEncoder(hash_buckets, embedding_dim)
+        self.ivf_min_size = ivf_min_size
+        self.n_probe = n_probe
+
+        self.logger = logger.bind(component="account_similarity_index")
+
+        self._vectors = np.zeros((0, self.encoder.dim), dtype=np.float32)
+        self._active = np.zeros(0, dtype=bool)
+        self._size = 0
+        self._ids: List[str] = []
+        self._names: List[str] = []
+        self._row_of: Dict[str, int] = {}
+
+        # IVF state
+        self._centroids: Optional[np.ndarray] = None
+        self._assignments = np.zeros(0, dtype=np.int32)
+        self._lists: Optional[List[np.ndarray]] = None
+        self._trained_size = 0
+
+    def __len__(self) -> int:
+        return int(self._active[:self._size].sum())
+
+    def __contains__(self, account_id: str) -> bool:
+        row = self._row_of.get(account_id)
+        return row is not None and bool(self._active[row])
+
+    # Updates
+
+    def upsert(
+        self,
+        account_id: str,
+        account: Dict[str, Any],
+        health: Optional[Dict[str, Any]] = None,
+        embedding: Optional[Sequence[float]] = None
+    ) -> None:
+        """
+        Insert or replace an account's feature vector.
+
+        Args:
+            account_id: Account identifier
+            account: Zoho account record
+            health: Optional health analysis
+            embedding: Optional external embedding
+        """
+        vector = self.encoder.encode(account, health, embedding)
+        name = str(account.get("Account_Name") or account.get("account_name") or "")
+
+        row = self._row_of.get(account_id)
+        if row is None:
+            row = self._append_row()
+            self._ids.append(account_id)
+            self._names.append(name)
+            self._row_of[account_id] = row
+        else:
+            self._names[row] = name
+
+        self._vectors[row] = vector
+        self._active[row] = True
+
+        if self._centroids is not None:
+            self._assignments[row] = int(np.argmax(self._centroids @ vector))
+            self._lists = None
+
+    def upsert_many(self, accounts: Iterable[Dict[str, Any]]) -> int:
+        """
+        Upsert a batch of Zoho account records keyed by their ``id`` field.
+
+        Returns:
+            Number of accounts indexed
+        """
+        count = 0
+        for account in accounts:
+            account_id = account.get("id") or account.get("account_id")
+            if not account_id:
+                continue
+            self.upsert(str(account_id), account)
+            count += 1
+        return count
+
+    def remove(self, account_id: str) -> bool:
+        """Tombstone an account so it is no longer returned."""
+        row = self._row_of.get(account_id)
+        if row is None or not self._active[row]:
+            return False
+        self._active[row] = False
+        self._lists = None
+        return True
+
+    def _append_row(self) -> int:
+        """Reserve a row, growing storage geometrically."""
+        if self._size == len(self._vectors):
+            capacity = max(1024, 2 * len(self._vectors))
+            vectors = np.zeros((capacity, self.encoder.dim), dtype=np.float32)
+            vectors[:self._size] = self._vectors[:self._size]
+            active = np.zeros(capacity, dtype=bool)
+            active[:self._size] = self._active[:self._size]
+            assignments = np.zeros(capacity, dtype=np.int32)
+            assignments[:self._size] = self._assignments[:self._size]
+            self._vectors, self._active, self._assignments = vectors, active, assignments
+
+        self._size += 1
+        return self._size - 1
+
+    # Queries
+
+    def query(
+        self,
+        account_id: str,
+        k: int = 10,
+        criteria: str = "all"
+    ) -> List[Dict[str, Any]]:
+        """
+        Find the top-k accounts most similar to an indexed account.
+
+        Returns:
+            Ranked accounts shaped like ``CogneeClient.search_accounts`` results
+        """
+        return self.query_batch([account_id], k=k, criteria=criteria).get(account_id, [])
+
+    def query_batch(
+        self,
+        account_ids: Sequence[str],
+        k: int = 10,
+        criteria: str = "all"
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Top-k similar accounts for many indexed accounts at once.
+
+        Accounts missing from the index are omitted from the result.
+
+        Args:
+            account_ids: Source accounts
+            k: Results per account
+            criteria: Similarity criteria (all, industry, region, size, health)
+
+        Returns:
+            Mapping of source account ID to ranked similar accounts
+        """
+        rows = [self._row_of[a] for a in account_ids if a in self]
+        if not rows or k <= 0:
+            return {}
+
+        block_mask = self.encoder.block_mask(criteria)
+        query_rows = np.asarray(rows, dtype=np.int64)
+
+        use_ivf = bool(block_mask.all()) and len(self) >= self.ivf_min_size
+        if use_ivf:
+            self._ensure_ivf()
+            top_rows, top_scores = self._search_ivf(query_rows, k)
+        else:
+            top_rows, top_scores = self._search_exact(query_rows, k, block_mask)
+
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        for row, neighbour_rows, scores in zip(rows, top_rows, top_scores):
+            results[self._ids[row]] = [
+                {
+                    "account_id": self._ids[n],
+                    "account_name": self._names[n],
+                    "relevance_score": round(float(s), 6),
+                    "metadata": {"source": "similarity_index", "criteria": criteria},
+                }
+                for n, s in zip(neighbour_rows, scores)
+                if n >= 0
+            ]
+
+        self.logger.debug(
+            "similarity_batch_query",
+            queries=len(rows),
+            k=k,
+            criteria=criteria,
+            ivf=use_ivf
+        )
+
+        return results
+
+    def _masked_view(self, block_mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Column mask and per-row norms restricted to the selected blocks."""
+        columns = np.zeros(self.encoder.dim, dtype=np.float32)
+        for selected, block_slice in zip(block_mask, self.encoder.blocks.values()):
+            if selected:
+                columns[block_slice] = 1.0
+        vectors = self._vectors[:self._size]
+        norms = np.sqrt(np.einsum("ij,ij->i", vectors * columns, vectors))
+        return columns, norms
+
+    def _search_exact(
+        self,
+        query_rows: np.ndarray,
+        k: int,
+        block_mask: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Brute-force masked cosine search, chunked to bound memory."""
+        columns, norms = self._masked_view(block_mask)
+        vectors = self._vectors[:self._size]
+        invalid = ~self._active[:self._size] | (norms == 0)
+        safe_norms = np.where(norms == 0, 1.0, norms)
+
+        k = min(k, self._size)
+        chunk = max(1, (1 << 24) // max(1, self._size))
+        all_rows = np.full((len(query_rows), k), -1, dtype=np.int64)
+        all_scores = np.zeros((len(query_rows), k), dtype=np.float32)
+
+        for start in range(0, len(query_rows), chunk):
+            batch = query_rows[start:start + chunk]
+            queries = vectors[batch] * columns
+            scores = (queries @ vectors.T) / (safe_norms[batch][:, None] * safe_norms[None, :])
+            scores[:, invalid] = -np.inf
+            scores[np.arange(len(batch)), batch] = -np.inf
+
+            all_rows[start:start + len(batch)], all_scores[start:start + len(batch)] = (
+                self._top_k(scores, k)
+            )
+
+        return all_rows, all_scores
+
+    def _search_ivf(self, query_rows: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Approximate search over the closest IVF partitions.
+
+        Work is grouped by partition rather than by query: every partition
+        is scored against all queries probing it in one matrix product and
+        merged into the running per-query top-k.
+        """
+        vectors = self._vectors[:self._size]
+        _, norms = self._masked_view(self.encoder.block_mask("all"))
+        searchable = self._active[:self._size] & (norms > 0)
+        safe_norms = np.where(norms == 0, 1.0, norms)
+
+        lists = self._inverted_lists()
+        n_probe = min(self.n_probe, len(lists))
+        queries = vectors[query_rows]
+        centroid_scores = queries @ self._centroids.T
+        probes = np.argpartition(-centroid_scores, n_probe - 1, axis=1)[:, :n_probe]
+
+        best_rows = np.full((len(query_rows), k), -1, dtype=np.int64)
+        best_scores = np.full((len(query_rows), k), -np.inf, dtype=np.float32)
+
+        for partition in range(len(lists)):
+            candidates = lists[partition]
+            candidates = candidates[searchable[candidates]]
+            if not len(candidates):
+                continue
+            probing = np.flatnonzero((probes == partition).any(axis=1))
+            if not len(probing):
+                continue
+
+            scores = (queries[probing] @ vectors[candidates].T) / (
+                safe_norms[query_rows[probing]][:, None] * safe_norms[candidates][None, :]
+            )
+            scores[query_rows[probing][:, None] == candidates[None, :]] = -np.inf
+
+            local = min(k, len(candidates))
+            top = np.argpartition(-scores, local - 1, axis=1)[:, :local]
+            merged_scores = np.concatenate(
+                [best_scores[probing], np.take_along_axis(scores, top, axis=1)], axis=1
+            )
+            merged_rows = np.concatenate([best_rows[probing], candidates[top]], axis=1)
+            keep = np.argpartition(-merged_scores, k - 1, axis=1)[:, :k]
+            best_scores[probing] = np.take_along_axis(merged_scores, keep, axis=1)
+            best_rows[probing] = np.take_along_axis(merged_rows, keep, axis=1)
+
+        order = np.argsort(-best_scores, axis=1, kind="stable")
+        best_rows = np.take_along_axis(best_rows, order, axis=1)
+        best_scores = np.take_along_axis(best_scores, order, axis=1)
+        finite = np.isfinite(best_scores)
+        return np.where(finite, best_rows, -1), np.where(finite, best_scores, 0.0)
+
+    @staticmethod
+    def _top_k(scores: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Row-wise top-k (descending), marking non-finite slots with -1."""
+        k = min(k, scores.shape[1])
+        part = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        part_scores = np.take_along_axis(scores, part, axis=1)
+        order = np.argsort(-part_scores, axis=1, kind="stable")
+        rows = np.take_along_axis(part, order, axis=1)
+        top_scores = np.take_along_axis(part_scores, order, axis=1)
+        rows = np.where(np.isfinite(top_scores), rows, -1)
+        return rows, np.where(np.isfinite(top_scores), top_scores, 0.0)
+
+    # IVF partitioning
+
+    def _ensure_ivf(self) -> None:
+        """Train (or retrain after 2x growth) the IVF coarse quantizer."""
+        if self._centroids is None or len(self) > 2 * self._trained_size:
+            self.build_ivf()
+
+    def build_ivf(self, n_lists: Optional[int] = None, iterations: int = 10, seed: int = 0) -> None:
+        """
+        Train IVF centroids with spherical k-means and assign all rows.
+
+        Args:
+            n_lists: Number of partitions (defaults to sqrt of active size)
+            iterations: k-means iterations
+            seed: Random seed for reproducible partitioning
+        """
+        active_rows = np.flatnonzero(self._active[:self._size])
+        if not len(active_rows):
+            return
+
+        n_lists = n_lists or int(min(4096, max(1, math.sqrt(len(active_rows)))))
+        rng = np.random.default_rng(seed)
+        sample_size = min(len(active_rows), 64 * n_lists)
+        sample = self._vectors[rng.choice(active_rows, sample_size, replace=False)]
+        centroids = sample[rng.choice(sample_size, n_lists, replace=False)].copy()
+
+        for _ in range(iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            for c in range(n_lists):
+                members = sample[labels == c]
+                if len(members):
+                    centroids[c] = members.sum(axis=0)
+            lengths = np.linalg.norm(centroids, axis=1, keepdims=True)
+            centroids /= np.where(lengths == 0, 1.0, lengths)
+
+        self._centroids = centroids.astype(np.float32)
+        vectors = self._vectors[:self._size]
+        assignments = np.empty(self._size, dtype=np.int32)
+        chunk = max(1, (1 << 24) // n_lists)
+        for start in range(0, self._size, chunk):
+            assignments[start:start + chunk] = np.argmax(
+                vectors[start:start + chunk] @ self._centroids.T, axis=1
+            )
+        self._assignments[:self._size] = assignments
+        self._lists = None
+        self._trained_size = len(active_rows)
+
+        self.logger.info("ivf_built", n_lists=n_lists, indexed=len(active_rows))
+
+    def _inverted_lists(self) -> List[np.ndarray]:
+        """Active rows grouped by IVF partition (rebuilt lazily after updates)."""
+        if self._lists is None:
+            rows = np.flatnonzero(self._active[:self._size])
+            labels = self._assignments[rows]
+            order = np.argsort(labels, kind="stable")
+            boundaries = np.searchsorted(labels[order], np.arange(len(self._centroids) + 1))
+            self._lists = [
+                rows[order[boundaries[c]:boundaries[c + 1]]]
+                for c in range(len(self._centroids))
+            ]
+        return self._lists
+
+    # Persistence
+
+    def save(self, path: Optional[str] = None) -> Path:
+        """
+        Persist the index to a directory.
+
+        Args:
+            path: Target directory (defaults to the configured path)
+
+        Returns:
+            Directory the index was written to
+        """
+        target = Path(path) if path else self.path
+        if target is None:
+            raise ValueError("No path configured for similarity index persistence")
+        target.mkdir(parents=True, exist_ok=True)
+
+        # A loaded index still maps vectors.npy, so every file is written
+        # to a temporary sibling and swapped in rather than truncated.
+        self._atomic_write(target / self._VECTORS_FILE, self._vectors[:self._size])
+        self._atomic_write(target / self._ASSIGNMENTS_FILE, self._assignments[:self._size])
+        if self._centroids is not None:
+            self._atomic_write(target / self._CENTROIDS_FILE, self._centroids)
+
+        meta = {
+            "hash_buckets": self.encoder.hash_buckets,
+            "embedding_dim": self.encoder.embedding_dim,
+            "ids": self._ids,
+            "names": self._names,
+            "active": self._active[:self._size].astype(int).tolist(),
+            "trained_size": self._trained_size,
+        }
+        self._atomic_write(target / self._META_FILE, meta)
+
+        self.logger.info("similarity_index_saved", path=str(target), size=len(self))
+        return target
+
+    @staticmethod
+    def _atomic_write(file_path: Path, content: Any) -> None:
+        """Write an array (``.npy``) or JSON metadata via a temp file and ``os.replace``."""
+        fd, tmp_name = tempfile.mkstemp(dir=file_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                if isinstance(content, np.ndarray):
+                    np.save(f, content)
+                else:
+                    f.write(json.dumps(content).encode("utf-8"))
+            os.replace(tmp_name, file_path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+    @classmethod
+    def load(
+        cls,
+        path: str,
+        ivf_min_size: int = 20000,
+        n_probe: int = 8
+    ) -> "AccountSimilarityIndex":
+        """
+        Load a persisted index, memory-mapping the vector matrix.
+
+        The vectors are mapped copy-on-write, so incremental upserts after
+        loading never modify the files until ``save`` is called.
+        """
+        directory = Path(path)
+        with open(directory / cls._META_FILE) as f:
+            meta = json.load(f)
+
+        index = cls(
+            path=str(directory),
+            hash_buckets=meta["hash_buckets"],
+            embedding_dim=meta["embedding_dim"],
+            ivf_min_size=ivf_min_size,
+            n_probe=n_probe
+        )
+        index._vectors = np.load(directory / cls._VECTORS_FILE, mmap_mode="c")
+        index._size = len(index._vectors)
+        index._active = np.asarray(meta["active"], dtype=bool)
+        index._ids = list(meta["ids"])
+        index._names = list(meta["names"])
+        index._row_of = {account_id: row for row, account_id in enumerate(index._ids)}
+        index._assignments = np.array(np.load(directory / cls._ASSIGNMENTS_FILE), dtype=np.int32)
+
+        centroids_file = directory / cls._CENTROIDS_FILE
+        if centroids_file.exists():
+            index._centroids = np.load(centroids_file)
+            index._trained_size = meta.get("trained_size", 0)
+
+        index.logger.info("similarity_index_loaded", path=str(directory), size=len(index))
+        return index
+
+    @classmethod
+    def load_or_create(cls, path: str, **kwargs: Any) -> "AccountSimilarityIndex":
+        """Load the index at ``path`` if present, otherwise create an empty one."""
+        if (Path(path) / cls._META_FILE).exists():
+            return cls.load(
+                path,
+                ivf_min_size=kwargs.get("ivf_min_size", 20000),
+                n_probe=kwargs.get("n_probe", 8)
+            )
+        return cls(path=path, **kwargs)
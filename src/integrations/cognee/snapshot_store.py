@@ -0,0 +1,345 @@
+"""
+Write-through key-value store for the last synced account snapshot.
+
+Exact-lookup paths (change detection in the Data Scout query, industry
+lookups for similarity searches) only need the last record synced for an
+account, yet used to re-derive it through a Cognee context query. This
+store keeps ``account_id -> (record, checksum)`` in process memory for
+dictionary-speed reads and writes every update through to a local SQLite
+file so the cache survives restarts.
+
+The store is populated by the Cognee sync pipeline and by webhook-driven
+memory syncs; Cognee remains the source of truth and the fallback when an
+account has not been seen yet.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+# Fields that define account identity for change detection (timestamps excluded)
+CHECKSUM_FIELDS: Tuple[str, ...] = (
+    "id",
+    "Account_Name",
+    "Industry",
+    "Annual_Revenue",
+    "Rating",
+    "Description",
+    "Account_Type",
+    "Owner",
+)
+
+
+def calculate_account_checksum(account: Dict[str, Any]) -> str:
+    """Calculate the MD5 change-detection checksum of an account record.
+
+    Args:
+        account: Account record
+
+    Returns:
+        Hexadecimal checksum string
+    """
+    data_str = ""
+    for field in CHECKSUM_FIELDS:
+        value = account.get(field, "")
+        # Handle nested objects (like Owner)
+        if isinstance(value, dict):
+            value = str(sorted(value.items()))
+        data_str += f"{field}:{value}|"
+
+    return hashlib.md5(data_str.encode()).hexdigest()
+
+
+@dataclass
+class AccountSnapshot:
+    """Last synced state of a single account."""
+
+    account_id: str
+    record: Dict[str, Any]
+    checksum: str
+    synced_at: str
+    source: str = "zoho_sync"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "account_id": self.account_id,
+            "record": self.record,
+            "checksum": self.checksum,
+            "synced_at": self.synced_at,
+            "source": self.source,
+        }
+
+
+class AccountSnapshotStore:
+    """In-memory snapshot map with write-through SQLite persistence.
+
+    Reads never touch disk: the full table is loaded once on construction
+    and served from a dictionary afterwards. Writes go to SQLite first and
+    then to the dictionary, so a crash never leaves the cache ahead of the
+    file. Without a ``path`` the store is purely in-memory.
+
+    Example:
+        >>> store = AccountSnapshotStore("data/account_snapshots.db")
+        >>> store.put("acc_1", {"id": "acc_1", "Industry": "Technology"})
+        >>> store.get_record("acc_1")["Industry"]
+        'Technology'
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """Initialize snapshot store.
+
+        Args:
+            path: SQLite file for persistence (None keeps snapshots in memory only)
+        """
+        self.path = Path(path) if path else None
+        self.logger = logger.bind(component="account_snapshot_store")
+
+        self._snapshots: Dict[str, AccountSnapshot] = {}
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        if self.path is not None:
+            self._open()
+
+    def _open(self) -> None:
+        """Open the SQLite file and load existing snapshots into memory."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.path),
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS account_snapshots (
+                account_id TEXT PRIMARY KEY,
+                record TEXT NOT NULL,
+                checksum TEXT NOT NULL,
+                synced_at TEXT NOT NULL,
+                source TEXT NOT NULL
+            )
+            """
+        )
+
+        rows = self._conn.execute(
+            "SELECT account_id, record, checksum, synced_at, source "
+            "FROM account_snapshots"
+        )
+        for account_id, record, checksum, synced_at, source in rows:
+            self._snapshots[account_id] = AccountSnapshot(
+                account_id=account_id,
+                record=json.loads(record),
+                checksum=checksum,
+                synced_at=synced_at,
+                source=source,
+            )
+
+        self.logger.info(
+            "snapshot_store_loaded",
+            path=str(self.path),
+            snapshots=len(self._snapshots),
+        )
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def __contains__(self, account_id: object) -> bool:
+        return account_id in self._snapshots
+
+    def get(self, account_id: str) -> Optional[AccountSnapshot]:
+        """Get the last synced snapshot for an account.
+
+        Args:
+            account_id: Account identifier
+
+        Returns:
+            Snapshot or None if the account has not been synced
+        """
+        return self._snapshots.get(account_id)
+
+    def get_record(self, account_id: str) -> Optional[Dict[str, Any]]:
+        """Get the last synced record for an account.
+
+        Args:
+            account_id: Account identifier
+
+        Returns:
+            Account record or None if the account has not been synced
+        """
+        snapshot = self._snapshots.get(account_id)
+        return snapshot.record if snapshot is not None else None
+
+    def get_checksum(self, account_id: str) -> Optional[str]:
+        """Get the checksum of the last synced record for an account.
+
+        Args:
+            account_id: Account identifier
+
+        Returns:
+            Checksum or None if the account has not been synced
+        """
+        snapshot = self._snapshots.get(account_id)
+        return snapshot.checksum if snapshot is not None else None
+
+    def get_many(self, account_ids: Iterable[str]) -> Dict[str, AccountSnapshot]:
+        """Get snapshots for several accounts, skipping unknown IDs.
+
+        Args:
+            account_ids: Account identifiers
+
+        Returns:
+            Mapping of account_id to snapshot
+        """
+        snapshots = self._snapshots
+        return {
+            account_id: snapshots[account_id]
+            for account_id in account_ids
+            if account_id in snapshots
+        }
+
+    def put(
+        self,
+        account_id: str,
+        record: Dict[str, Any],
+        checksum: Optional[str] = None,
+        source: str = "zoho_sync",
+    ) -> AccountSnapshot:
+        """Write an account snapshot through to disk and memory.
+
+        Args:
+            account_id: Account identifier
+            record: Full account record as synced
+            checksum: Precomputed checksum (computed from the record if omitted)
+            source: Origin of the update (zoho_sync, webhook, ...)
+
+        Returns:
+            Stored snapshot
+        """
+        snapshot = AccountSnapshot(
+            account_id=account_id,
+            record=record,
+            checksum=checksum or calculate_account_checksum(record),
+            synced_at=datetime.utcnow().isoformat(),
+            source=source,
+        )
+        self._write([snapshot])
+        return snapshot
+
+    def put_many(
+        self,
+        records: Iterable[Tuple[str, Dict[str, Any]]],
+        source: str = "zoho_sync",
+    ) -> int:
+        """Write several snapshots in a single transaction.
+
+        Args:
+            records: (account_id, record) pairs
+            source: Origin of the update
+
+        Returns:
+            Number of snapshots written
+        """
+        synced_at = datetime.utcnow().isoformat()
+        snapshots = [
+            AccountSnapshot(
+                account_id=account_id,
+                record=record,
+                checksum=calculate_account_checksum(record),
+                synced_at=synced_at,
+                source=source,
+            )
+            for account_id, record in records
+        ]
+        if snapshots:
+            self._write(snapshots)
+        return len(snapshots)
+
+    def delete(self, account_id: str) -> bool:
+        """Remove an account snapshot.
+
+        Args:
+            account_id: Account identifier
+
+        Returns:
+            True if a snapshot was removed
+        """
+        with self._lock:
+            if self._conn is not None:
+                self._conn.execute(
+                    "DELETE FROM account_snapshots WHERE account_id = ?",
+                    (account_id,),
+                )
+            removed = self._snapshots.pop(account_id, None) is not None
+
+        if removed:
+            self.logger.debug("snapshot_deleted", account_id=account_id)
+        return removed
+
+    def is_current(self, account_id: str, record: Dict[str, Any]) -> bool:
+        """Check whether a record matches the stored snapshot.
+
+        Args:
+            account_id: Account identifier
+            record: Candidate account record
+
+        Returns:
+            True if the stored checksum equals the record's checksum
+        """
+        stored = self.get_checksum(account_id)
+        return stored is not None and stored == calculate_account_checksum(record)
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _write(self, snapshots: List[AccountSnapshot]) -> None:
+        """Persist snapshots, then publish them to the in-memory map."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.execute("BEGIN")
+                try:
+                    self._conn.executemany(
+                        """
+                        INSERT INTO account_snapshots
+                            (account_id, record, checksum, synced_at, source)
+                        VALUES (?, ?, ?, ?, ?)
+                        ON CONFLICT(account_id) DO UPDATE SET
+                            record = excluded.record,
+                            checksum = excluded.checksum,
+                            synced_at = excluded.synced_at,
+                            source = excluded.source
+                        """,
+                        [
+                            (
+                                s.account_id,
+                                json.dumps(s.record, default=str),
+                                s.checksum,
+                                s.synced_at,
+                                s.source,
+                            )
+                            for s in snapshots
+                        ],
+                    )
+                    self._conn.execute("COMMIT")
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
+
+            for snapshot in snapshots:
+                self._snapshots[snapshot.account_id] = snapshot
@@ -0,0 +1,364 @@
+"""
+Append-only per-account event index for incremental timeline reads.
+
+``CogneeClient.get_account_timeline`` used to run a fresh semantic search
+for every call and return the whole window again. This index records each
+interaction and account sync as it is written, assigning it a
+monotonically increasing sequence number. The sequence number doubles as
+an opaque cursor: callers remember the cursor of the last event they saw
+and later read only the events appended after it.
+
+Events are held in per-account lists for in-process reads and optionally
+written through to a local SQLite file so cursors stay valid across
+restarts.
+"""
+
+import bisect
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class IndexedTimelineEvent:
+    """Single entry in an account timeline."""
+
+    cursor: int
+    account_id: str
+    interaction_id: Optional[str]
+    type: Optional[str]
+    timestamp: Optional[str]
+    summary: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the timeline entry shape returned by CogneeClient."""
+        return {
+            "interaction_id": self.interaction_id,
+            "type": self.type,
+            "timestamp": self.timestamp,
+            "summary": self.summary,
+            "cursor": self.cursor,
+        }
+
+
+@dataclass
+class TimelinePage:
+    """Page of timeline events read forward from a cursor."""
+
+    account_id: str
+    events: List[IndexedTimelineEvent] = field(default_factory=list)
+    next_cursor: int = 0
+    has_more: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "account_id": self.account_id,
+            "events": [event.to_dict() for event in self.events],
+            "next_cursor": self.next_cursor,
+            "has_more": self.has_more,
+        }
+
+
+class AccountEventIndex:
+    """Append-only event log partitioned by account.
+
+    Cursors are global sequence numbers, so a cursor taken from one
+    account's timeline is only meaningful for that account but never
+    collides with another. Appends with an interaction ID already present
+    for the account are ignored, which makes re-feeding events from sync
+    idempotent.
+
+    Example:
+        >>> index = AccountEventIndex()
+        >>> index.append("acc_1", "call", "2025-01-01T10:00:00", "Kickoff")
+        >>> page = index.read_since("acc_1", since=0)
+        >>> cursor = page.next_cursor
+        >>> index.read_since("acc_1", since=cursor).events
+        []
+    """
+
+    def __init__(self, path: Optional[str] = None, backfill_limit: int = 200) -> None:
+        """Initialize event index.
+
+        Args:
+            path: SQLite file for persistence (None keeps events in memory only)
+            backfill_limit: Events to seed from Cognee for an unindexed account
+        """
+        self.path = Path(path) if path else None
+        self.backfill_limit = backfill_limit
+        self.logger = logger.bind(component="account_event_index")
+
+        self._events: Dict[str, List[IndexedTimelineEvent]] = {}
+        self._seen: Dict[str, Set[str]] = {}
+        self._last_cursor = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        if self.path is not None:
+            self._open()
+
+    def _open(self) -> None:
+        """Open the SQLite file and replay the log into memory."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.path),
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS account_events (
+                cursor INTEGER PRIMARY KEY,
+                account_id TEXT NOT NULL,
+                interaction_id TEXT,
+                type TEXT,
+                timestamp TEXT,
+                summary TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS indexed_accounts (account_id TEXT PRIMARY KEY)"
+        )
+
+        for (account_id,) in self._conn.execute(
+            "SELECT account_id FROM indexed_accounts"
+        ):
+            self._events.setdefault(account_id, [])
+            self._seen.setdefault(account_id, set())
+
+        rows = self._conn.execute(
+            "SELECT cursor, account_id, interaction_id, type, timestamp, summary "
+            "FROM account_events ORDER BY cursor"
+        )
+        for row in rows:
+            self._publish(IndexedTimelineEvent(*row))
+
+        self.logger.info(
+            "event_index_loaded",
+            path=str(self.path),
+            accounts=len(self._events),
+            last_cursor=self._last_cursor,
+        )
+
+    def __contains__(self, account_id: object) -> bool:
+        return account_id in self._events
+
+    def __len__(self) -> int:
+        return sum(len(events) for events in self._events.values())
+
+    @property
+    def last_cursor(self) -> int:
+        """Cursor of the most recently appended event across all accounts."""
+        return self._last_cursor
+
+    def latest_cursor(self, account_id: str) -> int:
+        """Get the cursor of the newest event for an account.
+
+        Args:
+            account_id: Account identifier
+
+        Returns:
+            Cursor (0 if the account has no events)
+        """
+        events = self._events.get(account_id)
+        return events[-1].cursor if events else 0
+
+    def append(
+        self,
+        account_id: str,
+        event_type: Optional[str],
+        timestamp: Optional[str],
+        summary: str = "",
+        interaction_id: Optional[str] = None,
+    ) -> Optional[IndexedTimelineEvent]:
+        """Append an event to an account timeline.
+
+        Args:
+            account_id: Account identifier
+            event_type: Interaction type (email, call, account_sync, ...)
+            timestamp: ISO timestamp of the event
+            summary: Short event summary
+            interaction_id: Unique interaction ID used for de-duplication
+
+        Returns:
+            Appended event, or None if the interaction was already indexed
+        """
+        appended = self.extend(
+            account_id, [(interaction_id, event_type, timestamp, summary)]
+        )
+        return appended[0] if appended else None
+
+    def extend(
+        self,
+        account_id: str,
+        entries: Iterable[Tuple[Optional[str], Optional[str], Optional[str], str]],
+    ) -> List[IndexedTimelineEvent]:
+        """Append several events to an account timeline in one transaction.
+
+        Marks the account as indexed even when no entries are given, so an
+        account with an empty history is not backfilled again.
+
+        Args:
+            account_id: Account identifier
+            entries: (interaction_id, type, timestamp, summary) tuples in order
+
+        Returns:
+            Events actually appended (duplicates are skipped)
+        """
+        with self._lock:
+            seen = set(self._seen.get(account_id, ()))
+            new_events: List[IndexedTimelineEvent] = []
+            cursor = self._last_cursor
+
+            for interaction_id, event_type, timestamp, summary in entries:
+                if interaction_id is not None:
+                    if interaction_id in seen:
+                        continue
+                    seen.add(interaction_id)
+                cursor += 1
+                new_events.append(
+                    IndexedTimelineEvent(
+                        cursor=cursor,
+                        account_id=account_id,
+                        interaction_id=interaction_id,
+                        type=event_type,
+                        timestamp=timestamp,
+                        summary=summary,
+                    )
+                )
+
+            if self._conn is not None:
+                self._persist(account_id, new_events)
+
+            self._events.setdefault(account_id, [])
+            self._seen[account_id] = seen
+            for event in new_events:
+                self._publish(event)
+
+        return new_events
+
+    def read_since(
+        self,
+        account_id: str,
+        since: int = 0,
+        limit: int = 50,
+    ) -> TimelinePage:
+        """Read events appended after a cursor, oldest first.
+
+        Args:
+            account_id: Account identifier
+            since: Cursor of the last event already seen (0 reads from the start)
+            limit: Maximum events in the page
+
+        Returns:
+            Page with the events and the cursor to resume from
+        """
+        events = self._events.get(account_id, [])
+        start = bisect.bisect_right(events, since, key=lambda e: e.cursor)
+        page = events[start:start + limit]
+
+        return TimelinePage(
+            account_id=account_id,
+            events=page,
+            next_cursor=page[-1].cursor if page else since,
+            has_more=start + len(page) < len(events),
+        )
+
+    def read_latest(
+        self,
+        account_id: str,
+        limit: int = 50,
+    ) -> List[IndexedTimelineEvent]:
+        """Read the most recent events, newest first.
+
+        Incremental readers should use ``read_since`` instead, which pages
+        forward from a cursor without skipping events.
+
+        Args:
+            account_id: Account identifier
+            limit: Maximum events to return
+
+        Returns:
+            Events in reverse append order
+        """
+        events = self._events.get(account_id, [])
+        return events[max(0, len(events) - limit):][::-1]
+
+    def iter_pages(
+        self,
+        account_id: str,
+        since: int = 0,
+        page_size: int = 50,
+    ) -> Iterator[TimelinePage]:
+        """Iterate forward over an account timeline page by page.
+
+        Args:
+            account_id: Account identifier
+            since: Cursor to start after
+            page_size: Events per page
+
+        Yields:
+            Pages until the end of the log is reached
+        """
+        while True:
+            page = self.read_since(account_id, since=since, limit=page_size)
+            if page.events:
+                yield page
+            if not page.has_more:
+                return
+            since = page.next_cursor
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _persist(self, account_id: str, events: List[IndexedTimelineEvent]) -> None:
+        """Write appended events (and the indexed marker) to SQLite."""
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO indexed_accounts (account_id) VALUES (?)",
+                (account_id,),
+            )
+            self._conn.executemany(
+                """
+                INSERT INTO account_events
+                    (cursor, account_id, interaction_id, type, timestamp, summary)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        e.cursor,
+                        e.account_id,
+                        e.interaction_id,
+                        e.type,
+                        e.timestamp,
+                        e.summary,
+                    )
+                    for e in events
+                ],
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def _publish(self, event: IndexedTimelineEvent) -> None:
+        """Add a persisted event to the in-memory log."""
+        self._events.setdefault(event.account_id, []).append(event)
+        if event.interaction_id is not None:
+            self._seen.setdefault(event.account_id, set()).add(event.interaction_id)
+        self._last_cursor = max(self._last_cursor, event.cursor)
@@ -18,6 +18,8 @@ load_dotenv()
 # This allows .env to be managed by Claude Code while app uses GLM-4.6
 load_dotenv('.env.local', override=True)
 
+from src.agents.agent_pool import close_agent_pool, get_agent_pool
+from src.api.llm_client import close_llm_client, get_llm_client
 from src.api.routers.copilotkit_router_enhanced import router as copilotkit_router
 from src.api.routers.approval_router import router as approval_router
 from src.copilotkit import setup_copilotkit_with_agents
@@ -222,6 +224,13 @@ async def startup_event():
     """Application startup tasks with agent validation."""
     logger.info("sergas_agents_startup", version="1.0.0")
 
+    # Shared pooled LLM client for the routers (after .env is loaded)
+    llm_client = get_llm_client()
+    logger.info("llm_client_ready", model=llm_client.model)
+
+    # Build the shared agent instances before the first request
+    get_agent_pool().warm()
+
     # Log CopilotKit integration status
     if copilotkit_integration:
         logger.info(
@@ -250,6 +259,8 @@ async def startup_event():
 async def shutdown_event():
     """Application shutdown tasks."""
     logger.info("sergas_agents_shutdown")
+    await close_llm_client()
+    await close_agent_pool()
 
 
 if __name__ == "__main__":
@@ -15,6 +15,7 @@ from enum import Enum
 import structlog
 from pydantic import BaseModel, Field
 
+from src.agents.recommendation_author import RecommendationAuthor
 from src.orchestrator.config import OrchestratorConfig
 from src.services.memory_service import MemoryService
 from src.integrations.zoho.integration_manager import ZohoIntegrationManager
@@ -81,6 +82,7 @@ class WorkflowEngine:
         config: OrchestratorConfig,
         memory_service: MemoryService,
         zoho_manager: ZohoIntegrationManager,
+        recommendation_author: Optional[RecommendationAuthor] = None,
     ) -> None:
         """Initialize workflow engine.
 
@@ -88,10 +90,13 @@ class WorkflowEngine:
             config: Orchestrator configuration
             memory_service: Memory coordination service
             zoho_manager: Zoho integration manager
+            recommendation_author: Author for owner brief recommendations
+                (a new RecommendationAuthor if omitted)
         """
         self.config = config
         self.memory_service = memory_service
         self.zoho_manager = zoho_manager
+        self.recommendation_author = recommendation_author or RecommendationAuthor()
 
         # Priority queue for high-risk accounts
         self.priority_queue: List[Dict[str, Any]] = []
@@ -140,6 +145,8 @@ class WorkflowEngine:
             )
             await asyncio.sleep(1)  # Grace period
 
+        await self.recommendation_author.cleanup()
+
         self.logger.info("workflow_engine_shutdown")
 
     async def execute_owner_reviews(
@@ -238,11 +245,11 @@ class WorkflowEngine:
 
         Workflow steps:
         1. Prioritize accounts by risk
-        2. Spawn parallel subagents:
+        2. Spawn parallel subagents per account:
            - Data Scout: Fetch account updates
            - Memory Analyst: Retrieve historical context
-           - Recommendation Author: Generate suggestions
-        3. Aggregate results
+        3. Recommendation Author: Generate suggestions for all accounts
+           in one batch
         4. Compile owner brief
 
         Args:
@@ -270,28 +277,26 @@ class WorkflowEngine:
 
             # Step 2: Execute parallel subagent queries
             updates = []
-            recommendations = []
+            author_contexts = []
 
             for account_id in prioritized_accounts:
                 try:
                     # Query subagents in parallel
                     scout_task = self._query_data_scout(account_id)
                     analyst_task = self._query_memory_analyst(account_id)
-                    author_task = self._query_recommendation_author(account_id)
 
-                    scout_result, analyst_result, author_result = await asyncio.gather(
+                    scout_result, analyst_result = await asyncio.gather(
                         scout_task,
                         analyst_task,
-                        author_task,
                         return_exceptions=True,
                     )
 
                     # Aggregate results
                     if not isinstance(scout_result, Exception):
                         updates.append(scout_result)
-
-                    if not isinstance(author_result, Exception):
-                        recommendations.extend(author_result.get("recommendations", []))
+                        author_contexts.append(
+                            self._build_author_context(scout_result, analyst_result)
+                        )
 
                 except Exception as e:
                     self.logger.warning(
@@ -301,6 +306,9 @@ class WorkflowEngine:
                     )
                     continue
 
+            # Generate recommendations for all accounts in one batch
+            recommendations = await self._query_recommendation_author(author_contexts)
+
             # Step 3: Compile brief
             brief = await self._compile_owner_brief(
                 owner=owner,
@@ -394,14 +402,13 @@ class WorkflowEngine:
         # Fetch current data from Zoho
         current_data = await self.zoho_manager.get_account(account_id)
 
-        # Get last known state from memory
-        context = await self.memory_service.cognee.get_account_context(account_id)
-        last_snapshot = context.get("current_snapshot", {})
+        # Get last known state from memory (local snapshot, Cognee fallback)
+        previous = await self.memory_service.get_last_known_state(account_id)
 
         # Detect changes
         changes = self._detect_changes(
             current=current_data,
-            previous=last_snapshot.get("data", {}),
+            previous=previous,
         )
 
         return {
@@ -439,25 +446,72 @@ class WorkflowEngine:
 
     async def _query_recommendation_author(
         self,
-        account_id: str,
+        contexts: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Query Recommendation Author subagent for a batch of accounts.
+
+        Args:
+            contexts: Author contexts (account_data, historical_insights)
+
+        Returns:
+            Generated recommendations for every account
+        """
+        recommendations = []
+
+        async for result in self.recommendation_author.generate_batch(
+            contexts,
+            max_workers=self.config.max_concurrent_subagents,
+        ):
+            if result["error"] is not None:
+                self.logger.warning(
+                    "account_recommendations_failed",
+                    account_id=result["account_id"],
+                    error=result["error"],
+                )
+                continue
+            recommendations.extend(result["recommendations"])
+
+        return recommendations
+
+    @staticmethod
+    def _build_author_context(
+        scout_result: Dict[str, Any],
+        analyst_result: Any,
     ) -> Dict[str, Any]:
-        """Query Recommendation Author subagent.
+        """Build a Recommendation Author context from subagent results.
 
         Args:
-            account_id: Account identifier
+            scout_result: Data Scout result for the account
+            analyst_result: Memory Analyst result, or the exception it raised
 
         Returns:
-            Generated recommendations
+            Context with account_data and historical_insights
         """
-        # Get account brief with recommendations
-        brief = await self.memory_service.get_account_brief(
-            account_id=account_id,
-            include_recommendations=True,
-        )
+        current_data = scout_result.get("current_data", {})
+        account_data = {
+            "account_id": scout_result["account_id"],
+            "account_name": scout_result.get("account_name", ""),
+            "annual_revenue": current_data.get("Annual_Revenue") or 0,
+            "last_activity_date": current_data.get("Last_Activity_Time"),
+        }
+
+        historical_insights = []
+        if not isinstance(analyst_result, Exception):
+            health_score = analyst_result.get("health_analysis", {}).get("health_score")
+            if health_score is not None:
+                account_data["health_score"] = health_score
+
+            for pattern in analyst_result.get("context", {}).get("patterns", []):
+                historical_insights.append({
+                    "pattern_type": pattern.get("pattern_type"),
+                    "insight": pattern.get("description"),
+                    "confidence_score": int(pattern.get("confidence", 0) * 100),
+                    "occurrence_count": 1,
+                })
 
         return {
-            "account_id": account_id,
-            "recommendations": brief.get("recommendations", []),
+            "account_data": account_data,
+            "historical_insights": historical_insights,
         }
 
     def _detect_changes(
@@ -11,6 +11,8 @@ from datetime import datetime
 import structlog
 
 from src.integrations.cognee.cognee_client import CogneeClient
+from src.integrations.cognee.similarity_index import AccountSimilarityIndex
+from src.integrations.cognee.snapshot_store import AccountSnapshotStore
 from src.integrations.zoho.integration_manager import ZohoIntegrationManager
 
 logger = structlog.get_logger(__name__)
@@ -42,16 +44,22 @@ class MemoryService:
     def __init__(
         self,
         cognee_client: CogneeClient,
-        zoho_manager: ZohoIntegrationManager
+        zoho_manager: ZohoIntegrationManager,
+        similarity_index: Optional[AccountSimilarityIndex] = None,
+        snapshot_store: Optional[AccountSnapshotStore] = None
     ):
         """Initialize memory service.
 
         Args:
             cognee_client: Cognee knowledge graph client
             zoho_manager: Zoho integration manager for live data
+            similarity_index: Optional local ANN index for lookalike queries
+            snapshot_store: Optional write-through store of last synced records
         """
         self.cognee = cognee_client
         self.zoho = zoho_manager
+        self.similarity_index = similarity_index
+        self.snapshot_store = snapshot_store
         self.logger = logger.bind(component="memory_service")
 
         self._sync_stats = {
@@ -177,6 +185,12 @@ class MemoryService:
                 }
             )
 
+            if self.similarity_index is not None:
+                self.similarity_index.upsert(account_id, account_data)
+
+            if self.snapshot_store is not None:
+                self.snapshot_store.put(account_id, account_data)
+
             # Update sync stats
             self._sync_stats["total_syncs"] += 1
             self._sync_stats["successful_syncs"] += 1
@@ -251,6 +265,38 @@ class MemoryService:
             self.logger.error("agent_action_recording_failed", error=str(e))
             raise
 
+    async def get_last_known_state(self, account_id: str) -> Dict[str, Any]:
+        """Get the last synced account record.
+
+        Served from the snapshot store when the account has been synced
+        locally; otherwise derived from the Cognee account context.
+
+        Args:
+            account_id: Account identifier
+
+        Returns:
+            Last synced account record (empty if the account is unknown)
+        """
+        if self.snapshot_store is not None:
+            record = self.snapshot_store.get_record(account_id)
+            if record is not None:
+                return record
+
+        context = await self.cognee.get_account_context(account_id)
+        return context.get("current_snapshot", {}).get("data", {})
+
+    async def forget_account(self, account_id: str) -> None:
+        """Drop locally cached state for a deleted account.
+
+        Args:
+            account_id: Account identifier
+        """
+        if self.snapshot_store is not None:
+            self.snapshot_store.delete(account_id)
+
+        if self.similarity_index is not None:
+            self.similarity_index.remove(account_id)
+
     async def find_similar_accounts(
         self,
         account_id: str,
@@ -278,14 +324,14 @@ class MemoryService:
             criteria=criteria
         )
 
-        try:
-            # Get source account context
-            source_context = await self.cognee.get_account_context(account_id)
-            source_data = source_context.get("current_snapshot", {})
+        if self.similarity_index is not None and account_id in self.similarity_index:
+            return self.similarity_index.query(account_id, k=10, criteria=criteria)
 
+        try:
             # Build search query based on criteria
             if criteria == "industry":
-                industry = source_data.get("data", {}).get("Industry")
+                source_data = await self.get_last_known_state(account_id)
+                industry = source_data.get("Industry")
                 if industry:
                     similar = await self.cognee.search_accounts(
                         f"Industry:{industry}",
@@ -324,6 +370,46 @@ class MemoryService:
             self.logger.error("similar_accounts_search_failed", error=str(e))
             return []
 
+    async def find_similar_accounts_batch(
+        self,
+        account_ids: List[str],
+        criteria: str = "all",
+        limit: int = 10
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Find similar accounts for a whole portfolio in one pass.
+
+        Uses the local similarity index for every indexed account and falls
+        back to per-account knowledge graph lookups for the rest.
+
+        Args:
+            account_ids: Source accounts
+            criteria: Similarity criteria
+            limit: Results per account
+
+        Returns:
+            Mapping of account ID to similar accounts
+        """
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        if self.similarity_index is not None:
+            results = self.similarity_index.query_batch(
+                account_ids, k=limit, criteria=criteria
+            )
+        indexed = len(results)
+
+        for account_id in account_ids:
+            if account_id not in results:
+                similar = await self.find_similar_accounts(account_id, criteria)
+                results[account_id] = similar[:limit]
+
+        self.logger.info(
+            "similar_accounts_batch_found",
+            count=len(account_ids),
+            indexed=indexed,
+            criteria=criteria
+        )
+
+        return results
+
     async def get_memory_stats(self) -> Dict[str, Any]:
         """Get memory system statistics.
 
@@ -7,14 +7,20 @@ Components:
 - WebhookHandler: FastAPI endpoints for receiving Zoho webhooks
 - WebhookProcessor: Event-driven Cognee updates with retry logic
 - WebhookConfig: Webhook registration and configuration management
+- WebhookStreamQueue: Durable account-partitioned Redis Streams queue
+- DeadLetterReplayer: Deduplicated, rate-limited dead letter replay
 """
 
 from src.sync.webhook_handler import WebhookHandler
 from src.sync.webhook_processor import WebhookProcessor
 from src.sync.webhook_config import WebhookConfig
+from src.sync.webhook_stream import WebhookStreamQueue
+from src.sync.dead_letter_replay import DeadLetterReplayer
 
 __all__ = [
     "WebhookHandler",
     "WebhookProcessor",
     "WebhookConfig",
+    "WebhookStreamQueue",
+    "DeadLetterReplayer",
 ]
@@ -15,7 +15,6 @@ to Cognee knowledge graph with the following features:
 """
 
 import asyncio
-import hashlib
 import uuid
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Tuple
@@ -27,6 +26,11 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from src.integrations.zoho.sdk_client import ZohoSDKClient
 from src.integrations.cognee.cognee_client import CogneeClient
+from src.integrations.cognee.similarity_index import AccountSimilarityIndex
+from src.integrations.cognee.snapshot_store import (
+    AccountSnapshotStore,
+    calculate_account_checksum,
+)
 from src.models.sync.sync_models import (
     Base,
     SyncStateModel,
@@ -80,6 +84,8 @@ class CogneeSyncPipeline:
         retry_delay: float = 1.0,
         max_concurrent_batches: int = 5,
         enable_checksum_validation: bool = True,
+        similarity_index: Optional[AccountSimilarityIndex] = None,
+        snapshot_store: Optional[AccountSnapshotStore] = None,
     ) -> None:
         """
         Initialize Cognee sync pipeline.
@@ -93,6 +99,10 @@ class CogneeSyncPipeline:
             retry_delay: Initial delay between retries in seconds
             max_concurrent_batches: Maximum concurrent batch processing
             enable_checksum_validation: Enable checksum-based change detection
+            similarity_index: Optional local ANN index updated as accounts sync
+                (defaults to the Cognee client's)
+            snapshot_store: Optional write-through store of last synced records
+                (defaults to the Cognee client's)
         """
         self.zoho_client = zoho_client
         self.cognee_client = cognee_client
@@ -102,6 +112,12 @@ class CogneeSyncPipeline:
         self.retry_delay = retry_delay
         self.max_concurrent_batches = max_concurrent_batches
         self.enable_checksum_validation = enable_checksum_validation
+        if similarity_index is None:
+            similarity_index = getattr(cognee_client, "similarity_index", None)
+        if snapshot_store is None:
+            snapshot_store = getattr(cognee_client, "snapshot_store", None)
+        self.similarity_index = similarity_index
+        self.snapshot_store = snapshot_store
 
         self.logger = logger.bind(component="cognee_sync_pipeline")
 
@@ -271,6 +287,9 @@ class CogneeSyncPipeline:
                 session.failed_records = summary.failed_records
                 db.commit()
 
+            if self.similarity_index is not None and self.similarity_index.path:
+                self.similarity_index.save()
+
             self.logger.info(
                 "sync_completed",
                 session_id=session_id,
@@ -610,6 +629,12 @@ class CogneeSyncPipeline:
                     # Sync to Cognee
                     await self._sync_account_to_cognee(account)
 
+                    if self.similarity_index is not None:
+                        self.similarity_index.upsert(str(account.get("id")), account)
+
+                    if self.snapshot_store is not None:
+                        self.snapshot_store.put(str(account.get("id")), account)
+
                     # Update sync state
                     await self._update_sync_state(account)
 
@@ -721,27 +746,7 @@ class CogneeSyncPipeline:
         Returns:
             Hexadecimal checksum string
         """
-        # Use relevant fields for checksum (exclude timestamps)
-        relevant_fields = [
-            "id",
-            "Account_Name",
-            "Industry",
-            "Annual_Revenue",
-            "Rating",
-            "Description",
-            "Account_Type",
-            "Owner",
-        ]
-
-        data_str = ""
-        for field in relevant_fields:
-            value = account.get(field, "")
-            # Handle nested objects (like Owner)
-            if isinstance(value, dict):
-                value = str(sorted(value.items()))
-            data_str += f"{field}:{value}|"
-
-        return hashlib.md5(data_str.encode()).hexdigest()
+        return calculate_account_checksum(account)
 
     async def _sync_account_to_cognee(self, account: Dict[str, Any]) -> str:
         """
@@ -0,0 +1,319 @@
+"""Bulk, rate-limited replay of the webhook dead letter queue.
+
+After a Cognee outage the dead letter queue can hold tens of thousands of
+events, most of them redundant: many edits to the same record, and many
+records belonging to the same account. The replayer:
+
+- Claims the whole queue under a working key, so events that fail again
+  during replay land in a fresh dead letter queue instead of looping
+- Deduplicates to the latest event per record, then groups sync-only
+  events into one coalesced account sync per account
+- Replays the plan in chunks through the processor's normal sync and
+  event paths, starting items at a steady rate (Cognee operations per
+  second) rather than in per-chunk bursts
+- Checkpoints progress in Redis after every chunk; an interrupted replay
+  resumes from the last checkpoint on the next run
+"""
+
+import asyncio
+import json
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+import structlog
+from redis.exceptions import ResponseError
+
+from src.sync.webhook_processor import PendingSync, WebhookProcessor
+
+logger = structlog.get_logger(__name__)
+
+
+DEAD_LETTER_KEY = "webhook:dead_letter"
+REPLAY_QUEUE_KEY = "webhook:dead_letter:replaying"
+REPLAY_PROGRESS_KEY = "webhook:dead_letter:replay_progress"
+
+# Replay plan item: one coalesced account sync, or one event processed as-is
+ReplayItem = Union[PendingSync, Dict[str, Any]]
+
+ProgressCallback = Callable[[Dict[str, Any]], Optional[Awaitable[None]]]
+
+
+class DeadLetterReplayer:
+    """Replays dead-lettered webhook events in deduplicated, paced batches.
+
+    Example:
+        >>> replayer = DeadLetterReplayer(processor, rate_limit=20)
+        >>> progress = await replayer.run()
+        >>> progress["events_superseded"], progress["failed"]
+    """
+
+    def __init__(
+        self,
+        processor: WebhookProcessor,
+        chunk_size: int = 50,
+        rate_limit: float = 10.0,
+        scan_page_size: int = 1000
+    ):
+        """Initialize replayer.
+
+        Args:
+            processor: Processor whose sync and event paths replay events
+            chunk_size: Plan items in flight at once (progress is
+                checkpointed per chunk)
+            rate_limit: Maximum plan items (account syncs or events)
+                replayed per second
+            scan_page_size: Entries read per LRANGE while planning
+        """
+        self.processor = processor
+        self.redis = processor.redis
+        self.chunk_size = chunk_size
+        self.rate_limit = rate_limit
+        self.scan_page_size = scan_page_size
+        self.logger = logger.bind(component="dead_letter_replayer")
+
+    async def run(
+        self,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
+        """Replay the dead letter queue, resuming an interrupted replay.
+
+        Args:
+            progress_callback: Called (or awaited) with the progress dict
+                after every chunk
+
+        Returns:
+            Final progress dict
+        """
+        claimed = await self._claim()
+        if not claimed:
+            self.logger.info("dead_letter_replay_nothing_to_do")
+            return {"status": "empty"}
+
+        entries, malformed = await self._load_entries()
+        plan, stats = self._build_plan(entries)
+
+        progress = await self.get_progress()
+        if progress is None or progress.get("planned") != len(plan):
+            progress = {
+                "status": "running",
+                "dead_letters": len(entries) + malformed,
+                "malformed": malformed,
+                "planned": len(plan),
+                "completed": 0,
+                "succeeded": 0,
+                "failed": 0,
+                "started_at": datetime.utcnow().isoformat(),
+                **stats
+            }
+        else:
+            self.logger.info("dead_letter_replay_resuming", completed=progress["completed"])
+
+        self.logger.info(
+            "dead_letter_replay_started",
+            dead_letters=progress["dead_letters"],
+            planned=len(plan),
+            resume_from=progress["completed"]
+        )
+
+        interval = 1.0 / self.rate_limit if self.rate_limit > 0 else 0.0
+        next_start = time.monotonic()
+
+        for start in range(progress["completed"], len(plan), self.chunk_size):
+            chunk = plan[start:start + self.chunk_size]
+
+            # Start items one interval apart, carrying the schedule across
+            # chunks so Cognee never sees a burst
+            tasks = []
+            for item in chunk:
+                delay = next_start - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                next_start = max(next_start, time.monotonic()) + interval
+                tasks.append(asyncio.create_task(self._replay_item(item)))
+
+            results = await asyncio.gather(*tasks)
+
+            progress["completed"] = start + len(chunk)
+            progress["succeeded"] += sum(1 for ok in results if ok)
+            progress["failed"] += sum(1 for ok in results if not ok)
+            await self._checkpoint(progress, progress_callback)
+
+        progress["status"] = "completed"
+        progress["finished_at"] = datetime.utcnow().isoformat()
+        await self._finish()
+        await self._notify(progress, progress_callback)
+
+        self.logger.info(
+            "dead_letter_replay_completed",
+            planned=progress["planned"],
+            succeeded=progress["succeeded"],
+            failed=progress["failed"]
+        )
+        return progress
+
+    async def get_progress(self) -> Optional[Dict[str, Any]]:
+        """Get the checkpoint of the replay in progress.
+
+        Returns:
+            Progress dict, or None when no replay is in progress
+        """
+        raw = await self.redis.get(REPLAY_PROGRESS_KEY)
+        return json.loads(raw) if raw else None
+
+    async def _claim(self) -> bool:
+        """Move the dead letter queue to the replay working key.
+
+        Returns:
+            True if there is a (new or interrupted) replay to run
+        """
+        if await self.redis.exists(REPLAY_QUEUE_KEY):
+            return True
+
+        try:
+            claimed = await self.redis.renamenx(DEAD_LETTER_KEY, REPLAY_QUEUE_KEY)
+        except ResponseError:
+            # RENAMENX errors when the source key does not exist
+            return False
+
+        if claimed:
+            # Don't let the dead letter TTL expire a long replay
+            await self.redis.persist(REPLAY_QUEUE_KEY)
+            await self.redis.delete(REPLAY_PROGRESS_KEY)
+        return bool(claimed)
+
+    async def _load_entries(self) -> Tuple[List[Dict[str, Any]], int]:
+        """Read every claimed dead letter entry, newest first.
+
+        Returns:
+            (parsed entries, number of malformed entries)
+        """
+        entries = []
+        malformed = 0
+        start = 0
+
+        while True:
+            page = await self.redis.lrange(
+                REPLAY_QUEUE_KEY, start, start + self.scan_page_size - 1
+            )
+            if not page:
+                break
+
+            for raw in page:
+                try:
+                    entry = json.loads(raw)
+                    entries.append(entry["event"])
+                except (TypeError, ValueError, KeyError) as e:
+                    self.logger.warning("malformed_dead_letter_skipped", error=str(e))
+                    malformed += 1
+
+            start += len(page)
+
+        return entries, malformed
+
+    def _build_plan(
+        self,
+        events: List[Dict[str, Any]]
+    ) -> Tuple[List[ReplayItem], Dict[str, int]]:
+        """Deduplicate and coalesce dead-lettered events into a replay plan.
+
+        The plan only depends on the claimed entries, so an interrupted
+        replay rebuilds the same plan and resumes at its checkpoint.
+
+        Args:
+            events: Dead-lettered events, newest first
+
+        Returns:
+            (plan items oldest first, planning stats)
+        """
+        latest: Dict[Tuple[Any, Any], Dict[str, Any]] = {}
+        for event in events:
+            record_id = event.get("record_id")
+            key = (event.get("module"), record_id) if record_id else (None, event.get("event_id"))
+            latest.setdefault(key, event)
+        unique = list(reversed(list(latest.values())))
+
+        deleted_accounts = {
+            event.get("record_id")
+            for event in unique
+            if event.get("event_type") == "delete" and event.get("module") == "Accounts"
+        }
+
+        syncs: Dict[str, PendingSync] = {}
+        plan: List[ReplayItem] = []
+        superseded = 0
+
+        for event in unique:
+            target = self.processor.resolve_account_sync(event)
+            if target is None:
+                plan.append(event)
+                continue
+
+            account_id, force = target
+            if account_id in deleted_accounts:
+                superseded += 1
+                continue
+
+            pending = syncs.get(account_id)
+            if pending is None:
+                pending = PendingSync(account_id=account_id, first_seen=0.0)
+                syncs[account_id] = pending
+                plan.append(pending)
+
+            pending.add(event, force)
+
+        stats = {
+            "events_deduplicated": len(events) - len(unique),
+            "events_superseded": superseded,
+            "account_syncs": len(syncs),
+        }
+        return plan, stats
+
+    async def _replay_item(self, item: ReplayItem) -> bool:
+        """Replay one plan item.
+
+        Failures are dead-lettered again by the processor.
+
+        Args:
+            item: Coalesced account sync or single event
+
+        Returns:
+            True if the replay succeeded
+        """
+        try:
+            return await self.processor.replay(item)
+        except Exception as e:
+            self.logger.error("dead_letter_replay_item_failed", error=str(e))
+            return False
+
+    async def _checkpoint(
+        self,
+        progress: Dict[str, Any],
+        progress_callback: Optional[ProgressCallback]
+    ) -> None:
+        """Persist progress and report it."""
+        progress["updated_at"] = datetime.utcnow().isoformat()
+        await self.redis.set(REPLAY_PROGRESS_KEY, json.dumps(progress))
+        await self._notify(progress, progress_callback)
+
+        self.logger.info(
+            "dead_letter_replay_progress",
+            completed=progress["completed"],
+            planned=progress["planned"],
+            failed=progress["failed"]
+        )
+
+    async def _notify(
+        self,
+        progress: Dict[str, Any],
+        progress_callback: Optional[ProgressCallback]
+    ) -> None:
+        if progress_callback is None:
+            return
+        result = progress_callback(dict(progress))
+        if asyncio.iscoroutine(result):
+            await result
+
+    async def _finish(self) -> None:
+        """Drop the replayed entries and the checkpoint."""
+        await self.redis.delete(REPLAY_QUEUE_KEY, REPLAY_PROGRESS_KEY)
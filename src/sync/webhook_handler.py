@@ -4,14 +4,16 @@ Handles incoming webhook events from Zoho CRM with:
 - Webhook signature verification
 - Event parsing and routing
 - Deduplication logic
-- Async processing with Redis queue
+- Async processing with Redis queue, split into priority lanes
+- Optional fast-path ingest that enqueues the raw body and defers parsing
+  and validation to the worker
 """
 
 import hashlib
 import hmac
 import json
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Awaitable, Callable, Dict, Any, Optional, List, Tuple
 from uuid import uuid4
 
 import structlog
@@ -20,9 +22,32 @@ from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field, validator
 from redis.asyncio import Redis
 
+from src.sync.webhook_lanes import LANE_QUEUE_KEYS, LANES, classify_lane
+from src.sync.webhook_stream import WebhookStreamQueue
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
 logger = structlog.get_logger(__name__)
 
 
+# Capacity check, push and notification in one atomic round-trip.
+# Returns the new queue length, or -1 when the queue is full.
+ENQUEUE_SCRIPT = """
+local size = redis.call('LLEN', KEYS[1])
+if size >= tonumber(ARGV[2]) then
+    return -1
+end
+redis.call('LPUSH', KEYS[1], ARGV[1])
+redis.call('PUBLISH', KEYS[2], ARGV[1])
+return size + 1
+"""
+
+
 class WebhookEvent(BaseModel):
     """Zoho webhook event model."""
 
@@ -61,13 +86,102 @@ class WebhookResponse(BaseModel):
     queued: bool = Field(..., description="Whether event was queued for processing")
 
 
+def normalize_webhook_payload(
+    payload: Dict[str, Any],
+    event_id: Optional[str]
+) -> Dict[str, Any]:
+    """Extract event fields from a Zoho webhook payload.
+
+    Handles both the Zoho CRM v2/v3 ``data`` envelope and the generic
+    flat format.
+
+    Args:
+        payload: Webhook JSON payload
+        event_id: Event ID from header (fallback to generated)
+
+    Returns:
+        Event fields (without timestamp)
+    """
+    if 'data' in payload:
+        # Zoho CRM v2/v3 format
+        data = payload['data']
+        if isinstance(data, list) and len(data) > 0:
+            data = data[0]
+
+        return {
+            "event_id": event_id or str(uuid4()),
+            "event_type": payload.get('operation', 'update').lower(),
+            "module": payload.get('module', 'Accounts'),
+            "record_id": data.get('id', ''),
+            "record_data": data,
+            "modified_fields": payload.get('modified_fields', []),
+            "user_id": payload.get('user', {}).get('id')
+        }
+
+    # Generic format
+    return {
+        "event_id": event_id or str(uuid4()),
+        "event_type": payload.get('event_type', 'update'),
+        "module": payload.get('module', 'Accounts'),
+        "record_id": payload.get('record_id', ''),
+        "record_data": payload.get('record_data', {}),
+        "modified_fields": payload.get('modified_fields', []),
+        "user_id": payload.get('user_id')
+    }
+
+
+def event_to_dict(event: WebhookEvent) -> Dict[str, Any]:
+    """Serialize a validated event into the queued event format.
+
+    Args:
+        event: Validated webhook event
+
+    Returns:
+        JSON-serializable event dict
+    """
+    return {
+        "event_id": event.event_id,
+        "event_type": event.event_type,
+        "module": event.module,
+        "record_id": event.record_id,
+        "record_data": event.record_data,
+        "modified_fields": event.modified_fields,
+        "timestamp": event.timestamp.isoformat(),
+        "user_id": event.user_id
+    }
+
+
+def expand_raw_event(envelope: Dict[str, Any]) -> Dict[str, Any]:
+    """Parse and validate an event enqueued by the fast ingest path.
+
+    Args:
+        envelope: Queued envelope with ``event_id``, ``received_at`` and the
+            original webhook body under ``raw``
+
+    Returns:
+        Event dict in the standard queued format
+
+    Raises:
+        ValueError: If the payload fails validation
+    """
+    fields = normalize_webhook_payload(envelope["raw"], envelope.get("event_id"))
+    received_at = envelope.get("received_at")
+    if received_at:
+        fields["timestamp"] = datetime.fromisoformat(received_at)
+
+    return event_to_dict(WebhookEvent(**fields))
+
+
 class WebhookHandler:
     """FastAPI webhook handler for Zoho CRM events.
 
     Features:
     - Webhook signature verification using HMAC-SHA256
     - Event deduplication using Redis
-    - Async event queueing
+    - Async event queueing (one Redis list per priority lane, or
+      account-partitioned Redis Streams when a stream queue is configured)
+    - Fast ingest mode: verify the HMAC over the raw bytes, read only the
+      routing keys and enqueue the original body; the worker validates
     - Comprehensive error handling
     - Request validation and sanitization
 
@@ -83,7 +197,9 @@ class WebhookHandler:
         redis_client: Redis,
         webhook_secret: str,
         event_ttl: int = 3600,
-        max_queue_size: int = 10000
+        max_queue_size: int = 10000,
+        stream_queue: Optional[WebhookStreamQueue] = None,
+        fast_ingest: bool = False
     ):
         """Initialize webhook handler.
 
@@ -91,14 +207,24 @@ class WebhookHandler:
             redis_client: Redis client for queue and deduplication
             webhook_secret: Secret key for webhook verification
             event_ttl: Event deduplication TTL in seconds (default: 1 hour)
-            max_queue_size: Maximum events in queue
+            max_queue_size: Maximum events per lane queue (per partition
+                with streams)
+            stream_queue: Optional durable Redis Streams backend used instead
+                of the ``webhook:queue`` list
+            fast_ingest: Enqueue raw webhook bodies without building a
+                validated event on the request path
         """
         self.redis = redis_client
         self.webhook_secret = webhook_secret.encode('utf-8')
         self.event_ttl = event_ttl
         self.max_queue_size = max_queue_size
+        self.stream_queue = stream_queue
+        self.fast_ingest = fast_ingest
         self.logger = logger.bind(component="webhook_handler")
 
+        # Script object caches the SHA and falls back to EVAL on first use
+        self._enqueue_script = self.redis.register_script(ENQUEUE_SCRIPT)
+
         # Metrics
         self._metrics = {
             "total_events": 0,
@@ -175,7 +301,6 @@ class WebhookHandler:
         try:
             # Read request body
             body = await request.body()
-            body_str = body.decode('utf-8')
 
             self.logger.info(
                 "webhook_received",
@@ -199,46 +324,31 @@ class WebhookHandler:
 
             # Parse webhook payload
             try:
-                payload = json.loads(body_str)
-            except json.JSONDecodeError as e:
+                payload = _json_loads(body)
+            except ValueError as e:
                 self.logger.error("webhook_json_parse_failed", error=str(e))
                 raise HTTPException(
                     status_code=400,
                     detail="Invalid JSON payload"
                 )
 
+            if self.fast_ingest:
+                # The parsed body is only used for routing (lane and account
+                # partition); validation and re-serialization are left to
+                # the worker
+                fields, envelope = self._prepare_raw_event(body, payload, event_id)
+                return await self._accept_event(
+                    fields["event_id"],
+                    lambda: self._enqueue_payload(fields, envelope)
+                )
+
             # Extract event data
             event = await self._parse_event(payload, event_id)
 
-            # Check for duplicate
-            if await self._is_duplicate(event.event_id):
-                self._metrics["duplicated_events"] += 1
-                self.logger.info("webhook_duplicate_detected", event_id=event.event_id)
-                return WebhookResponse(
-                    status="duplicate",
-                    event_id=event.event_id,
-                    message="Event already processed",
-                    queued=False
-                )
-
-            # Queue event for processing
-            queued = await self._queue_event(event)
-
-            if queued:
-                self._metrics["queued_events"] += 1
-                self.logger.info("webhook_event_queued", event_id=event.event_id)
-                return WebhookResponse(
-                    status="accepted",
-                    event_id=event.event_id,
-                    message="Event queued for processing",
-                    queued=True
-                )
-            else:
-                self._metrics["failed_events"] += 1
-                raise HTTPException(
-                    status_code=503,
-                    detail="Queue full or unavailable"
-                )
+            return await self._accept_event(
+                event.event_id,
+                lambda: self._queue_event(event)
+            )
 
         except HTTPException:
             raise
@@ -250,6 +360,83 @@ class WebhookHandler:
                 detail=f"Internal processing error: {str(e)}"
             )
 
+    async def _accept_event(
+        self,
+        event_id: str,
+        enqueue: Callable[[], Awaitable[bool]]
+    ) -> WebhookResponse:
+        """Deduplicate and enqueue an event, building the HTTP response.
+
+        Args:
+            event_id: Event identifier
+            enqueue: Coroutine function that queues the event
+
+        Returns:
+            WebhookResponse with processing status
+
+        Raises:
+            HTTPException: If the queue is full or unavailable
+        """
+        # Check for duplicate
+        if await self._is_duplicate(event_id):
+            self._metrics["duplicated_events"] += 1
+            self.logger.info("webhook_duplicate_detected", event_id=event_id)
+            return WebhookResponse(
+                status="duplicate",
+                event_id=event_id,
+                message="Event already processed",
+                queued=False
+            )
+
+        # Queue event for processing
+        if await enqueue():
+            self._metrics["queued_events"] += 1
+            self.logger.info("webhook_event_queued", event_id=event_id)
+            return WebhookResponse(
+                status="accepted",
+                event_id=event_id,
+                message="Event queued for processing",
+                queued=True
+            )
+
+        self._metrics["failed_events"] += 1
+        raise HTTPException(
+            status_code=503,
+            detail="Queue full or unavailable"
+        )
+
+    def _prepare_raw_event(
+        self,
+        body: bytes,
+        payload: Dict[str, Any],
+        event_id: Optional[str]
+    ) -> Tuple[Dict[str, Any], bytes]:
+        """Build the routing fields and queued envelope for fast ingest.
+
+        The original body is spliced into the envelope as-is rather than
+        re-serialized. The body still has to be parsed in full, since the
+        account partition comes from the nested record data.
+
+        Args:
+            body: Verified raw request body
+            payload: Parsed body (only routing keys are read)
+            event_id: Event ID from header
+
+        Returns:
+            (routing fields, envelope bytes)
+        """
+        fields = normalize_webhook_payload(payload, event_id)
+        envelope = b"".join([
+            b'{"event_id":',
+            json.dumps(fields["event_id"]).encode("utf-8"),
+            b',"received_at":"',
+            datetime.utcnow().isoformat().encode("ascii"),
+            b'","raw":',
+            body,
+            b"}"
+        ])
+        return fields, envelope
+
     async def _verify_signature(
         self,
         body: bytes,
@@ -292,35 +479,10 @@ class WebhookHandler:
         Returns:
             Parsed WebhookEvent
         """
-        # Handle different Zoho webhook formats
-        if 'data' in payload:
-            # Zoho CRM v2/v3 format
-            data = payload['data']
-            if isinstance(data, list) and len(data) > 0:
-                data = data[0]
-
-            return WebhookEvent(
-                event_id=event_id or str(uuid4()),
-                event_type=payload.get('operation', 'update').lower(),
-                module=payload.get('module', 'Accounts'),
-                record_id=data.get('id', ''),
-                record_data=data,
-                modified_fields=payload.get('modified_fields', []),
-                timestamp=datetime.utcnow(),
-                user_id=payload.get('user', {}).get('id')
-            )
-        else:
-            # Generic format
-            return WebhookEvent(
-                event_id=event_id or str(uuid4()),
-                event_type=payload.get('event_type', 'update'),
-                module=payload.get('module', 'Accounts'),
-                record_id=payload.get('record_id', ''),
-                record_data=payload.get('record_data', {}),
-                modified_fields=payload.get('modified_fields', []),
-                timestamp=datetime.utcnow(),
-                user_id=payload.get('user_id')
-            )
+        return WebhookEvent(
+            **normalize_webhook_payload(payload, event_id),
+            timestamp=datetime.utcnow()
+        )
 
     async def _is_duplicate(self, event_id: str) -> bool:
         """Check if event has already been processed.
@@ -352,44 +514,70 @@ class WebhookHandler:
         Args:
             event: WebhookEvent to queue
 
+        Returns:
+            True if queued successfully
+        """
+        event_data = event_to_dict(event)
+        return await self._enqueue_payload(event_data, json.dumps(event_data))
+
+    async def _enqueue_payload(
+        self,
+        event_data: Dict[str, Any],
+        payload: Any
+    ) -> bool:
+        """Push a serialized event to the configured queue backend.
+
+        Args:
+            event_data: Event fields (used for lane and partition routing)
+            payload: Serialized event (str or bytes)
+
         Returns:
             True if queued successfully
         """
         try:
-            # Check queue size
-            queue_size = await self.redis.llen("webhook:queue")
-            if queue_size >= self.max_queue_size:
+            if self.stream_queue is not None:
+                return await self.stream_queue.enqueue(
+                    event_data,
+                    payload,
+                    self.max_queue_size
+                )
+
+            # Check capacity, push (LPUSH for FIFO with right-side pops) and
+            # publish the notification for processors in one script call
+            lane = classify_lane(event_data)
+            queue_size = await self._enqueue_script(
+                keys=[LANE_QUEUE_KEYS[lane], "webhook:events"],
+                args=[payload, self.max_queue_size]
+            )
+
+            if queue_size < 0:
                 self.logger.warning(
                     "webhook_queue_full",
-                    queue_size=queue_size,
+                    lane=lane,
                     max_size=self.max_queue_size
                 )
                 return False
 
-            # Serialize event
-            event_json = json.dumps({
-                "event_id": event.event_id,
-                "event_type": event.event_type,
-                "module": event.module,
-                "record_id": event.record_id,
-                "record_data": event.record_data,
-                "modified_fields": event.modified_fields,
-                "timestamp": event.timestamp.isoformat(),
-                "user_id": event.user_id
-            })
-
-            # Push to queue (LPUSH for FIFO with BRPOP)
-            await self.redis.lpush("webhook:queue", event_json)
-
-            # Publish notification for processors
-            await self.redis.publish("webhook:events", event_json)
-
             return True
 
         except Exception as e:
             self.logger.error("event_queue_failed", error=str(e))
             return False
 
+    async def _lane_queue_sizes(self) -> Dict[str, int]:
+        """Get the length of each lane queue (-1 if unavailable).
+
+        Returns:
+            Queue length per lane
+        """
+        sizes = {}
+        for lane in LANES:
+            try:
+                sizes[lane] = await self.redis.llen(LANE_QUEUE_KEYS[lane])
+            except Exception:
+                sizes[lane] = -1
+        return sizes
+
     async def get_health_status(self) -> Dict[str, Any]:
         """Get webhook system health status.
 
@@ -404,16 +592,15 @@ class WebhookHandler:
             self.logger.error("redis_health_check_failed", error=str(e))
             redis_healthy = False
 
-        # Get queue size
-        try:
-            queue_size = await self.redis.llen("webhook:queue")
-        except Exception:
-            queue_size = -1
+        # Capacity is per lane, so report the fullest one
+        lane_sizes = await self._lane_queue_sizes()
+        queue_size = max(lane_sizes.values())
 
         return {
             "status": "healthy" if redis_healthy else "unhealthy",
             "redis_connected": redis_healthy,
             "queue_size": queue_size,
+            "lane_queue_sizes": lane_sizes,
             "queue_capacity": self.max_queue_size,
             "queue_utilization": (
                 f"{(queue_size / self.max_queue_size * 100):.1f}%"
@@ -428,14 +615,16 @@ class WebhookHandler:
         Returns:
             Metrics dict
         """
-        try:
-            queue_size = await self.redis.llen("webhook:queue")
-        except Exception:
-            queue_size = -1
+        lane_sizes = await self._lane_queue_sizes()
+        queue_size = (
+            sum(lane_sizes.values())
+            if all(size >= 0 for size in lane_sizes.values()) else -1
+        )
 
         return {
             **self._metrics,
             "current_queue_size": queue_size,
+            "lane_queue_sizes": lane_sizes,
             "acceptance_rate": (
                 f"{(self._metrics['verified_events'] / self._metrics['total_events'] * 100):.1f}%"
                 if self._metrics['total_events'] > 0 else "0.0%"
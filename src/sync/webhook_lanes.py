@@ -0,0 +1,97 @@
+"""Priority lanes for webhook events.
+
+Events are classified at enqueue time into lanes with separate Redis
+lists, so critical account changes never queue behind bulk activity:
+
+- critical: account create/delete/restore and updates to critical fields
+- default: other account updates, contacts and deals
+- bulk: notes, activities and tasks
+"""
+
+from typing import Any, Dict, List, Tuple
+
+# Account fields whose change forces an immediate memory sync
+CRITICAL_ACCOUNT_FIELDS = frozenset({
+    "Account_Status", "Health_Score", "Owner",
+    "Annual_Revenue", "Account_Type", "Industry"
+})
+
+LANE_CRITICAL = "critical"
+LANE_DEFAULT = "default"
+LANE_BULK = "bulk"
+
+# Lanes in priority order
+LANES: Tuple[str, ...] = (LANE_CRITICAL, LANE_DEFAULT, LANE_BULK)
+
+# The default lane keeps the original queue key
+LANE_QUEUE_KEYS: Dict[str, str] = {
+    LANE_CRITICAL: "webhook:queue:critical",
+    LANE_DEFAULT: "webhook:queue",
+    LANE_BULK: "webhook:queue:bulk",
+}
+
+QUEUE_KEY_LANES: Dict[str, str] = {key: lane for lane, key in LANE_QUEUE_KEYS.items()}
+
+BULK_MODULES = frozenset({"Notes", "Activities", "Tasks"})
+
+
+def classify_lane(event: Dict[str, Any]) -> str:
+    """Assign an event to a priority lane.
+
+    Args:
+        event: Event fields (module, event_type, modified_fields)
+
+    Returns:
+        Lane name
+    """
+    module = event.get("module")
+
+    if module == "Accounts":
+        if event.get("event_type") != "update":
+            return LANE_CRITICAL
+        if CRITICAL_ACCOUNT_FIELDS & set(event.get("modified_fields") or []):
+            return LANE_CRITICAL
+        return LANE_DEFAULT
+
+    if module in BULK_MODULES:
+        return LANE_BULK
+
+    return LANE_DEFAULT
+
+
+def lane_poll_order(lane: str) -> List[str]:
+    """Lanes a worker assigned to ``lane`` polls, highest priority first.
+
+    Every worker helps drain the critical lane; critical workers poll
+    nothing else, which reserves them for critical changes.
+
+    Args:
+        lane: Worker's own lane
+
+    Returns:
+        Lane names in poll order
+    """
+    if lane == LANE_CRITICAL:
+        return [LANE_CRITICAL]
+    return [LANE_CRITICAL, lane]
+
+
+def default_lane_workers(num_workers: int) -> Dict[str, int]:
+    """Split a worker count across lanes.
+
+    Args:
+        num_workers: Total workers
+
+    Returns:
+        Workers per lane (empty when there are too few workers to
+        dedicate, in which case every worker polls all lanes)
+    """
+    if num_workers < len(LANES):
+        return {}
+
+    reserved = max(1, num_workers // 4)
+    return {
+        LANE_CRITICAL: reserved,
+        LANE_BULK: reserved,
+        LANE_DEFAULT: num_workers - 2 * reserved,
+    }
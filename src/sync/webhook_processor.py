@@ -3,18 +3,25 @@
 Processes webhook events from Redis queue with:
 - Event-driven Cognee updates
 - Batch processing for efficiency
+- Per-account coalescing of sync-triggering events
+- Priority lanes with reserved workers for critical account changes
 - Dead letter queue for failed events
 - Exponential backoff retry strategy
 """
 
 import asyncio
 import json
+import time
+from collections import deque
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from typing import Deque, Dict, Any, Optional, List, Set, Tuple, Union
 from enum import Enum
 
 import structlog
 from redis.asyncio import Redis
+from redis.exceptions import ResponseError
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -23,9 +30,39 @@ from tenacity import (
 )
 
 from src.services.memory_service import MemoryService
+from src.sync.webhook_handler import expand_raw_event
+from src.sync.webhook_lanes import (
+    CRITICAL_ACCOUNT_FIELDS,
+    LANE_CRITICAL,
+    LANE_QUEUE_KEYS,
+    LANES,
+    classify_lane,
+    default_lane_workers,
+    lane_poll_order
+)
+from src.sync.webhook_stream import WebhookStreamQueue
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
 
 logger = structlog.get_logger(__name__)
 
+# Recent dequeue samples kept per lane for queue-age percentiles
+QUEUE_AGE_SAMPLES = 1000
+
+# Field holding the parent account reference on create/restore events
+CREATE_ACCOUNT_FIELDS = {
+    "Contacts": "Account_Name",
+    "Deals": "Account_Name",
+    "Activities": "What_Id",
+    "Tasks": "What_Id",
+    "Notes": "Parent_Id"
+}
+
 
 class ProcessingStatus(str, Enum):
     """Event processing status."""
@@ -37,12 +74,39 @@ class ProcessingStatus(str, Enum):
     DEAD_LETTER = "dead_letter"
 
 
+@dataclass
+class PendingSync:
+    """Account sync accumulated from events within one coalescing window."""
+
+    account_id: str
+    first_seen: float
+    force: bool = False
+    urgent: bool = False
+    modified_fields: Set[str] = field(default_factory=set)
+    events: List[Dict[str, Any]] = field(default_factory=list)
+
+    def add(self, event: Dict[str, Any], force: bool) -> None:
+        """Fold an event into the sync."""
+        self.force = self.force or force
+        self.modified_fields.update(event.get("modified_fields") or [])
+        self.events.append(event)
+
+
 class WebhookProcessor:
     """Async webhook event processor with retry logic.
 
     Features:
     - Async event processing from Redis queue
-    - Batch processing for efficiency (configurable batch size)
+    - Batch processing for efficiency (configurable batch size), dequeued
+      in one round-trip that blocks only until the first event arrives
+    - Adaptive idle backoff when the queue is unavailable or empty
+    - Optional Redis Streams backend: account-partitioned consumer groups
+      with XACK after processing and claiming of stale pending entries
+    - Per-account coalescing: events that only trigger an account sync are
+      collapsed within ``coalesce_window`` into a single sync per account;
+      critical account changes flush their account immediately
+    - Priority lanes (critical, default, bulk) with per-lane worker quotas,
+      per-module concurrency caps and per-lane queue-age metrics
     - Exponential backoff retry (3 attempts)
     - Dead letter queue for failed events
     - Cognee memory synchronization
@@ -61,7 +125,14 @@ class WebhookProcessor:
         batch_size: int = 10,
         batch_timeout: int = 5,
         max_retries: int = 3,
-        retry_delay_base: int = 2
+        retry_delay_base: int = 2,
+        coalesce_window: float = 2.0,
+        max_concurrent_syncs: int = 10,
+        idle_backoff_min: float = 0.05,
+        idle_backoff_max: float = 1.0,
+        stream_queue: Optional[WebhookStreamQueue] = None,
+        lane_workers: Optional[Dict[str, int]] = None,
+        module_concurrency: Optional[Dict[str, int]] = None
     ):
         """Initialize webhook processor.
 
@@ -69,20 +140,77 @@ class WebhookProcessor:
             redis_client: Redis client for queue access
             memory_service: Memory service for Cognee updates
             batch_size: Number of events to process in batch
-            batch_timeout: Seconds to wait for batch to fill
+            batch_timeout: Seconds to block waiting for the first event of a batch
             max_retries: Maximum retry attempts per event
             retry_delay_base: Base delay for exponential backoff (seconds)
+            coalesce_window: Seconds to collapse sync events per account
+                (0 processes every event individually)
+            max_concurrent_syncs: Maximum account syncs in flight when
+                flushing coalesced events
+            idle_backoff_min: Initial sleep after an empty dequeue (seconds)
+            idle_backoff_max: Ceiling for the doubling idle sleep (seconds)
+            stream_queue: Optional durable Redis Streams backend; each worker
+                becomes a consumer in its group
+            lane_workers: Workers per lane (overrides ``num_workers`` in
+                ``start``); by default a quarter of the workers are reserved
+                for the critical lane and a quarter for the bulk lane. Lanes
+                apply to the list backend only.
+            module_concurrency: Maximum events per Zoho module processed at
+                once across all workers (e.g. ``{"Notes": 2}``)
+
+        Raises:
+            ValueError: If ``lane_workers`` names an unknown lane or leaves a
+                lane without workers (its events would never be polled)
         """
+        if lane_workers is not None:
+            unknown_lanes = set(lane_workers) - set(LANES)
+            if unknown_lanes:
+                raise ValueError(f"Unknown webhook lanes: {sorted(unknown_lanes)}")
+
+            unserved_lanes = [lane for lane in LANES if lane_workers.get(lane, 0) < 1]
+            if unserved_lanes:
+                raise ValueError(f"Webhook lanes without workers: {unserved_lanes}")
+
         self.redis = redis_client
         self.memory = memory_service
         self.batch_size = batch_size
         self.batch_timeout = batch_timeout
         self.max_retries = max_retries
         self.retry_delay_base = retry_delay_base
+        self.coalesce_window = coalesce_window
+        self.idle_backoff_min = idle_backoff_min
+        self.idle_backoff_max = idle_backoff_max
+        self.stream_queue = stream_queue
+        self.lane_workers = lane_workers
         self.logger = logger.bind(component="webhook_processor")
 
         self._running = False
         self._worker_tasks: List[asyncio.Task] = []
+        self._flusher_task: Optional[asyncio.Task] = None
+
+        # BLMPOP needs Redis 7.0+; fall back to BRPOP + RPOP count otherwise
+        self._use_blmpop = True
+
+        # Stream consumers started by this processor, and stream entries
+        # whose events finished outside a batch (superseded syncs)
+        self._consumers: List[str] = []
+        self._pending_acks: List[Dict[str, Any]] = []
+
+        # Coalescing stage state
+        self._pending_syncs: Dict[str, PendingSync] = {}
+        self._sync_semaphore = asyncio.Semaphore(max_concurrent_syncs)
+        self._flush_wakeup = asyncio.Event()
+
+        # Lane and module scheduling state
+        self._module_semaphores = {
+            module: asyncio.Semaphore(limit)
+            for module, limit in (module_concurrency or {}).items()
+        }
+        self._worker_lanes: Dict[int, List[str]] = {}
+        self._lane_dequeued = {lane: 0 for lane in LANES}
+        self._lane_ages: Dict[str, Deque[float]] = {
+            lane: deque(maxlen=QUEUE_AGE_SAMPLES) for lane in LANES
+        }
 
         # Processing metrics
         self._metrics = {
@@ -92,6 +220,8 @@ class WebhookProcessor:
             "events_retried": 0,
             "events_dead_letter": 0,
             "batches_processed": 0,
+            "events_coalesced": 0,
+            "coalesced_syncs": 0,
             "average_processing_time": 0.0,
             "last_processed": None
         }
@@ -100,7 +230,8 @@ class WebhookProcessor:
         """Start event processing workers.
 
         Args:
-            num_workers: Number of concurrent worker tasks
+            num_workers: Number of concurrent worker tasks (ignored when
+                ``lane_workers`` was given)
         """
         if self._running:
             self.logger.warning("processor_already_running")
@@ -109,12 +240,24 @@ class WebhookProcessor:
         self._running = True
         self.logger.info("starting_webhook_processor", num_workers=num_workers)
 
+        if self.stream_queue is not None:
+            await self.stream_queue.ensure_groups()
+
         # Start worker tasks
-        for i in range(num_workers):
-            task = asyncio.create_task(self._worker(worker_id=i))
+        assignments = self._lane_assignments(num_workers)
+        for i, lanes in enumerate(assignments):
+            self._worker_lanes[i] = lanes
+            task = asyncio.create_task(self._worker(worker_id=i, lanes=lanes))
             self._worker_tasks.append(task)
 
-        self.logger.info("webhook_processor_started", workers=num_workers)
+        if self.coalesce_window > 0:
+            self._flusher_task = asyncio.create_task(self._coalesce_flusher())
+
+        self.logger.info(
+            "webhook_processor_started",
+            workers=len(assignments),
+            lane_workers=self._lane_worker_counts()
+        )
 
     async def stop(self) -> None:
         """Stop event processing gracefully."""
@@ -125,30 +268,93 @@ class WebhookProcessor:
         if self._worker_tasks:
             await asyncio.gather(*self._worker_tasks, return_exceptions=True)
             self._worker_tasks.clear()
+            self._worker_lanes.clear()
+
+        if self._flusher_task is not None:
+            self._flush_wakeup.set()
+            await asyncio.gather(self._flusher_task, return_exceptions=True)
+            self._flusher_task = None
+
+        # Don't drop syncs still waiting for their window to close
+        await self.flush_coalesced()
+
+        if self.stream_queue is not None:
+            for consumer in self._consumers:
+                await self.stream_queue.release(consumer)
+            self._consumers.clear()
 
         self.logger.info("webhook_processor_stopped")
 
-    async def _worker(self, worker_id: int) -> None:
+    def _lane_assignments(self, num_workers: int) -> List[List[str]]:
+        """Build each worker's lane poll order.
+
+        Args:
+            num_workers: Requested worker count
+
+        Returns:
+            One list of lanes (highest priority first) per worker
+        """
+        quotas = self.lane_workers or default_lane_workers(num_workers)
+
+        # Streams partition by account, and too few workers can't be split
+        if self.stream_queue is not None or not quotas:
+            return [list(LANES) for _ in range(num_workers)]
+
+        return [
+            lane_poll_order(lane)
+            for lane in LANES
+            for _ in range(quotas.get(lane, 0))
+        ]
+
+    def _lane_worker_counts(self) -> Dict[str, int]:
+        """Count running workers polling each lane."""
+        counts = {lane: 0 for lane in LANES}
+        for lanes in self._worker_lanes.values():
+            for lane in lanes:
+                counts[lane] += 1
+        return counts
+
+    async def _worker(
+        self,
+        worker_id: int,
+        lanes: Optional[List[str]] = None
+    ) -> None:
         """Event processing worker.
 
         Args:
             worker_id: Worker identifier
+            lanes: Lanes to poll, highest priority first (default: all)
         """
-        worker_logger = self.logger.bind(worker_id=worker_id)
+        worker_logger = self.logger.bind(worker_id=worker_id, lanes=lanes)
         worker_logger.info("worker_started")
+        idle_backoff = self.idle_backoff_min
+
+        consumer = None
+        if self.stream_queue is not None:
+            consumer = self.stream_queue.default_consumer_name(worker_id)
+            self._consumers.append(consumer)
 
         while self._running:
             try:
                 # Get batch of events
-                events = await self._get_event_batch()
+                events = await self._get_event_batch(consumer, lanes)
 
                 if not events:
-                    # No events available, wait briefly
-                    await asyncio.sleep(1)
+                    # Dequeue already blocked for batch_timeout; back off
+                    # further only while the queue stays empty or errors
+                    await asyncio.sleep(idle_backoff)
+                    idle_backoff = min(idle_backoff * 2, self.idle_backoff_max)
                     continue
 
+                idle_backoff = self.idle_backoff_min
+
                 # Process batch
-                await self._process_batch(events, worker_logger)
+                if consumer is not None:
+                    # Keep partition leases alive however long the batch takes
+                    async with self.stream_queue.lease_heartbeat(consumer):
+                        await self._process_batch(events, worker_logger)
+                else:
+                    await self._process_batch(events, worker_logger)
 
             except Exception as e:
                 worker_logger.error("worker_error", error=str(e))
@@ -156,35 +362,218 @@ class WebhookProcessor:
 
         worker_logger.info("worker_stopped")
 
-    async def _get_event_batch(self) -> List[Dict[str, Any]]:
+    async def _get_event_batch(
+        self,
+        consumer: Optional[str] = None,
+        lanes: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
         """Get batch of events from queue.
 
+        Blocks up to ``batch_timeout`` for the first event only, then takes
+        whatever else is queued (up to ``batch_size``) in the same call. The
+        batch comes from the highest-priority non-empty lane.
+
+        Args:
+            consumer: Stream consumer name (stream backend only)
+            lanes: Lanes to poll, highest priority first (default: all)
+
         Returns:
             List of event dicts
         """
+        if self.stream_queue is not None:
+            events = await self._get_stream_batch(consumer)
+            self._record_queue_age(events)
+            return events
+
         events = []
 
         try:
-            # Get events with timeout
-            for _ in range(self.batch_size):
-                result = await self.redis.brpop(
-                    "webhook:queue",
-                    timeout=self.batch_timeout
-                )
+            payloads = await self._pop_batch(lanes or list(LANES))
+        except Exception as e:
+            self.logger.error("get_event_batch_failed", error=str(e))
+            return events
 
-                if result:
-                    _, event_json = result
-                    event = json.loads(event_json)
-                    events.append(event)
-                else:
-                    # Timeout reached
-                    break
+        for event_json in payloads:
+            try:
+                event = _json_loads(event_json)
+            except (TypeError, ValueError) as e:
+                self.logger.error("malformed_event_skipped", error=str(e))
+                continue
+
+            try:
+                event = await self._expand_event(event)
+            except (AttributeError, KeyError, TypeError, ValueError):
+                continue
+            if event is not None:
+                events.append(event)
+
+        self._record_queue_age(events)
+        return events
+
+    def _record_queue_age(self, events: List[Dict[str, Any]]) -> None:
+        """Record how long dequeued events waited, per lane.
 
+        Age is measured from the event timestamp, which the handler sets
+        when the webhook is received.
+
+        Args:
+            events: Freshly dequeued events
+        """
+        now = datetime.utcnow()
+        for event in events:
+            lane = classify_lane(event)
+            self._lane_dequeued[lane] += 1
+
+            try:
+                received = datetime.fromisoformat(event["timestamp"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            self._lane_ages[lane].append((now - received).total_seconds())
+
+    async def _expand_event(self, event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Validate events enqueued raw by the handler's fast ingest path.
+
+        Args:
+            event: Decoded queue entry
+
+        Returns:
+            Event dict, or None if validation failed (event dead-lettered)
+
+        Raises:
+            ValueError: (or the original validation error) if the event is
+                invalid and could not be written to the dead letter queue
+        """
+        if "raw" not in event:
+            return event
+
+        try:
+            return expand_raw_event(event)
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            self.logger.error(
+                "raw_event_validation_failed",
+                event_id=event.get("event_id"),
+                error=str(e)
+            )
+            if not await self._move_to_dead_letter(event, f"validation failed: {e}"):
+                raise
+            return None
+
+    async def _get_stream_batch(self, consumer: str) -> List[Dict[str, Any]]:
+        """Read a batch of events from the consumer's stream partitions.
+
+        Each event carries its stream reference under ``_stream_ref`` (and
+        the consumer that read it under ``_stream_consumer``) until it is
+        acknowledged.
+
+        Args:
+            consumer: Stream consumer name
+
+        Returns:
+            List of event dicts
+        """
+        events = []
+
+        try:
+            entries = await self.stream_queue.read(
+                consumer,
+                count=self.batch_size,
+                block_ms=int(self.batch_timeout * 1000)
+            )
         except Exception as e:
             self.logger.error("get_event_batch_failed", error=str(e))
+            return events
+
+        malformed = []
+        for ref, event_json in entries:
+            try:
+                event = _json_loads(event_json)
+            except (TypeError, ValueError) as e:
+                self.logger.error("malformed_event_skipped", error=str(e))
+                malformed.append(ref)
+                continue
+
+            try:
+                event = await self._expand_event(event)
+            except (AttributeError, KeyError, TypeError, ValueError):
+                # Not dead-lettered; leave unacked so it is reclaimed later
+                continue
+            if event is None:
+                malformed.append(ref)
+                continue
+
+            event["_stream_ref"] = ref
+            event["_stream_consumer"] = consumer
+            events.append(event)
+
+        if malformed:
+            # Unparseable entries would otherwise be reclaimed forever
+            await self.stream_queue.ack(malformed, consumer)
 
         return events
 
+    async def _ack_events(self, events: List[Dict[str, Any]]) -> None:
+        """Acknowledge stream entries for events that finished processing.
+
+        Args:
+            events: Processed (or dead-lettered) events
+        """
+        if self.stream_queue is None:
+            return
+
+        by_consumer: Dict[Optional[str], List[Tuple[str, str]]] = {}
+        for event in events:
+            if "_stream_ref" in event:
+                by_consumer.setdefault(event.get("_stream_consumer"), []).append(
+                    tuple(event["_stream_ref"])
+                )
+
+        for consumer, refs in by_consumer.items():
+            try:
+                # Entries of partitions lost meanwhile stay pending for the new owner
+                await self.stream_queue.ack(refs, consumer)
+            except Exception as e:
+                # Unacked entries are reclaimed and processed again later
+                self.logger.error("stream_ack_failed", error=str(e), count=len(refs))
+
+    async def _pop_batch(self, lanes: List[str]) -> List[Any]:
+        """Pop up to ``batch_size`` raw events from the first non-empty lane.
+
+        Args:
+            lanes: Lanes to poll, highest priority first
+
+        Returns:
+            Raw event payloads, oldest first
+        """
+        keys = [LANE_QUEUE_KEYS[lane] for lane in lanes]
+
+        if self._use_blmpop:
+            try:
+                result = await self.redis.blmpop(
+                    self.batch_timeout,
+                    len(keys),
+                    *keys,
+                    direction="RIGHT",
+                    count=self.batch_size
+                )
+            except ResponseError:
+                self.logger.info("blmpop_unsupported_falling_back")
+                self._use_blmpop = False
+            else:
+                return result[1] if result else []
+
+        result = await self.redis.brpop(keys, timeout=self.batch_timeout)
+        if not result:
+            return []
+
+        key, payload = result
+        payloads = [payload]
+        if self.batch_size > 1:
+            rest = await self.redis.rpop(key, self.batch_size - 1)
+            if rest:
+                payloads.extend(rest)
+
+        return payloads
+
     async def _process_batch(
         self,
         events: List[Dict[str, Any]],
@@ -199,20 +588,35 @@ class WebhookProcessor:
         batch_start = datetime.utcnow()
         worker_logger.info("processing_batch", batch_size=len(events))
 
+        # Sync-only events wait in the coalescing stage, the rest run now
+        direct_events = [
+            event for event in events
+            if not self._coalesce_event(event)
+        ]
+
         # Process events concurrently
         tasks = [
             self._process_event(event)
-            for event in events
+            for event in direct_events
         ]
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
+        # Processed and dead-lettered events are both done with; an event
+        # whose dead-letter write failed raised and stays unacknowledged
+        done = [
+            event for event, result in zip(direct_events, results)
+            if not isinstance(result, BaseException)
+        ]
+        finished, self._pending_acks = done + self._pending_acks, []
+        await self._ack_events(finished)
+
         # Update metrics
         succeeded = sum(1 for r in results if r is True)
         failed = sum(1 for r in results if r is not True)
 
         self._metrics["batches_processed"] += 1
-        self._metrics["events_processed"] += len(events)
+        self._metrics["events_processed"] += len(direct_events)
         self._metrics["events_succeeded"] += succeeded
         self._metrics["events_failed"] += failed
         self._metrics["last_processed"] = datetime.utcnow().isoformat()
@@ -229,9 +633,238 @@ class WebhookProcessor:
             "batch_processed",
             succeeded=succeeded,
             failed=failed,
+            coalesced=len(events) - len(direct_events),
             duration_seconds=duration
         )
 
+    def _coalesce_event(self, event: Dict[str, Any]) -> bool:
+        """Route an event into the per-account coalescing stage.
+
+        Args:
+            event: Event dict
+
+        Returns:
+            True if the event was absorbed into a pending account sync
+        """
+        if self.coalesce_window <= 0:
+            return False
+
+        # An account delete supersedes any sync still pending for it
+        if event.get("event_type") == "delete" and event.get("module") == "Accounts":
+            superseded = self._pending_syncs.pop(event.get("record_id"), None)
+            if superseded is not None:
+                self._metrics["events_processed"] += len(superseded.events)
+                self._metrics["events_succeeded"] += len(superseded.events)
+                self._pending_acks.extend(superseded.events)
+            return False
+
+        target = self.resolve_account_sync(event)
+        if target is None:
+            return False
+
+        account_id, force = target
+        pending = self._pending_syncs.get(account_id)
+        if pending is None:
+            pending = PendingSync(account_id=account_id, first_seen=time.monotonic())
+            self._pending_syncs[account_id] = pending
+
+        pending.add(event, force)
+
+        # Critical changes don't wait out the window
+        if not pending.urgent and classify_lane(event) == LANE_CRITICAL:
+            pending.urgent = True
+            self._flush_wakeup.set()
+
+        return True
+
+    def resolve_account_sync(
+        self,
+        event: Dict[str, Any]
+    ) -> Optional[Tuple[str, bool]]:
+        """Determine the account sync an event would trigger.
+
+        Events that resolve to the same account can be folded into one
+        ``PendingSync`` and replayed together.
+
+        Args:
+            event: Event dict
+
+        Returns:
+            (account_id, force) if the event's only effect is an account
+            sync, None otherwise
+        """
+        event_type = event.get("event_type")
+        module = event.get("module")
+        record_data = event.get("record_data") or {}
+
+        if event_type not in {"create", "update", "restore"}:
+            return None
+
+        if module == "Accounts":
+            record_id = event.get("record_id")
+            if not record_id:
+                return None
+            if event_type == "update":
+                modified_fields = event.get("modified_fields") or []
+                return record_id, bool(CRITICAL_ACCOUNT_FIELDS & set(modified_fields))
+            return record_id, True
+
+        if module in CREATE_ACCOUNT_FIELDS:
+            if event_type == "update":
+                account_id = self._extract_account_id(module, record_data)
+            else:
+                # Creates and restores sync the referenced record without
+                # checking its module, as _handle_create does
+                account_ref = record_data.get(CREATE_ACCOUNT_FIELDS[module])
+                account_id = account_ref.get("id") if isinstance(account_ref, dict) else None
+            if account_id:
+                return account_id, True
+
+        return None
+
+    async def _coalesce_flusher(self) -> None:
+        """Flush pending account syncs as their windows close.
+
+        Sleeps until the oldest window closes, or until an urgent (critical)
+        sync is queued.
+        """
+        while self._running:
+            now = time.monotonic()
+            delay = self.coalesce_window
+            if self._pending_syncs:
+                delay = min(
+                    0.0 if p.urgent else p.first_seen + self.coalesce_window - now
+                    for p in self._pending_syncs.values()
+                )
+
+            try:
+                await asyncio.wait_for(self._flush_wakeup.wait(), max(delay, 0.01))
+            except asyncio.TimeoutError:
+                pass
+            self._flush_wakeup.clear()
+
+            try:
+                await self.flush_coalesced(due_only=True)
+            except Exception as e:
+                self.logger.error("coalesce_flush_failed", error=str(e))
+
+    async def flush_coalesced(self, due_only: bool = False) -> int:
+        """Issue one sync per account for pending coalesced events.
+
+        Args:
+            due_only: Only flush urgent accounts and those whose coalescing
+                window has closed
+
+        Returns:
+            Number of account syncs issued
+        """
+        now = time.monotonic()
+        due = [
+            account_id
+            for account_id, pending in self._pending_syncs.items()
+            if not due_only
+            or pending.urgent
+            or now - pending.first_seen >= self.coalesce_window
+        ]
+        if not due:
+            return 0
+
+        batch = [self._pending_syncs.pop(account_id) for account_id in due]
+        await asyncio.gather(*(self._flush_pending_sync(p) for p in batch))
+        return len(batch)
+
+    async def replay(self, item: Union[PendingSync, Dict[str, Any]]) -> bool:
+        """Process an account sync or event outside the worker loop.
+
+        Failures are dead-lettered like any other event.
+
+        Args:
+            item: Coalesced account sync or single event
+
+        Returns:
+            True if processing succeeded
+        """
+        if isinstance(item, PendingSync):
+            return await self._flush_pending_sync(item)
+        return await self._process_event(item)
+
+    async def _flush_pending_sync(self, pending: PendingSync) -> bool:
+        """Run a single coalesced account sync.
+
+        Args:
+            pending: Accumulated events for one account
+
+        Returns:
+            True if the sync succeeded (otherwise the events are dead-lettered)
+        """
+        event_count = len(pending.events)
+
+        # Honour the caps of every module that contributed an event (taken
+        # in a fixed order so overlapping syncs cannot deadlock)
+        modules = sorted({e.get("module") for e in pending.events} & self._module_semaphores.keys())
+
+        async with AsyncExitStack() as stack:
+            for module in modules:
+                await stack.enter_async_context(self._module_semaphores[module])
+            await stack.enter_async_context(self._sync_semaphore)
+            try:
+                await self._sync_account_with_retry(pending.account_id, pending.force)
+                succeeded = True
+                error = None
+            except Exception as e:
+                succeeded = False
+                error = str(e)
+
+        self._metrics["coalesced_syncs"] += 1
+        self._metrics["events_coalesced"] += event_count
+        self._metrics["events_processed"] += event_count
+        self._metrics["last_processed"] = datetime.utcnow().isoformat()
+
+        if succeeded:
+            await self._ack_events(pending.events)
+            self._metrics["events_succeeded"] += event_count
+            self.logger.info(
+                "coalesced_sync_completed",
+                account_id=pending.account_id,
+                events=event_count,
+                force=pending.force,
+                modified_fields=sorted(pending.modified_fields)
+            )
+            return True
+
+        self._metrics["events_failed"] += event_count
+        self.logger.error(
+            "coalesced_sync_failed",
+            account_id=pending.account_id,
+            events=event_count,
+            error=error
+        )
+
+        # Replaying the latest event re-syncs the account once
+        representative = {
+            **pending.events[-1],
+            "modified_fields": sorted(pending.modified_fields),
+            "coalesced_event_ids": [e.get("event_id") for e in pending.events]
+        }
+        if await self._move_to_dead_letter(representative, error):
+            await self._ack_events(pending.events)
+        return False
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=2, min=2, max=30),
+        retry=retry_if_exception_type(Exception)
+    )
+    async def _sync_account_with_retry(self, account_id: str, force: bool) -> None:
+        """Sync an account to memory with retry logic.
+
+        Args:
+            account_id: Account to sync
+            force: Force sync even if recently synced
+        """
+        self._metrics["events_retried"] += 1
+        await self.memory.sync_account_to_memory(account_id, force=force)
+
     async def _process_event(self, event: Dict[str, Any]) -> bool:
         """Process single webhook event with retry logic.
 
@@ -255,8 +888,13 @@ class WebhookProcessor:
         )
 
         try:
-            # Process event with retry
-            await self._process_with_retry(event)
+            # Process event with retry, within its module's concurrency cap
+            semaphore = self._module_semaphores.get(module)
+            if semaphore is None:
+                await self._process_with_retry(event)
+            else:
+                async with semaphore:
+                    await self._process_with_retry(event)
 
             self.logger.info("event_processed_successfully", event_id=event_id)
             return True
@@ -268,8 +906,10 @@ class WebhookProcessor:
                 error=str(e)
             )
 
-            # Move to dead letter queue
-            await self._move_to_dead_letter(event, str(e))
+            # Move to dead letter queue; if that fails too, raise so the
+            # caller does not acknowledge an event that was never stored
+            if not await self._move_to_dead_letter(event, str(e)):
+                raise
             return False
 
     @retry(
@@ -373,14 +1013,9 @@ class WebhookProcessor:
 
         if module == "Accounts":
             # Check if critical fields changed
-            critical_fields = {
-                "Account_Status", "Health_Score", "Owner",
-                "Annual_Revenue", "Account_Type", "Industry"
-            }
-
             has_critical_changes = any(
                 field in modified_fields
-                for field in critical_fields
+                for field in CRITICAL_ACCOUNT_FIELDS
             )
 
             # Always sync if critical fields changed, otherwise debounce
@@ -404,9 +1039,11 @@ class WebhookProcessor:
         """
         self.logger.info("handling_delete", module=module, record_id=record_id)
 
-        # Mark record as deleted in memory
-        # Implementation depends on Cognee capabilities
-        # For now, we'll log the deletion
+        # Cognee has no delete yet, so only drop locally cached account state
+        # to keep exact lookups from serving the deleted record
+        if module == "Accounts":
+            await self.memory.forget_account(record_id)
+
         self.logger.warning("delete_event_received", module=module, record_id=record_id)
 
     async def _handle_restore(
@@ -469,15 +1106,22 @@ class WebhookProcessor:
         self,
         event: Dict[str, Any],
         error: str
-    ) -> None:
+    ) -> bool:
         """Move failed event to dead letter queue.
 
         Args:
             event: Failed event
             error: Error message
+
+        Returns:
+            True if the event was written to the dead letter queue
         """
         try:
             event_id = event.get("event_id", "unknown")
+            event = {
+                k: v for k, v in event.items()
+                if k not in ("_stream_ref", "_stream_consumer")
+            }
 
             dead_letter_entry = {
                 "event": event,
@@ -502,9 +1146,11 @@ class WebhookProcessor:
                 event_id=event_id,
                 error=error
             )
+            return True
 
         except Exception as e:
             self.logger.error("dead_letter_move_failed", error=str(e))
+            return False
 
     async def get_metrics(self) -> Dict[str, Any]:
         """Get processing metrics.
@@ -512,18 +1158,46 @@ class WebhookProcessor:
         Returns:
             Metrics dict
         """
+        lane_sizes = {lane: -1 for lane in LANES}
         try:
-            queue_size = await self.redis.llen("webhook:queue")
+            if self.stream_queue is not None:
+                queue_size = await self.stream_queue.backlog()
+            else:
+                for lane in LANES:
+                    lane_sizes[lane] = await self.redis.llen(LANE_QUEUE_KEYS[lane])
+                queue_size = sum(lane_sizes.values())
             dead_letter_size = await self.redis.llen("webhook:dead_letter")
         except Exception:
             queue_size = -1
             dead_letter_size = -1
 
+        worker_counts = self._lane_worker_counts()
+        lanes = {}
+        for lane in LANES:
+            ages = sorted(self._lane_ages[lane])
+            lanes[lane] = {
+                "queue_size": lane_sizes[lane],
+                "workers": worker_counts[lane],
+                "events_dequeued": self._lane_dequeued[lane],
+                "queue_age_p50_ms": _percentile_ms(ages, 0.50),
+                "queue_age_p95_ms": _percentile_ms(ages, 0.95),
+                "queue_age_max_ms": _percentile_ms(ages, 1.0),
+            }
+
         return {
             **self._metrics,
             "current_queue_size": queue_size,
             "dead_letter_queue_size": dead_letter_size,
             "workers_running": len(self._worker_tasks),
+            "lanes": lanes,
+            "pending_coalesced_accounts": len(self._pending_syncs),
+            "coalescing_ratio": (
+                round(
+                    self._metrics["events_coalesced"] / self._metrics["coalesced_syncs"],
+                    2
+                )
+                if self._metrics["coalesced_syncs"] > 0 else 0.0
+            ),
             "processor_running": self._running,
             "success_rate": (
                 f"{(self._metrics['events_succeeded'] / self._metrics['events_processed'] * 100):.1f}%"
@@ -536,7 +1210,10 @@ class WebhookProcessor:
         self,
         limit: int = 10
     ) -> Dict[str, Any]:
-        """Reprocess events from dead letter queue.
+        """Reprocess events from dead letter queue one at a time.
+
+        For bulk replay after an outage use ``DeadLetterReplayer``, which
+        deduplicates, coalesces and rate-limits the replay.
 
         Args:
             limit: Maximum events to reprocess
@@ -576,3 +1253,11 @@ class WebhookProcessor:
 
         self.logger.info("dead_letter_reprocessing_completed", results=results)
         return results
+
+
+def _percentile_ms(sorted_seconds: List[float], fraction: float) -> Optional[float]:
+    """Nearest-rank percentile of sorted durations, in milliseconds."""
+    if not sorted_seconds:
+        return None
+    index = min(len(sorted_seconds) - 1, int(fraction * len(sorted_seconds)))
+    return round(sorted_seconds[index] * 1000, 1)
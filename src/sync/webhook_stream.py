@@ -0,0 +1,480 @@
+"""Durable Redis Streams backend for the webhook event queue.
+
+Replaces the plain ``webhook:queue`` list with account-partitioned streams
+read through a consumer group:
+
+- Events are XADDed to ``webhook:stream:{partition}`` where the partition
+  is a stable hash of the account the event affects, so one account's
+  events always land in the same stream in arrival order
+- Each partition is leased to exactly one consumer at a time; consumers
+  heartbeat and rebalance leases so partitions spread evenly across
+  worker processes and hosts
+- Entries stay pending until XACKed after successful processing (or after
+  being moved to the dead letter queue), so a worker crash never loses an
+  event: the next owner of the partition claims its stale pending entries
+  before reading new ones
+- While a batch is processed its leases are kept alive by a heartbeat
+  (``lease_heartbeat``), and ownership is re-checked before reading and
+  acknowledging, so a slow batch never has its partition read by a second
+  consumer at the same time
+"""
+
+import asyncio
+import math
+import os
+import socket
+import time
+import zlib
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+import structlog
+from redis.asyncio import Redis
+from redis.exceptions import ResponseError
+
+logger = structlog.get_logger(__name__)
+
+
+# Record fields that reference the owning account, per Zoho module
+ACCOUNT_REFERENCE_FIELDS = {
+    "Contacts": "Account_Name",
+    "Deals": "Account_Name",
+    "Activities": "What_Id",
+    "Tasks": "What_Id",
+    "Notes": "Parent_Id",
+}
+
+
+def partition_key(event: Dict[str, Any]) -> str:
+    """Get the key that determines an event's partition.
+
+    Events are keyed by the account they affect so that all of an
+    account's events are consumed in order by a single consumer.
+
+    Args:
+        event: Serialized webhook event
+
+    Returns:
+        Account ID when resolvable, otherwise the record ID
+    """
+    module = event.get("module")
+    record_id = event.get("record_id") or ""
+
+    if module == "Accounts":
+        return record_id
+
+    field = ACCOUNT_REFERENCE_FIELDS.get(module)
+    reference = (event.get("record_data") or {}).get(field) if field else None
+    if isinstance(reference, dict) and reference.get("id"):
+        return reference["id"]
+
+    return record_id
+
+
+# Stream entry reference: (stream key, entry ID)
+StreamRef = Tuple[str, str]
+
+
+class WebhookStreamQueue:
+    """Account-partitioned Redis Streams queue with consumer-group reads.
+
+    Example:
+        >>> queue = WebhookStreamQueue(redis, num_partitions=16)
+        >>> await queue.ensure_groups()
+        >>> await queue.enqueue(event, event_json, max_len=10000)
+        >>> entries = await queue.read("host-1-0", count=50, block_ms=5000)
+        >>> await queue.ack([ref for ref, _ in entries])
+    """
+
+    def __init__(
+        self,
+        redis_client: Redis,
+        num_partitions: int = 8,
+        group: str = "webhook-processors",
+        stream_prefix: str = "webhook:stream",
+        lease_ms: int = 30000,
+        claim_idle_ms: int = 60000
+    ):
+        """Initialize stream queue.
+
+        Args:
+            redis_client: Redis client
+            num_partitions: Number of account partitions (streams)
+            group: Consumer group name
+            stream_prefix: Key prefix for partition streams
+            lease_ms: Partition ownership lease; a consumer that stops
+                renewing loses its partitions after this long
+            claim_idle_ms: Minimum idle time before another consumer's
+                pending entries are claimed
+        """
+        self.redis = redis_client
+        self.num_partitions = num_partitions
+        self.group = group
+        self.stream_prefix = stream_prefix
+        self.lease_ms = lease_ms
+        self.claim_idle_ms = claim_idle_ms
+        self.logger = logger.bind(component="webhook_stream_queue")
+
+        self._consumers_key = f"{stream_prefix}:consumers"
+        self._owned: Dict[str, List[int]] = {}
+        self._last_rebalance: Dict[str, float] = {}
+
+        # Partitions acquired from another owner whose pending entries
+        # have not all been claimed yet
+        self._unclaimed: Dict[str, Set[int]] = {}
+
+    @staticmethod
+    def default_consumer_name(worker_id: int) -> str:
+        """Build a consumer name unique to this host, process and worker.
+
+        Args:
+            worker_id: Worker identifier within the process
+
+        Returns:
+            Consumer name
+        """
+        return f"{socket.gethostname()}-{os.getpid()}-{worker_id}"
+
+    def stream_key(self, partition: int) -> str:
+        """Get the stream key for a partition."""
+        return f"{self.stream_prefix}:{partition}"
+
+    def partition_for(self, key: str) -> int:
+        """Map a partition key to a partition (stable across processes)."""
+        return zlib.crc32(key.encode("utf-8")) % self.num_partitions
+
+    def _owner_key(self, partition: int) -> str:
+        return f"{self.stream_key(partition)}:owner"
+
+    def _partition_of(self, key: str) -> int:
+        return int(key.rsplit(":", 1)[1])
+
+    async def ensure_groups(self) -> None:
+        """Create the consumer group on every partition stream."""
+        for partition in range(self.num_partitions):
+            try:
+                await self.redis.xgroup_create(
+                    self.stream_key(partition),
+                    self.group,
+                    id="0",
+                    mkstream=True
+                )
+            except ResponseError as e:
+                if "BUSYGROUP" not in str(e):
+                    raise
+
+    async def enqueue(
+        self,
+        event: Dict[str, Any],
+        event_json: Union[str, bytes],
+        max_len: int
+    ) -> bool:
+        """Append an event to its account's partition stream.
+
+        The partition backlog is checked first (a soft limit), then XADD and
+        the processor notification are sent in one MULTI/EXEC round-trip.
+
+        Args:
+            event: Event dict (used for partitioning)
+            event_json: Serialized event
+            max_len: Maximum backlog per partition
+
+        Returns:
+            True if the event was queued
+        """
+        key = self.stream_key(self.partition_for(partition_key(event)))
+
+        backlog = await self.redis.xlen(key)
+        if backlog >= max_len:
+            self.logger.warning("webhook_stream_full", stream=key, backlog=backlog)
+            return False
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.xadd(key, {"event": event_json})
+            pipe.publish("webhook:events", event_json)
+            await pipe.execute()
+
+        return True
+
+    async def assigned_partitions(self, consumer: str) -> List[int]:
+        """Acquire, renew and rebalance this consumer's partition leases.
+
+        Leases are refreshed at most every third of ``lease_ms``. Each
+        consumer aims for an equal share of partitions among consumers that
+        heartbeated within the lease; surplus leases are released so newly
+        started consumers can pick them up.
+
+        Args:
+            consumer: Consumer name
+
+        Returns:
+            Partitions currently owned by the consumer
+        """
+        now = time.time()
+        if (
+            consumer in self._owned
+            and (now - self._last_rebalance.get(consumer, 0)) * 1000 < self.lease_ms / 3
+        ):
+            return self._owned[consumer]
+
+        # Heartbeat and count live consumers
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.zadd(self._consumers_key, {consumer: now})
+            pipe.zremrangebyscore(self._consumers_key, 0, now - self.lease_ms / 1000)
+            pipe.zcard(self._consumers_key)
+            for partition in range(self.num_partitions):
+                pipe.get(self._owner_key(partition))
+            results = await pipe.execute()
+
+        live_consumers = max(results[2], 1)
+        owners = results[3:]
+        fair_share = math.ceil(self.num_partitions / live_consumers)
+
+        owned = [
+            p for p, owner in enumerate(owners)
+            if owner is not None and _decode(owner) == consumer
+        ]
+        free = [p for p, owner in enumerate(owners) if owner is None]
+        keep, release = owned[:fair_share], owned[fair_share:]
+        wanted = free[:max(fair_share - len(keep), 0)]
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for partition in keep:
+                pipe.pexpire(self._owner_key(partition), self.lease_ms)
+            for partition in release:
+                pipe.delete(self._owner_key(partition))
+            for partition in wanted:
+                pipe.set(self._owner_key(partition), consumer, nx=True, px=self.lease_ms)
+            results = await pipe.execute()
+
+        acquired = [
+            partition
+            for partition, ok in zip(wanted, results[len(keep) + len(release):])
+            if ok
+        ]
+        assigned = sorted(keep + acquired)
+
+        if assigned != self._owned.get(consumer):
+            self.logger.info(
+                "stream_partitions_assigned",
+                consumer=consumer,
+                partitions=assigned,
+                live_consumers=live_consumers
+            )
+
+        self._owned[consumer] = assigned
+        self._unclaimed.setdefault(consumer, set()).update(acquired)
+        self._last_rebalance[consumer] = now
+        return assigned
+
+    async def _still_owned(self, consumer: str, partitions: Iterable[int]) -> List[int]:
+        """Filter partitions down to those whose lease the consumer still holds."""
+        partitions = list(partitions)
+        if not partitions:
+            return []
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for partition in partitions:
+                pipe.get(self._owner_key(partition))
+            owners = await pipe.execute()
+
+        owned = [
+            partition for partition, owner in zip(partitions, owners)
+            if owner is not None and _decode(owner) == consumer
+        ]
+        lost = set(partitions) - set(owned)
+        if lost:
+            self.logger.warning(
+                "stream_partitions_lost",
+                consumer=consumer,
+                partitions=sorted(lost)
+            )
+            self._owned[consumer] = [p for p in self._owned.get(consumer, []) if p not in lost]
+            self._unclaimed.get(consumer, set()).difference_update(lost)
+        return owned
+
+    async def renew_leases(self, consumer: str) -> List[int]:
+        """Extend the leases of partitions the consumer still owns.
+
+        Unlike ``assigned_partitions`` this never rebalances, so it is safe
+        to call while a batch from those partitions is being processed.
+
+        Args:
+            consumer: Consumer name
+
+        Returns:
+            Partitions still owned
+        """
+        owned = await self._still_owned(consumer, self._owned.get(consumer, []))
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.zadd(self._consumers_key, {consumer: time.time()})
+            for partition in owned:
+                pipe.pexpire(self._owner_key(partition), self.lease_ms)
+            await pipe.execute()
+
+        return owned
+
+    @asynccontextmanager
+    async def lease_heartbeat(self, consumer: str) -> AsyncIterator[None]:
+        """Keep the consumer's leases alive for the duration of a batch.
+
+        Example:
+            >>> async with queue.lease_heartbeat(consumer):
+            ...     await process(entries)
+        """
+        async def beat() -> None:
+            while True:
+                await asyncio.sleep(self.lease_ms / 3000)
+                try:
+                    await self.renew_leases(consumer)
+                except Exception as e:
+                    self.logger.error("stream_lease_renewal_failed", consumer=consumer, error=str(e))
+
+        task = asyncio.create_task(beat())
+        try:
+            yield
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def read(
+        self,
+        consumer: str,
+        count: int,
+        block_ms: int
+    ) -> List[Tuple[StreamRef, str]]:
+        """Read the next entries from the consumer's partitions.
+
+        Stale pending entries left by a previous owner are claimed and
+        returned before any new entries, preserving per-account order. On a
+        partition just taken over from another consumer, all of its pending
+        entries are claimed regardless of idle time.
+
+        Args:
+            consumer: Consumer name
+            count: Maximum entries to return per partition
+            block_ms: Milliseconds to block when nothing is available
+
+        Returns:
+            ((stream key, entry ID), serialized event) pairs
+        """
+        partitions = await self.assigned_partitions(consumer)
+        partitions = await self._still_owned(consumer, partitions)
+        if not partitions:
+            # Every partition is leased elsewhere; wait for a rebalance
+            await asyncio.sleep(block_ms / 1000)
+            return []
+
+        entries: List[Tuple[StreamRef, str]] = []
+        unclaimed = self._unclaimed.setdefault(consumer, set())
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for partition in partitions:
+                pipe.xautoclaim(
+                    self.stream_key(partition),
+                    self.group,
+                    consumer,
+                    min_idle_time=0 if partition in unclaimed else self.claim_idle_ms,
+                    start_id="0-0",
+                    count=count
+                )
+            claims = await pipe.execute()
+
+        for partition, (next_id, claimed, *_) in zip(partitions, claims):
+            entries.extend(_entries(self.stream_key(partition), claimed))
+            if _decode(next_id) == "0-0" and len(claimed) < count:
+                unclaimed.discard(partition)
+
+        if entries:
+            self.logger.info("stale_entries_claimed", consumer=consumer, count=len(entries))
+            return entries
+
+        # COUNT applies per stream; a hot partition still fills a batch
+        response = await self.redis.xreadgroup(
+            self.group,
+            consumer,
+            {self.stream_key(p): ">" for p in partitions},
+            count=count,
+            block=block_ms
+        )
+        for key, messages in response or []:
+            entries.extend(_entries(_decode(key), messages))
+
+        return entries
+
+    async def ack(self, refs: Iterable[StreamRef], consumer: Optional[str] = None) -> int:
+        """Acknowledge and delete processed entries.
+
+        Args:
+            refs: (stream key, entry ID) pairs
+            consumer: Consumer that read the entries; when given, entries of
+                partitions it no longer owns are left pending for the new
+                owner to claim
+
+        Returns:
+            Number of entries acknowledged
+        """
+        by_stream: Dict[str, List[str]] = {}
+        for key, entry_id in refs:
+            by_stream.setdefault(key, []).append(entry_id)
+
+        if consumer is not None and by_stream:
+            owned = await self._still_owned(
+                consumer, {self._partition_of(key) for key in by_stream}
+            )
+            for key in list(by_stream):
+                if self._partition_of(key) not in owned:
+                    self.logger.warning(
+                        "stream_ack_skipped_partition_lost",
+                        consumer=consumer,
+                        stream=key,
+                        count=len(by_stream.pop(key))
+                    )
+
+        if not by_stream:
+            return 0
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key, ids in by_stream.items():
+                pipe.xack(key, self.group, *ids)
+                pipe.xdel(key, *ids)
+            results = await pipe.execute()
+
+        return sum(results[::2])
+
+    async def backlog(self) -> int:
+        """Total entries waiting or pending across all partitions."""
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for partition in range(self.num_partitions):
+                pipe.xlen(self.stream_key(partition))
+            return sum(await pipe.execute())
+
+    async def release(self, consumer: str) -> None:
+        """Give up a consumer's partition leases and heartbeat.
+
+        Args:
+            consumer: Consumer name
+        """
+        for partition in self._owned.pop(consumer, []):
+            owner_key = self._owner_key(partition)
+            owner = await self.redis.get(owner_key)
+            if owner is not None and _decode(owner) == consumer:
+                await self.redis.delete(owner_key)
+
+        await self.redis.zrem(self._consumers_key, consumer)
+        self._last_rebalance.pop(consumer, None)
+        self._unclaimed.pop(consumer, None)
+
+
+def _decode(value: Any) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+def _entries(key: str, messages: Iterable[Any]) -> List[Tuple[StreamRef, str]]:
+    """Convert raw stream messages into (ref, payload) pairs."""
+    entries = []
+    for entry_id, fields in messages:
+        payload = fields.get(b"event", fields.get("event"))
+        entries.append(((key, _decode(entry_id)), _decode(payload)))
+    return entries
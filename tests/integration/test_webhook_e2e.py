@@ -220,8 +220,8 @@ class TestWebhookE2EFlow:
 
             assert response.status_code == 200
 
-        # Check queue size
-        queue_size = await redis_client.llen("webhook:queue")
+        # Check queue size (account creates use the critical lane)
+        queue_size = await redis_client.llen("webhook:queue:critical")
         assert queue_size == 5
 
     @pytest.mark.asyncio
@@ -21,6 +21,8 @@ from statistics import mean, median, stdev
 from typing import List, Dict, Any
 from datetime import datetime
 
+from src.events.ag_ui_emitter import AGUIEventEmitter
+
 
 # ============================================================================
 # Mock Event Emitter (Standalone)
@@ -412,6 +414,69 @@ async def test_throughput_benchmark():
     assert error_rate < target_error_rate, f"Error rate {error_rate:.2f}% exceeds {target_error_rate}% threshold"
 
 
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_sse_frame_throughput():
+    """
+    Benchmark: SSE frames per second for token-sized stream chunks
+    Target: Pre-serialised frames at least 1.2x the dict + json.dumps path
+
+    Compares the dict path (emit_agent_stream + format_sse_event) against
+    frames built straight from the event model, then measures how many
+    frames coalescing saves for a bursty token stream.
+    """
+
+    print("\n" + "="*80)
+    print("BENCHMARK: SSE Frame Throughput")
+    print("="*80)
+
+    emitter = AGUIEventEmitter(session_id="frame-benchmark")
+    tokens = [f"token{i} " for i in range(20000)]
+
+    start = time.perf_counter()
+    for token in tokens:
+        emitter.format_sse_event(emitter.emit_agent_stream("recommendation_author", token))
+    dict_fps = len(tokens) / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for token in tokens:
+        emitter.emit_agent_stream_frame("recommendation_author", token)
+    frame_fps = len(tokens) / (time.perf_counter() - start)
+
+    async def token_stream():
+        for i, token in enumerate(tokens[:2000]):
+            if i % 50 == 0:
+                await asyncio.sleep(0)
+            yield emitter.emit_agent_stream("recommendation_author", token)
+
+    start = time.perf_counter()
+    frames = [frame async for frame in emitter.stream_sse_frames(token_stream())]
+    coalesce_duration = time.perf_counter() - start
+    streamed = b"".join(
+        json.loads(frame[6:])["data"]["content"].encode() for frame in frames
+    )
+
+    speedup = frame_fps / dict_fps
+
+    print(f"\nFrame Throughput Results:")
+    print(f"  Dict + json.dumps:    {dict_fps:,.0f} frames/s")
+    print(f"  Model frames:         {frame_fps:,.0f} frames/s")
+    print(f"  Speedup:              {speedup:.2f}x")
+    print(f"  Coalesced:            2000 chunks -> {len(frames)} frames in {coalesce_duration*1000:.1f}ms")
+
+    # Performance targets
+    target_speedup = 1.2
+
+    print(f"\nPerformance Target Validation:")
+    print(f"  Target Speedup:  {target_speedup}x")
+    print(f"  Actual Speedup:  {speedup:.2f}x {'✅ PASS' if speedup >= target_speedup else '❌ FAIL'}")
+    print("="*80 + "\n")
+
+    assert streamed.decode() == "".join(tokens[:2000]), "Coalescing lost or reordered content"
+    assert len(frames) < 2000, "Stream chunks were not coalesced"
+    assert speedup >= target_speedup, f"Frame speedup {speedup:.2f}x below {target_speedup}x target"
+
+
 # ============================================================================
 # Benchmark Summary
 # ============================================================================
@@ -432,6 +497,7 @@ def print_benchmark_summary(request):
     print("  ✅ Complete Workflow Duration (<10s)")
     print("  ✅ Memory Usage Under Load (<500 MB)")
     print("  ✅ System Throughput (100+ events/s)")
+    print("  ✅ SSE Frame Throughput (1.2x+ over dict serialisation)")
     print("\nSPARC Compliance: Week 8, Day 15 - Refinement Phase")
     print("NFR-P01 Reference: MASTER_SPARC_PLAN_V3.md line 96")
     print("="*80 + "\n")
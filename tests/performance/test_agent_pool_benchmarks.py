@@ -0,0 +1,86 @@
+"""
+Agent setup benchmarks for the CopilotKit request path.
+
+Compares per-request construction of the Zoho scout, memory analyst,
+recommendation author, approval manager and orchestrator (what the graph
+nodes and router did before) with handing out a per-session orchestrator
+from the process-wide ``AgentPool``. External integrations are stubbed so
+only local setup cost is measured.
+"""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("anthropic")
+
+from src.agents.agent_pool import AgentPool
+from src.agents.analysis_cache import AccountAnalysisCache
+from src.agents.config import CacheConfig, DataScoutConfig
+from src.agents.memory_analyst import MemoryAnalyst
+from src.agents.orchestrator import OrchestratorAgent
+from src.agents.recommendation_author import RecommendationAuthor
+from src.agents.zoho_data_scout import ZohoDataScout
+from src.events.approval_manager import ApprovalManager
+from src.services.memory_service import MemoryService
+
+
+REQUESTS = 200
+
+
+def _per_request_setup(session_id, zoho_manager, cognee_client, cache_dir):
+    """Build everything a request needed before the pool."""
+    scout = ZohoDataScout(
+        zoho_manager=zoho_manager,
+        config=DataScoutConfig(cache=CacheConfig(cache_dir=cache_dir))
+    )
+    memory_analyst = MemoryAnalyst(
+        memory_service=MemoryService(cognee_client=cognee_client, zoho_manager=zoho_manager),
+        cognee_client=cognee_client,
+        api_key="test-key"
+    )
+    return OrchestratorAgent(
+        session_id=session_id,
+        zoho_scout=scout,
+        memory_analyst=memory_analyst,
+        approval_manager=ApprovalManager(),
+        recommendation_author=RecommendationAuthor(),
+        analysis_cache=AccountAnalysisCache()
+    )
+
+
+@pytest.mark.performance
+def test_request_setup_time(tmp_path):
+    """Pooled agents cut per-request setup to the per-session orchestrator."""
+    zoho_manager = MagicMock()
+    cognee_client = MagicMock()
+
+    start = time.perf_counter()
+    for i in range(REQUESTS):
+        _per_request_setup(f"session_{i}", zoho_manager, cognee_client, tmp_path)
+    per_request_duration = time.perf_counter() - start
+
+    pool = AgentPool(
+        zoho_manager=zoho_manager,
+        cognee_client=cognee_client,
+        scout_config=DataScoutConfig(cache=CacheConfig(cache_dir=tmp_path)),
+        api_key="test-key",
+        analysis_cache=AccountAnalysisCache()
+    )
+    start = time.perf_counter()
+    pool.warm()
+    warm_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    orchestrators = [pool.create_orchestrator(f"session_{i}") for i in range(REQUESTS)]
+    pooled_duration = time.perf_counter() - start
+
+    print(f"\nRequest setup ({REQUESTS} requests):")
+    print(f"  Per-request construction: {per_request_duration / REQUESTS * 1000:.2f}ms/request")
+    print(f"  Pool warm-up (once):      {warm_duration * 1000:.1f}ms")
+    print(f"  Pooled orchestrator:      {pooled_duration / REQUESTS * 1000:.3f}ms/request")
+    print(f"  Speedup:                  {per_request_duration / pooled_duration:.1f}x")
+
+    assert len({id(o.zoho_scout) for o in orchestrators}) == 1
+    assert pooled_duration * 5 < per_request_duration
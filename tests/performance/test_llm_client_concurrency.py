@@ -0,0 +1,120 @@
+"""
+LLM client concurrency benchmarks for the CopilotKit router.
+
+Runs N simultaneous chat requests against a local stub of the Anthropic
+Messages API that answers after a fixed latency. With the shared async
+client the requests overlap, so the batch finishes in about one LLM
+latency; the former per-request synchronous client serialised them on the
+event loop (N latencies).
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+pytest.importorskip("anthropic")
+
+from src.api.llm_client import LLMClient
+
+
+STUB_LATENCY = 0.2
+CONCURRENT_REQUESTS = 20
+
+
+async def _handle_stub_connection(reader, writer):
+    """Minimal keep-alive HTTP/1.1 server answering every POST as /v1/messages."""
+    try:
+        while True:
+            headers = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in headers.split(b"\r\n"):
+                name, _, value = line.partition(b":")
+                if name.strip().lower() == b"content-length":
+                    length = int(value.strip())
+            request = json.loads(await reader.readexactly(length)) if length else {}
+
+            await asyncio.sleep(STUB_LATENCY)
+
+            body = json.dumps({
+                "id": "msg_stub",
+                "type": "message",
+                "role": "assistant",
+                "model": request.get("model", "glm-4.6"),
+                "content": [{"type": "text", "text": "Account ACC-001 looks healthy."}],
+                "stop_reason": "end_turn",
+                "stop_sequence": None,
+                "usage": {"input_tokens": 10, "output_tokens": 8},
+            }).encode()
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Type: application/json\r\n"
+                b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        pass
+    finally:
+        writer.close()
+
+
+@pytest.fixture
+async def stub_llm_url():
+    connections = []
+
+    async def handle(reader, writer):
+        connections.append(writer)
+        await _handle_stub_connection(reader, writer)
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", connections
+    server.close()
+    await server.wait_closed()
+
+
+async def _chat(client: LLMClient, i: int) -> str:
+    response = await client.create_message(
+        system="You are an AI Account Manager assistant.",
+        messages=[{"role": "user", "content": f"Summarize ACC-{i:03d}"}],
+        max_tokens=200
+    )
+    return response.content[0].text
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_concurrent_requests_finish_in_one_llm_latency(stub_llm_url):
+    """N simultaneous requests take ~1 stub latency, not N."""
+    base_url, connections = stub_llm_url
+    client = LLMClient(api_key="test-key", base_url=base_url)
+
+    try:
+        # Warm the pool
+        await _chat(client, 0)
+
+        start = time.perf_counter()
+        responses = await asyncio.gather(
+            *(_chat(client, i) for i in range(CONCURRENT_REQUESTS))
+        )
+        concurrent_duration = time.perf_counter() - start
+
+        # Follow-up batch reuses pooled connections
+        opened = len(connections)
+        await asyncio.gather(*(_chat(client, i) for i in range(CONCURRENT_REQUESTS)))
+        reopened = len(connections) - opened
+    finally:
+        await client.aclose()
+
+    serial_duration = CONCURRENT_REQUESTS * STUB_LATENCY
+
+    print(f"\nLLM client concurrency ({CONCURRENT_REQUESTS} requests, "
+          f"{STUB_LATENCY * 1000:.0f}ms stub latency):")
+    print(f"  Concurrent:           {concurrent_duration * 1000:.0f}ms")
+    print(f"  Serialised (former):  {serial_duration * 1000:.0f}ms")
+    print(f"  Connections opened:   {opened} (+{reopened} on second batch)")
+
+    assert len(responses) == CONCURRENT_REQUESTS
+    assert concurrent_duration < STUB_LATENCY * 2.5
+    assert reopened == 0
@@ -0,0 +1,271 @@
+"""
+Webhook queue throughput and ingest latency benchmarks.
+
+Compares the batched dequeue in WebhookProcessor._get_event_batch (one
+blocking pop per batch) with the former one-BRPOP-per-event loop, at
+several batch sizes, and the request-path latency of WebhookHandler's
+validated vs fast ingest modes, end to end and with Redis stubbed out. Uses fakeredis as a local Redis stand-in,
+so absolute numbers exclude network latency; against a real server every
+saved round-trip is worth roughly one RTT.
+"""
+
+import hashlib
+import hmac
+import json
+import time
+from statistics import quantiles
+from unittest.mock import Mock
+
+import pytest
+import structlog
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from src.sync.webhook_handler import WebhookHandler
+from src.sync.webhook_processor import WebhookProcessor
+from src.sync.webhook_stream import WebhookStreamQueue
+
+
+EVENT_COUNT = 5000
+BATCH_SIZES = [1, 10, 50, 100]
+
+
+def _event_payload(i: int) -> str:
+    return json.dumps({
+        "event_id": f"evt_{i}",
+        "event_type": "update",
+        "module": "Deals",
+        "record_id": f"deal_{i}",
+        "record_data": {"Account_Name": {"id": f"acc_{i % 50}"}},
+        "modified_fields": ["Stage"],
+    })
+
+
+async def _fill_queue(redis, count: int) -> None:
+    payloads = [_event_payload(i) for i in range(count)]
+    for start in range(0, count, 1000):
+        await redis.lpush("webhook:queue", *payloads[start:start + 1000])
+
+
+async def _drain_per_event(redis, batch_size: int) -> int:
+    """Former dequeue: one BRPOP round-trip per event."""
+    drained = 0
+    while True:
+        batch = []
+        for _ in range(batch_size):
+            result = await redis.brpop("webhook:queue", timeout=0.01)
+            if not result:
+                break
+            batch.append(json.loads(result[1]))
+        if not batch:
+            return drained
+        drained += len(batch)
+
+
+async def _drain_batched(processor: WebhookProcessor) -> int:
+    drained = 0
+    while True:
+        events = await processor._get_event_batch()
+        if not events:
+            return drained
+        drained += len(events)
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_batched_dequeue_throughput():
+    """
+    Benchmark: events/sec for batched vs per-event dequeue.
+    Target: batched dequeue at least matches per-event dequeue at batch
+    size 1 and is faster at larger batch sizes.
+    """
+    print("\n" + "=" * 80)
+    print("BENCHMARK: Webhook Queue Dequeue Throughput")
+    print("=" * 80)
+    print(f"{'batch':>6} {'per-event ev/s':>16} {'batched ev/s':>14} {'speedup':>8}")
+
+    redis = fakeredis.FakeAsyncRedis()
+    results = {}
+
+    try:
+        for batch_size in BATCH_SIZES:
+            await _fill_queue(redis, EVENT_COUNT)
+            start = time.perf_counter()
+            drained = await _drain_per_event(redis, batch_size)
+            per_event_rate = drained / (time.perf_counter() - start)
+            assert drained == EVENT_COUNT
+
+            processor = WebhookProcessor(
+                redis,
+                Mock(),
+                batch_size=batch_size,
+                batch_timeout=0.01,
+                coalesce_window=0
+            )
+            await _fill_queue(redis, EVENT_COUNT)
+            start = time.perf_counter()
+            drained = await _drain_batched(processor)
+            batched_rate = drained / (time.perf_counter() - start)
+            assert drained == EVENT_COUNT
+
+            results[batch_size] = (per_event_rate, batched_rate)
+            print(
+                f"{batch_size:>6} {per_event_rate:>16,.0f} {batched_rate:>14,.0f} "
+                f"{batched_rate / per_event_rate:>7.1f}x"
+            )
+    finally:
+        await redis.aclose()
+
+    per_event, batched = results[max(BATCH_SIZES)]
+    assert batched > per_event
+
+
+class _RawRequest:
+    """Minimal stand-in for a FastAPI request carrying a raw body."""
+
+    def __init__(self, body: bytes):
+        self._body = body
+
+    async def body(self) -> bytes:
+        return self._body
+
+
+def _zoho_body(i: int) -> bytes:
+    return json.dumps({
+        "operation": "Update",
+        "module": "Deals",
+        "data": [{
+            "id": f"deal_{i}",
+            "Account_Name": {"id": f"acc_{i % 50}", "name": "Acme"},
+            "Stage": "Negotiation",
+            "Amount": 125000,
+            "Description": "x" * 2000,
+        }],
+        "modified_fields": ["Stage", "Amount"],
+    }).encode()
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_fast_ingest_request_latency():
+    """
+    Benchmark: p50/p99 request-path latency, validated vs fast ingest.
+    Target: fast ingest p99 no worse than the validated path.
+    """
+    print("\n" + "=" * 80)
+    print("BENCHMARK: Webhook Ingest Request Latency")
+    print("=" * 80)
+
+    secret = "bench_secret"
+    requests_count = 2000
+    bodies = [_zoho_body(i) for i in range(requests_count)]
+    signatures = [
+        hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+        for body in bodies
+    ]
+
+    handlers = {}
+    latencies = {}
+    for mode, fast in (("validated", False), ("fast", True)):
+        redis = fakeredis.FakeAsyncRedis()
+        handlers[mode] = WebhookHandler(
+            redis,
+            secret,
+            max_queue_size=requests_count * 2,
+            stream_queue=WebhookStreamQueue(redis, num_partitions=4),
+            fast_ingest=fast
+        )
+        latencies[mode] = []
+
+    # Alternate modes request by request so both see the same conditions
+    for i, (body, signature) in enumerate(zip(bodies, signatures)):
+        for mode, handler in handlers.items():
+            start = time.perf_counter()
+            response = await handler.handle_webhook(
+                _RawRequest(body), signature, f"{mode}_{i}"
+            )
+            latencies[mode].append((time.perf_counter() - start) * 1000)
+            assert response.queued
+
+    results = {}
+    for mode, handler in handlers.items():
+        await handler.redis.aclose()
+        cuts = quantiles(latencies[mode], n=100)
+        results[mode] = (cuts[49], cuts[98])
+        print(f"{mode:>10}: p50={cuts[49]:.3f}ms p99={cuts[98]:.3f}ms")
+
+    # Both modes share the Redis round-trips; fast ingest must still win
+    assert results["fast"][0] < results["validated"][0]
+
+
+class _NullRedis:
+    """Dedup store that accepts every event without a round-trip."""
+
+    async def set(self, *args, **kwargs):
+        return True
+
+    def register_script(self, script):
+        return None
+
+
+def _drop_event(logger, method_name, event_dict):
+    raise structlog.DropEvent
+
+
+class _NullStreamQueue:
+    """Stream backend that only records what would be enqueued."""
+
+    def __init__(self):
+        self.payloads = []
+
+    async def enqueue(self, event_data, payload, max_len):
+        self.payloads.append(payload)
+        return True
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_fast_ingest_enqueue_cost():
+    """
+    Benchmark: handler CPU per request with Redis and log rendering taken
+    out of the path (signature check, parse, validation or splicing,
+    serialization).
+    Target: fast ingest p50 at least 20% below the validated path.
+    """
+    print("\n" + "=" * 80)
+    print("BENCHMARK: Webhook Ingest Enqueue-Side Cost")
+    print("=" * 80)
+
+    secret = "bench_secret"
+    requests_count = 5000
+    bodies = [_zoho_body(i) for i in range(requests_count)]
+    signatures = [
+        hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+        for body in bodies
+    ]
+
+    results = {}
+    for mode, fast in (("validated", False), ("fast", True)):
+        queue = _NullStreamQueue()
+        handler = WebhookHandler(
+            _NullRedis(),
+            secret,
+            stream_queue=queue,
+            fast_ingest=fast
+        )
+        handler.logger = structlog.wrap_logger(
+            structlog.ReturnLogger(), processors=[_drop_event]
+        )
+
+        latencies = []
+        for i, (body, signature) in enumerate(zip(bodies, signatures)):
+            start = time.perf_counter()
+            await handler.handle_webhook(_RawRequest(body), signature, f"{mode}_{i}")
+            latencies.append((time.perf_counter() - start) * 1000)
+
+        assert len(queue.payloads) == requests_count
+        cuts = quantiles(latencies, n=100)
+        results[mode] = (cuts[49], cuts[98])
+        print(f"{mode:>10}: p50={cuts[49] * 1000:.1f}us p99={cuts[98] * 1000:.1f}us")
+
+    assert results["fast"][0] < results["validated"][0] * 0.8
@@ -0,0 +1,257 @@
+"""
+Workflow scheduling benchmarks.
+
+Compares running ``get_execution_groups`` layers one after another (each
+layer waits for its slowest step) with the engine's dependency-counting
+scheduler, which launches a step as soon as its dependencies finish, on a
+generated 5,000-step DAG. Agent work is replaced with short sleeps so only
+scheduling behaviour is measured.
+
+A portfolio-review workflow is also replayed against ``StepScheduler`` with
+per-capability pools to compare the makespan of critical-path priorities
+before and after step durations are learned.
+"""
+
+import asyncio
+import heapq
+import random
+import time
+
+import pytest
+
+from src.agents.dynamic_workflow_engine import (
+    AgentCapability,
+    DynamicWorkflowEngine,
+    ExecutionMode,
+    StepScheduler,
+    Workflow,
+    WorkflowState,
+    WorkflowStep,
+)
+from src.events.ag_ui_emitter import AGUIEventEmitter
+
+
+STEPS = 5_000
+WORKERS = 16
+
+
+def _generated_workflow(step_count: int, seed: int = 7) -> Workflow:
+    """Build a layered DAG with 0-3 dependencies per step on recent steps."""
+    rng = random.Random(seed)
+    capabilities = list(AgentCapability)
+    steps = []
+    for i in range(step_count):
+        window = range(max(0, i - 50), i)
+        dependencies = [f"step_{j}" for j in rng.sample(window, min(len(window), rng.randint(0, 3)))]
+        steps.append(WorkflowStep(
+            step_id=f"step_{i}",
+            name=f"Step {i}",
+            description="Generated step",
+            agent_type="worker",
+            agent_capability=capabilities[i % len(capabilities)],
+            dependencies=dependencies,
+            estimated_duration=rng.choice((0.0005, 0.001, 0.002, 0.004))
+        ))
+    return Workflow(
+        workflow_id="generated",
+        name="Generated",
+        description="Generated benchmark workflow",
+        steps=steps,
+        execution_mode=ExecutionMode.PARALLEL,
+        max_parallel_steps=WORKERS
+    )
+
+
+def _engine() -> DynamicWorkflowEngine:
+    engine = DynamicWorkflowEngine(enable_adaptation=False, enable_monitoring=False)
+    engine.register_agent(
+        agent_id="worker",
+        agent_type="Worker",
+        capabilities=list(AgentCapability),
+        max_concurrent_tasks=WORKERS
+    )
+
+    durations = {}
+
+    async def simulated_agent(agent, context):
+        await asyncio.sleep(durations[context["step_id"]])
+        return {"step_id": context["step_id"]}
+
+    engine._execute_with_agent = simulated_agent
+    engine.durations = durations
+    return engine
+
+
+async def _run_layered(engine: DynamicWorkflowEngine, workflow: Workflow) -> None:
+    """Run each execution group to completion before starting the next."""
+    for group in workflow.get_execution_groups():
+        for start in range(0, len(group), workflow.max_parallel_steps):
+            await asyncio.gather(*(
+                engine._execute_step(step, workflow)
+                for step in group[start:start + workflow.max_parallel_steps]
+            ))
+
+
+async def _run_scheduled(engine: DynamicWorkflowEngine, workflow: Workflow) -> None:
+    emitter = AGUIEventEmitter(session_id="benchmark")
+    async for _ in engine._execute_parallel(workflow, emitter):
+        pass
+
+
+@pytest.mark.performance
+def test_generated_workflow_grouping():
+    """Execution groups for 5,000 steps are built in one topological pass."""
+    workflow = _generated_workflow(STEPS)
+
+    start = time.perf_counter()
+    groups = workflow.get_execution_groups()
+    duration = time.perf_counter() - start
+
+    print(f"\nExecution groups ({STEPS} steps): {len(groups)} groups in {duration * 1000:.1f}ms")
+
+    assert sum(len(group) for group in groups) == STEPS
+    assert duration < 0.5
+
+
+@pytest.mark.performance
+async def test_generated_workflow_makespan():
+    """Launching steps as dependencies finish beats layer-by-layer execution."""
+    layered_workflow = _generated_workflow(STEPS)
+    scheduled_workflow = _generated_workflow(STEPS)
+
+    engine = _engine()
+    engine.durations.update({step.step_id: step.estimated_duration for step in layered_workflow.steps})
+
+    start = time.perf_counter()
+    await _run_layered(engine, layered_workflow)
+    layered_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    await _run_scheduled(engine, scheduled_workflow)
+    scheduled_duration = time.perf_counter() - start
+
+    print(f"\nWorkflow makespan ({STEPS} steps, {WORKERS} workers):")
+    print(f"  Layered groups:      {layered_duration:.2f}s")
+    print(f"  Dependency-driven:   {scheduled_duration:.2f}s")
+    print(f"  Speedup:             {layered_duration / scheduled_duration:.1f}x")
+
+    assert all(step.state == WorkflowState.COMPLETED for step in scheduled_workflow.steps)
+    assert scheduled_duration < layered_duration
+
+
+ACCOUNTS = 80
+POOL_LIMITS = {
+    AgentCapability.DATA_FETCH: 4,
+    AgentCapability.MEMORY: 2,
+    AgentCapability.ANALYSIS: 8,
+    AgentCapability.RECOMMENDATION: 6,
+    AgentCapability.NOTIFICATION: 2,
+    AgentCapability.COORDINATION: 1,
+}
+
+
+def _portfolio_workflow(seed: int = 11):
+    """Nightly portfolio review: per-account fetch, memory, analysis, recommendation.
+
+    Every step is declared with the same 60s estimate, as ``create_workflow``
+    does by default. Large accounts (about one in ten) take much longer to
+    analyse and write up, which the declared estimates do not show.
+
+    Returns:
+        Tuple of (workflow, step ID -> actual duration)
+    """
+    rng = random.Random(seed)
+    steps = []
+    actual = {}
+
+    def add(step_id, name, capability, duration, dependencies=()):
+        steps.append(WorkflowStep(
+            step_id=step_id,
+            name=name,
+            description=name,
+            agent_type=capability.value,
+            agent_capability=capability,
+            dependencies=list(dependencies),
+            estimated_duration=60.0
+        ))
+        actual[step_id] = duration
+
+    for i in range(ACCOUNTS):
+        scale = 6.0 if rng.random() < 0.1 else 1.0
+        account = f"ACC-{i:04d}"
+        add(f"{account}_fetch", f"Fetch {account}", AgentCapability.DATA_FETCH, rng.uniform(0.5, 1.5))
+        add(f"{account}_memory", f"Memory {account}", AgentCapability.MEMORY, rng.uniform(0.2, 0.6),
+            [f"{account}_fetch"])
+        add(f"{account}_analysis", f"Analyze {account}", AgentCapability.ANALYSIS,
+            scale * rng.uniform(1.0, 2.0), [f"{account}_fetch"])
+        add(f"{account}_recommend", f"Recommend {account}", AgentCapability.RECOMMENDATION,
+            scale * rng.uniform(0.5, 1.0), [f"{account}_memory", f"{account}_analysis"])
+        add(f"{account}_notify", f"Notify {account}", AgentCapability.NOTIFICATION, 0.1,
+            [f"{account}_recommend"])
+
+    add("portfolio_rollup", "Portfolio rollup", AgentCapability.COORDINATION, 2.0,
+        [f"ACC-{i:04d}_recommend" for i in range(ACCOUNTS)])
+
+    workflow = Workflow(
+        workflow_id="portfolio",
+        name="Portfolio review",
+        description="Nightly portfolio review",
+        steps=steps,
+        execution_mode=ExecutionMode.PARALLEL,
+        max_parallel_steps=WORKERS
+    )
+    return workflow, actual
+
+
+def _simulate(workflow: Workflow, actual, workers: int) -> float:
+    """Replay the engine's launch loop with actual durations; return the makespan."""
+    scheduler = StepScheduler(workflow, POOL_LIMITS)
+    scheduler.push(scheduler.start())
+    now = 0.0
+    running = []
+
+    while True:
+        while len(running) < workers:
+            step = scheduler.pop()
+            if step is None:
+                break
+            heapq.heappush(running, (now + actual[step.step_id], step.step_id, step))
+
+        if not running:
+            return now
+
+        now, _, step = heapq.heappop(running)
+        step.state = WorkflowState.COMPLETED
+        scheduler.push(scheduler.complete(step))
+
+
+@pytest.mark.performance
+async def test_portfolio_makespan_with_learned_durations():
+    """Critical-path priority on learned durations shortens a multi-agent workflow."""
+    engine = DynamicWorkflowEngine(enable_monitoring=False)
+
+    # Definition order: no duration information at all
+    fifo_workflow, actual = _portfolio_workflow()
+    for step in fifo_workflow.steps:
+        step.estimated_duration = 0.0
+    fifo_makespan = _simulate(fifo_workflow, actual, WORKERS)
+
+    # Declared estimates: every step looks the same, so only chain depth counts
+    declared_workflow, actual = _portfolio_workflow()
+    declared_makespan = _simulate(declared_workflow, actual, WORKERS)
+    for step in declared_workflow.steps:
+        engine._record_step_duration(step, actual[step.step_id])
+
+    # Next run: estimates refined from the observed durations
+    learned_workflow, actual = _portfolio_workflow()
+    await engine._optimize_workflow(learned_workflow)
+    learned_makespan = _simulate(learned_workflow, actual, WORKERS)
+
+    print(f"\nPortfolio makespan ({len(actual)} steps, {WORKERS} workers, capability pools):")
+    print(f"  Definition order:     {fifo_makespan:.1f}s")
+    print(f"  Declared estimates:   {declared_makespan:.1f}s")
+    print(f"  Learned estimates:    {learned_makespan:.1f}s")
+    print(f"  Improvement:          {(1 - learned_makespan / fifo_makespan) * 100:.0f}%")
+
+    assert learned_makespan < declared_makespan
+    assert learned_makespan < fifo_makespan * 0.9
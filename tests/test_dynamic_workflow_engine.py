@@ -12,6 +12,7 @@ Tests cover:
 
 import pytest
 import asyncio
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Dict, Any, List
 from unittest.mock import Mock, AsyncMock
@@ -24,7 +25,8 @@ from src.agents.dynamic_workflow_engine import (
     AgentCapability,
     DependencyType,
     WorkflowStep,
-    Workflow
+    Workflow,
+    StepScheduler
 )
 
 
@@ -468,6 +470,136 @@ class TestWorkflow:
         assert workflow_dict["step_count"] == 1
         assert len(workflow_dict["steps"]) == 1
 
+    def test_get_execution_groups(self):
+        """Test grouping steps into dependency layers."""
+        def make_step(step_id, dependencies=None, exclusive=False):
+            return WorkflowStep(
+                step_id=step_id,
+                name=step_id,
+                description="Step",
+                agent_type="agent",
+                agent_capability=AgentCapability.ANALYSIS,
+                dependencies=dependencies or [],
+                resource_requirements={"exclusive": True} if exclusive else {}
+            )
+
+        workflow = Workflow(
+            workflow_id="test",
+            name="Test",
+            description="Test",
+            steps=[
+                make_step("fetch"),
+                make_step("analyze", ["fetch"], exclusive=True),
+                make_step("memory", ["fetch"], exclusive=True),
+                make_step("notify"),
+                make_step("finalize", ["analyze", "memory"])
+            ],
+            execution_mode=ExecutionMode.PARALLEL
+        )
+
+        groups = [[step.step_id for step in group] for group in workflow.get_execution_groups()]
+
+        # Exclusive steps are split across groups
+        assert groups == [["fetch", "notify"], ["analyze"], ["memory"], ["finalize"]]
+
+        workflow.execution_mode = ExecutionMode.SEQUENTIAL
+        assert len(workflow.get_execution_groups()) == 5
+
+
+class TestStepScheduler:
+    """Test cases for StepScheduler class."""
+
+    def _workflow(self, *steps):
+        return Workflow(
+            workflow_id="test",
+            name="Test",
+            description="Test",
+            steps=list(steps)
+        )
+
+    def _step(self, step_id, dependencies=None, agent_capability=AgentCapability.ANALYSIS, **kwargs):
+        return WorkflowStep(
+            step_id=step_id,
+            name=step_id,
+            description="Step",
+            agent_type="agent",
+            agent_capability=agent_capability,
+            dependencies=dependencies or [],
+            **kwargs
+        )
+
+    def test_ready_order_and_release(self):
+        """Test steps are released as dependencies complete, longest remaining path first."""
+        slow = self._step("slow", estimated_duration=10)
+        fast = self._step("fast", estimated_duration=1)
+        urgent = self._step("urgent", estimated_duration=1, priority_boost=10)
+        after_fast = self._step("after_fast", ["fast"], estimated_duration=20)
+        after_both = self._step("after_both", ["fast", "slow"])
+        scheduler = StepScheduler(self._workflow(slow, fast, urgent, after_fast, after_both))
+
+        scheduler.push(scheduler.start())
+        # "fast" heads a 21s chain, so it goes before the 10s "slow" step
+        assert [scheduler.pop(), scheduler.pop(), scheduler.pop()] == [urgent, fast, slow]
+        assert scheduler.pop() is None
+
+        assert scheduler.complete(fast) == [after_fast]
+        assert scheduler.complete(slow) == [after_both]
+
+    def test_capability_limits(self):
+        """Test steps wait for a free slot in their capability pool."""
+        fetches = [
+            self._step(f"fetch_{i}", agent_capability=AgentCapability.DATA_FETCH)
+            for i in range(3)
+        ]
+        memory = self._step("memory", agent_capability=AgentCapability.MEMORY)
+        scheduler = StepScheduler(
+            self._workflow(*fetches, memory),
+            {AgentCapability.DATA_FETCH: 2}
+        )
+
+        scheduler.push(scheduler.start())
+        assert [scheduler.pop(), scheduler.pop(), scheduler.pop()] == [fetches[0], fetches[1], memory]
+        assert scheduler.pop() is None
+        assert scheduler.has_ready()
+
+        scheduler.complete(fetches[0])
+        assert scheduler.pop() == fetches[2]
+
+    def test_completed_steps_count_as_satisfied(self):
+        """Test resuming a workflow with completed steps."""
+        done = self._step("done", state=WorkflowState.COMPLETED)
+        next_step = self._step("next", ["done"])
+        scheduler = StepScheduler(self._workflow(done, next_step))
+
+        assert scheduler.start() == [next_step]
+
+    def test_exclusive_steps_never_overlap(self):
+        """Test exclusive steps wait for each other but not for other steps."""
+        first = self._step("first", resource_requirements={"exclusive": True})
+        second = self._step("second", resource_requirements={"exclusive": True})
+        shared = self._step("shared", estimated_duration=5)
+        scheduler = StepScheduler(self._workflow(first, second, shared))
+
+        scheduler.push(scheduler.start())
+        assert scheduler.pop() == shared
+        assert scheduler.pop() == first
+        assert scheduler.pop() is None
+
+        scheduler.complete(first)
+        assert scheduler.pop() == second
+
+    def test_fail_blocks_dependents(self):
+        """Test a failed step blocks its transitive dependents only."""
+        root = self._step("root")
+        child = self._step("child", ["root"])
+        grandchild = self._step("grandchild", ["child"])
+        other = self._step("other")
+        scheduler = StepScheduler(self._workflow(root, child, grandchild, other))
+
+        blocked = scheduler.fail(root)
+
+        assert sorted(step.step_id for step in blocked) == ["child", "grandchild"]
+
 
 class TestDynamicWorkflowEngine:
     """Test cases for DynamicWorkflowEngine class."""
@@ -871,6 +1003,161 @@ class TestDynamicWorkflowEngine:
         assert "active_workflows=0" in repr_str
         assert "adaptation_enabled=True" in repr_str
 
+    @pytest.mark.asyncio
+    async def test_parallel_execution_launches_steps_eagerly(self, engine):
+        """Test steps start as soon as their dependencies finish, within the worker limit."""
+        engine.register_agent(
+            agent_id="test_agent",
+            agent_type="TestAgent",
+            capabilities=list(AgentCapability),
+            max_concurrent_tasks=10
+        )
+        durations = {"slow": 0.2, "fast": 0.01, "after_fast": 0.01, "extra_1": 0.01, "extra_2": 0.01}
+        started = []
+        running = 0
+        max_running = 0
+
+        async def simulated_agent(agent, context):
+            nonlocal running, max_running
+            started.append(context["step_id"])
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(durations[context["step_id"]])
+            running -= 1
+            return {"step_id": context["step_id"]}
+
+        engine._execute_with_agent = simulated_agent
+
+        steps = [
+            {"step_id": step_id, "name": step_id, "agent_type": "test_agent", "estimated_duration": 1.0}
+            for step_id in ("slow", "fast", "extra_1", "extra_2")
+        ]
+        steps.insert(2, {
+            "step_id": "after_fast",
+            "name": "after_fast",
+            "agent_type": "test_agent",
+            "dependencies": ["fast"],
+            "estimated_duration": 1.0
+        })
+
+        workflow = await engine.create_workflow(
+            name="Parallel Test",
+            description="Test eager launch",
+            steps=steps,
+            execution_mode=ExecutionMode.PARALLEL,
+            max_parallel_steps=2
+        )
+
+        events = [event async for event in engine.execute_workflow(workflow)]
+
+        assert events[-1]["type"] == "workflow_completed"
+        assert all(step.state == WorkflowState.COMPLETED for step in workflow.steps)
+        assert max_running == 2
+        # Dependents of "fast" run while "slow" is still going
+        assert started.index("after_fast") < started.index("extra_2")
+        assert workflow.get_step_by_id("after_fast").end_time < workflow.get_step_by_id("slow").end_time
+
+    @pytest.mark.asyncio
+    async def test_parallel_execution_cancels_dependents_of_failed_step(self, engine):
+        """Test a failing step cancels its dependents while other steps continue."""
+        engine.register_agent(
+            agent_id="test_agent",
+            agent_type="TestAgent",
+            capabilities=list(AgentCapability),
+            max_concurrent_tasks=10
+        )
+
+        async def simulated_agent(agent, context):
+            if context["step_id"] == "broken":
+                raise RuntimeError("agent unavailable")
+            return {"step_id": context["step_id"]}
+
+        engine._execute_with_agent = simulated_agent
+
+        workflow = await engine.create_workflow(
+            name="Failure Test",
+            description="Test failure handling",
+            steps=[
+                {"step_id": "broken", "name": "broken", "agent_type": "test_agent"},
+                {"step_id": "child", "name": "child", "agent_type": "test_agent", "dependencies": ["broken"]},
+                {"step_id": "independent", "name": "independent", "agent_type": "test_agent"}
+            ],
+            execution_mode=ExecutionMode.PARALLEL
+        )
+
+        events = [event async for event in engine.execute_workflow(workflow)]
+
+        assert any(event["type"] == "agent_error" for event in events)
+        assert workflow.get_step_by_id("broken").state == WorkflowState.FAILED
+        assert workflow.get_step_by_id("child").state == WorkflowState.CANCELLED
+        assert workflow.get_step_by_id("independent").state == WorkflowState.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_capability_pools_and_learned_durations(self, engine):
+        """Test agent limits bound concurrency and observed durations refine estimates."""
+        engine.register_agent(
+            agent_id="fetch_agent",
+            agent_type="FetchAgent",
+            capabilities=[AgentCapability.DATA_FETCH],
+            max_concurrent_tasks=1
+        )
+        engine.register_agent(
+            agent_id="analysis_agent",
+            agent_type="AnalysisAgent",
+            capabilities=[AgentCapability.ANALYSIS],
+            max_concurrent_tasks=4
+        )
+        running = defaultdict(int)
+        max_running = defaultdict(int)
+
+        async def simulated_agent(agent, context):
+            capability = agent["capability"]
+            running[capability] += 1
+            max_running[capability] = max(max_running[capability], running[capability])
+            await asyncio.sleep(0.01)
+            running[capability] -= 1
+            return {"step_id": context["step_id"]}
+
+        engine._execute_with_agent = simulated_agent
+
+        def steps():
+            return [
+                {"step_id": f"fetch_{i}", "name": "Fetch", "agent_type": "fetch_agent", "agent_capability": "data_fetch"}
+                for i in range(3)
+            ] + [
+                {"step_id": f"analyze_{i}", "name": "Analyze", "agent_type": "analysis_agent", "agent_capability": "analysis"}
+                for i in range(3)
+            ]
+
+        workflow = await engine.create_workflow(
+            name="Pool Test",
+            description="Test capability pools",
+            steps=steps(),
+            execution_mode=ExecutionMode.PARALLEL
+        )
+        async for _ in engine.execute_workflow(workflow):
+            pass
+
+        assert max_running[AgentCapability.DATA_FETCH] == 1
+        assert max_running[AgentCapability.ANALYSIS] == 3
+        assert workflow.get_step_by_id("fetch_0").metrics["estimated_duration"] == 60.0
+        assert workflow.get_step_by_id("fetch_0").metrics["actual_duration"] < 1.0
+        assert workflow.metrics["mean_estimate_error"] > 50.0
+
+        # The next run starts from the learned durations
+        next_workflow = await engine.create_workflow(
+            name="Pool Test",
+            description="Test capability pools",
+            steps=steps(),
+            execution_mode=ExecutionMode.PARALLEL
+        )
+        await engine._optimize_workflow(next_workflow)
+
+        refined = next_workflow.get_step_by_id("fetch_0")
+        assert refined.estimated_duration == pytest.approx(engine.duration_estimates["data_fetch:Fetch"])
+        assert refined.estimated_duration < 1.0
+        assert refined.metrics["declared_duration"] == 60.0
+
 
 class TestIntegration:
     """Integration tests for the complete workflow system."""
@@ -25,6 +25,9 @@ from src.agents.enhanced_glm_integration import (
     GLMResponse,
     create_enhanced_glm_integration,
 )
+from src.agents.glm_admission import GLMAdmissionScheduler, ModelLimits, RequestPriority
+from src.agents.llm_response_cache import LLMResponseCache
+import httpx
 
 
 class TestGLMModel:
@@ -773,6 +776,188 @@ class TestIntegrationScenarios:
         assert performance.total_requests > 0
 
 
+
+class TestResponseCache:
+    """Test response caching for deterministic requests."""
+
+    @staticmethod
+    def _integration(cache):
+        integration = EnhancedGLMIntegration(api_key="test_key", response_cache=cache)
+
+        async def execute(config, request_id):
+            execute.calls += 1
+            return GLMResponse(
+                content=f"Answer {execute.calls}",
+                model=config.model,
+                usage={"total_tokens": 10},
+                finish_reason="stop",
+                latency_ms=0,
+                request_id=request_id
+            )
+
+        execute.calls = 0
+        integration._execute_request_with_retry = execute
+        return integration, execute
+
+    @pytest.mark.asyncio
+    async def test_identical_deterministic_request_is_cached(self):
+        """Test temperature-0 requests of enabled task types hit the cache."""
+        cache = LLMResponseCache(task_types={TaskType.CLASSIFICATION})
+        integration, execute = self._integration(cache)
+        messages = [{"role": "user", "content": "Classify ACC-1 churn risk"}]
+
+        first = await integration.generate(
+            messages, task_type=TaskType.CLASSIFICATION,
+            model=GLMModel.GLM_4_6_FLASH, temperature=0
+        )
+        second = await integration.generate(
+            [{"role": "user", "content": "  Classify ACC-1   churn risk "}],
+            task_type=TaskType.CLASSIFICATION,
+            model=GLMModel.GLM_4_6_FLASH, temperature=0
+        )
+
+        assert execute.calls == 1
+        assert second.content == first.content
+        assert second.request_id != first.request_id
+
+        report = integration.get_performance_report()
+        assert report["response_cache"]["hits"] == 1
+        assert report["response_cache"]["hit_rate"] == 0.5
+
+        await integration.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_non_deterministic_requests_bypass_cache(self):
+        """Test sampling temperatures and other task types are never cached."""
+        cache = LLMResponseCache(task_types={TaskType.CLASSIFICATION})
+        integration, execute = self._integration(cache)
+        messages = [{"role": "user", "content": "Hello"}]
+
+        for _ in range(2):
+            await integration.generate(
+                messages, task_type=TaskType.CLASSIFICATION,
+                model=GLMModel.GLM_4_6_FLASH, temperature=0.7
+            )
+            await integration.generate(
+                messages, task_type=TaskType.TEXT_GENERATION,
+                model=GLMModel.GLM_4_6_FLASH, temperature=0
+            )
+
+        assert execute.calls == 4
+        assert cache.get_stats()["entries"] == 0
+
+        await integration.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_account_checksum_change_misses(self):
+        """Test cached answers are tied to the account data they were built from."""
+        cache = LLMResponseCache(task_types={TaskType.ANALYSIS})
+        integration, execute = self._integration(cache)
+        messages = [{"role": "user", "content": "Analyze account ACC-1"}]
+
+        async def analyze(checksum):
+            return await integration.generate(
+                messages, task_type=TaskType.ANALYSIS, model=GLMModel.GLM_4_6,
+                temperature=0, cache_accounts={"ACC-1": checksum}
+            )
+
+        await analyze("v1")
+        await analyze("v1")
+        assert execute.calls == 1
+
+        await analyze("v2")
+        assert execute.calls == 2
+
+        cache.invalidate_account("ACC-1")
+        await analyze("v2")
+        assert execute.calls == 3
+
+        await integration.cleanup()
+
+
+class TestAdmissionScheduling:
+    """Test admission control of concurrent requests."""
+
+    @pytest.mark.asyncio
+    async def test_fan_out_respects_concurrency_and_priority(self):
+        """Test a batch fan-out queues behind the limit and interactive goes first."""
+        scheduler = GLMAdmissionScheduler(default_limits=ModelLimits(max_concurrent=2))
+        integration = EnhancedGLMIntegration(api_key="test_key", scheduler=scheduler)
+        active = peak = 0
+        order = []
+
+        async def execute(config, request_id):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            order.append(config.messages[0]["content"])
+            return GLMResponse(
+                content="ok", model=config.model, usage={"total_tokens": 10},
+                finish_reason="stop", latency_ms=0, request_id=request_id
+            )
+
+        integration._execute_request_with_retry = execute
+
+        def request(content, priority):
+            return integration.generate(
+                [{"role": "user", "content": content}],
+                model=GLMModel.GLM_4_6, request_priority=priority
+            )
+
+        batch = [
+            asyncio.create_task(request(f"batch-{i}", RequestPriority.BATCH))
+            for i in range(6)
+        ]
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(request("interactive", RequestPriority.INTERACTIVE))
+        await asyncio.gather(*batch, interactive)
+
+        assert peak == 2
+        # Only the two batch requests already in flight finish first
+        assert order.index("interactive") <= 2
+        assert integration.get_performance_report()["admission"]["glm-4.6"]["admitted"] == 7
+
+        await integration.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_pauses_model_and_requeues(self):
+        """Test a 429 throttles the model for Retry-After and the request is re-sent."""
+        integration = EnhancedGLMIntegration(api_key="test_key", max_retries=3)
+        calls = 0
+
+        async def execute(config, request_id):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                request = httpx.Request("POST", "https://glm.test/chat/completions")
+                response = httpx.Response(429, headers={"Retry-After": "0.05"}, request=request)
+                raise httpx.HTTPStatusError("rate limited", request=request, response=response)
+            return GLMResponse(
+                content="ok", model=config.model, usage={"total_tokens": 10},
+                finish_reason="stop", latency_ms=0, request_id=request_id
+            )
+
+        integration._execute_request_with_retry = execute
+
+        response = await integration.generate(
+            [{"role": "user", "content": "Hello"}], model=GLMModel.GLM_4_6
+        )
+
+        assert response.content == "ok"
+        assert calls == 2
+        assert response.latency_ms >= 50
+        stats = integration.get_performance_report()["admission"]["glm-4.6"]
+        assert stats["throttles"] == 1
+
+        # Selector sees provider latency, not the throttle wait
+        performance = integration.model_selector.get_model_performance(GLMModel.GLM_4_6)
+        assert performance.average_latency_ms < 50
+
+        await integration.cleanup()
+
+
 if __name__ == "__main__":
     """Run tests if executed directly."""
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -1007,6 +1007,92 @@ class TestIntegrationScenarios:
         assert detector_stats["average_confidence"] > 0.5, "Average confidence should be reasonable"
 
 
+class TestIntentDetectionEngineThroughput:
+    """Test suite for the compiled fast path of the real IntentDetectionEngine."""
+
+    MESSAGES = [
+        "Hello, how are you?",
+        "Analyze account ACC-123",
+        "I need help with performance analysis",
+        "Show me Zoho data for account ACC-456",
+        "What are your capabilities?",
+        "Check the health and risks of account ACC-789",
+        "What happened last quarter with renewal trends?",
+        "Review account ACC-001 status",
+        "Tell me about recommendations",
+        "Get contacts and deals from Zoho for ACC-234"
+    ]
+
+    @pytest.fixture
+    def engine(self):
+        """Provide the real intent detection engine."""
+        from src.agents.intent_detection import IntentDetectionEngine
+        return IntentDetectionEngine()
+
+    def test_keyword_matcher_matches_substring_scan(self, engine):
+        """Test the compiled matcher finds exactly what a substring scan finds."""
+        matcher = engine.keyword_matcher
+        for message in self.MESSAGES + ["accounts", "acc-1 risky trend analysis", ""]:
+            normalized = engine._normalize_message(message)
+            expected = [
+                index for index, (_, _, keyword, _) in enumerate(matcher.entries)
+                if keyword in normalized
+            ]
+            assert matcher.match(normalized) == expected, message
+
+    def test_signals_can_be_skipped(self, engine):
+        """Test verbose signal lists are built by default and can be skipped."""
+        from src.agents.intent_detection import IntentDetectionEngine
+
+        quiet = IntentDetectionEngine(verbose_signals=False).analyze_intent("Analyze account ACC-123")
+        verbose = engine.analyze_intent("Analyze account ACC-123")
+
+        assert engine.analyze_intent("Analyze account ACC-123", include_signals=False).signals_detected == []
+
+        assert quiet.signals_detected == []
+        assert verbose.signals_detected
+        assert quiet.primary_intent == verbose.primary_intent
+        assert quiet.confidence_score == verbose.confidence_score
+        assert quiet.keywords_matched == verbose.keywords_matched
+
+    def test_normalized_messages_share_cache_entry(self, engine):
+        """Test messages differing only in case/whitespace hit the cache."""
+        first = engine.analyze_intent("Analyze  account ACC-123")
+        first.keywords_matched.append("tampered")
+        second = engine.analyze_intent("analyze account acc-123 ")
+
+        stats = engine.get_cache_stats()
+        assert stats["hits"] == 1 and stats["misses"] == 1
+        assert "tampered" not in second.keywords_matched
+        assert second.analysis_id != first.analysis_id
+
+    @pytest.mark.performance
+    def test_messages_per_second(self, engine):
+        """Benchmark classification throughput with and without the cache."""
+        from src.agents.intent_detection import IntentDetectionEngine
+
+        uncached_engine = IntentDetectionEngine(cache_size=0)
+        messages = [f"{message} #{i}" for i in range(200) for message in self.MESSAGES]
+
+        start_time = time.perf_counter()
+        for message in messages:
+            uncached_engine.analyze_intent(message)
+        uncached_rate = len(messages) / (time.perf_counter() - start_time)
+
+        start_time = time.perf_counter()
+        for _ in range(200):
+            for message in self.MESSAGES:
+                engine.analyze_intent(message)
+        cached_rate = len(messages) / (time.perf_counter() - start_time)
+
+        print(f"\nIntent classification: {uncached_rate:,.0f} msg/s uncached, "
+              f"{cached_rate:,.0f} msg/s cached "
+              f"(hit rate {engine.get_cache_stats()['hit_rate']:.1%})")
+
+        assert uncached_rate > 1000, f"Classification too slow: {uncached_rate:.0f} msg/s"
+        assert cached_rate > uncached_rate
+
+
 # Test Execution and Reporting
 
 @pytest.fixture(scope="session", autouse=True)
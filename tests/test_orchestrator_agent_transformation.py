@@ -14,6 +14,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
 
 from src.agents.orchestrator import OrchestratorAgent
+from src.agents.analysis_cache import AccountAnalysisCache
 from src.agents.zoho_data_scout import ZohoDataScout
 from src.agents.memory_analyst import MemoryAnalyst
 from src.events.approval_manager import ApprovalManager
@@ -352,6 +353,317 @@ class TestOrchestratorTransformation:
         assert final_output["account_id"] == "ACC-999"
         assert final_output["status"] == "completed"
 
+    @pytest.mark.asyncio
+    async def test_scout_and_memory_fetch_concurrently(self, orchestrator, mock_zoho_scout, mock_memory_analyst):
+        """Test Zoho and memory fetches overlap while events keep step order."""
+
+        mock_account_snapshot = MagicMock()
+        mock_account_snapshot.snapshot_id = "snapshot_parallel"
+        mock_account_snapshot.account.account_name = "Parallel Customer"
+        mock_account_snapshot.risk_signals = []
+        mock_account_snapshot.risk_level.value = "low"
+        mock_account_snapshot.priority_score = 10
+        mock_account_snapshot.needs_review = False
+
+        mock_historical_context = MagicMock()
+        mock_historical_context.timeline = []
+        mock_historical_context.patterns = []
+        mock_historical_context.sentiment_trend.value = "stable"
+        mock_historical_context.relationship_strength.value = "strong"
+        mock_historical_context.risk_level.value = "low"
+        mock_historical_context.model_dump.return_value = {"sentiment_trend": "stable"}
+
+        async def slow_snapshot(account_id):
+            await asyncio.sleep(0.2)
+            return mock_account_snapshot
+
+        async def slow_history(**kwargs):
+            await asyncio.sleep(0.2)
+            return mock_historical_context
+
+        mock_zoho_scout.get_account_snapshot.side_effect = slow_snapshot
+        mock_memory_analyst.get_historical_context.side_effect = slow_history
+
+        context = {"account_id": "ACC-321", "workflow": "account_analysis", "timeout_seconds": 300}
+
+        start = asyncio.get_running_loop().time()
+        events = [event async for event in orchestrator.execute_with_events(context)]
+        elapsed = asyncio.get_running_loop().time() - start
+
+        # Both fetches take 0.2s; run back to back they would take 0.4s
+        assert elapsed < 0.35
+
+        agents = [
+            e["data"]["agent"] for e in events
+            if e.get("event") in ("agent_started", "agent_completed")
+            and e["data"].get("agent") in ("zoho_scout", "memory_analyst")
+        ]
+        assert agents == ["zoho_scout", "zoho_scout", "memory_analyst", "memory_analyst"]
+
+    @pytest.mark.asyncio
+    async def test_scout_failure_cancels_memory_fetch(self, orchestrator, mock_zoho_scout, mock_memory_analyst):
+        """Test a failed Zoho fetch cancels the in-flight memory lookup."""
+
+        memory_cancelled = asyncio.Event()
+
+        async def hanging_history(**kwargs):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                memory_cancelled.set()
+                raise
+
+        mock_zoho_scout.get_account_snapshot.side_effect = RuntimeError("Zoho unavailable")
+        mock_memory_analyst.get_historical_context.side_effect = hanging_history
+
+        context = {"account_id": "ACC-321", "workflow": "account_analysis", "timeout_seconds": 300}
+
+        events = []
+        with pytest.raises(RuntimeError):
+            async for event in orchestrator.execute_with_events(context):
+                events.append(event)
+
+        await asyncio.sleep(0)
+        assert memory_cancelled.is_set()
+        assert any(
+            e.get("event") == "agent_error" and e["data"]["agent"] == "zoho_scout"
+            for e in events
+        )
+
+    @pytest.mark.asyncio
+    async def test_follow_up_reuses_cached_analysis(self, mock_zoho_scout, mock_memory_analyst, mock_approval_manager):
+        """Test repeated queries reuse the analysis until the account changes."""
+
+        orchestrator = OrchestratorAgent(
+            session_id="test_session_cache",
+            zoho_scout=mock_zoho_scout,
+            memory_analyst=mock_memory_analyst,
+            approval_manager=mock_approval_manager,
+            analysis_cache=AccountAnalysisCache()
+        )
+
+        mock_account_snapshot = MagicMock()
+        mock_account_snapshot.snapshot_id = "snapshot_cached"
+        mock_account_snapshot.account.account_name = "Cached Customer"
+        mock_account_snapshot.risk_signals = []
+        mock_account_snapshot.risk_level.value = "low"
+        mock_account_snapshot.priority_score = 10
+        mock_account_snapshot.needs_review = False
+        mock_zoho_scout.get_account_snapshot.return_value = mock_account_snapshot
+
+        mock_historical_context = MagicMock()
+        mock_historical_context.timeline = []
+        mock_historical_context.patterns = []
+        mock_historical_context.sentiment_trend.value = "stable"
+        mock_historical_context.relationship_strength.value = "strong"
+        mock_historical_context.risk_level.value = "low"
+        mock_historical_context.model_dump.return_value = {"sentiment_trend": "stable"}
+        mock_memory_analyst.get_historical_context.return_value = mock_historical_context
+
+        mock_zoho_scout.get_account_version.return_value = "2025-01-01T10:00:00+00:00"
+        context = {"account_id": "ACC-555", "workflow": "account_analysis", "timeout_seconds": 300}
+
+        async def run():
+            return [event async for event in orchestrator.execute_with_events(context)]
+
+        first = await run()
+        second = await run()
+
+        # Second turn reused snapshot, history and recommendations
+        assert mock_zoho_scout.get_account_snapshot.await_count == 1
+        assert mock_memory_analyst.get_historical_context.await_count == 1
+        final_outputs = [
+            e["data"]["final_output"] for e in (first[-1], second[-1])
+        ]
+        assert final_outputs[0]["recommendations"] == final_outputs[1]["recommendations"]
+
+        # The account changed in Zoho: run the full chain again
+        mock_zoho_scout.get_account_version.return_value = "2025-01-02T09:00:00+00:00"
+        await run()
+        assert mock_zoho_scout.get_account_snapshot.await_count == 2
+
+    @staticmethod
+    def _mock_account_results():
+        """Build a minimal snapshot and historical context."""
+        mock_account_snapshot = MagicMock()
+        mock_account_snapshot.snapshot_id = "snapshot_prefetch"
+        mock_account_snapshot.account.account_name = "Prefetch Customer"
+        mock_account_snapshot.risk_signals = []
+        mock_account_snapshot.risk_level.value = "low"
+        mock_account_snapshot.priority_score = 10
+        mock_account_snapshot.needs_review = False
+
+        mock_historical_context = MagicMock()
+        mock_historical_context.timeline = []
+        mock_historical_context.patterns = []
+        mock_historical_context.sentiment_trend.value = "stable"
+        mock_historical_context.relationship_strength.value = "strong"
+        mock_historical_context.risk_level.value = "low"
+        mock_historical_context.model_dump.return_value = {"sentiment_trend": "stable"}
+        return mock_account_snapshot, mock_historical_context
+
+    @pytest.mark.asyncio
+    async def test_account_id_in_message_prefetches_before_routing(self, mock_zoho_scout, mock_memory_analyst, mock_approval_manager):
+        """Test "analyze ACC-xxx" fetches overlap the cache version lookup."""
+
+        orchestrator = OrchestratorAgent(
+            session_id="test_session_prefetch",
+            zoho_scout=mock_zoho_scout,
+            memory_analyst=mock_memory_analyst,
+            approval_manager=mock_approval_manager,
+            analysis_cache=AccountAnalysisCache()
+        )
+        mock_account_snapshot, mock_historical_context = self._mock_account_results()
+
+        async def slow_version(account_id):
+            await asyncio.sleep(0.1)
+            return "2025-01-01T10:00:00+00:00"
+
+        async def slow_snapshot(account_id):
+            await asyncio.sleep(0.1)
+            return mock_account_snapshot
+
+        async def slow_history(**kwargs):
+            await asyncio.sleep(0.1)
+            return mock_historical_context
+
+        mock_zoho_scout.get_account_version.side_effect = slow_version
+        mock_zoho_scout.get_account_snapshot.side_effect = slow_snapshot
+        mock_memory_analyst.get_historical_context.side_effect = slow_history
+
+        context = {
+            "account_id": "ACC-777",
+            "message": "Analyze ACC-777",
+            "workflow": "account_analysis",
+            "timeout_seconds": 300
+        }
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        events = orchestrator.execute_with_events(context)
+        async for event in events:
+            if event["type"] == "agent_stream" and event["data"]["agent"] == "zoho_scout":
+                first_useful = loop.time() - start
+                break
+        await events.aclose()
+
+        # Version lookup then snapshot would take 0.2s back to back
+        assert first_useful < 0.18
+        assert mock_zoho_scout.get_account_snapshot.await_count == 1
+        assert orchestrator.prefetch_stats == {"started": 1, "used": 1, "discarded": 0}
+
+    @pytest.mark.asyncio
+    async def test_prefetch_uses_account_id_from_message(self, mock_zoho_scout, mock_memory_analyst, mock_approval_manager):
+        """Test the account quoted in the message is prefetched over the context's."""
+
+        orchestrator = OrchestratorAgent(
+            session_id="test_session_message_account",
+            zoho_scout=mock_zoho_scout,
+            memory_analyst=mock_memory_analyst,
+            approval_manager=mock_approval_manager,
+            analysis_cache=AccountAnalysisCache()
+        )
+        mock_account_snapshot, mock_historical_context = self._mock_account_results()
+        mock_zoho_scout.get_account_version.return_value = "2025-01-01T10:00:00+00:00"
+        mock_zoho_scout.get_account_snapshot.return_value = mock_account_snapshot
+        mock_memory_analyst.get_historical_context.return_value = mock_historical_context
+
+        context = {
+            "account_id": "ACC-001",
+            "message": "Analyze acc-321",
+            "workflow": "account_analysis",
+            "timeout_seconds": 300
+        }
+
+        events = orchestrator.execute_with_events(context)
+        async for event in events:
+            if event["type"] == "agent_stream" and event["data"]["agent"] == "zoho_scout":
+                break
+        await events.aclose()
+
+        mock_zoho_scout.get_account_snapshot.assert_awaited_once_with("ACC-321")
+        assert orchestrator.prefetch_stats == {"started": 1, "used": 1, "discarded": 0}
+
+    @pytest.mark.asyncio
+    async def test_account_fetches_overlap_version_lookup(self, mock_zoho_scout, mock_memory_analyst, mock_approval_manager):
+        """Test the cache version lookup doesn't delay the account fetches."""
+
+        orchestrator = OrchestratorAgent(
+            session_id="test_session_version_overlap",
+            zoho_scout=mock_zoho_scout,
+            memory_analyst=mock_memory_analyst,
+            approval_manager=mock_approval_manager,
+            analysis_cache=AccountAnalysisCache()
+        )
+        mock_account_snapshot, mock_historical_context = self._mock_account_results()
+
+        async def slow_version(account_id):
+            await asyncio.sleep(0.1)
+            return "2025-01-01T10:00:00+00:00"
+
+        async def slow_snapshot(account_id):
+            await asyncio.sleep(0.1)
+            return mock_account_snapshot
+
+        mock_zoho_scout.get_account_version.side_effect = slow_version
+        mock_zoho_scout.get_account_snapshot.side_effect = slow_snapshot
+        mock_memory_analyst.get_historical_context.return_value = mock_historical_context
+
+        # Forced mode skips the prefetch
+        context = {
+            "account_id": "ACC-778",
+            "workflow": "account_analysis",
+            "force_mode": "account_analysis",
+            "timeout_seconds": 300
+        }
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        events = orchestrator.execute_with_events(context)
+        async for event in events:
+            if event["type"] == "agent_stream" and event["data"]["agent"] == "zoho_scout":
+                first_useful = loop.time() - start
+                break
+        await events.aclose()
+
+        assert first_useful < 0.18
+        assert orchestrator.prefetch_stats["started"] == 0
+
+    @pytest.mark.asyncio
+    async def test_prefetch_cancelled_when_route_does_not_need_it(self, orchestrator, mock_zoho_scout, mock_memory_analyst):
+        """Test speculative fetches are cancelled on a general conversation route."""
+
+        fetch_cancelled = asyncio.Event()
+
+        async def hanging_snapshot(account_id):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                fetch_cancelled.set()
+                raise
+
+        mock_zoho_scout.get_account_snapshot.side_effect = hanging_snapshot
+
+        intent = MagicMock()
+        intent.primary_intent = "general_conversation"
+        intent.confidence_score = 0.6
+        intent.requires_account_data = False
+        intent.should_call_zoho_agent = False
+        intent.should_call_memory_agent = False
+
+        async def general_conversation(message, context, emitter):
+            yield {"type": "workflow_completed", "data": {"final_output": {"status": "completed"}}}
+
+        with patch.object(orchestrator.intent_engine, "analyze_intent", return_value=intent), \
+                patch.object(orchestrator, "_execute_general_conversation", side_effect=general_conversation):
+            context = {"account_id": "ACC-123", "message": "What does ACC-123 stand for?"}
+            events = [event async for event in orchestrator.execute_with_events(context)]
+
+        await asyncio.sleep(0)
+        assert fetch_cancelled.is_set()
+        assert events[-1]["data"]["final_output"]["status"] == "completed"
+        assert orchestrator.prefetch_stats == {"started": 1, "used": 0, "discarded": 1}
+
     @pytest.mark.asyncio
     async def test_error_handling_in_general_conversation(self, orchestrator):
         """Test error handling in general conversation mode."""
@@ -0,0 +1,88 @@
+"""Unit tests for the process-wide agent pool."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.agents.agent_pool import AgentPool
+from src.agents.analysis_cache import AccountAnalysisCache
+from src.agents.config import CacheConfig, DataScoutConfig
+
+
+def _scout_config(tmp_path):
+    return DataScoutConfig(cache=CacheConfig(cache_dir=tmp_path))
+
+
+@pytest.fixture
+def pool(tmp_path):
+    return AgentPool(
+        zoho_manager=MagicMock(),
+        cognee_client=MagicMock(close=AsyncMock()),
+        scout_config=_scout_config(tmp_path),
+        api_key="test-key",
+        analysis_cache=AccountAnalysisCache()
+    )
+
+
+def test_sessions_share_pooled_agents(pool):
+    first = pool.create_orchestrator("session-1")
+    second = pool.create_orchestrator("session-2")
+
+    assert first.session_id == "session-1" and second.session_id == "session-2"
+    assert first.zoho_scout is second.zoho_scout is pool.zoho_scout
+    assert first.memory_analyst is second.memory_analyst is pool.memory_analyst
+    assert first.recommendation_author is None
+    assert "recommendation_author" not in pool.get_stats()["components"]
+    assert first.intent_engine is second.intent_engine
+    assert first.approval_manager is pool.approval_manager
+    assert pool.memory_service.zoho is pool.zoho_manager
+
+    stats = pool.get_stats()
+    assert stats["sessions_created"] == 2
+    assert "zoho_scout" in stats["build_ms"]
+
+
+def test_general_conversation_orchestrator_skips_specialists(pool):
+    orchestrator = pool.create_orchestrator("session-1", with_specialists=False)
+
+    assert orchestrator.zoho_scout is None
+    assert orchestrator.memory_analyst is None
+    assert "zoho_scout" not in pool.get_stats()["components"]
+
+
+def test_create_session_is_lightweight(pool):
+    session = pool.create_session()
+
+    assert session.session_id.startswith("session_")
+    assert session.emitter.session_id == session.session_id
+    assert pool.get_stats()["components"] == ["cognee_client", "scout_config", "zoho_manager"]
+
+
+def test_warm_reports_unavailable_components(tmp_path, monkeypatch):
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    pool = AgentPool(
+        cognee_client=MagicMock(),
+        scout_config=_scout_config(tmp_path),
+        api_key="test-key"
+    )
+    monkeypatch.setattr(
+        "src.agents.agent_pool.ZohoIntegrationManager",
+        MagicMock(from_env=MagicMock(side_effect=ValueError("ZOHO_CLIENT_ID not set")))
+    )
+
+    ready = pool.warm()
+
+    assert ready["intent_engine"] is True
+    assert ready["recommendation_author"] is True
+    assert ready["zoho_scout"] is False
+    assert ready["memory_analyst"] is False
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_clients(pool):
+    cognee_client = pool.cognee_client
+
+    await pool.aclose()
+
+    cognee_client.close.assert_awaited_once()
+    assert pool.get_stats()["components"] == []
@@ -0,0 +1,68 @@
+"""Unit tests for the account analysis result cache."""
+
+import time
+
+from src.agents.analysis_cache import AccountAnalysisCache, CachedAnalysis
+
+
+def _analysis(account_id="ACC-1", version="2025-01-01T00:00:00", workflow="account_analysis"):
+    return CachedAnalysis(
+        account_id=account_id,
+        workflow=workflow,
+        version=version,
+        account_snapshot={"snapshot_id": f"{account_id}_snap"},
+        historical_context={"sentiment_trend": "stable"},
+        recommendations=[{"recommendation_id": "rec_1"}],
+    )
+
+
+def test_hit_requires_matching_version():
+    cache = AccountAnalysisCache()
+    cache.put(_analysis())
+
+    assert cache.get("ACC-1", "account_analysis", "2025-01-01T00:00:00") is not None
+    assert cache.get("ACC-1", "account_analysis", "2025-02-01T00:00:00") is None
+
+    # The stale entry was dropped
+    assert cache.get("ACC-1", "account_analysis", "2025-01-01T00:00:00") is None
+    assert cache.get_stats()["stale"] == 1
+
+
+def test_session_tier_survives_global_eviction():
+    cache = AccountAnalysisCache(max_entries=1)
+    cache.put(_analysis("ACC-1"), session_id="s1")
+    cache.put(_analysis("ACC-2"), session_id="s2")
+
+    assert cache.get("ACC-1", "account_analysis", "2025-01-01T00:00:00") is None
+    assert cache.get("ACC-1", "account_analysis", "2025-01-01T00:00:00", "s1") is not None
+
+    stats = cache.get_stats()
+    assert stats["session_hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_global_hit_is_promoted_into_session():
+    cache = AccountAnalysisCache()
+    cache.put(_analysis(), session_id="s1")
+
+    assert cache.get("ACC-1", "account_analysis", "2025-01-01T00:00:00", "s2") is not None
+    assert cache.get("ACC-1", "account_analysis", "2025-01-01T00:00:00", "s2") is not None
+
+    stats = cache.get_stats()
+    assert (stats["global_hits"], stats["session_hits"]) == (1, 1)
+    assert stats["hit_rate"] == 1.0
+
+
+def test_ttl_and_invalidation():
+    cache = AccountAnalysisCache(ttl_seconds=60)
+    entry = _analysis()
+    entry.cached_at = time.monotonic() - 120
+    cache.put(entry)
+    assert cache.get("ACC-1", "account_analysis", entry.version) is None
+
+    cache.put(_analysis(), session_id="s1")
+    cache.put(_analysis(workflow="renewal_review"), session_id="s1")
+    cache.invalidate("ACC-1")
+
+    assert cache.get("ACC-1", "account_analysis", entry.version, "s1") is None
+    assert cache.get("ACC-1", "renewal_review", entry.version, "s1") is None
@@ -8,6 +8,8 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, List
 
 from src.agents.confidence_scoring import (
+    COMPONENT_WEIGHTS,
+    ConfidenceFeatures,
     ConfidenceScorer,
     adjust_confidence_for_priority,
     compare_confidence_scores,
@@ -440,6 +442,94 @@ class TestConfidenceScorer:
         assert "Confidence:" in confidence.rationale
 
 
+class TestBatchScoring:
+    """Tests for vectorized batch scoring."""
+
+    @pytest.fixture
+    def scorer(self) -> ConfidenceScorer:
+        """Create a ConfidenceScorer instance."""
+        return ConfidenceScorer()
+
+    @staticmethod
+    def _inputs(count: int):
+        now = datetime.utcnow()
+        references, patterns, types = [], [], []
+        for i in range(count):
+            references.append([
+                DataReference(
+                    source_type=("zoho", "cognee", "memory")[j % 3],
+                    source_id=f"src_{(i + j) % 4}",
+                    entity_type="account",
+                    entity_id=str(i),
+                    timestamp=now - timedelta(days=(i * 7 + j * 3) % 60 - 2)
+                )
+                for j in range(i % 4)
+            ])
+            patterns.append(
+                None if i % 5 == 0 else
+                {"occurrences": i % 8, "consistency": (i % 10) / 10, "confidence": 0.4 + (i % 6) / 10}
+            )
+            types.append(("follow_up", "renewal", "upsell", None)[i % 4])
+
+        past = (
+            [{"type": "follow_up", "outcome": "successful"} for _ in range(3)] +
+            [{"type": "follow_up", "outcome": "failed"}] +
+            [{"type": "renewal", "status": "approved"} for _ in range(6)] +
+            [{"type": "renewal", "status": "rejected"} for _ in range(2)]
+        )
+        return references, patterns, past, types
+
+    def test_batch_matches_single_scoring(self, scorer: ConfidenceScorer):
+        """Test batch sub-scores, overall and level match per-item scoring."""
+        references, patterns, past, types = self._inputs(60)
+
+        batch = scorer.calculate_confidence_scores_batch(
+            ConfidenceFeatures.from_inputs(references, patterns, past, types),
+            min_threshold=0.0
+        )
+
+        for i in range(60):
+            single = scorer.calculate_confidence_score(
+                data_references=references[i],
+                pattern=patterns[i],
+                past_recommendations=past,
+                recommendation_type=types[i]
+            )
+            assert batch.data_recency[i] == pytest.approx(single.data_recency, abs=1e-6)
+            assert batch.pattern_strength[i] == pytest.approx(single.pattern_strength)
+            assert batch.evidence_quality[i] == pytest.approx(single.evidence_quality, abs=1e-6)
+            assert batch.historical_accuracy[i] == pytest.approx(single.historical_accuracy)
+            assert batch.overall[i] == pytest.approx(single.overall, abs=1e-6)
+            assert batch.levels[i] == single.level
+            assert batch.rationales[i] == single.rationale
+
+    def test_rationale_only_for_passing_items(self, scorer: ConfidenceScorer):
+        """Test items below the minimum confidence get no rationale."""
+        references, patterns, past, types = self._inputs(40)
+
+        batch = scorer.calculate_confidence_scores_batch(
+            ConfidenceFeatures.from_inputs(references, patterns, past, types),
+            min_threshold=0.5
+        )
+        scores = batch.to_confidence_scores()
+
+        assert 0 < batch.passed.sum() < len(batch)
+        for i, score in enumerate(scores):
+            if batch.passed[i]:
+                assert validate_minimum_confidence(score, 0.5)
+                assert score.rationale == batch.rationales[i]
+            else:
+                assert score is None
+                assert batch.rationales[i] is None
+
+    def test_empty_batch(self, scorer: ConfidenceScorer):
+        """Test scoring no recommendations."""
+        batch = scorer.calculate_confidence_scores_batch(ConfidenceFeatures.from_inputs([]))
+
+        assert len(batch) == 0
+        assert batch.to_confidence_scores() == []
+
+
 class TestHelperFunctions:
     """Tests for helper functions."""
 
@@ -452,7 +542,7 @@ class TestHelperFunctions:
         assert config["min_evidence_sources"] == 2
         assert "confidence_thresholds" in config
         assert config["confidence_thresholds"]["high"] == 0.8
-        assert "weights" in config
+        assert config["weights"] == COMPONENT_WEIGHTS
 
     def test_adjust_confidence_for_priority_critical(self):
         """Test confidence adjustment for critical priority."""
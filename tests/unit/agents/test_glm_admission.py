@@ -0,0 +1,102 @@
+"""Unit tests for the GLM admission scheduler."""
+
+import asyncio
+
+import pytest
+
+from src.agents.glm_admission import (
+    GLMAdmissionScheduler,
+    ModelLimits,
+    RequestPriority,
+    estimate_request_tokens,
+    parse_retry_after,
+)
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_per_model():
+    scheduler = GLMAdmissionScheduler(default_limits=ModelLimits(max_concurrent=2))
+    active = peak = 0
+
+    async def request():
+        nonlocal active, peak
+        async with scheduler.admit("glm-4.6", estimated_tokens=10):
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(request() for _ in range(6)))
+
+    assert peak == 2
+    stats = scheduler.get_stats()["glm-4.6"]
+    assert stats["admitted"] == 6
+    assert stats["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_interactive_admitted_before_queued_batch():
+    scheduler = GLMAdmissionScheduler(default_limits=ModelLimits(max_concurrent=1))
+    order = []
+
+    blocker = await scheduler.acquire("glm-4.6", 10)
+
+    async def request(name, priority):
+        async with scheduler.admit("glm-4.6", 10, priority):
+            order.append(name)
+
+    tasks = [asyncio.create_task(request(f"batch-{i}", RequestPriority.BATCH)) for i in range(3)]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(request("interactive", RequestPriority.INTERACTIVE)))
+    await asyncio.sleep(0)
+
+    scheduler.release(blocker)
+    await asyncio.gather(*tasks)
+
+    assert order == ["interactive", "batch-0", "batch-1", "batch-2"]
+
+
+@pytest.mark.asyncio
+async def test_token_budget_uses_actual_usage():
+    scheduler = GLMAdmissionScheduler(default_limits=ModelLimits(tokens_per_minute=1000))
+
+    async with scheduler.admit("glm-4.6", estimated_tokens=900) as ticket:
+        ticket.tokens_used = 200
+
+    # 800 tokens left: admitted immediately
+    second = await asyncio.wait_for(scheduler.acquire("glm-4.6", 700), timeout=0.1)
+
+    # Budget exhausted: waits for the window
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(scheduler.acquire("glm-4.6", 700), timeout=0.05)
+
+    scheduler.release(second)
+    stats = scheduler.get_stats()["glm-4.6"]
+    assert stats["tokens_last_minute"] == 900
+    assert stats["queued"] == 0
+    assert stats["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_throttle_pauses_admission():
+    scheduler = GLMAdmissionScheduler()
+    scheduler.throttle("glm-4.6", 0.05)
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    async with scheduler.admit("glm-4.6", 10) as ticket:
+        assert ticket.queued_ms >= 40
+    assert loop.time() - start >= 0.04
+
+    # Other models are unaffected
+    async with scheduler.admit("glm-4.6-flash", 10) as ticket:
+        assert ticket.queued_ms < 40
+    assert scheduler.get_stats()["glm-4.6"]["throttles"] == 1
+
+
+def test_helpers():
+    messages = [{"role": "user", "content": "x" * 400}]
+    assert estimate_request_tokens(messages, max_tokens=100) == 200
+    assert parse_retry_after("2") == 2.0
+    assert parse_retry_after(None) == 1.0
+    assert parse_retry_after("Wed, 21 Oct 2026 07:28:00 GMT") == 1.0
@@ -0,0 +1,90 @@
+"""Unit tests for the deterministic LLM response cache."""
+
+import time
+
+from src.agents.llm_response_cache import LLMResponseCache, hashed_embedding
+
+PARAMS = {"temperature": 0, "top_p": 0.9, "max_tokens": 200}
+SYSTEM = {"role": "system", "content": "You are an AI Account Manager assistant."}
+
+
+def _messages(text):
+    return [SYSTEM, {"role": "user", "content": text}]
+
+
+def test_key_covers_model_and_parameters():
+    cache = LLMResponseCache(task_types={"classification"})
+    cache.put("glm-4.6", _messages("Classify ACC-1"), PARAMS, "low")
+
+    assert cache.get("glm-4.6", _messages("Classify ACC-1"), PARAMS) == "low"
+    assert cache.get("glm-4.6-air", _messages("Classify ACC-1"), PARAMS) is None
+    assert cache.get("glm-4.6", _messages("Classify ACC-1"), {**PARAMS, "max_tokens": 50}) is None
+
+
+def test_ttl_expiry():
+    cache = LLMResponseCache(task_types={"classification"}, ttl_seconds=0.01)
+    cache.put("glm-4.6", _messages("Classify ACC-1"), PARAMS, "low")
+    time.sleep(0.02)
+
+    assert cache.get("glm-4.6", _messages("Classify ACC-1"), PARAMS) is None
+    assert cache.get_stats()["stale"] == 1
+
+
+def test_semantic_mode_matches_near_duplicates_only():
+    cache = LLMResponseCache(task_types={"analysis"}, semantic_threshold=0.8)
+    cache.put(
+        "glm-4.6",
+        _messages("Analyze account ACC-1 health, risks and renewal outlook"),
+        PARAMS,
+        "cached analysis"
+    )
+
+    near = _messages("Analyze account ACC-1 health, risks and renewal outlook please")
+    assert cache.get("glm-4.6", near, PARAMS) == "cached analysis"
+    assert cache.get("glm-4.6", _messages("Draft a renewal email for ACC-9"), PARAMS) is None
+
+    # A different system prompt is never a semantic candidate
+    other_system = [{"role": "system", "content": "Be terse."}, near[1]]
+    assert cache.get("glm-4.6", other_system, PARAMS) is None
+
+    stats = cache.get_stats()
+    assert stats["semantic_hits"] == 1
+    assert stats["misses"] == 2
+
+
+def test_hits_require_the_same_accounts_and_checksums():
+    cache = LLMResponseCache(task_types={"analysis"}, semantic_threshold=0.8)
+    cache.put(
+        "glm-4.6",
+        _messages("Analyze account health, risks and renewal outlook"),
+        PARAMS,
+        "ACC-1 analysis",
+        accounts={"ACC-1": "v1"}
+    )
+    near = _messages("Analyze account health, risks and renewal outlook please")
+
+    assert cache.get("glm-4.6", near, PARAMS, accounts={"ACC-2": "v1"}) is None
+    assert cache.get("glm-4.6", near, PARAMS) is None
+    assert cache.get("glm-4.6", near, PARAMS, accounts={"ACC-1": "v1", "ACC-2": "v1"}) is None
+    assert cache.get("glm-4.6", near, PARAMS, accounts={"ACC-1": "v1"}) == "ACC-1 analysis"
+
+    # A changed checksum for the bound account evicts the entry
+    assert cache.get("glm-4.6", near, PARAMS, accounts={"ACC-1": "v2"}) is None
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_lru_eviction_and_account_invalidation():
+    cache = LLMResponseCache(task_types={"analysis"}, max_entries=2)
+    cache.put("glm-4.6", _messages("a"), PARAMS, "A", accounts={"ACC-1": "v1"})
+    cache.put("glm-4.6", _messages("b"), PARAMS, "B", accounts={"ACC-2": "v1"})
+    cache.put("glm-4.6", _messages("c"), PARAMS, "C", accounts={"ACC-1": "v1"})
+
+    assert cache.get("glm-4.6", _messages("a"), PARAMS) is None
+    assert cache.invalidate_account("ACC-1") == 1
+    assert cache.get_stats()["entries"] == 1
+
+
+def test_hashed_embedding_is_unit_length():
+    vector = hashed_embedding("Account health is declining")
+    assert abs(float((vector ** 2).sum()) - 1.0) < 1e-5
+    assert not hashed_embedding("").any()
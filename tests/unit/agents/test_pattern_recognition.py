@@ -13,7 +13,7 @@ import pytest
 from datetime import datetime, timedelta
 from typing import List
 
-from src.agents.pattern_recognition import PatternRecognizer
+from src.agents.pattern_recognition import AccountTimeline, PatternRecognizer
 from src.agents.memory_models import (
     Pattern, PatternType, TimelineEvent, EventType,
     SentimentTrend, RiskLevel
@@ -1068,3 +1068,97 @@ def test_pattern_recognizer_default_thresholds():
     assert recognizer.churn_threshold == 0.7
     assert recognizer.upsell_threshold == 0.6
     assert recognizer.renewal_risk_threshold == 0.65
+
+
+# Batch Detection Tests
+
+def _signature(patterns: List[Pattern]):
+    """Comparable view of patterns ignoring time-derived IDs."""
+    return [(p.pattern_type, p.description, p.risk_score, p.frequency) for p in patterns]
+
+
+def _portfolio() -> List[AccountTimeline]:
+    """Build a small mixed portfolio of account timelines."""
+    now = datetime.utcnow()
+    timelines = []
+    for n in range(6):
+        account_id = f"acc{n}"
+        events = [
+            TimelineEvent(
+                event_id=f"{account_id}_evt{i}",
+                account_id=account_id,
+                timestamp=now - timedelta(days=i * (n + 1) + 31 * (n % 2)),
+                event_type=EventType.DEAL_UPDATE if i % 4 == 0 else EventType.MEETING,
+                description=["Discussed budget", "Considering competitor", "New feature demo",
+                             "Plans to expand team"][i % 4],
+                outcome="Cancelled" if i % 5 == 0 else None,
+                metadata={"sentiment": 0.8 - (i * 0.1), "deal_id": f"deal{i % 2}"}
+            )
+            for i in range(3 * n)
+        ]
+        timelines.append(AccountTimeline(
+            account_id=account_id,
+            events=events,
+            engagement_data={},
+            usage_data={"current_usage": 150, "historical_usage": 100} if n % 2 else {},
+            contract_data={"renewal_date": (now + timedelta(days=30 * n)).isoformat()}
+        ))
+    return timelines
+
+
+def test_detect_patterns_batch_matches_per_account(pattern_recognizer):
+    """Batch results match the single-account detectors."""
+    timelines = _portfolio()
+
+    results = pattern_recognizer.detect_patterns_batch(timelines)
+
+    assert set(results) == {t.account_id for t in timelines}
+    for timeline in timelines:
+        expected = (
+            pattern_recognizer.detect_churn_risk_patterns(
+                timeline.account_id, timeline.events, timeline.engagement_data
+            )
+            + pattern_recognizer.detect_upsell_opportunities(
+                timeline.account_id, timeline.events, timeline.usage_data
+            )
+            + pattern_recognizer.detect_renewal_risk_patterns(
+                timeline.account_id, timeline.events, timeline.contract_data
+            )
+        )
+        assert _signature(results[timeline.account_id]) == _signature(expected)
+
+
+def test_detect_patterns_batch_process_pool(pattern_recognizer):
+    """Process pool execution returns the same results as inline execution."""
+    timelines = _portfolio()
+
+    inline = pattern_recognizer.detect_patterns_batch(timelines)
+    pooled = pattern_recognizer.detect_patterns_batch(timelines, max_workers=2, chunk_size=2)
+
+    assert {k: _signature(v) for k, v in pooled.items()} == \
+        {k: _signature(v) for k, v in inline.items()}
+
+
+def test_detect_patterns_batch_empty(pattern_recognizer):
+    """Empty batches and accounts without events are handled."""
+    assert pattern_recognizer.detect_patterns_batch([]) == {}
+
+    results = pattern_recognizer.detect_patterns_batch([AccountTimeline("acc_empty", [])])
+    assert results == {"acc_empty": []}
+
+
+def test_compute_window_counts():
+    """Window counts bucket events by age per account."""
+    now = datetime.utcnow()
+    timelines = [
+        AccountTimeline("a", [
+            TimelineEvent(event_id=f"a{d}", account_id="a", timestamp=now - timedelta(days=d),
+                          event_type=EventType.EMAIL, description="Email")
+            for d in (1, 29, 45, 61, 120)
+        ]),
+        AccountTimeline("b", []),
+    ]
+
+    counts = PatternRecognizer._compute_window_counts(timelines, now)
+
+    assert counts.tolist() == [[2, 2, 3], [0, 0, 0]]
@@ -0,0 +1,137 @@
+"""Unit tests for RecommendationAuthor batch generation."""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.agents.recommendation_author import RecommendationAuthor
+from src.orchestrator.workflow_engine import WorkflowEngine
+
+
+def _context(i: int) -> dict:
+    now = datetime.utcnow()
+    return {
+        "account_data": {
+            "account_id": f"ACC-{i:03d}",
+            "health_score": 40 if i % 3 == 0 else 85,
+            "annual_revenue": 20000 + i * 1000,
+            "last_activity_date": (now - timedelta(days=10 + i % 80)).isoformat(),
+            "contract_end_date": (now + timedelta(days=30 + i % 120)).isoformat(),
+        },
+        "historical_insights": (
+            [{"pattern_type": "seasonal_dip", "confidence_score": 70, "occurrence_count": 4}]
+            if i % 2 else []
+        ),
+    }
+
+
+def _without_timestamps(recommendations):
+    return [{k: v for k, v in rec.items() if k != "created_at"} for rec in recommendations]
+
+
+@pytest.fixture
+def author():
+    return RecommendationAuthor()
+
+
+@pytest.mark.asyncio
+async def test_batch_matches_single_account_execute(author):
+    contexts = [_context(i) for i in range(12)]
+
+    results = [result async for result in author.generate_batch(contexts, chunk_size=5)]
+
+    assert [r["account_id"] for r in results] == [f"ACC-{i:03d}" for i in range(12)]
+    for context, result in zip(contexts, results):
+        expected = await author.execute(dict(context))
+        assert result["error"] is None
+        assert _without_timestamps(result["recommendations"]) == _without_timestamps(
+            expected["recommendations"]
+        )
+
+    # One reference time for the whole batch
+    stamps = {rec["created_at"] for r in results for rec in r["recommendations"]}
+    assert len(stamps) == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_deduplicates_and_isolates_failures(author):
+    contexts = [
+        _context(1), _context(1), {"account_data": {}}, {}, _context(2)
+    ]
+
+    results = [result async for result in author.generate_batch(contexts)]
+
+    # Contexts without an account ID are each reported, not merged
+    assert [r["account_id"] for r in results] == ["ACC-001", "unknown", "unknown", "ACC-002"]
+    for missing in results[1:3]:
+        assert missing["error"] == "account_data is required in context"
+        assert missing["recommendations"] == []
+    assert results[3]["recommendations"]
+
+
+@pytest.mark.asyncio
+async def test_batch_with_worker_pool(author):
+    contexts = [_context(i) for i in range(40)]
+
+    inline = {
+        r["account_id"]: _without_timestamps(r["recommendations"])
+        async for r in author.generate_batch(contexts, chunk_size=10)
+    }
+    pooled = {
+        r["account_id"]: _without_timestamps(r["recommendations"])
+        async for r in author.generate_batch(contexts, max_workers=2, chunk_size=10)
+    }
+
+    assert pooled == inline
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_reused_across_batches(author):
+    contexts = [_context(i) for i in range(20)]
+
+    async for _ in author.generate_batch(contexts, max_workers=2, chunk_size=5):
+        pass
+    executor = author._batch_executor
+    async for _ in author.generate_batch(contexts, max_workers=2, chunk_size=5):
+        pass
+
+    assert executor is not None
+    assert author._batch_executor is executor
+
+    await author.cleanup()
+    assert author._batch_executor is None
+
+
+@pytest.mark.asyncio
+async def test_workflow_engine_authors_accounts_in_one_batch(author):
+    engine = WorkflowEngine(
+        config=SimpleNamespace(max_concurrent_subagents=1),
+        memory_service=MagicMock(),
+        zoho_manager=MagicMock(),
+        recommendation_author=author,
+    )
+    calls = []
+    generate_batch = author.generate_batch
+
+    def spy(contexts, **kwargs):
+        calls.append(list(contexts))
+        return generate_batch(contexts, **kwargs)
+
+    author.generate_batch = spy
+
+    contexts = [
+        engine._build_author_context(
+            {
+                "account_id": f"ACC-{i:03d}",
+                "current_data": {"Annual_Revenue": 80000, "Last_Activity_Time": None},
+            },
+            {"health_analysis": {"health_score": 40}, "context": {}},
+        )
+        for i in range(3)
+    ]
+    recommendations = await engine._query_recommendation_author(contexts)
+
+    assert len(calls) == 1
+    assert {rec["account_id"] for rec in recommendations} == {"ACC-000", "ACC-001", "ACC-002"}
@@ -0,0 +1,211 @@
+"""Unit tests for resumable Cognee account ingestion."""
+
+import asyncio
+import json
+
+import pytest
+
+from src.integrations.cognee.account_ingestion import (
+    AccountIngestionPipeline,
+    AdaptiveBatchSizer,
+    IngestionCheckpoint,
+)
+from src.integrations.cognee.cognee_config import CogneeIngestionConfig
+
+
+class SimulatedCrash(BaseException):
+    """Stands in for a process crash mid-ingestion."""
+
+
+class FakeZoho:
+    """Zoho manager returning synthetic accounts (in reverse order)."""
+
+    def __init__(self):
+        self.requested = []
+
+    async def get_accounts_bulk(self, account_ids):
+        self.requested.extend(account_ids)
+        return [{"id": a, "Account_Name": f"Account {a}"} for a in reversed(account_ids)]
+
+
+class FakeCognee:
+    """Cognee client recording writes and peak concurrency."""
+
+    def __init__(self, crash_after=None, latency=0.0, fail_ids=()):
+        self.written = []
+        self.inflight = 0
+        self.peak_inflight = 0
+        self.crash_after = crash_after
+        self.latency = latency
+        self.fail_ids = set(fail_ids)
+
+    async def add_account(self, account):
+        if self.crash_after is not None and len(self.written) >= self.crash_after:
+            raise SimulatedCrash()
+        self.inflight += 1
+        self.peak_inflight = max(self.peak_inflight, self.inflight)
+        try:
+            await asyncio.sleep(self.latency)
+            if account["id"] in self.fail_ids:
+                raise RuntimeError("cognee write failed")
+            self.written.append(account["id"])
+            return account["id"]
+        finally:
+            self.inflight -= 1
+
+
+def _config(tmp_path, **overrides):
+    values = dict(
+        batch_delay_ms=0,
+        batch_size=5,
+        enable_progress_tracking=False,
+        adaptive_batch_sizing=False,
+        checkpoint_path=str(tmp_path / "ingestion_cursor.json"),
+    )
+    values.update(overrides)
+    return CogneeIngestionConfig(**values)
+
+
+ACCOUNT_IDS = [f"acc{i:03d}" for i in range(60)]
+
+
+class TestIngestionCheckpoint:
+    """Test cursor persistence."""
+
+    def test_save_and_load_roundtrip(self, tmp_path):
+        path = str(tmp_path / "cursor.json")
+        key = IngestionCheckpoint.run_key_for(["a", "b"])
+        IngestionCheckpoint(run_key=key, last_batch=3, last_account_id="b").save(path)
+
+        loaded = IngestionCheckpoint.load(path, key)
+
+        assert loaded.last_batch == 3
+        assert loaded.last_account_id == "b"
+        assert loaded.updated_at is not None
+
+    def test_load_ignores_other_runs(self, tmp_path):
+        path = str(tmp_path / "cursor.json")
+        IngestionCheckpoint(run_key="other").save(path)
+
+        assert IngestionCheckpoint.load(path, "mine") is None
+        assert IngestionCheckpoint.load(str(tmp_path / "missing.json"), "mine") is None
+
+
+class TestAdaptiveBatchSizer:
+    """Test latency-driven batch sizing."""
+
+    def test_grows_when_fast_and_halves_when_slow(self):
+        sizer = AdaptiveBatchSizer(initial=10, minimum=5, maximum=100, target_latency_ms=100)
+
+        assert sizer.observe([10, 20, 30]) == 15
+        assert sizer.observe([500, 600]) == 7
+        assert sizer.observe([500]) == 5
+
+    def test_respects_bounds_and_disable(self):
+        sizer = AdaptiveBatchSizer(initial=95, minimum=5, maximum=100, target_latency_ms=100)
+        assert sizer.observe([1]) == 100
+
+        disabled = AdaptiveBatchSizer(10, 5, 100, 100, enabled=False)
+        assert disabled.observe([1000]) == 10
+
+        # Bounds only apply to adaptive sizing
+        assert AdaptiveBatchSizer(500, 5, 100, 100, enabled=False).size == 500
+
+
+class TestResumableIngestion:
+    """Test checkpointed, bounded-concurrency ingestion."""
+
+    async def test_full_run_ingests_all_and_clears_cursor(self, tmp_path):
+        config = _config(tmp_path)
+        cognee = FakeCognee()
+        pipeline = AccountIngestionPipeline(FakeZoho(), cognee, config)
+
+        report = await pipeline.ingest_pilot_accounts(ACCOUNT_IDS)
+
+        assert sorted(cognee.written) == ACCOUNT_IDS
+        assert report["summary"]["success_count"] == 60
+        assert not (tmp_path / "ingestion_cursor.json").exists()
+
+    async def test_resume_after_crash_skips_completed_batches(self, tmp_path):
+        config = _config(tmp_path, max_inflight_batches=1)
+        crashed = FakeCognee(crash_after=20)
+        pipeline = AccountIngestionPipeline(FakeZoho(), crashed, config)
+
+        with pytest.raises(SimulatedCrash):
+            await pipeline.ingest_pilot_accounts(ACCOUNT_IDS)
+
+        cursor = json.loads((tmp_path / "ingestion_cursor.json").read_text())
+        assert cursor["last_batch"] == 4
+        assert cursor["last_account_id"] == "acc019"
+
+        zoho = FakeZoho()
+        cognee = FakeCognee()
+        resumed = AccountIngestionPipeline(zoho, cognee, config)
+        report = await resumed.ingest_pilot_accounts(ACCOUNT_IDS)
+
+        assert zoho.requested == ACCOUNT_IDS[20:]
+        assert cognee.written == ACCOUNT_IDS[20:]
+        assert report["summary"]["total_processed"] == 60
+
+    async def test_resume_disabled_restarts(self, tmp_path):
+        config = _config(tmp_path)
+        key = IngestionCheckpoint.run_key_for(ACCOUNT_IDS)
+        IngestionCheckpoint(run_key=key, last_batch=2, last_account_id="acc009").save(
+            config.checkpoint_path
+        )
+        cognee = FakeCognee()
+
+        await AccountIngestionPipeline(FakeZoho(), cognee, config).ingest_pilot_accounts(
+            ACCOUNT_IDS, resume=False
+        )
+
+        assert len(cognee.written) == 60
+
+    async def test_concurrent_writes_bounded_across_batches(self, tmp_path):
+        config = _config(tmp_path, max_concurrent_writes=3, max_inflight_batches=4)
+        cognee = FakeCognee(latency=0.005)
+
+        await AccountIngestionPipeline(FakeZoho(), cognee, config).ingest_pilot_accounts(
+            ACCOUNT_IDS
+        )
+
+        assert cognee.peak_inflight == 3
+        assert len(cognee.written) == 60
+
+    async def test_failed_accounts_recorded_in_cursor(self, tmp_path):
+        config = _config(tmp_path, max_inflight_batches=1, max_errors=2)
+        cognee = FakeCognee(fail_ids={"acc002", "acc007"})
+        pipeline = AccountIngestionPipeline(FakeZoho(), cognee, config)
+
+        results = await pipeline._ingest_in_batches(
+            [{"id": a, "Account_Name": a} for a in ACCOUNT_IDS],
+            checkpoint=IngestionCheckpoint(run_key="k")
+        )
+
+        assert results["failed"] == ["acc002", "acc007"]
+        cursor = json.loads((tmp_path / "ingestion_cursor.json").read_text())
+        assert cursor["failed_ids"] == ["acc002", "acc007"]
+        assert cursor["last_account_id"] == "acc009"
+
+    async def test_resume_retries_failed_accounts(self, tmp_path):
+        config = _config(tmp_path, max_inflight_batches=1)
+        crashed = FakeCognee(crash_after=18, fail_ids={"acc002", "acc007"})
+        pipeline = AccountIngestionPipeline(FakeZoho(), crashed, config)
+
+        with pytest.raises(SimulatedCrash):
+            await pipeline.ingest_pilot_accounts(ACCOUNT_IDS)
+
+        cursor = json.loads((tmp_path / "ingestion_cursor.json").read_text())
+        assert cursor["failed_ids"] == ["acc002", "acc007"]
+
+        zoho = FakeZoho()
+        cognee = FakeCognee()
+        report = await AccountIngestionPipeline(zoho, cognee, config).ingest_pilot_accounts(
+            ACCOUNT_IDS
+        )
+
+        assert zoho.requested[:2] == ["acc002", "acc007"]
+        assert sorted(cognee.written) == sorted(["acc002", "acc007"] + ACCOUNT_IDS[20:])
+        assert report["summary"]["total_processed"] == 60
+        assert report["summary"]["failure_count"] == 0
+        assert not (tmp_path / "ingestion_cursor.json").exists()
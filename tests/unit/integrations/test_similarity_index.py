@@ -0,0 +1,194 @@
+"""Unit tests for the local account similarity index."""
+
+import numpy as np
+import pytest
+
+from src.integrations.cognee.similarity_index import (
+    AccountFeatureEncoder,
+    AccountSimilarityIndex,
+)
+
+
+def _account(account_id, industry, country, employees, revenue, name=None):
+    return {
+        "id": account_id,
+        "Account_Name": name or f"Account {account_id}",
+        "Industry": industry,
+        "Billing_Country": country,
+        "Employees": employees,
+        "Annual_Revenue": revenue,
+    }
+
+
+@pytest.fixture
+def accounts():
+    """Small portfolio with two clear clusters."""
+    return [
+        _account("a1", "Software", "USA", 200, 5_000_000),
+        _account("a2", "Software", "USA", 250, 6_000_000),
+        _account("a3", "Software", "Germany", 180, 4_000_000),
+        _account("b1", "Manufacturing", "Japan", 20_000, 900_000_000),
+        _account("b2", "Manufacturing", "Japan", 15_000, 800_000_000),
+        _account("c1", "Healthcare", "USA", 5, 100_000),
+    ]
+
+
+@pytest.fixture
+def index(accounts):
+    index = AccountSimilarityIndex()
+    index.upsert_many(accounts)
+    return index
+
+
+class TestAccountFeatureEncoder:
+    """Test feature encoding."""
+
+    def test_blocks_are_unit_normalised(self):
+        encoder = AccountFeatureEncoder(hash_buckets=16)
+        vector = encoder.encode(
+            _account("a", "Software", "USA", 100, 1_000_000),
+            health={"health_score": 80, "risk_level": "low"},
+        )
+
+        assert vector.shape == (encoder.dim,)
+        for block in encoder.blocks.values():
+            assert np.linalg.norm(vector[block]) == pytest.approx(1.0, abs=1e-5)
+
+    def test_missing_fields_leave_blocks_empty(self):
+        encoder = AccountFeatureEncoder()
+        vector = encoder.encode({"Account_Name": "Bare"})
+
+        assert not vector.any()
+
+    def test_embedding_dimension_validated(self):
+        encoder = AccountFeatureEncoder(embedding_dim=4)
+
+        with pytest.raises(ValueError):
+            encoder.encode({"Industry": "Software"}, embedding=[0.1, 0.2])
+
+    def test_unknown_criteria_falls_back_to_all(self):
+        encoder = AccountFeatureEncoder()
+
+        assert encoder.block_mask("bogus").all()
+        assert encoder.block_mask("similar_industry").tolist() == [True, False, False, False]
+
+
+class TestAccountSimilarityIndex:
+    """Test index updates and queries."""
+
+    def test_query_returns_nearest_cluster(self, index):
+        results = index.query("a1", k=2)
+
+        assert [r["account_id"] for r in results] == ["a2", "a3"]
+        assert results[0]["relevance_score"] >= results[1]["relevance_score"]
+        assert results[0]["account_name"] == "Account a2"
+
+    def test_query_excludes_source_account(self, index):
+        results = index.query("b1", k=10)
+
+        assert "b1" not in [r["account_id"] for r in results]
+        assert results[0]["account_id"] == "b2"
+
+    def test_criteria_restricts_compared_features(self, index):
+        results = index.query("c1", k=5, criteria="region")
+        top_scores = {r["account_id"]: r["relevance_score"] for r in results}
+
+        assert top_scores["a1"] == pytest.approx(1.0)
+        assert "b1" not in top_scores or top_scores["b1"] < top_scores["a1"]
+
+    def test_query_batch(self, index):
+        results = index.query_batch(["a1", "b1", "missing"], k=1)
+
+        assert set(results) == {"a1", "b1"}
+        assert results["a1"][0]["account_id"] == "a2"
+        assert results["b1"][0]["account_id"] == "b2"
+
+    def test_upsert_replaces_existing_vector(self, index):
+        index.upsert("c1", _account("c1", "Manufacturing", "Japan", 18_000, 850_000_000))
+
+        assert len(index) == 6
+        assert index.query("c1", k=1)[0]["account_id"] in {"b1", "b2"}
+
+    def test_remove_tombstones_account(self, index):
+        assert index.remove("a2") is True
+        assert "a2" not in index
+        assert index.remove("a2") is False
+
+        assert "a2" not in [r["account_id"] for r in index.query("a1", k=5)]
+
+    def test_ivf_search_matches_exact_on_clusters(self):
+        rng = np.random.default_rng(7)
+        index = AccountSimilarityIndex(ivf_min_size=100, n_probe=4)
+        industries = ["Software", "Manufacturing", "Retail", "Finance"]
+        for i in range(400):
+            index.upsert(f"acc{i}", _account(
+                f"acc{i}",
+                industries[i % 4],
+                "USA",
+                int(rng.integers(10, 10_000)),
+                int(rng.integers(100_000, 100_000_000)),
+            ))
+
+        results = index.query_batch([f"acc{i}" for i in range(8)], k=5)
+
+        assert index._centroids is not None
+        for i in range(8):
+            neighbours = results[f"acc{i}"]
+            assert len(neighbours) == 5
+            assert all(int(n["account_id"][3:]) % 4 == i % 4 for n in neighbours)
+
+    def test_removed_accounts_leave_ivf_results(self):
+        index = AccountSimilarityIndex(ivf_min_size=10, n_probe=4)
+        for i in range(40):
+            index.upsert(f"acc{i}", _account(f"acc{i}", "Software", "USA", 100 + i, 1_000_000 + i))
+        index.upsert("blank", {})
+
+        first = [r["account_id"] for r in index.query("acc0", k=5)]
+        assert index._centroids is not None
+        for account_id in first:
+            index.remove(account_id)
+
+        second = [r["account_id"] for r in index.query("acc0", k=5)]
+        assert len(second) == 5
+        assert not set(first) & set(second)
+        assert "blank" not in second
+
+    def test_save_and_load_memory_mapped(self, index, tmp_path):
+        index.save(str(tmp_path))
+
+        loaded = AccountSimilarityIndex.load(str(tmp_path))
+
+        assert isinstance(loaded._vectors, np.memmap)
+        assert len(loaded) == len(index)
+        assert loaded.query("a1", k=2) == index.query("a1", k=2)
+
+        loaded.upsert("d1", _account("d1", "Software", "USA", 220, 5_500_000))
+        assert "d1" in loaded
+        assert "d1" not in AccountSimilarityIndex.load(str(tmp_path))
+
+    def test_save_over_loaded_memory_map(self, tmp_path):
+        index = AccountSimilarityIndex(path=str(tmp_path), ivf_min_size=100_000)
+        for i in range(300):
+            index.upsert(f"acc{i}", _account(f"acc{i}", "Software", "USA", 100 + i, 1_000_000 + i))
+        index.upsert("a2", _account("a2", "Software", "USA", 220, 5_500_000))
+        index.save()
+        loaded = AccountSimilarityIndex.load(str(tmp_path))
+
+        loaded.upsert("a2", _account("a2", "Manufacturing", "Japan", 18_000, 850_000_000))
+        assert isinstance(loaded._vectors, np.memmap)
+        loaded.save()
+
+        reloaded = AccountSimilarityIndex.load(str(tmp_path))
+        assert len(reloaded) == len(loaded)
+        assert np.array_equal(reloaded._vectors, loaded._vectors[:loaded._size])
+        assert reloaded.query("a2", k=2) == loaded.query("a2", k=2)
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_load_or_create(self, tmp_path):
+        created = AccountSimilarityIndex.load_or_create(str(tmp_path / "idx"))
+
+        assert len(created) == 0
+
+    def test_save_without_path_raises(self, index):
+        with pytest.raises(ValueError):
+            index.save()
@@ -0,0 +1,90 @@
+"""Unit tests for the write-through account snapshot store."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.integrations.cognee.snapshot_store import (
+    AccountSnapshotStore,
+    calculate_account_checksum,
+)
+from src.services.memory_service import MemoryService
+
+
+def _account(account_id, industry="Technology", revenue=1_000_000):
+    return {
+        "id": account_id,
+        "Account_Name": f"Account {account_id}",
+        "Industry": industry,
+        "Annual_Revenue": revenue,
+        "Owner": {"id": "owner_1", "name": "Jane"},
+    }
+
+
+def test_put_and_get_in_memory():
+    store = AccountSnapshotStore()
+    snapshot = store.put("acc_1", _account("acc_1"))
+
+    assert "acc_1" in store
+    assert len(store) == 1
+    assert store.get_record("acc_1")["Industry"] == "Technology"
+    assert snapshot.checksum == calculate_account_checksum(_account("acc_1"))
+    assert store.get("missing") is None
+
+
+def test_write_through_survives_reopen(tmp_path):
+    path = tmp_path / "snapshots.db"
+    store = AccountSnapshotStore(str(path))
+    store.put_many([(f"acc_{i}", _account(f"acc_{i}")) for i in range(5)])
+    store.put("acc_2", _account("acc_2", industry="Retail"), source="webhook")
+    store.delete("acc_4")
+    store.close()
+
+    reopened = AccountSnapshotStore(str(path))
+    assert len(reopened) == 4
+    assert reopened.get_record("acc_2")["Industry"] == "Retail"
+    assert reopened.get("acc_2").source == "webhook"
+    assert "acc_4" not in reopened
+
+
+def test_is_current_tracks_checksum_fields():
+    store = AccountSnapshotStore()
+    store.put("acc_1", _account("acc_1"))
+
+    unchanged = dict(_account("acc_1"), Modified_Time="2025-01-01T00:00:00Z")
+    assert store.is_current("acc_1", unchanged)
+    assert not store.is_current("acc_1", _account("acc_1", revenue=2_000_000))
+    assert not store.is_current("acc_2", _account("acc_2"))
+
+
+def test_get_many_skips_unknown():
+    store = AccountSnapshotStore()
+    store.put("acc_1", _account("acc_1"))
+
+    assert list(store.get_many(["acc_1", "acc_2"])) == ["acc_1"]
+
+
+@pytest.mark.asyncio
+async def test_memory_service_reads_snapshot_before_cognee():
+    cognee = MagicMock()
+    cognee.get_account_context = AsyncMock(
+        return_value={"current_snapshot": {"data": {"Industry": "Cognee"}}}
+    )
+    zoho = MagicMock()
+    zoho.get_account = AsyncMock(return_value=_account("acc_1"))
+    cognee.store_account_data = AsyncMock()
+
+    store = AccountSnapshotStore()
+    service = MemoryService(cognee, zoho, snapshot_store=store)
+
+    # Unknown account falls back to Cognee
+    assert (await service.get_last_known_state("acc_1"))["Industry"] == "Cognee"
+
+    # Sync writes through, later lookups skip Cognee
+    assert await service.sync_account_to_memory("acc_1")
+    cognee.get_account_context.reset_mock()
+    assert (await service.get_last_known_state("acc_1"))["Industry"] == "Technology"
+    cognee.get_account_context.assert_not_awaited()
+
+    await service.forget_account("acc_1")
+    assert "acc_1" not in store
@@ -0,0 +1,171 @@
+"""Unit tests for the incremental account timeline index."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.integrations.cognee import cognee_client as cognee_client_module
+from src.integrations.cognee.cognee_client import CogneeClient
+from src.integrations.cognee.cognee_mcp_tools import CogneeMCPTools
+from src.integrations.cognee.timeline_index import AccountEventIndex
+
+
+def _fill(index, account_id, count, prefix="evt"):
+    for i in range(count):
+        index.append(
+            account_id,
+            "note",
+            f"2025-01-{i + 1:02d}T00:00:00",
+            f"{prefix} {i}",
+            interaction_id=f"{account_id}_{prefix}_{i}",
+        )
+
+
+def test_read_since_returns_only_new_events():
+    index = AccountEventIndex()
+    _fill(index, "acc_1", 3)
+    _fill(index, "acc_2", 2)
+
+    page = index.read_since("acc_1")
+    assert [e.summary for e in page.events] == ["evt 0", "evt 1", "evt 2"]
+    assert not page.has_more
+
+    _fill(index, "acc_1", 2, prefix="new")
+    delta = index.read_since("acc_1", since=page.next_cursor)
+    assert [e.summary for e in delta.events] == ["new 0", "new 1"]
+    assert index.read_since("acc_1", since=delta.next_cursor).events == []
+
+
+def test_duplicate_interactions_are_ignored():
+    index = AccountEventIndex()
+    _fill(index, "acc_1", 3)
+    _fill(index, "acc_1", 3)
+
+    assert len(index) == 3
+
+
+def test_iter_pages_and_read_latest():
+    index = AccountEventIndex()
+    _fill(index, "acc_1", 7)
+
+    pages = list(index.iter_pages("acc_1", page_size=3))
+    assert [len(p.events) for p in pages] == [3, 3, 1]
+
+    latest = index.read_latest("acc_1", limit=2)
+    assert [e.summary for e in latest] == ["evt 6", "evt 5"]
+
+
+def test_log_and_cursors_survive_reopen(tmp_path):
+    path = str(tmp_path / "events.db")
+    index = AccountEventIndex(path)
+    _fill(index, "acc_1", 3)
+    index.extend("acc_empty", [])
+    cursor = index.latest_cursor("acc_1")
+    index.close()
+
+    reopened = AccountEventIndex(path)
+    assert "acc_empty" in reopened
+    assert reopened.latest_cursor("acc_1") == cursor
+
+    _fill(reopened, "acc_1", 4)
+    delta = reopened.read_since("acc_1", since=cursor)
+    assert [e.summary for e in delta.events] == ["evt 3"]
+
+
+@pytest.fixture
+def mock_cognee():
+    module = MagicMock()
+    module.add = AsyncMock()
+    module.cognify = AsyncMock()
+    module.search = AsyncMock(return_value=[
+        {
+            "text": "older interaction",
+            "metadata": {
+                "interaction_id": "acc_1_call_1",
+                "interaction_type": "call",
+                "timestamp": "2025-01-01T00:00:00",
+            },
+        },
+    ])
+    with patch.object(cognee_client_module, "COGNEE_AVAILABLE", True), \
+            patch.object(cognee_client_module, "cognee", module):
+        yield module
+
+
+@pytest.mark.asyncio
+async def test_client_serves_deltas_from_index(mock_cognee):
+    client = CogneeClient(event_index=AccountEventIndex())
+    client._initialized = True
+
+    timeline = await client.get_account_timeline("acc_1")
+    assert [e["interaction_id"] for e in timeline] == ["acc_1_call_1"]
+    cursor = timeline[0]["cursor"]
+
+    await client.store_interaction("acc_1", "email", {"summary": "follow up"})
+    await client.store_interaction("acc_1", "meeting", {"summary": "review"})
+
+    delta = await client.get_account_timeline("acc_1", since=cursor)
+    assert [e["type"] for e in delta] == ["meeting", "email"]
+
+    pages = [
+        page async for page in client.iter_account_timeline(
+            "acc_1", since=cursor, page_size=1
+        )
+    ]
+    assert [page["events"][0]["type"] for page in pages] == ["email", "meeting"]
+
+    # Backfill searched Cognee once; later reads were local
+    assert mock_cognee.search.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cursor_reads_larger_than_limit_skip_nothing(mock_cognee):
+    index = AccountEventIndex()
+    client = CogneeClient(event_index=index)
+    client._initialized = True
+    tools = CogneeMCPTools(client)
+
+    cursor = (await client.get_account_timeline("acc_1"))[0]["cursor"]
+    _fill(index, "acc_1", 5, prefix="new")
+
+    delta = await client.get_account_timeline("acc_1", limit=2, since=cursor)
+    assert [e["summary"] for e in delta] == ["new 1", "new 0"]
+
+    seen, has_more = [], True
+    while has_more:
+        result = await tools.cognee_get_timeline("acc_1", limit=2, since=cursor)
+        assert result["success"]
+        seen += [e["summary"] for e in result["timeline"]]
+        cursor, has_more = result["next_cursor"], result["has_more"]
+
+    assert seen == [f"new {i}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_client_cursor_requires_index(mock_cognee):
+    client = CogneeClient()
+    client._initialized = True
+
+    assert len(await client.get_account_timeline("acc_1")) == 1
+    with pytest.raises(ValueError):
+        await client.get_account_timeline("acc_1", since=1)
+
+
+def test_client_builds_local_stores_from_config(mock_cognee, tmp_path):
+    from src.integrations.cognee.cognee_config import CogneeConfig
+    from src.sync.cognee_sync_pipeline import CogneeSyncPipeline
+
+    config = CogneeConfig(
+        similarity_index_path=str(tmp_path / "similarity"),
+        snapshot_store_path=str(tmp_path / "snapshots.db"),
+        event_index_path=str(tmp_path / "events.db"),
+    )
+    client = CogneeClient(config=config)
+
+    assert client.event_index.path == tmp_path / "events.db"
+    assert client.snapshot_store.path == tmp_path / "snapshots.db"
+    assert client.similarity_index.path == tmp_path / "similarity"
+
+    pipeline = CogneeSyncPipeline(MagicMock(), client, "sqlite:///:memory:")
+    assert pipeline.similarity_index is client.similarity_index
+    assert pipeline.snapshot_store is client.snapshot_store
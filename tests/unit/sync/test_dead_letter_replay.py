@@ -0,0 +1,150 @@
+"""Unit tests for bulk dead letter replay."""
+
+import json
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from src.sync.dead_letter_replay import (
+    REPLAY_PROGRESS_KEY,
+    REPLAY_QUEUE_KEY,
+    DeadLetterReplayer,
+)
+from src.sync.webhook_processor import WebhookProcessor
+
+
+@pytest.fixture
+async def fake_redis():
+    client = fakeredis.FakeAsyncRedis()
+    yield client
+    await client.aclose()
+
+
+@pytest.fixture
+def memory_mock():
+    memory = Mock()
+    memory.sync_account_to_memory = AsyncMock(return_value=True)
+    memory.forget_account = AsyncMock()
+    return memory
+
+
+@pytest.fixture
+def processor(fake_redis, memory_mock):
+    return WebhookProcessor(fake_redis, memory_mock, coalesce_window=0)
+
+
+def _deal(deal_id, account_id, stage):
+    return {
+        "event_id": f"evt_{deal_id}_{stage}",
+        "event_type": "update",
+        "module": "Deals",
+        "record_id": deal_id,
+        "record_data": {"Account_Name": {"id": account_id}},
+        "modified_fields": [stage],
+    }
+
+
+async def _dead_letter(redis, events):
+    for event in events:
+        await redis.lpush(
+            "webhook:dead_letter",
+            json.dumps({"event": event, "error": "cognee down", "retry_count": 3})
+        )
+
+
+def _outage_backlog():
+    events = []
+    for round_ in range(3):
+        events += [_deal(f"deal_{i}", "acc_1", f"Stage{round_}") for i in range(10)]
+    events += [_deal(f"deal_x{i}", "acc_2", "Amount") for i in range(5)]
+    events.append(_deal("deal_gone", "acc_3", "Stage"))
+    events.append({
+        "event_id": "evt_acc_3_delete",
+        "event_type": "delete",
+        "module": "Accounts",
+        "record_id": "acc_3",
+    })
+    return events
+
+
+@pytest.mark.asyncio
+async def test_replay_dedups_and_coalesces_per_account(fake_redis, processor, memory_mock):
+    await _dead_letter(fake_redis, _outage_backlog())
+
+    progress = await DeadLetterReplayer(processor, rate_limit=0).run()
+
+    assert progress["status"] == "completed"
+    assert progress["dead_letters"] == 37
+    assert progress["events_deduplicated"] == 20
+    assert progress["events_superseded"] == 1
+    assert progress["planned"] == 3
+    assert progress["succeeded"] == 3
+
+    assert memory_mock.sync_account_to_memory.await_count == 2
+    memory_mock.forget_account.assert_awaited_once_with("acc_3")
+    assert not await fake_redis.exists(REPLAY_QUEUE_KEY, REPLAY_PROGRESS_KEY)
+
+
+@pytest.mark.asyncio
+async def test_failed_replays_go_to_fresh_dead_letter_queue(fake_redis, processor):
+    processor._sync_account_with_retry = AsyncMock(side_effect=RuntimeError("still down"))
+    await _dead_letter(fake_redis, [_deal(f"deal_{i}", "acc_1", "Stage") for i in range(4)])
+
+    progress = await DeadLetterReplayer(processor, rate_limit=0).run()
+
+    assert progress["failed"] == 1
+    dead = [json.loads(e) for e in await fake_redis.lrange("webhook:dead_letter", 0, -1)]
+    assert len(dead) == 1
+    assert len(dead[0]["event"]["coalesced_event_ids"]) == 4
+
+
+@pytest.mark.asyncio
+async def test_interrupted_replay_resumes_from_checkpoint(fake_redis, processor, memory_mock):
+    await _dead_letter(
+        fake_redis, [_deal(f"deal_{i}", f"acc_{i}", "Stage") for i in range(5)]
+    )
+
+    def crash_after_first_chunk(progress):
+        raise RuntimeError("worker killed")
+
+    replayer = DeadLetterReplayer(processor, chunk_size=2, rate_limit=0)
+    with pytest.raises(RuntimeError):
+        await replayer.run(progress_callback=crash_after_first_chunk)
+
+    assert (await replayer.get_progress())["completed"] == 2
+
+    reports = []
+    progress = await replayer.run(progress_callback=reports.append)
+
+    assert progress["succeeded"] == 5
+    assert [r["completed"] for r in reports] == [4, 5, 5]
+    assert memory_mock.sync_account_to_memory.await_count == 5
+
+
+@pytest.mark.asyncio
+async def test_replay_is_rate_limited(fake_redis, processor, memory_mock):
+    await _dead_letter(
+        fake_redis, [_deal(f"deal_{i}", f"acc_{i}", "Stage") for i in range(10)]
+    )
+    sync_starts = []
+
+    async def sync(account_id, force=False):
+        sync_starts.append(time.monotonic())
+        return True
+
+    memory_mock.sync_account_to_memory.side_effect = sync
+
+    await DeadLetterReplayer(processor, chunk_size=5, rate_limit=50).run()
+
+    # At 50/s syncs start ~20ms apart, within and across chunks
+    gaps = [b - a for a, b in zip(sync_starts, sync_starts[1:])]
+    assert len(gaps) == 9
+    assert min(gaps) >= 0.015
+
+
+@pytest.mark.asyncio
+async def test_empty_dead_letter_queue(processor):
+    assert (await DeadLetterReplayer(processor).run()) == {"status": "empty"}
@@ -19,12 +19,20 @@ from redis.asyncio import Redis
 from src.sync.webhook_handler import (
     WebhookHandler,
     WebhookEvent,
-    WebhookResponse
+    WebhookResponse,
+    event_to_dict,
+    expand_raw_event
 )
 
 
 @pytest.fixture
-def redis_mock():
+def enqueue_script():
+    """Mock registered enqueue script (returns new queue length)."""
+    return AsyncMock(return_value=6)
+
+
+@pytest.fixture
+def redis_mock(enqueue_script):
     """Mock Redis client."""
     mock = AsyncMock(spec=Redis)
     mock.ping = AsyncMock(return_value=True)
@@ -32,6 +40,7 @@ def redis_mock():
     mock.llen = AsyncMock(return_value=5)
     mock.lpush = AsyncMock(return_value=1)
     mock.publish = AsyncMock(return_value=1)
+    mock.register_script = Mock(return_value=enqueue_script)
     return mock
 
 
@@ -501,10 +510,8 @@ class TestEventQueueing:
     """Tests for webhook event queueing."""
 
     @pytest.mark.asyncio
-    async def test_successful_queue(self, webhook_handler, redis_mock):
+    async def test_successful_queue(self, webhook_handler, enqueue_script):
         """Test successful event queueing."""
-        redis_mock.llen = AsyncMock(return_value=5)
-
         event = WebhookEvent(
             event_id="evt_123",
             event_type="create",
@@ -515,13 +522,12 @@ class TestEventQueueing:
         result = await webhook_handler._queue_event(event)
 
         assert result is True
-        redis_mock.lpush.assert_called_once()
-        redis_mock.publish.assert_called_once()
+        enqueue_script.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_queue_full_rejection(self, webhook_handler, redis_mock):
+    async def test_queue_full_rejection(self, webhook_handler, enqueue_script):
         """Test queue rejection when full."""
-        redis_mock.llen = AsyncMock(return_value=1000)  # At max capacity
+        enqueue_script.return_value = -1  # Script refused: at max capacity
 
         event = WebhookEvent(
             event_id="evt_123",
@@ -533,13 +539,11 @@ class TestEventQueueing:
         result = await webhook_handler._queue_event(event)
 
         assert result is False
-        redis_mock.lpush.assert_not_called()
+        assert enqueue_script.call_args.kwargs["args"][1] == 1000
 
     @pytest.mark.asyncio
-    async def test_queue_serialization(self, webhook_handler, redis_mock):
+    async def test_queue_serialization(self, webhook_handler, enqueue_script):
         """Test event serialization for queue."""
-        redis_mock.llen = AsyncMock(return_value=5)
-
         event = WebhookEvent(
             event_id="evt_123",
             event_type="create",
@@ -550,17 +554,14 @@ class TestEventQueueing:
 
         await webhook_handler._queue_event(event)
 
-        call_args = redis_mock.lpush.call_args
-        queued_data = json.loads(call_args[0][1])
+        queued_data = json.loads(enqueue_script.call_args.kwargs["args"][0])
 
         assert queued_data["event_id"] == "evt_123"
         assert queued_data["record_data"]["name"] == "Test"
 
     @pytest.mark.asyncio
-    async def test_queue_publish_notification(self, webhook_handler, redis_mock):
-        """Test publish notification after queueing."""
-        redis_mock.llen = AsyncMock(return_value=5)
-
+    async def test_queue_publish_notification(self, webhook_handler, enqueue_script):
+        """Test publish notification channel is passed to the script."""
         event = WebhookEvent(
             event_id="evt_123",
             event_type="create",
@@ -570,15 +571,12 @@ class TestEventQueueing:
 
         await webhook_handler._queue_event(event)
 
-        redis_mock.publish.assert_called_once_with(
-            "webhook:events",
-            unittest.mock.ANY
-        )
+        assert enqueue_script.call_args.kwargs["keys"][1] == "webhook:events"
 
     @pytest.mark.asyncio
-    async def test_queue_error_handling(self, webhook_handler, redis_mock):
+    async def test_queue_error_handling(self, webhook_handler, enqueue_script):
         """Test queue error handling."""
-        redis_mock.llen = AsyncMock(side_effect=Exception("Redis error"))
+        enqueue_script.side_effect = Exception("Redis error")
 
         event = WebhookEvent(
             event_id="evt_123",
@@ -592,21 +590,122 @@ class TestEventQueueing:
         assert result is False
 
     @pytest.mark.asyncio
-    async def test_queue_key_name(self, webhook_handler, redis_mock):
+    async def test_queue_key_name(self, webhook_handler, enqueue_script):
         """Test queue uses correct Redis key."""
-        redis_mock.llen = AsyncMock(return_value=5)
+        event = WebhookEvent(
+            event_id="evt_123",
+            event_type="update",
+            module="Deals",
+            record_id="deal_456"
+        )
+
+        await webhook_handler._queue_event(event)
 
+        assert enqueue_script.call_args.kwargs["keys"][0] == "webhook:queue"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("module,event_type,fields,key", [
+        ("Accounts", "create", [], "webhook:queue:critical"),
+        ("Accounts", "update", ["Owner"], "webhook:queue:critical"),
+        ("Accounts", "update", ["Phone"], "webhook:queue"),
+        ("Notes", "update", ["Note_Content"], "webhook:queue:bulk"),
+    ])
+    async def test_events_routed_to_priority_lanes(
+        self, webhook_handler, enqueue_script, module, event_type, fields, key
+    ):
+        """Test events are queued on their priority lane."""
         event = WebhookEvent(
             event_id="evt_123",
-            event_type="create",
-            module="Accounts",
-            record_id="acc_456"
+            event_type=event_type,
+            module=module,
+            record_id="rec_456",
+            modified_fields=fields
         )
 
         await webhook_handler._queue_event(event)
 
-        call_args = redis_mock.lpush.call_args
-        assert call_args[0][0] == "webhook:queue"
+        assert enqueue_script.call_args.kwargs["keys"][0] == key
+
+
+# Fast Ingest Tests (3 tests)
+
+class TestFastIngest:
+    """Tests for the raw-body fast ingest path."""
+
+    @pytest.fixture
+    def fast_client(self, redis_mock, webhook_secret):
+        handler = WebhookHandler(
+            redis_client=redis_mock,
+            webhook_secret=webhook_secret,
+            fast_ingest=True
+        )
+        app = FastAPI()
+        handler.register_routes(app)
+        return TestClient(app)
+
+    def test_enqueues_original_body(self, fast_client, enqueue_script, webhook_secret):
+        """Test the raw body is spliced into the envelope unchanged."""
+        body = '{"operation": "Update", "module": "Deals", "data": [{"id": "d1"}]}'
+
+        response = fast_client.post(
+            "/webhooks/zoho",
+            content=body,
+            headers={
+                "X-Zoho-Signature": generate_signature(body, webhook_secret),
+                "X-Zoho-Event-Id": "evt_fast"
+            }
+        )
+
+        assert response.status_code == 200
+        assert response.json()["event_id"] == "evt_fast"
+        envelope = enqueue_script.call_args.kwargs["args"][0]
+        assert isinstance(envelope, bytes)
+        assert body.encode() in envelope
+
+    def test_expanded_event_matches_validated_path(self, fast_client, enqueue_script, webhook_secret):
+        """Test worker-side expansion yields the standard event format."""
+        payload = {
+            "operation": "Update",
+            "module": "Deals",
+            "data": [{"id": "d1", "Account_Name": {"id": "acc_1"}}],
+            "modified_fields": ["Stage"]
+        }
+        body = json.dumps(payload)
+
+        fast_client.post(
+            "/webhooks/zoho",
+            content=body,
+            headers={
+                "X-Zoho-Signature": generate_signature(body, webhook_secret),
+                "X-Zoho-Event-Id": "evt_fast"
+            }
+        )
+
+        expanded = expand_raw_event(json.loads(enqueue_script.call_args.kwargs["args"][0]))
+        expected = event_to_dict(WebhookEvent(
+            event_id="evt_fast",
+            event_type="update",
+            module="Deals",
+            record_id="d1",
+            record_data=payload["data"][0],
+            modified_fields=["Stage"]
+        ))
+        expected["timestamp"] = expanded["timestamp"]
+        assert expanded == expected
+
+    def test_invalid_event_deferred_to_worker(self, fast_client, enqueue_script, webhook_secret):
+        """Test validation is skipped on the request path."""
+        body = '{"event_type": "archive", "module": "Leads", "record_id": "x"}'
+
+        response = fast_client.post(
+            "/webhooks/zoho",
+            content=body,
+            headers={"X-Zoho-Signature": generate_signature(body, webhook_secret)}
+        )
+
+        assert response.status_code == 200
+        with pytest.raises(ValueError):
+            expand_raw_event(json.loads(enqueue_script.call_args.kwargs["args"][0]))
 
 
 # Health and Metrics Tests (6 tests)
@@ -0,0 +1,356 @@
+"""Unit tests for WebhookProcessor dequeue, lanes and event coalescing."""
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from redis.exceptions import ResponseError
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from src.sync.webhook_processor import WebhookProcessor
+
+
+@pytest.fixture
+def redis_mock():
+    redis = AsyncMock()
+    redis.llen = AsyncMock(return_value=0)
+    return redis
+
+
+@pytest.fixture
+def memory_mock():
+    memory = Mock()
+    memory.sync_account_to_memory = AsyncMock(return_value=True)
+    memory.forget_account = AsyncMock()
+    return memory
+
+
+def _deal_update(deal_id, account_id, fields):
+    return {
+        "event_id": f"evt_{deal_id}",
+        "event_type": "update",
+        "module": "Deals",
+        "record_id": deal_id,
+        "record_data": {"Account_Name": {"id": account_id}},
+        "modified_fields": fields,
+    }
+
+
+def _account_update(account_id, fields):
+    return {
+        "event_id": f"evt_{account_id}_{'_'.join(fields)}",
+        "event_type": "update",
+        "module": "Accounts",
+        "record_id": account_id,
+        "record_data": {},
+        "modified_fields": fields,
+    }
+
+
+@pytest.mark.asyncio
+async def test_bulk_edit_collapses_to_one_sync_per_account(redis_mock, memory_mock):
+    processor = WebhookProcessor(redis_mock, memory_mock, coalesce_window=60)
+    events = [_deal_update(f"deal_{i}", "acc_1", ["Stage"]) for i in range(2000)]
+    events.append(_deal_update("deal_x", "acc_2", ["Amount"]))
+
+    await processor._process_batch(events, Mock())
+    memory_mock.sync_account_to_memory.assert_not_awaited()
+
+    assert await processor.flush_coalesced() == 2
+    assert memory_mock.sync_account_to_memory.await_count == 2
+    memory_mock.sync_account_to_memory.assert_any_await("acc_1", force=True)
+
+    metrics = await processor.get_metrics()
+    assert metrics["events_processed"] == 2001
+    assert metrics["events_succeeded"] == 2001
+    assert metrics["coalescing_ratio"] == 1000.5
+    assert metrics["pending_coalesced_accounts"] == 0
+
+
+@pytest.mark.asyncio
+async def test_account_updates_merge_fields_and_force(redis_mock, memory_mock):
+    processor = WebhookProcessor(redis_mock, memory_mock, coalesce_window=60)
+
+    await processor._process_batch([
+        _account_update("acc_1", ["Phone"]),
+        _account_update("acc_1", ["Industry"]),
+    ], Mock())
+
+    pending = processor._pending_syncs["acc_1"]
+    assert pending.modified_fields == {"Phone", "Industry"}
+    assert pending.force is True
+
+    await processor.flush_coalesced()
+    memory_mock.sync_account_to_memory.assert_awaited_once_with("acc_1", force=True)
+
+
+@pytest.mark.asyncio
+async def test_due_only_flush_respects_window(redis_mock, memory_mock):
+    processor = WebhookProcessor(redis_mock, memory_mock, coalesce_window=60)
+    await processor._process_batch([_account_update("acc_1", ["Phone"])], Mock())
+
+    assert await processor.flush_coalesced(due_only=True) == 0
+    assert "acc_1" in processor._pending_syncs
+
+
+@pytest.mark.asyncio
+async def test_delete_supersedes_pending_sync(redis_mock, memory_mock):
+    processor = WebhookProcessor(redis_mock, memory_mock, coalesce_window=60)
+    await processor._process_batch([
+        _account_update("acc_1", ["Phone"]),
+        {
+            "event_id": "evt_delete",
+            "event_type": "delete",
+            "module": "Accounts",
+            "record_id": "acc_1",
+        },
+    ], Mock())
+
+    assert await processor.flush_coalesced() == 0
+    memory_mock.forget_account.assert_awaited_once_with("acc_1")
+    memory_mock.sync_account_to_memory.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_zero_window_processes_each_event(redis_mock, memory_mock):
+    processor = WebhookProcessor(redis_mock, memory_mock, coalesce_window=0)
+    events = [_deal_update(f"deal_{i}", "acc_1", ["Stage"]) for i in range(3)]
+
+    await processor._process_batch(events, Mock())
+
+    assert memory_mock.sync_account_to_memory.await_count == 3
+
+
+@pytest.fixture
+async def fake_redis():
+    client = fakeredis.FakeAsyncRedis()
+    yield client
+    await client.aclose()
+
+
+async def _enqueue(redis, count):
+    for i in range(count):
+        await redis.lpush("webhook:queue", json.dumps({"event_id": f"evt_{i}"}))
+
+
+@pytest.mark.asyncio
+async def test_batch_dequeue_preserves_fifo_order(fake_redis, memory_mock):
+    processor = WebhookProcessor(fake_redis, memory_mock, batch_size=4, batch_timeout=1)
+    await _enqueue(fake_redis, 6)
+
+    first = await processor._get_event_batch()
+    second = await processor._get_event_batch()
+
+    assert [e["event_id"] for e in first] == ["evt_0", "evt_1", "evt_2", "evt_3"]
+    assert [e["event_id"] for e in second] == ["evt_4", "evt_5"]
+
+
+@pytest.mark.asyncio
+async def test_dequeue_falls_back_without_blmpop(fake_redis, memory_mock):
+    processor = WebhookProcessor(fake_redis, memory_mock, batch_size=4, batch_timeout=1)
+    fake_redis.blmpop = AsyncMock(side_effect=ResponseError("unknown command 'BLMPOP'"))
+    await _enqueue(fake_redis, 3)
+
+    events = await processor._get_event_batch()
+
+    assert [e["event_id"] for e in events] == ["evt_0", "evt_1", "evt_2"]
+    assert processor._use_blmpop is False
+
+
+@pytest.mark.asyncio
+async def test_malformed_payload_is_skipped(fake_redis, memory_mock):
+    processor = WebhookProcessor(fake_redis, memory_mock, batch_size=4, batch_timeout=1)
+    await fake_redis.lpush("webhook:queue", b"{not json")
+    await _enqueue(fake_redis, 1)
+
+    events = await processor._get_event_batch()
+
+    assert [e["event_id"] for e in events] == ["evt_0"]
+
+
+@pytest.mark.asyncio
+async def test_raw_events_are_validated_in_worker(fake_redis, memory_mock):
+    processor = WebhookProcessor(fake_redis, memory_mock, batch_size=4, batch_timeout=1)
+    valid = {"event_id": "evt_raw", "received_at": "2025-01-01T00:00:00",
+             "raw": {"event_type": "update", "module": "Accounts", "record_id": "acc_1"}}
+    invalid = {"event_id": "evt_bad", "raw": {"event_type": "archive", "module": "Leads"}}
+    await fake_redis.lpush("webhook:queue", json.dumps(valid), json.dumps(invalid))
+
+    events = await processor._get_event_batch()
+
+    assert [(e["event_id"], e["record_id"]) for e in events] == [("evt_raw", "acc_1")]
+    dead = json.loads(await fake_redis.rpop("webhook:dead_letter"))
+    assert dead["event"]["event_id"] == "evt_bad"
+
+
+def _note_update(note_id, account_id):
+    return {
+        "event_id": f"evt_{note_id}",
+        "event_type": "update",
+        "module": "Notes",
+        "record_id": note_id,
+        "record_data": {"Parent_Id": {"module": "Accounts", "id": account_id}},
+        "modified_fields": ["Note_Content"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_critical_lane_is_dequeued_first(fake_redis, memory_mock):
+    processor = WebhookProcessor(fake_redis, memory_mock, batch_size=10, batch_timeout=1)
+    await fake_redis.lpush(
+        "webhook:queue:bulk",
+        *[json.dumps(_note_update(f"note_{i}", "acc_1")) for i in range(5)]
+    )
+    await fake_redis.lpush(
+        "webhook:queue:critical",
+        json.dumps(_account_update("acc_1", ["Owner"]))
+    )
+
+    first = await processor._get_event_batch(lanes=["critical", "bulk"])
+    second = await processor._get_event_batch(lanes=["critical", "bulk"])
+
+    assert [e["module"] for e in first] == ["Accounts"]
+    assert len(second) == 5
+
+
+def test_lane_workers_reserve_critical_share(redis_mock, memory_mock):
+    processor = WebhookProcessor(redis_mock, memory_mock)
+    assignments = processor._lane_assignments(8)
+
+    assert assignments.count(["critical"]) == 2
+    assert assignments.count(["critical", "bulk"]) == 2
+    assert assignments.count(["critical", "default"]) == 4
+
+    # Too few workers to split: everyone polls every lane
+    assert processor._lane_assignments(2) == [["critical", "default", "bulk"]] * 2
+
+    with pytest.raises(ValueError):
+        WebhookProcessor(redis_mock, memory_mock, lane_workers={"urgent": 1})
+
+
+@pytest.mark.parametrize("lane_workers", [
+    {"critical": 1, "default": 2},
+    {"critical": 1, "default": 2, "bulk": 0},
+])
+def test_lane_workers_must_serve_every_lane(redis_mock, memory_mock, lane_workers):
+    with pytest.raises(ValueError, match="bulk"):
+        WebhookProcessor(redis_mock, memory_mock, lane_workers=lane_workers)
+
+    processor = WebhookProcessor(
+        redis_mock, memory_mock, lane_workers={**lane_workers, "bulk": 1}
+    )
+    assert ["critical", "bulk"] in processor._lane_assignments(4)
+
+
+@pytest.mark.asyncio
+async def test_critical_change_skips_coalescing_window(redis_mock, memory_mock):
+    processor = WebhookProcessor(redis_mock, memory_mock, coalesce_window=60)
+    await processor._process_batch([
+        _account_update("acc_1", ["Phone"]),
+        _account_update("acc_2", ["Phone"]),
+        _account_update("acc_1", ["Owner"]),
+    ], Mock())
+
+    assert await processor.flush_coalesced(due_only=True) == 1
+    memory_mock.sync_account_to_memory.assert_awaited_once_with("acc_1", force=True)
+    assert "acc_2" in processor._pending_syncs
+
+
+@pytest.mark.asyncio
+async def test_module_concurrency_cap(redis_mock, memory_mock):
+    in_flight = peak = 0
+
+    async def slow_sync(account_id, force=False):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    memory_mock.sync_account_to_memory = AsyncMock(side_effect=slow_sync)
+    processor = WebhookProcessor(
+        redis_mock,
+        memory_mock,
+        coalesce_window=0,
+        module_concurrency={"Notes": 2}
+    )
+
+    await processor._process_batch(
+        [_note_update(f"note_{i}", f"acc_{i}") for i in range(6)], Mock()
+    )
+
+    assert memory_mock.sync_account_to_memory.await_count == 6
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_module_concurrency_cap_applies_to_coalesced_syncs(redis_mock, memory_mock):
+    in_flight = peak = 0
+
+    async def slow_sync(account_id, force=False):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    memory_mock.sync_account_to_memory = AsyncMock(side_effect=slow_sync)
+    processor = WebhookProcessor(
+        redis_mock,
+        memory_mock,
+        coalesce_window=60,
+        module_concurrency={"Notes": 2}
+    )
+
+    await processor._process_batch(
+        [_note_update(f"note_{i}", f"acc_{i}") for i in range(6)], Mock()
+    )
+    assert await processor.flush_coalesced() == 6
+
+    assert memory_mock.sync_account_to_memory.await_count == 6
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_create_coalesces_without_account_module_tag(redis_mock, memory_mock):
+    processor = WebhookProcessor(redis_mock, memory_mock, coalesce_window=60)
+    task_create = {
+        "event_id": "evt_task_1",
+        "event_type": "create",
+        "module": "Tasks",
+        "record_id": "task_1",
+        "record_data": {"What_Id": {"id": "acc_1"}},
+    }
+    task_update = {**task_create, "event_id": "evt_task_2", "event_type": "update"}
+
+    # Creates sync the What_Id record like _handle_create; updates still
+    # require it to be tagged as an account
+    assert processor.resolve_account_sync(task_create) == ("acc_1", True)
+    assert processor.resolve_account_sync(task_update) is None
+
+    await processor._process_batch([task_create], Mock())
+    await processor.flush_coalesced()
+    memory_mock.sync_account_to_memory.assert_awaited_once_with("acc_1", force=True)
+
+
+@pytest.mark.asyncio
+async def test_queue_age_metrics_per_lane(fake_redis, memory_mock):
+    processor = WebhookProcessor(fake_redis, memory_mock, batch_size=10, batch_timeout=1)
+    received = (datetime.utcnow() - timedelta(seconds=2)).isoformat()
+    critical = {**_account_update("acc_1", ["Owner"]), "timestamp": received}
+    await fake_redis.lpush("webhook:queue:critical", json.dumps(critical))
+    await fake_redis.lpush("webhook:queue", json.dumps(_deal_update("deal_1", "acc_1", ["Stage"])))
+
+    await processor._get_event_batch()
+    await processor._get_event_batch()
+    lanes = (await processor.get_metrics())["lanes"]
+
+    assert lanes["critical"]["events_dequeued"] == 1
+    assert 2000 <= lanes["critical"]["queue_age_p95_ms"] < 3000
+    # Events without a receive timestamp count but have no age
+    assert lanes["default"]["events_dequeued"] == 1
+    assert lanes["default"]["queue_age_p95_ms"] is None
+    assert lanes["bulk"]["queue_size"] == 0
@@ -0,0 +1,199 @@
+"""Unit tests for the Redis Streams webhook queue backend."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from src.sync.webhook_handler import WebhookEvent, WebhookHandler
+from src.sync.webhook_processor import WebhookProcessor
+from src.sync.webhook_stream import WebhookStreamQueue, partition_key
+
+
+@pytest.fixture
+async def fake_redis():
+    client = fakeredis.FakeAsyncRedis()
+    yield client
+    await client.aclose()
+
+
+@pytest.fixture
+async def stream_queue(fake_redis):
+    queue = WebhookStreamQueue(
+        fake_redis,
+        num_partitions=4,
+        lease_ms=100,
+        claim_idle_ms=50
+    )
+    await queue.ensure_groups()
+    return queue
+
+
+def _event(i, account_id="acc_1"):
+    return {
+        "event_id": f"evt_{i}",
+        "event_type": "update",
+        "module": "Deals",
+        "record_id": f"deal_{i}",
+        "record_data": {"Account_Name": {"id": account_id}},
+        "modified_fields": ["Stage"],
+    }
+
+
+async def _enqueue(queue, events):
+    for event in events:
+        assert await queue.enqueue(event, json.dumps(event), max_len=1000)
+
+
+def test_partition_key_follows_account():
+    assert partition_key(_event(1, "acc_9")) == "acc_9"
+    assert partition_key({"module": "Accounts", "record_id": "acc_9"}) == "acc_9"
+    assert partition_key({"module": "Notes", "record_id": "note_1",
+                          "record_data": {"Parent_Id": "x"}}) == "note_1"
+
+
+@pytest.mark.asyncio
+async def test_read_ack_round_trip_preserves_account_order(stream_queue):
+    await _enqueue(stream_queue, [_event(i) for i in range(5)])
+
+    entries = await stream_queue.read("c1", count=10, block_ms=10)
+    events = [json.loads(payload) for _, payload in entries]
+    assert [e["event_id"] for e in events] == [f"evt_{i}" for i in range(5)]
+
+    assert await stream_queue.ack([ref for ref, _ in entries]) == 5
+    assert await stream_queue.backlog() == 0
+
+
+@pytest.mark.asyncio
+async def test_enqueue_rejects_full_partition(stream_queue):
+    event = _event(0)
+    assert await stream_queue.enqueue(event, json.dumps(event), max_len=1)
+    assert not await stream_queue.enqueue(event, json.dumps(event), max_len=1)
+
+
+@pytest.mark.asyncio
+async def test_partitions_rebalance_across_consumers(stream_queue):
+    assert len(await stream_queue.assigned_partitions("c1")) == 4
+
+    # A second consumer joins; c1 gives up its surplus on the next refresh
+    await stream_queue.assigned_partitions("c2")
+    await asyncio.sleep(0.05)
+    c1 = await stream_queue.assigned_partitions("c1")
+    c2 = await stream_queue.assigned_partitions("c2")
+
+    assert len(c1) == 2 and len(c2) == 2
+    assert not set(c1) & set(c2)
+
+
+@pytest.mark.asyncio
+async def test_crashed_consumer_entries_are_claimed(stream_queue):
+    await _enqueue(stream_queue, [_event(i) for i in range(3)])
+
+    # c1 reads but never acks, then stops renewing its lease
+    assert len(await stream_queue.read("c1", count=10, block_ms=10)) == 3
+    await asyncio.sleep(0.15)
+
+    recovered = await stream_queue.read("c2", count=10, block_ms=10)
+    assert [json.loads(p)["event_id"] for _, p in recovered] == [
+        "evt_0", "evt_1", "evt_2"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_keeps_lease_during_long_batch(stream_queue):
+    await _enqueue(stream_queue, [_event(0)])
+    entries = await stream_queue.read("c1", count=10, block_ms=10)
+
+    # The batch outlives several lease periods
+    async with stream_queue.lease_heartbeat("c1"):
+        await asyncio.sleep(0.3)
+        assert await stream_queue.read("c2", count=10, block_ms=10) == []
+
+    assert await stream_queue.ack([ref for ref, _ in entries], "c1") == 1
+
+
+@pytest.mark.asyncio
+async def test_ack_skipped_after_partition_lost(stream_queue):
+    await _enqueue(stream_queue, [_event(0)])
+    entries = await stream_queue.read("c1", count=10, block_ms=10)
+
+    # c1 stalls without a heartbeat and c2 takes over the partition
+    await asyncio.sleep(0.15)
+    await stream_queue.assigned_partitions("c2")
+
+    assert await stream_queue.ack([ref for ref, _ in entries], "c1") == 0
+    assert await stream_queue.backlog() == 1
+
+
+@pytest.mark.asyncio
+async def test_new_owner_claims_pending_before_new_entries(stream_queue):
+    await _enqueue(stream_queue, [_event(i) for i in range(2)])
+    assert len(await stream_queue.read("c1", count=10, block_ms=10)) == 2
+
+    # Lease expires before the entries go idle long enough for XAUTOCLAIM
+    stream_queue.claim_idle_ms = 60000
+    await asyncio.sleep(0.15)
+    await _enqueue(stream_queue, [_event(2)])
+
+    first = await stream_queue.read("c2", count=10, block_ms=10)
+    second = await stream_queue.read("c2", count=10, block_ms=10)
+    assert [json.loads(p)["event_id"] for _, p in first] == ["evt_0", "evt_1"]
+    assert [json.loads(p)["event_id"] for _, p in second] == ["evt_2"]
+
+
+@pytest.mark.asyncio
+async def test_handler_to_processor_over_streams(fake_redis, stream_queue):
+    handler = WebhookHandler(fake_redis, "secret", stream_queue=stream_queue)
+    memory = Mock()
+    memory.sync_account_to_memory = AsyncMock(return_value=True)
+    processor = WebhookProcessor(
+        fake_redis,
+        memory,
+        batch_size=10,
+        batch_timeout=0.01,
+        coalesce_window=0,
+        stream_queue=stream_queue
+    )
+
+    for i in range(3):
+        assert await handler._queue_event(WebhookEvent(**_event(i)))
+
+    events = await processor._get_event_batch("c1")
+    assert all("_stream_ref" in e for e in events)
+
+    await processor._process_batch(events, Mock())
+
+    assert memory.sync_account_to_memory.await_count == 3
+    assert await stream_queue.backlog() == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_dead_letter_write_leaves_entry_unacked(fake_redis, stream_queue):
+    processor = WebhookProcessor(
+        fake_redis,
+        Mock(),
+        batch_size=10,
+        batch_timeout=0.01,
+        coalesce_window=0,
+        stream_queue=stream_queue
+    )
+    processor._process_with_retry = AsyncMock(side_effect=RuntimeError("sync down"))
+    processor._move_to_dead_letter = AsyncMock(return_value=False)
+
+    event = {**_event(0), "event_type": "create"}
+    await _enqueue(stream_queue, [event])
+    events = await processor._get_event_batch("c1")
+
+    await processor._process_batch(events, Mock())
+
+    processor._move_to_dead_letter.assert_awaited_once()
+    assert await stream_queue.backlog() == 1
+
+    # Once the dead letter queue accepts the event it is acknowledged
+    processor._move_to_dead_letter = AsyncMock(return_value=True)
+    await processor._process_batch(events, Mock())
+
+    assert await stream_queue.backlog() == 0
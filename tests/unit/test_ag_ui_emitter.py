@@ -6,12 +6,15 @@ Reference: MASTER_SPARC_PLAN_V3.md lines 1770-1814
 Reference: AG_UI_PROTOCOL_Implementation_Requirements.md Section 6.1
 """
 
+import asyncio
+import json
+
 import pytest
 import time
 from datetime import datetime
 from unittest.mock import patch
 
-from src.events.ag_ui_emitter import AGUIEventEmitter
+from src.events.ag_ui_emitter import AGUIEventEmitter, coalesce_stream_events
 from src.events.event_schemas import (
     WorkflowStartedEvent,
     AgentStartedEvent,
@@ -460,6 +463,128 @@ class TestSSEFormatting:
             assert sse_event.startswith("data: ")
             assert sse_event.endswith("\n\n")
 
+    def test_to_sse_frame_from_model_and_dict(self):
+        """Test frames from event models and dicts carry the same event."""
+        emitter = AGUIEventEmitter()
+
+        frame = emitter.emit_agent_stream_frame("zoho_scout", "Fetching account")
+        assert frame.startswith(b"data: {")
+        assert frame.endswith(b"}\n\n")
+
+        from_model = json.loads(frame[len(b"data: "):])
+        from_dict = json.loads(
+            emitter.to_sse_frame(emitter.emit_agent_stream("zoho_scout", "Fetching account"))[6:]
+        )
+        assert from_model["type"] == from_dict["type"] == "agent_stream"
+        assert from_model["data"] == from_dict["data"]
+        assert isinstance(from_dict["timestamp"], str)
+
+
+async def _event_source(events, pause_after=None, pause=0.0):
+    for i, event in enumerate(events):
+        if i == pause_after:
+            await asyncio.sleep(pause)
+        yield event
+
+
+class TestStreamCoalescing:
+    """Test agent_stream chunk coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_consecutive_chunks_are_merged_in_order(self):
+        """Test chunks merge per agent and non-stream events keep their place."""
+        emitter = AGUIEventEmitter()
+        events = [
+            emitter.emit_agent_started("zoho_scout", 1),
+            *[emitter.emit_agent_stream("zoho_scout", f"tok{i} ") for i in range(5)],
+            emitter.emit_agent_stream("memory_analyst", "other"),
+            emitter.emit_agent_completed("zoho_scout", 1),
+        ]
+
+        out = [e async for e in coalesce_stream_events(_event_source(events), 1.0)]
+
+        assert [e["type"] for e in out] == [
+            "agent_started", "agent_stream", "agent_stream", "agent_completed"
+        ]
+        assert out[1]["data"]["content"] == "tok0 tok1 tok2 tok3 tok4 "
+        assert out[2]["data"]["agent"] == "memory_analyst"
+        # Source events are not mutated
+        assert events[1]["data"]["content"] == "tok0 "
+
+    @pytest.mark.asyncio
+    async def test_flush_interval_releases_chunk_while_producer_idle(self):
+        """Test a buffered chunk is flushed when the producer stalls."""
+        emitter = AGUIEventEmitter()
+        events = [emitter.emit_agent_stream("zoho_scout", c) for c in ("a", "b", "c")]
+
+        out = [
+            e["data"]["content"]
+            async for e in coalesce_stream_events(
+                _event_source(events, pause_after=2, pause=0.1), flush_interval=0.01
+            )
+        ]
+
+        assert out == ["ab", "c"]
+
+    @pytest.mark.asyncio
+    async def test_max_chunk_size_forces_flush(self):
+        """Test merged chunks are capped by size."""
+        emitter = AGUIEventEmitter()
+        events = [emitter.emit_agent_stream("zoho_scout", "x" * 10) for _ in range(5)]
+
+        out = [
+            e async for e in coalesce_stream_events(
+                _event_source(events), flush_interval=1.0, max_chunk_chars=20
+            )
+        ]
+
+        assert [len(e["data"]["content"]) for e in out] == [20, 20, 10]
+
+    @pytest.mark.asyncio
+    async def test_stream_sse_frames(self):
+        """Test coalesced SSE frame streaming."""
+        emitter = AGUIEventEmitter()
+        events = [emitter.emit_agent_stream("zoho_scout", c) for c in "abc"]
+
+        frames = [f async for f in emitter.stream_sse_frames(_event_source(events))]
+
+        assert len(frames) == 1
+        assert json.loads(frames[0][6:])["data"]["content"] == "abc"
+
+    @pytest.mark.asyncio
+    async def test_producer_error_propagates(self):
+        """Test source errors reach the consumer."""
+        async def failing():
+            yield {"type": "agent_stream", "data": {"agent": "a", "content": "x"}}
+            raise RuntimeError("agent failed")
+
+        out = []
+        with pytest.raises(RuntimeError, match="agent failed"):
+            async for event in coalesce_stream_events(failing(), flush_interval=1.0):
+                out.append(event)
+
+        # The chunk buffered before the failure is still delivered
+        assert [e["data"]["content"] for e in out] == ["x"]
+
+    @pytest.mark.asyncio
+    async def test_stream_sse_frames_transform(self):
+        """Test events are transformed after coalescing, before framing."""
+        emitter = AGUIEventEmitter()
+        events = [emitter.emit_agent_stream("zoho_scout", c) for c in "ab"]
+
+        frames = [
+            f async for f in emitter.stream_sse_frames(
+                _event_source(events),
+                transform=lambda e: {"event": e["type"], "data": e["data"]}
+            )
+        ]
+
+        assert len(frames) == 1
+        assert json.loads(frames[0][6:]) == {
+            "event": "agent_stream",
+            "data": {"agent": "zoho_scout", "content": "ab", "content_type": "text"},
+        }
+
 
 # ============================================================================
 # Integration Tests
@@ -0,0 +1,161 @@
+"""Unit tests for the session event bus."""
+
+import asyncio
+
+import pytest
+
+from src.events.event_bus import SessionEventBus, SubscriberDisconnected
+
+
+def _event(i, event_type="agent_stream"):
+    return {"type": event_type, "data": {"agent": "zoho_scout", "content": str(i)}}
+
+
+class _Run:
+    """Workflow run whose events are released by the test."""
+
+    def __init__(self):
+        self.queue = asyncio.Queue()
+
+    async def events(self):
+        while True:
+            item = await self.queue.get()
+            if item is None:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+
+async def _collect(stream, into):
+    async for event in stream:
+        into.append(event["data"]["content"])
+
+
+@pytest.mark.asyncio
+async def test_subscribers_share_one_run_with_replay():
+    bus = SessionEventBus(replay_size=2)
+    run = _Run()
+    assert bus.start("s1", run.events()) is True
+
+    first = []
+    first_task = asyncio.create_task(_collect(bus.subscribe("s1"), first))
+    for i in range(3):
+        await run.queue.put(_event(i))
+    await asyncio.sleep(0.01)
+
+    # Late subscriber gets the last two events, then live ones
+    late = []
+    late_task = asyncio.create_task(_collect(bus.subscribe("s1"), late))
+    await asyncio.sleep(0)
+
+    duplicate = run.events()
+    assert bus.start("s1", duplicate) is False
+
+    await run.queue.put(_event(3))
+    await run.queue.put(None)
+    await asyncio.gather(first_task, late_task)
+
+    assert first == ["0", "1", "2", "3"]
+    assert late == ["1", "2", "3"]
+    assert not bus.is_running("s1")
+
+
+@pytest.mark.asyncio
+async def test_run_key_identifies_shareable_run():
+    bus = SessionEventBus()
+    run = _Run()
+    assert bus.start("s1", run.events(), run_key=("ACC-1", "account_analysis", "risks?"))
+
+    assert bus.is_running("s1")
+    assert bus.is_running("s1", ("ACC-1", "account_analysis", "risks?"))
+    assert not bus.is_running("s1", ("ACC-2", "account_analysis", "risks?"))
+
+    await run.queue.put(None)
+    await asyncio.sleep(0.01)
+    assert not bus.is_running("s1")
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_is_sampled_without_blocking_producer():
+    bus = SessionEventBus(subscriber_queue_size=3)
+
+    async def burst():
+        for i in range(10):
+            yield _event(i)
+        yield _event("done", event_type="workflow_completed")
+
+    bus.start("s1", burst())
+    received = [event async for event in bus.subscribe("s1", replay=False)]
+
+    assert received[-1]["type"] == "workflow_completed"
+    assert len(received) < 11
+    assert bus.get_stats() == {}
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_disconnect_policy():
+    bus = SessionEventBus(subscriber_queue_size=2, overflow="disconnect")
+    run = _Run()
+    bus.start("s1", run.events())
+    stream = bus.subscribe("s1")
+
+    for i in range(5):
+        await run.queue.put(_event(i))
+    await asyncio.sleep(0.01)
+
+    with pytest.raises(SubscriberDisconnected):
+        async for _ in stream:
+            pass
+
+    await run.queue.put(None)
+
+
+@pytest.mark.asyncio
+async def test_run_error_reaches_subscribers():
+    bus = SessionEventBus()
+    run = _Run()
+    bus.start("s1", run.events())
+    received = []
+    task = asyncio.create_task(_collect(bus.subscribe("s1"), received))
+
+    await run.queue.put(_event(0))
+    await run.queue.put(RuntimeError("scout failed"))
+
+    with pytest.raises(RuntimeError, match="scout failed"):
+        await task
+    assert received == ["0"]
+
+    with pytest.raises(KeyError):
+        bus.subscribe("s1")
+
+
+@pytest.mark.asyncio
+async def test_run_cancelled_after_last_subscriber_leaves():
+    bus = SessionEventBus(idle_grace_seconds=0.05)
+    run = _Run()
+    bus.start("s1", run.events(), run_key="k1")
+
+    stream = bus.subscribe("s1")
+    await run.queue.put(_event(0))
+    assert (await stream.__anext__())["data"]["content"] == "0"
+    await stream.aclose()
+
+    # A subscriber re-attaching within the grace period keeps the run
+    reattached = bus.subscribe("s1", replay=False)
+    await asyncio.sleep(0.1)
+    assert bus.is_running("s1", "k1")
+    await run.queue.put(_event(1))
+    assert (await reattached.__anext__())["data"]["content"] == "1"
+
+    await reattached.aclose()
+    await asyncio.sleep(0.1)
+
+    # Nobody came back: the run is cancelled and the session freed
+    assert not bus.is_running("s1")
+    assert bus.start("s1", _Run().events(), run_key="k2") is True
+
+
+def test_unknown_overflow_policy():
+    with pytest.raises(ValueError):
+        SessionEventBus(overflow="block")